@@ -0,0 +1,83 @@
+"""
+B2B Lead Engine — API Latency Benchmark
+
+Measures per-request latency of the read endpoints with the SQLite
+connection pool disabled (``pool_size=0``, one connection per query),
+enabled, and enabled with the read-through result cache.
+
+Usage:
+    python -m benchmarks.bench_api_latency --requests 200 --pool-size 5 --cache-size 256
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+import src.api.main as api
+from src.config.settings import settings
+from src.database.database import Database
+from src.pipeline import run_pipeline
+
+ENDPOINTS = ["/stats", "/leads?limit=50", "/companies?limit=50"]
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def run(requests: int, pool_size: int, cache_size: int) -> list[dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench_api.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        client = TestClient(api.app)
+
+        modes = [
+            ("no pool", 0, 0),
+            (f"pool={pool_size}", pool_size, 0),
+            ("pool+cache", pool_size, cache_size),
+        ]
+        for label, size, cache in modes:
+            api._db = Database(db_path, pool_size=size, cache_size=cache)
+            for endpoint in ENDPOINTS:
+                client.get(endpoint)  # warm-up
+                samples = []
+                for _ in range(requests):
+                    start = time.perf_counter()
+                    client.get(endpoint).raise_for_status()
+                    samples.append((time.perf_counter() - start) * 1000)
+                results.append({
+                    "mode": label,
+                    "endpoint": endpoint,
+                    "p50_ms": round(statistics.median(samples), 2),
+                    "p95_ms": round(_percentile(samples, 95), 2),
+                    "mean_ms": round(statistics.fmean(samples), 2),
+                })
+            api._db.close()
+        api._db = None
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint")
+    parser.add_argument("--pool-size", type=int, default=settings.database_pool_size or 5)
+    parser.add_argument("--cache-size", type=int, default=settings.database_cache_size or 256)
+    args = parser.parse_args()
+
+    print(f"{'mode':<10} {'endpoint':<22} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8}")
+    print("─" * 60)
+    for r in run(args.requests, args.pool_size, args.cache_size):
+        print(f"{r['mode']:<10} {r['endpoint']:<22} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['mean_ms']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
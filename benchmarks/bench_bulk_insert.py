@@ -0,0 +1,89 @@
+"""
+B2B Lead Engine — Bulk Insert Benchmark
+
+Compares row-at-a-time inserts (one connection + commit per row) with the
+batched ``Database.insert_*`` bulk writers on a fresh SQLite file.
+
+Usage:
+    python -m benchmarks.bench_bulk_insert --rows 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from src.database.database import DEFAULT_BATCH_SIZE, Database
+from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+from src.models.models import Company, Contact
+
+
+def _make_companies(n: int) -> list[Company]:
+    """Clone the seed companies with fresh ids until ``n`` rows exist."""
+    seed = generate_seed_companies()
+    return [
+        seed[i % len(seed)].model_copy(update={"company_id": f"c-bench{i:08d}"})
+        for i in range(n)
+    ]
+
+
+def _make_contacts(companies: list[Company], n: int) -> list[Contact]:
+    seed = generate_seed_contacts(companies[:150])
+    return [
+        seed[i % len(seed)].model_copy(
+            update={"contact_id": f"ct-bench{i:08d}", "company_id": companies[i % len(companies)].company_id}
+        )
+        for i in range(n)
+    ]
+
+
+def _time_it(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(rows: int, batch_size: int) -> list[dict]:
+    companies = _make_companies(rows)
+    contacts = _make_contacts(companies, rows)
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        per_row_db = Database(str(Path(tmp) / "per_row.db"))
+        bulk_db = Database(str(Path(tmp) / "bulk.db"))
+
+        cases = [
+            ("companies", "per-row", lambda: [per_row_db.insert_company(c) for c in companies]),
+            ("companies", "bulk", lambda: bulk_db.insert_companies(iter(companies), batch_size)),
+            ("contacts", "per-row", lambda: [per_row_db.insert_contact(c) for c in contacts]),
+            ("contacts", "bulk", lambda: bulk_db.insert_contacts(iter(contacts), batch_size)),
+        ]
+        for table, mode, fn in cases:
+            elapsed = _time_it(fn)
+            results.append({
+                "table": table,
+                "mode": mode,
+                "rows": rows,
+                "seconds": round(elapsed, 3),
+                "rows_per_sec": round(rows / elapsed) if elapsed else 0,
+            })
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000, help="Rows per table")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    print(f"{'table':<10} {'mode':<8} {'rows':>8} {'seconds':>9} {'rows/sec':>10}")
+    print("─" * 49)
+    for r in run(args.rows, args.batch_size):
+        print(f"{r['table']:<10} {r['mode']:<8} {r['rows']:>8} {r['seconds']:>9.3f} {r['rows_per_sec']:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+B2B Lead Engine — Discovery Pushdown Benchmark
+
+Compares discovery straight from ``dim_companies`` (ICP filters pushed down
+into indexed SQL, only matches read back) with loading the whole stored TAM
+and filtering it in Python. Each database holds ``matchable`` companies from
+the default market mix plus ``padding`` INTL companies no profile targets,
+so the TAM grows while the number of matches stays put: pushdown time
+should follow the matches, full-load time the TAM.
+
+Usage:
+    python -m benchmarks.bench_discovery_pushdown --matchable 5000 20000 --padding 0 100000 300000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from src.config.icp_loader import load_icp_config
+from src.config.settings import settings
+from src.database.database import Database
+from src.database.synthetic import generate_synthetic_tam
+from src.discovery.discovery import DiscoveryEngine
+
+DEFAULT_MATCHABLE = [5_000, 20_000]
+DEFAULT_PADDING = [0, 100_000, 300_000]
+
+
+def build_db(path: str | Path, matchable: int, padding: int, seed: int = 42) -> Database:
+    db = Database(str(path))
+    generate_synthetic_tam(matchable, seed=seed).write_sqlite(db)
+    if padding:
+        generate_synthetic_tam(padding, market_mix={"INTL": 1}, seed=seed + 1).write_sqlite(db)
+    db.analyze()
+    return db
+
+
+def _pushdown(engine: DiscoveryEngine, db: Database) -> tuple[int, int]:
+    companies = contacts = 0
+    for batch_companies, batch_contacts in engine.discover_from_db(db):
+        companies += len(batch_companies)
+        contacts += len(batch_contacts)
+    return companies, contacts
+
+
+def _full_load(engine: DiscoveryEngine, db: Database, tam_size: int) -> tuple[int, int]:
+    companies = db.get_companies(limit=tam_size)
+    contacts = db.get_contacts(limit=10 * tam_size)
+    matched, matched_contacts = engine.discover(companies, contacts)
+    return len(matched), len(matched_contacts)
+
+
+def run_case(matchable: int, padding: int, seed: int = 42, full_load: bool = True) -> list[dict]:
+    engine = DiscoveryEngine(load_icp_config(settings.icp_config_path))
+    tam_size = matchable + padding
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db = build_db(Path(tmp) / "bench.db", matchable, padding, seed)
+        methods = [("pushdown", lambda: _pushdown(engine, db))]
+        if full_load:
+            methods.append(("full_load", lambda: _full_load(engine, db, tam_size)))
+        for method, fn in methods:
+            start = time.perf_counter()
+            matched, contacts = fn()
+            rows.append({
+                "tam": tam_size, "method": method, "matched": matched, "contacts": contacts,
+                "seconds": round(time.perf_counter() - start, 4),
+            })
+        db.close()
+    return rows
+
+
+def run(matchable: list[int], padding: list[int], seed: int = 42, full_load: bool = True) -> list[dict]:
+    return [
+        row for m in matchable for p in padding for row in run_case(m, p, seed, full_load)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--matchable", type=int, nargs="+", default=DEFAULT_MATCHABLE,
+                        help="Companies from the default market mix")
+    parser.add_argument("--padding", type=int, nargs="+", default=DEFAULT_PADDING,
+                        help="Extra INTL companies outside every ICP profile")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-full-load", action="store_true", help="Only time the pushdown")
+    args = parser.parse_args()
+
+    print(f"{'TAM':>9} {'method':<10} {'matched':>8} {'contacts':>9} {'seconds':>9} {'ms/match':>9}")
+    print("─" * 59)
+    for r in run(args.matchable, args.padding, args.seed, not args.no_full_load):
+        per_match = r["seconds"] * 1000 / max(r["matched"], 1)
+        print(f"{r['tam']:>9,} {r['method']:<10} {r['matched']:>8,} {r['contacts']:>9,} "
+              f"{r['seconds']:>9.3f} {per_match:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
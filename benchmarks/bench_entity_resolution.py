@@ -0,0 +1,134 @@
+"""
+B2B Lead Engine — Entity Resolution Benchmark
+
+Times company matching (blocking + MinHash LSH + scoring + clustering)
+over synthetic TAMs with injected near-duplicates: a ``dup_rate`` share
+of the records are copies of other records with the name respaced,
+re-cased or given a legal suffix, and the website moved to another TLD
+or dropped. Another ``dup_rate`` share are near misses: different
+companies that share a record's prefix, number and country but not its
+suffix or domain, so they land in its blocks and must be scored apart.
+Reports throughput, candidate pairs and the precision/recall of the
+merges against the injected duplicates.
+
+Usage:
+    python -m benchmarks.bench_entity_resolution --sizes 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import polars as pl
+
+from src.database.synthetic import generate_synthetic_tam
+from src.resolution.resolution import EntityResolver, connected_components
+
+DEFAULT_SIZES = [100_000, 1_000_000]
+DEFAULT_DUP_RATE = 0.05
+
+
+def make_records(n_records: int, dup_rate: float = DEFAULT_DUP_RATE, seed: int = 42):
+    """
+    ``n_records`` company rows (name, website, country, cnpj) and, per row,
+    the index of the row it duplicates (its own index for originals).
+    """
+    rng = np.random.default_rng(seed)
+    n_dups = int(n_records * dup_rate)
+    originals = generate_synthetic_tam(n_records - 2 * n_dups, seed=seed).companies.select(
+        "name", "website", "country", "cnpj",
+    )
+    source = np.sort(rng.choice(len(originals), n_dups, replace=False))
+    copies = originals[source]
+
+    name_edit = rng.integers(0, 3, n_dups)
+    names = copies["name"]
+    respaced = names.str.replace(r"^([A-Z][a-z]+)([A-Z])", "${1} ${2}")
+    names = (
+        pl.select(
+            pl.when(pl.Series(name_edit == 0)).then(respaced)
+            .when(pl.Series(name_edit == 1)).then(names + " Inc")
+            .otherwise(names.str.to_uppercase())
+        ).to_series()
+    )
+    site_edit = rng.integers(0, 3, n_dups)
+    websites = copies["website"]
+    websites = pl.select(
+        pl.when(pl.Series(site_edit == 0)).then(websites)
+        .when(pl.Series(site_edit == 1)).then(websites.str.replace(r"\.(io|com)$", ".net"))
+        .otherwise(pl.lit(""))
+    ).to_series()
+
+    others = originals[np.sort(rng.choice(len(originals), n_dups, replace=False))]
+    partners = others["name"].str.replace(r"^([A-Z][a-z]+)\S*", "${1}Partners")
+    ventures = others["name"].str.replace(r"^([A-Z][a-z]+)\S*", "${1}Ventures")
+    other_names = pl.select(
+        pl.when(partners == others["name"]).then(ventures).otherwise(partners)
+    ).to_series()
+    near_misses = others.with_columns(
+        name=other_names,
+        website="https://" + other_names.str.to_lowercase().str.replace_all(" ", "") + ".co",
+    )
+
+    records = pl.concat([
+        originals,
+        copies.with_columns(name=names, website=websites),
+        near_misses,
+    ])
+    truth = np.concatenate([
+        np.arange(len(originals)), source, len(originals) + n_dups + np.arange(n_dups),
+    ])
+    return records, truth
+
+
+def run_size(n_records: int, dup_rate: float = DEFAULT_DUP_RATE, seed: int = 42) -> dict:
+    records, truth = make_records(n_records, dup_rate, seed)
+    columns = [records[c].to_list() for c in ("name", "website", "country", "cnpj")]
+    resolver = EntityResolver()
+
+    start = time.perf_counter()
+    i, j, score = resolver.match(*columns)
+    matched = score >= resolver.threshold
+    roots = connected_components(n_records, i[matched], j[matched])
+    seconds = time.perf_counter() - start
+
+    true_pairs = truth[i[matched]] == truth[j[matched]]
+    duplicates = np.flatnonzero(truth != np.arange(len(truth)))
+    found = roots[duplicates] == roots[truth[duplicates]]
+    return {
+        "records": n_records,
+        "duplicates": len(duplicates),
+        "candidates": len(i),
+        "matches": int(matched.sum()),
+        "precision": round(float(true_pairs.mean()) if len(true_pairs) else 1.0, 4),
+        "recall": round(float(found.mean()) if len(found) else 1.0, 4),
+        "seconds": round(seconds, 3),
+        "records_per_sec": round(n_records / seconds, 1),
+    }
+
+
+def run(sizes: list[int], dup_rate: float = DEFAULT_DUP_RATE, seed: int = 42) -> list[dict]:
+    return [run_size(n, dup_rate, seed) for n in sizes]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--dup-rate", type=float, default=DEFAULT_DUP_RATE,
+                        help="Share of records that are injected near-duplicates")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'records':>10} {'dups':>8} {'candidates':>11} {'matches':>8} "
+          f"{'precision':>9} {'recall':>7} {'seconds':>8} {'records/s':>10}")
+    print("─" * 78)
+    for r in run(args.sizes, args.dup_rate, args.seed):
+        print(f"{r['records']:>10,} {r['duplicates']:>8,} {r['candidates']:>11,} {r['matches']:>8,} "
+              f"{r['precision']:>9.3f} {r['recall']:>7.3f} {r['seconds']:>8.2f} "
+              f"{r['records_per_sec']:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
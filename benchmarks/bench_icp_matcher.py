@@ -0,0 +1,76 @@
+"""
+B2B Lead Engine — ICP Matcher Benchmark
+
+Times ICP discovery over synthetic TAMs two ways: the compiled matcher
+called per company model (what ``DiscoveryEngine.discover`` does), and
+the vectorized ``match_frame`` over the TAM's polars frame. The frame path
+is expected to filter a million companies in well under a second.
+
+Usage:
+    python -m benchmarks.bench_icp_matcher --sizes 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from src.config.icp_loader import load_icp_config
+from src.config.settings import settings
+from src.database.synthetic import generate_synthetic_tam
+from src.discovery.icp_matcher import ICPMatcher
+
+DEFAULT_SIZES = [100_000, 1_000_000]
+
+# Companies built as models for the per-company timing (extrapolated above)
+MODEL_SAMPLE = 200_000
+
+
+def _best_of(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_size(n_companies: int, seed: int = 42) -> list[dict]:
+    matcher = ICPMatcher(load_icp_config(settings.icp_config_path))
+    tam = generate_synthetic_tam(n_companies, seed=seed)
+    mask, _ = matcher.match_frame(tam.companies)
+
+    sample = min(n_companies, MODEL_SAMPLE)
+    companies, _ = next(tam.batches(batch_size=sample))
+    per_model = _best_of(lambda: [matcher.match(c) for c in companies], repeat=1)
+
+    rows = [
+        ("per_company", per_model * n_companies / sample),
+        ("match_frame", _best_of(lambda: matcher.match_frame(tam.companies))),
+    ]
+    return [
+        {"size": n_companies, "method": method, "matched": int(mask.sum()),
+         "seconds": round(seconds, 4), "rows_per_sec": round(n_companies / seconds, 1)}
+        for method, seconds in rows
+    ]
+
+
+def run(sizes: list[int], seed: int = 42) -> list[dict]:
+    return [row for size in sizes for row in run_size(size, seed)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'size':>10} {'method':<12} {'matched':>9} {'seconds':>9} {'rows/sec':>12}")
+    print("─" * 56)
+    for r in run(args.sizes, args.seed):
+        print(f"{r['size']:>10,} {r['method']:<12} {r['matched']:>9,} "
+              f"{r['seconds']:>9.3f} {r['rows_per_sec']:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+B2B Lead Engine — Model Construction Benchmark
+
+Measures the cost of building Pydantic models with full validation, with
+Pydantic's ``model_construct``, and with ``build()`` on the trusted path
+(``settings.trusted_construction``), for in-memory pipeline records and
+for a database row mapper. Times include building each record's fields.
+
+Usage:
+    python -m benchmarks.bench_model_construction --records 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+
+from src.config.settings import settings
+from src.database.database import Database
+from src.models.models import (
+    Company,
+    OutreachChannel,
+    OutreachEvent,
+    OutreachStatus,
+    QualificationStatus,
+    ScoreBreakdown,
+    ScoredLead,
+    build,
+)
+
+
+def _company_fields(i: int, now: datetime) -> dict:
+    return dict(
+        company_id=f"c-{i:08x}", name=f"Company {i}", industry="SaaS / Software",
+        country="US", state="CA", employee_count=120, revenue_usd=12_500_000.0,
+        website=f"https://company{i}.example", tech_stack=["HubSpot", "Slack"],
+        funding_stage="Series A", founded_year=2015, source="synthetic", discovered_at=now,
+    )
+
+
+def _scored_fields(i: int, now: datetime) -> dict:
+    return dict(
+        lead_id=f"l-{i:08x}", score=72.5,
+        score_breakdown=build(ScoreBreakdown, icp_fit=80.0, behavioral=60.0, tech_gap=70.0,
+                              engagement=55.0, reasons=["Strong revenue fit"]),
+        qualification_status=QualificationStatus.NURTURE, budget_signal=True,
+        authority_signal=True, need_signal=False, timeline_signal=False,
+        deal_stage="Discovery", scored_at=now,
+    )
+
+
+def _event_fields(i: int, now: datetime) -> dict:
+    return dict(
+        event_id=f"e-{i:08x}", lead_id=f"l-{i:08x}", channel=OutreachChannel.EMAIL,
+        sequence_step=1, subject="Quick question", body="Hi there",
+        status=OutreachStatus.SENT, sent_at=now,
+    )
+
+
+def _company_row(i: int, now: str) -> dict:
+    return {
+        "company_id": f"c-{i:08x}", "name": f"Company {i}", "industry": "SaaS / Software",
+        "country": "US", "state": "CA", "employee_count": 120, "revenue_usd": 12_500_000.0,
+        "website": "", "tech_stack": json.dumps(["HubSpot", "Slack"]), "funding_stage": "",
+        "founded_year": 2015, "cnpj": None, "cnae_code": None, "source": "synthetic",
+        "discovered_at": now,
+    }
+
+
+def _time(fn, records: int, trusted: bool = True, repeat: int = 3) -> float:
+    """Best-of-``repeat`` seconds to call ``fn(i)`` for every record index."""
+    original = settings.trusted_construction
+    settings.trusted_construction = trusted
+    try:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for i in range(records):
+                fn(i)
+            best = min(best, time.perf_counter() - start)
+        return best
+    finally:
+        settings.trusted_construction = original
+
+
+def run(records: int) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
+    # The row mapper only reads its argument; no connection is needed.
+    mapper = Database._row_to_company.__get__(object.__new__(Database))
+    rows = [_company_row(i, now_iso) for i in range(records)]
+
+    results = []
+    for model, fields in [
+        (Company, _company_fields),
+        (ScoredLead, _scored_fields),
+        (OutreachEvent, _event_fields),
+    ]:
+        results.append({
+            "case": model.__name__,
+            "records": records,
+            "validated_s": _time(lambda i: build(model, **fields(i, now)), records, trusted=False),
+            "model_construct_s": _time(lambda i: model.model_construct(**fields(i, now)), records),
+            "trusted_s": _time(lambda i: build(model, **fields(i, now)), records),
+        })
+    results.append({
+        "case": "_row_to_company",
+        "records": records,
+        "validated_s": _time(lambda i: mapper(rows[i]), records, trusted=False),
+        "model_construct_s": None,
+        "trusted_s": _time(lambda i: mapper(rows[i]), records),
+    })
+    for r in results:
+        r["speedup"] = r["validated_s"] / r["trusted_s"]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000, help="Models built per case")
+    args = parser.parse_args()
+
+    print(f"{'case':<16} {'records':>8} {'validated s':>12} {'construct s':>12} {'trusted s':>10} {'speedup':>8}")
+    print("─" * 71)
+    for r in run(args.records):
+        construct = f"{r['model_construct_s']:>12.3f}" if r["model_construct_s"] else f"{'—':>12}"
+        print(
+            f"{r['case']:<16} {r['records']:>8,} {r['validated_s']:>12.3f} {construct} "
+            f"{r['trusted_s']:>10.3f} {r['speedup']:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
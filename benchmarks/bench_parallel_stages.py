@@ -0,0 +1,94 @@
+"""
+B2B Lead Engine — Parallel Stage Scaling Benchmark
+
+Times enrichment + scoring through ``StageExecutor`` at 1, 2, 4 and 8
+worker processes over a TAM built by replicating the seed data, and
+checks every run produced the same leads as the single-worker run.
+
+Usage:
+    python -m benchmarks.bench_parallel_stages --copies 100 --chunk-size 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import time
+
+from src.config.icp_loader import load_icp_config
+from src.config.settings import settings
+from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+from src.orchestration.parallel import DEFAULT_CHUNK_SIZE, StageExecutor
+
+VOLATILE = {"lead_id", "enriched_at", "scored_at", "enriched_lead"}
+
+
+def build_tam(copies: int):
+    """Replicate the seed TAM ``copies`` times under fresh company/contact ids."""
+    seed_companies = generate_seed_companies()
+    seed_contacts = generate_seed_contacts(seed_companies)
+    companies, contacts = [], []
+    for k in range(copies):
+        for c in seed_companies:
+            companies.append(c.model_copy(update={"company_id": f"{c.company_id}-{k}"}))
+        for ct in seed_contacts:
+            contacts.append(ct.model_copy(update={
+                "contact_id": f"{ct.contact_id}-{k}",
+                "company_id": f"{ct.company_id}-{k}",
+            }))
+    return companies, contacts
+
+
+def _fingerprint(scored) -> str:
+    digest = hashlib.sha256()
+    for lead in scored:
+        digest.update(repr(lead.model_dump(exclude=VOLATILE)).encode())
+        digest.update(lead.enriched_lead.contact_id.encode())
+    return digest.hexdigest()[:16]
+
+
+def run(copies: int, chunk_size: int, worker_counts: list[int]) -> list[dict]:
+    icp_config = load_icp_config(settings.icp_config_path)
+    companies, contacts = build_tam(copies)
+
+    results = []
+    baseline = None
+    for workers in worker_counts:
+        with StageExecutor(workers=workers, chunk_size=chunk_size) as executor:
+            start = time.perf_counter()
+            _, scored = executor.enrich_and_score(companies, contacts, icp_config, seed=42)
+            elapsed = time.perf_counter() - start
+        fingerprint = _fingerprint(scored)
+        if baseline is None:
+            baseline = {"seconds": elapsed, "fingerprint": fingerprint}
+        results.append({
+            "workers": workers,
+            "leads": len(scored),
+            "seconds": round(elapsed, 3),
+            "leads_per_sec": round(len(scored) / elapsed),
+            "speedup": round(baseline["seconds"] / elapsed, 2),
+            "identical": fingerprint == baseline["fingerprint"],
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--copies", type=int, default=100, help="Seed TAM replicas (150 companies each)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'workers':>7} {'leads':>8} {'seconds':>9} {'leads/sec':>10} {'speedup':>8} {'identical':>10}")
+    print("─" * 58)
+    for r in run(args.copies, args.chunk_size, args.workers):
+        print(
+            f"{r['workers']:>7} {r['leads']:>8,} {r['seconds']:>9.3f} {r['leads_per_sec']:>10,} "
+            f"{r['speedup']:>7.2f}x {str(r['identical']):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
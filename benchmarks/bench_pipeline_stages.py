@@ -0,0 +1,259 @@
+"""
+B2B Lead Engine — Pipeline Stage Benchmark
+
+Runs every pipeline stage in isolation over synthetic TAMs of several
+sizes and records wall time, rows/sec and peak traced memory per stage.
+Results can be saved as a JSON baseline and later runs compared against
+it; ``tests/test_benchmarks.py`` does that comparison under the opt-in
+``benchmark`` pytest marker.
+
+Each size runs the stage chain twice: once plainly for timings, once
+under ``tracemalloc`` for peak memory (tracing slows allocation-heavy
+stages too much to time them at the same time).
+
+Usage:
+    python -m benchmarks.bench_pipeline_stages --sizes 1000 10000 100000
+    python -m benchmarks.bench_pipeline_stages --sizes 1000 5000 --save-baseline
+    python -m benchmarks.bench_pipeline_stages --compare --max-regression 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from src.config.icp_loader import load_icp_config
+from src.config.settings import settings
+from src.crm.crm_sync import CRMSync
+from src.database.database import Database
+from src.database.synthetic import generate_synthetic_tam
+from src.discovery.discovery import DiscoveryEngine
+from src.orchestration.parallel import StageExecutor
+from src.orchestration.streaming import is_enrichable
+from src.outreach.outreach import OutreachEngine
+from src.scoring.deal_brief import DealBriefGenerator
+
+STAGES = (
+    "discovery", "enrichment", "scoring", "deal_brief", "outreach", "crm_sync", "persistence",
+)
+
+DEFAULT_SIZES = [1_000, 10_000, 50_000]
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+# Allowed slowdown before a stage counts as regressed, in percent
+DEFAULT_MAX_REGRESSION = 25.0
+
+# Increases smaller than these are noise, whatever the percentage
+MIN_REGRESSION_SECONDS = 0.05
+MIN_REGRESSION_MB = 1.0
+
+
+# ── Stage Chain ───────────────────────────────────────
+
+
+def _stage_chain(n_companies: int, seed: int, record: Callable[[str, int, Callable], object]):
+    """
+    Run the stages in pipeline order, passing each through ``record(stage,
+    rows_in, fn)``, which calls ``fn`` and returns its output.
+    """
+    icp_config = load_icp_config(settings.icp_config_path)
+    tam = generate_synthetic_tam(n_companies, seed=seed)
+    ((companies, contacts),) = tam.batches(batch_size=max(n_companies, 1))
+
+    discovery = DiscoveryEngine(icp_config)
+    discovered, discovered_contacts = record(
+        "discovery", len(companies), lambda: discovery.discover(companies, contacts),
+    )
+
+    selected = {c.company_id for c in discovered if is_enrichable(c, seed)}
+    enrichable = [c for c in discovered_contacts if c.company_id in selected]
+    with StageExecutor() as executor:
+        enriched = record(
+            "enrichment", len(enrichable),
+            lambda: executor.enrich(discovered, enrichable, seed=seed),
+        )
+        scored = record("scoring", len(enriched), lambda: executor.score(icp_config, enriched))
+
+    eligible = [l for l in scored if l.qualification_status.value in ("qualified", "nurture")]
+
+    def write_briefs():
+        generator = DealBriefGenerator()
+        for lead in eligible:
+            lead.deal_brief = generator.generate_brief(lead).to_text()
+        return eligible
+
+    record("deal_brief", len(eligible), write_briefs)
+    outreach = OutreachEngine(seed)
+    events = record("outreach", len(eligible), lambda: outreach.generate_sequences(eligible))
+    crm = CRMSync()
+    record("crm_sync", len(eligible), lambda: crm.sync_leads(eligible, events))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / "bench.db"))
+
+        def persist():
+            db.insert_companies(companies)
+            db.insert_contacts(contacts)
+            db.insert_enriched_leads(enriched)
+            db.insert_scored_leads(scored)
+            db.insert_outreach_events(events)
+
+        rows = len(companies) + len(contacts) + len(enriched) + len(scored) + len(events)
+        record("persistence", rows, persist)
+        db.close()
+
+
+def run_size(n_companies: int, seed: int = 42) -> list[dict]:
+    """
+    Time, throughput and peak memory of every stage at one TAM size.
+
+    Peak memory is what the stage allocated on top of the memory already
+    live when it started, so it does not include upstream outputs.
+    """
+    results: dict[str, dict] = {}
+
+    def timed(stage: str, rows: int, fn: Callable):
+        start = time.perf_counter()
+        output = fn()
+        seconds = time.perf_counter() - start
+        results[stage] = {
+            "size": n_companies,
+            "stage": stage,
+            "rows": rows,
+            "seconds": round(seconds, 4),
+            "rows_per_sec": round(rows / seconds, 1) if seconds else 0.0,
+        }
+        return output
+
+    def traced(stage: str, rows: int, fn: Callable):
+        tracemalloc.reset_peak()
+        live = tracemalloc.get_traced_memory()[0]
+        output = fn()
+        peak = tracemalloc.get_traced_memory()[1] - live
+        results[stage]["peak_memory_mb"] = round(peak / 2**20, 2)
+        return output
+
+    _stage_chain(n_companies, seed, timed)
+    tracemalloc.start()
+    try:
+        _stage_chain(n_companies, seed, traced)
+    finally:
+        tracemalloc.stop()
+    return [results[stage] for stage in STAGES]
+
+
+def run(sizes: list[int], seed: int = 42) -> list[dict]:
+    return [row for size in sizes for row in run_size(size, seed)]
+
+
+# ── Baselines ─────────────────────────────────────────
+
+
+def save_baseline(results: list[dict], path: str | Path = DEFAULT_BASELINE, seed: int = 42):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": seed,
+        "results": results,
+    }, indent=2) + "\n")
+
+
+def load_baseline(path: str | Path = DEFAULT_BASELINE) -> dict:
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"No benchmark baseline at {path}; create one with "
+            "python -m benchmarks.bench_pipeline_stages --save-baseline"
+        )
+    return json.loads(path.read_text())
+
+
+def baseline_sizes(baseline: dict) -> list[int]:
+    return sorted({row["size"] for row in baseline["results"]})
+
+
+def compare(
+    results: list[dict],
+    baseline: dict,
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+    min_seconds: float = MIN_REGRESSION_SECONDS,
+) -> list[str]:
+    """
+    Describe every (size, stage) whose time or peak memory grew by more
+    than ``max_regression`` percent over the baseline. Empty means no
+    regressions. Increases under ``min_seconds`` / ``MIN_REGRESSION_MB``
+    are ignored.
+    """
+    expected = {(row["size"], row["stage"]): row for row in baseline["results"]}
+    regressions = []
+    for row in results:
+        base = expected.get((row["size"], row["stage"]))
+        if base is None:
+            continue
+        limit = 1 + max_regression / 100
+        label = f"{row['stage']} @ {row['size']:,}"
+        if row["seconds"] > base["seconds"] * limit and row["seconds"] - base["seconds"] >= min_seconds:
+            regressions.append(
+                f"{label}: {row['seconds']:.3f}s vs baseline {base['seconds']:.3f}s "
+                f"(+{(row['seconds'] / base['seconds'] - 1) * 100:.0f}%)"
+            )
+        memory, base_memory = row.get("peak_memory_mb"), base.get("peak_memory_mb")
+        if (memory is not None and base_memory and memory > base_memory * limit
+                and memory - base_memory >= MIN_REGRESSION_MB):
+            regressions.append(
+                f"{label}: peak {memory:.1f} MB vs baseline {base_memory:.1f} MB "
+                f"(+{(memory / base_memory - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", help=f"TAM sizes (default {DEFAULT_SIZES}, "
+                        "or the baseline's sizes with --compare)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="Overwrite the baseline")
+    parser.add_argument("--compare", action="store_true", help="Exit 1 on regressions")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                        help="Allowed slowdown / memory growth in percent")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline) if args.compare else None
+    sizes = args.sizes or (baseline_sizes(baseline) if baseline else DEFAULT_SIZES)
+    results = run(sizes, args.seed)
+
+    print(f"{'size':>8} {'stage':<12} {'rows':>9} {'seconds':>9} {'rows/sec':>11} {'peak MB':>9}")
+    print("─" * 63)
+    for r in results:
+        print(
+            f"{r['size']:>8,} {r['stage']:<12} {r['rows']:>9,} {r['seconds']:>9.3f} "
+            f"{r['rows_per_sec']:>11,.0f} {r['peak_memory_mb']:>9.1f}"
+        )
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline, args.seed)
+        print(f"\nBaseline written to {args.baseline}")
+    if baseline:
+        regressions = compare(results, baseline, args.max_regression)
+        print()
+        for line in regressions or ["No regressions."]:
+            print(line)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+B2B Lead Engine — Query Cache Benchmark
+
+Times the cached read methods on a cache miss (the query runs and its rows
+are decoded), on a cache hit (the stored snapshot is returned), and the
+deep copy of the same result that every hit used to pay. A hit should cost
+a small fraction of a miss, even for large lead pages.
+
+Usage:
+    python -m benchmarks.bench_query_cache --companies 5000 --limit 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import tempfile
+import time
+from pathlib import Path
+
+from src.database.database import Database
+from src.database.synthetic import generate_synthetic_tam
+from src.pipeline import run_pipeline
+
+DEFAULT_COMPANIES = 5_000
+DEFAULT_LIMIT = 500
+
+
+def _reads(limit: int) -> dict:
+    return {
+        "search_leads": lambda db: db.search_leads(limit=limit),
+        "get_scored_leads": lambda db: db.get_scored_leads(limit=limit),
+        "get_companies": lambda db: db.get_companies(limit=limit),
+        "get_pipeline_stats": lambda db: db.get_pipeline_stats(),
+    }
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(companies: int = DEFAULT_COMPANIES, limit: int = DEFAULT_LIMIT, repeat: int = 20) -> list[dict]:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "bench_cache.db")
+        run_pipeline(db_path=db_path, verbose=False, streaming=True,
+                     tam=generate_synthetic_tam(companies).batches())
+        uncached = Database(db_path, cache_size=0)
+        cached = Database(db_path, cache_size=64)
+        for name, read in _reads(limit).items():
+            result = read(cached)  # fills the cache
+            rows.append({
+                "read": name,
+                "rows": len(result),
+                "miss_ms": round(_best_of(lambda: read(uncached), repeat) * 1000, 3),
+                "hit_ms": round(_best_of(lambda: read(cached), repeat) * 1000, 3),
+                "deepcopy_ms": round(_best_of(lambda: copy.deepcopy(result), repeat) * 1000, 3),
+            })
+        uncached.close()
+        cached.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--companies", type=int, default=DEFAULT_COMPANIES,
+                        help="Synthetic TAM size the database is built from")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Rows per page read")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per read (best kept)")
+    args = parser.parse_args()
+
+    print(f"{'read':<20} {'rows':>6} {'miss ms':>9} {'hit ms':>9} {'deepcopy ms':>12} {'speedup':>8}")
+    print("─" * 68)
+    for r in run(args.companies, args.limit, args.repeat):
+        speedup = r["miss_ms"] / max(r["hit_ms"], 1e-6)
+        print(f"{r['read']:<20} {r['rows']:>6} {r['miss_ms']:>9.3f} {r['hit_ms']:>9.3f} "
+              f"{r['deepcopy_ms']:>12.3f} {speedup:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
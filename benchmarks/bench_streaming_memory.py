@@ -0,0 +1,111 @@
+"""
+B2B Lead Engine — Streaming Memory Benchmark
+
+Runs the full pipeline in list mode and in streaming mode over TAMs of
+growing size (replicas of the seed data, generated lazily) and reports peak
+RSS and peak traced Python allocations. Each run happens in a fresh
+subprocess so peak RSS is not inherited from earlier runs. In streaming
+mode the peak should stay roughly flat as the TAM grows.
+
+Usage:
+    python -m benchmarks.bench_streaming_memory --copies 10 50 200 --batch-size 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Iterator
+
+from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+from src.orchestration.streaming import TAMBatch
+from src.pipeline import run_pipeline
+
+
+def replicated_tam(copies: int) -> Iterator[TAMBatch]:
+    """Yield the seed TAM ``copies`` times under fresh ids, one replica at a time."""
+    seed_companies = generate_seed_companies()
+    seed_contacts = generate_seed_contacts(seed_companies)
+    for k in range(copies):
+        yield (
+            [c.model_copy(update={"company_id": f"{c.company_id}-{k}"}) for c in seed_companies],
+            [
+                ct.model_copy(update={
+                    "contact_id": f"{ct.contact_id}-{k}",
+                    "company_id": f"{ct.company_id}-{k}",
+                })
+                for ct in seed_contacts
+            ],
+        )
+
+
+def measure(mode: str, copies: int, batch_size: int) -> dict:
+    """Run one pipeline in this process and report its peak memory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = run_pipeline(
+            db_path=str(Path(tmp) / "bench.db"),
+            verbose=False,
+            streaming=mode == "streaming",
+            batch_size=batch_size,
+            tam=replicated_tam(copies),
+        )
+        elapsed = time.perf_counter() - start
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    # ru_maxrss is KiB on Linux
+    return {
+        "mode": mode,
+        "companies": copies * len(generate_seed_companies()),
+        "leads_scored": result.leads_scored,
+        "seconds": round(elapsed, 2),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "peak_traced_mb": round(traced_peak / 2**20, 1),
+    }
+
+
+def run(copy_counts: list[int], batch_size: int) -> list[dict]:
+    results = []
+    for copies in copy_counts:
+        for mode in ("list", "streaming"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_streaming_memory",
+                 "--child", mode, "--copies", str(copies), "--batch-size", str(batch_size)],
+                check=True, capture_output=True, text=True,
+            )
+            results.append(json.loads(out.stdout))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--copies", type=int, nargs="+", default=[10, 50, 200],
+                        help="Seed TAM replicas (150 companies each)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Companies per streamed batch")
+    parser.add_argument("--child", choices=["list", "streaming"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.copies[0], args.batch_size)))
+        return
+
+    print(f"{'mode':<10} {'companies':>10} {'scored':>8} {'seconds':>8} {'peak RSS MB':>12} {'traced MB':>10}")
+    print("─" * 63)
+    for r in run(args.copies, args.batch_size):
+        print(
+            f"{r['mode']:<10} {r['companies']:>10,} {r['leads_scored']:>8,} {r['seconds']:>8.2f} "
+            f"{r['peak_rss_mb']:>12.1f} {r['peak_traced_mb']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
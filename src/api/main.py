@@ -2,6 +2,10 @@
 B2B Lead Engine — FastAPI Application
 
 REST API for lead scoring, listing, and deal brief retrieval.
+
+The list endpoints return a plain JSON list. When more rows follow, the
+cursor for the next page is in the ``X-Next-Cursor`` response header;
+pass it back as ``?cursor=``.
 """
 
 from __future__ import annotations
@@ -10,7 +14,7 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 from pydantic import BaseModel
 
 from src.config.settings import settings
@@ -27,11 +31,13 @@ _icp_config = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup."""
+    """Initialize database on startup and release its connections on shutdown."""
     global _db, _icp_config
     _db = Database(settings.database_path)
     _icp_config = load_icp_config(settings.icp_config_path)
     yield
+    _db.close()
+    _db = None
 
 
 # ── App Instance ──────────────────────────────────────
@@ -89,6 +95,15 @@ class HealthResponse(BaseModel):
 
 # ── Endpoints ─────────────────────────────────────────
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _set_next_cursor(response: Response, next_cursor: Optional[str]):
+    """Point the client at the next page, if there is one."""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
 @app.get("/", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
@@ -101,13 +116,20 @@ async def health_check():
 
 @app.get("/companies", response_model=list[CompanyResponse])
 async def list_companies(
+    response: Response,
     limit: int = Query(default=50, le=500),
+    cursor: Optional[str] = Query(default=None, description="X-Next-Cursor from the previous page"),
 ):
-    """List discovered companies."""
+    """List discovered companies, newest first, one page at a time."""
     if not _db:
         raise HTTPException(status_code=503, detail="Database not initialized")
 
-    companies = _db.get_companies(limit=limit)
+    try:
+        companies, next_cursor = _db.get_companies_page(limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    _set_next_cursor(response, next_cursor)
     return [
         CompanyResponse(
             company_id=c.company_id,
@@ -128,14 +150,21 @@ async def list_companies(
 
 @app.get("/leads", response_model=list[ScoredLeadResponse])
 async def list_scored_leads(
+    response: Response,
     status: Optional[str] = Query(default=None, description="Filter by status: qualified, nurture, disqualified"),
     limit: int = Query(default=50, le=500),
+    cursor: Optional[str] = Query(default=None, description="X-Next-Cursor from the previous page"),
 ):
-    """List scored leads with optional status filter."""
+    """List scored leads by score with optional status filter, one page at a time."""
     if not _db:
         raise HTTPException(status_code=503, detail="Database not initialized")
 
-    leads = _db.get_scored_leads(status=status, limit=limit)
+    try:
+        leads, next_cursor = _db.get_scored_leads_page(status=status, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    _set_next_cursor(response, next_cursor)
     return [
         ScoredLeadResponse(
             lead_id=l.lead_id,
@@ -157,18 +186,12 @@ async def get_deal_brief(lead_id: str):
     if not _db:
         raise HTTPException(status_code=503, detail="Database not initialized")
 
-    leads = _db.get_scored_leads(limit=500)
-    lead = next((l for l in leads if l.lead_id == lead_id), None)
+    brief = _db.get_brief_by_id(lead_id)
 
-    if not lead:
+    if not brief:
         raise HTTPException(status_code=404, detail=f"Lead {lead_id} not found")
 
-    return {
-        "lead_id": lead.lead_id,
-        "score": lead.score,
-        "deal_brief": lead.deal_brief,
-        "deal_stage": lead.deal_stage,
-    }
+    return brief
 
 
 @app.get("/stats", response_model=PipelineStatsResponse)
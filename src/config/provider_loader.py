@@ -0,0 +1,76 @@
+"""
+B2B Lead Engine — Provider Mapping Loader
+
+Loads and validates the declarative column mappings that turn a data
+provider's bulk export into Company and Contact rows.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+from pydantic import BaseModel, model_validator
+
+
+# ── Provider Pydantic Models ─────────────────────────
+
+
+class EntityMapping(BaseModel):
+    columns: dict[str, str] = {}     # model field → provider column
+    constants: dict[str, Any] = {}   # model field → value for every row
+
+
+class ProviderMapping(BaseModel):
+    name: str
+    format: Optional[str] = None     # csv | jsonl | parquet; default from the file extension
+    delimiter: str = ","
+    revenue_currency: str = "USD"
+    revenue_currency_column: Optional[str] = None
+    list_separator: str = ";"
+    company: EntityMapping
+    contact: Optional[EntityMapping] = None
+
+    @model_validator(mode="after")
+    def _requires_names(self) -> ProviderMapping:
+        if "name" not in self.company.columns and "name" not in self.company.constants:
+            raise ValueError(f"{self.name}: the company mapping must map 'name'")
+        if self.contact is not None and "full_name" not in self.contact.columns:
+            raise ValueError(f"{self.name}: the contact mapping must map 'full_name'")
+        return self
+
+    def source_columns(self) -> set[str]:
+        """Every provider column the mapping reads."""
+        columns = set(self.company.columns.values())
+        if self.contact is not None:
+            columns |= set(self.contact.columns.values())
+        if self.revenue_currency_column:
+            columns.add(self.revenue_currency_column)
+        return columns
+
+
+class ProviderConfig(BaseModel):
+    version: str = "1.0"
+    providers: dict[str, ProviderMapping] = {}
+
+
+# ── Loader ────────────────────────────────────────────
+
+
+def load_provider_config(config_path: str | Path) -> ProviderConfig:
+    """
+    Load and validate provider mappings from a YAML file.
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+        ValidationError: If a mapping is invalid
+    """
+    config_path = Path(config_path)
+    if not config_path.exists():
+        raise FileNotFoundError(f"Provider config not found: {config_path}")
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f)
+
+    return ProviderConfig(**raw)
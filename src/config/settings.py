@@ -22,12 +22,123 @@ class Settings(BaseSettings):
         default=str(PROJECT_ROOT / "data" / "lead_engine.db"),
         description="Path to SQLite database file",
     )
+    database_pool_size: int = Field(
+        default=5,
+        description="Pooled SQLite connections per Database (0 disables pooling)",
+    )
+    database_cache_size: int = Field(
+        default=0,
+        description="LRU query-result cache entries per Database (0 disables caching)",
+    )
+
+    # ── Models ────────────────────────────────────────
+    trusted_construction: bool = Field(
+        default=False,
+        description="Build models from internal data with model_construct, skipping "
+                    "validation (slower than validating on pydantic 2)",
+    )
+
+    # ── Pipeline Execution ────────────────────────────
+    pipeline_workers: int = Field(
+        default=1,
+        description="Worker processes for enrichment and scoring (1 = in-process)",
+    )
+    pipeline_chunk_size: int = Field(
+        default=250,
+        description="Leads per parallel task; a throughput knob, results depend on neither it nor worker count",
+    )
+    pipeline_batch_size: int = Field(
+        default=500,
+        description="Companies per batch in streaming mode; bounds peak memory",
+    )
+    pipeline_queue_size: int = Field(
+        default=2,
+        description="Batches buffered between stage threads in pipelined mode",
+    )
+    pipeline_checkpoints: bool = Field(
+        default=False,
+        description="Persist stage outputs so a failed run can be resumed",
+    )
+    checkpoint_dir: str = Field(
+        default=str(PROJECT_ROOT / "data" / "runs"),
+        description="Directory holding one checkpoint subdirectory per run",
+    )
+    checkpoint_batch_size: int = Field(
+        default=5000,
+        description="Leads per committed enrichment batch",
+    )
+    pipeline_trace_memory: bool = Field(
+        default=False,
+        description="Record peak tracemalloc memory per stage (adds overhead)",
+    )
+
+    # ── Deduplication ─────────────────────────────────
+    dedup_bloom_capacity: int = Field(
+        default=1_000_000,
+        description="Natural keys the dedup Bloom filter is sized for (grows when exceeded)",
+    )
+    dedup_bloom_error_rate: float = Field(
+        default=0.01,
+        description="Target false-positive rate of the dedup Bloom filter",
+    )
+
+    # ── Entity Resolution ─────────────────────────────
+    resolution_threshold: float = Field(
+        default=0.8,
+        description="Match score at which two company records are merged",
+    )
+    resolution_num_perm: int = Field(
+        default=32,
+        description="MinHash values per company name signature",
+    )
+    resolution_bands: int = Field(
+        default=8,
+        description="LSH bands the signature is split into (must divide num_perm)",
+    )
+    resolution_window: int = Field(
+        default=10,
+        description="Records paired with each record of an LSH bucket, in bucket order",
+    )
+
+    # ── Daemon ────────────────────────────────────────
+    daemon_max_batch_items: int = Field(
+        default=200,
+        description="Queue items (companies) per daemon micro-batch",
+    )
+    daemon_max_wait_seconds: float = Field(
+        default=1.0,
+        description="Longest a daemon micro-batch waits to fill after its first item",
+    )
+    daemon_max_attempts: int = Field(
+        default=3,
+        description="Times a queue item is tried before a failing batch parks it as failed",
+    )
+    daemon_poll_interval: float = Field(
+        default=0.2,
+        description="Seconds between queue polls while the daemon is idle",
+    )
+    spool_dir: str = Field(
+        default=str(PROJECT_ROOT / "data" / "spool"),
+        description="NDJSON spool directory the daemon watches with --spool",
+    )
 
     # ── ICP Config ────────────────────────────────────
     icp_config_path: str = Field(
         default=str(PROJECT_ROOT / "config" / "icp_config.yaml"),
         description="Path to ICP configuration YAML",
     )
+    provider_config_path: str = Field(
+        default=str(PROJECT_ROOT / "config" / "providers.yaml"),
+        description="Path to the provider column mappings YAML",
+    )
+    brl_usd_rate: float = Field(
+        default=0.18,
+        description="USD per BRL, used to normalize BRL revenue and ICP revenue bounds",
+    )
+    import_chunk_size: int = Field(
+        default=50_000,
+        description="Rows per chunk when importing provider files",
+    )
 
     # ── API Keys (optional — mock providers used if empty) ──
     apollo_api_key: str = Field(default="", description="Apollo.io API key")
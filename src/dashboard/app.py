@@ -143,6 +143,11 @@ def get_sim_data():
 # ── Helpers ───────────────────────────────────────────
 FLAGS = {"US":"🇺🇸","BR":"🇧🇷","UK":"🇬🇧","DE":"🇩🇪","FR":"🇫🇷","IL":"🇮🇱","SG":"🇸🇬",
          "AU":"🇦🇺","CA":"🇨🇦","NL":"🇳🇱","SE":"🇸🇪","IN":"🇮🇳","JP":"🇯🇵","KR":"🇰🇷"}
+# search_leads projections: table views skip the JSON and deal-brief columns
+TABLE_COLS = ["qualification_status","company_name","contact_name","contact_title","email",
+              "country","industry","revenue_usd","deal_stage",
+              "budget_signal","authority_signal","need_signal","timeline_signal"]
+PICKER_COLS = ["company_name","contact_name"]
 PL = dict(plot_bgcolor="rgba(0,0,0,0)",paper_bgcolor="rgba(0,0,0,0)",
           font=dict(color="#94a3b8",family="Inter",size=11),margin=dict(l=40,r=20,t=36,b=40),
           hoverlabel=dict(bgcolor="#f8fafc",font=dict(size=12,family="Inter",color="#0f172a"),bordercolor="#cbd5e1"))
@@ -951,7 +956,8 @@ def render_generate_leads(db,stats):
         employees_min=emp[0] if emp[0]>0 else None,employees_max=emp[1] if emp[1]<5000 else None,
         seniorities=fsen,sources=fsrc,
         bant_budget=True if bb else None,bant_authority=True if ba else None,
-        bant_need=True if bn else None,bant_timeline=True if bt else None,limit=500)
+        bant_need=True if bn else None,bant_timeline=True if bt else None,limit=500,
+        columns=TABLE_COLS)
 
     st.divider()
     rc1,rc2,rc3,rc4 = st.columns(4)
@@ -1018,14 +1024,16 @@ def render_lead_intelligence(db,stats):
         li_rep = st.selectbox("👤 Sales Rep", ["All Reps"] + SDR_NAMES, key="li_rep")
     results = db.search_leads(text_query=search,markets=fmc,industries=fi,
         score_min=scr[0] if scr[0]>0 else None,score_max=scr[1] if scr[1]<100 else None,
-        statuses=fst,seniorities=fsen,limit=200)
+        statuses=fst,seniorities=fsen,limit=200,columns=TABLE_COLS)
 
-    # Assign reps deterministically based on lead_id so they don't change on filter
+    # Assign reps deterministically based on lead_id so they don't change on filter.
+    # Rows may be shared through the query cache, so they are copied, not edited.
     if results:
-        for r in results:
-            # Create a simple numeric hash from the lead_id string
-            hash_val = sum(ord(c) for c in r["lead_id"])
-            r["assigned_rep"] = SDR_NAMES[hash_val % len(SDR_NAMES)]
+        results = [
+            # A simple numeric hash of the lead_id string picks the rep
+            {**r, "assigned_rep": SDR_NAMES[sum(ord(c) for c in r["lead_id"]) % len(SDR_NAMES)]}
+            for r in results
+        ]
         if li_rep != "All Reps":
             results = [r for r in results if r["assigned_rep"] == li_rep]
 
@@ -1072,12 +1080,16 @@ def render_lead_intelligence(db,stats):
 def render_sales_navigator(db,stats):
     st.markdown(f"## {t('page_navigator')}")
     st.caption(t("nav_caption"))
-    leads=db.search_leads(limit=500)
+    leads=db.search_leads(limit=500,columns=PICKER_COLS)
     if not leads: st.warning("No scored leads."); return
     opts={f"{score_text(l['score'])} {l['company_name']} — {l['contact_name']}":l["lead_id"] for l in leads}
 
     # Check if a lead was opened from Lead Intelligence
     pre_selected_id = st.session_state.get("open_lead_id", None)
+    # Leads outside the top 500 are still reachable by direct lookup
+    if pre_selected_id and pre_selected_id not in opts.values():
+        pre = db.get_lead_by_id(pre_selected_id)
+        if pre: opts={f"{score_text(pre['score'])} {pre['company_name']} — {pre['contact_name']}":pre["lead_id"], **opts}
 
     # Lead Selection Filters (moved to main column from sidebar)
     st.markdown("### 🧭 Select Lead")
@@ -1099,7 +1111,7 @@ def render_sales_navigator(db,stats):
         sel_label = st.selectbox("Choose", list(filtered.keys()), index=default_idx, label_visibility="collapsed")
     
     sel_id = filtered[sel_label]
-    lead=db.get_lead_detail(sel_id)
+    lead=db.get_lead_by_id(sel_id)
     if not lead: st.error("Not found."); return
 
     # Assign rep deterministically based on lead_id string sum
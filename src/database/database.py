@@ -7,13 +7,25 @@ MVP uses SQLite; designed for easy migration to BigQuery/Snowflake.
 
 from __future__ import annotations
 
+import base64
+import binascii
+import functools
+import inspect
 import json
+import queue
+import re
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+from uuid import uuid4
 
+from src.config.settings import settings
+from src.database.lazy_row import LazyRow
+from src.database.query_cache import MISSING, QueryCache, freeze
 from src.models.models import (
     Company,
     Contact,
@@ -23,22 +35,326 @@ from src.models.models import (
     QualificationStatus,
     OutreachChannel,
     OutreachStatus,
+    StageMetrics,
+    build,
 )
 
 
+# Rows per transaction for the bulk writers. Large enough to amortize the
+# commit (fsync) cost, small enough to keep each transaction short.
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _batched(iterable: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of at most ``size`` items from any iterable."""
+    if size < 1:
+        raise ValueError("batch_size must be >= 1")
+    it = iter(iterable)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def encode_cursor(*values) -> str:
+    """Encode a keyset position (the sort key of the last row) as an opaque token."""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """Decode a token from ``encode_cursor``; raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return values
+
+
+class ConnectionPool:
+    """
+    Checkout/return pool of SQLite connections.
+
+    Connections are opened lazily up to ``size`` and configured once when
+    opened (row factory + pragmas), so a checkout costs a queue operation
+    instead of a file open. ``size=0`` disables pooling: every checkout
+    opens a fresh connection and every return closes it.
+    """
+
+    def __init__(self, db_path: str, size: int, timeout: float = 30.0):
+        if size < 0:
+            raise ValueError("pool size must be >= 0")
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        if self.size == 0:
+            return self._open()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                return self._open()
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No SQLite connection available after {self.timeout}s "
+                f"(pool size {self.size})"
+            ) from None
+
+    def release(self, conn: sqlite3.Connection):
+        if self.size == 0 or self._closed:
+            conn.close()
+        else:
+            self._idle.put(conn)
+
+    def close(self):
+        """Close all idle connections; checked-out ones close on release."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+# ── Incremental Stats Triggers ────────────────────────
+#
+# pipeline_stats holds one counter per (metric, dimension). Triggers on every
+# pipeline table apply each row's contribution with sign +1 on insert and -1
+# on delete; stats_company_rollup tracks per-company contact / enriched /
+# qualified counts so the distinct-company funnel metrics stay incremental.
+
+_STATS_TABLES = {
+    "dim_companies": "company_id",
+    "dim_contacts": "contact_id",
+    "fct_enriched_leads": "lead_id",
+    "fct_scored_leads": "lead_id",
+    "fct_outreach_events": "event_id",
+}
+
+
+def _stat_delta(metric: str, amount, dimension: str = "''", tables: str = "", where: str = "1"):
+    return (
+        "INSERT INTO pipeline_stats (metric, dimension, value)",
+        f"'{metric}', {dimension}, {amount}",
+        tables,
+        where,
+        "ON CONFLICT (metric, dimension) DO UPDATE SET value = value + excluded.value",
+    )
+
+
+def _rollup_delta(company_id: str, contacts=0, enriched=0, qualified=0, where: str = "1"):
+    return (
+        "INSERT INTO stats_company_rollup (company_id, contacts, enriched, qualified)",
+        f"{company_id}, {contacts}, {enriched}, {qualified}",
+        "",
+        f"({where}) AND {company_id} IS NOT NULL",
+        "ON CONFLICT (company_id) DO UPDATE SET "
+        "contacts = contacts + excluded.contacts, "
+        "enriched = enriched + excluded.enriched, "
+        "qualified = qualified + excluded.qualified",
+    )
+
+
+def _stats_deltas(table: str, r: str, sign: int) -> list[tuple]:
+    """Counter updates contributed by row ``r`` of ``table``, applied with ``sign``."""
+    # Rollup value a company must have *before* this change for a
+    # distinct-company counter to flip (0 -> 1 on insert, 1 -> 0 on delete).
+    prior = 0 if sign > 0 else 1
+    deltas = [_stat_delta("rows", sign, f"'{table}'")]
+
+    if table == "dim_companies":
+        deltas += [
+            _stat_delta("industry", sign, f"COALESCE({r}.industry, '')"),
+            _stat_delta("country", sign, f"COALESCE({r}.country, '')"),
+        ]
+    elif table == "dim_contacts":
+        deltas += [
+            _stat_delta("funnel_icp_contacts", sign, where=(
+                "EXISTS (SELECT 1 FROM stats_company_rollup rl "
+                f"WHERE rl.company_id = {r}.company_id AND rl.enriched > 0)"
+            )),
+            _rollup_delta(f"{r}.company_id", contacts=sign),
+        ]
+    elif table == "fct_enriched_leads":
+        deltas += [
+            _stat_delta("funnel_icp_contacts", f"{sign} * rl.contacts",
+                        tables="stats_company_rollup rl",
+                        where=f"rl.company_id = {r}.company_id AND rl.enriched = {prior}"),
+            _rollup_delta(f"{r}.company_id", enriched=sign),
+        ]
+    elif table == "fct_scored_leads":
+        company_id = f"(SELECT le.company_id FROM fct_enriched_leads le WHERE le.lead_id = {r}.lead_id)"
+        deltas += [
+            _stat_delta("qualification", sign, f"COALESCE({r}.qualification_status, '')"),
+            _stat_delta("score_sum", f"{sign} * {r}.score"),
+            _stat_delta(
+                "pipeline_value", f"{sign} * {r}.score * c.revenue_usd / 10000",
+                tables="fct_enriched_leads e JOIN dim_companies c ON e.company_id = c.company_id",
+                where=f"e.lead_id = {r}.lead_id AND {r}.qualification_status IN ('qualified', 'nurture')",
+            ),
+            _stat_delta("funnel_qualified_companies", sign, where=(
+                f"{r}.qualification_status = 'qualified' AND COALESCE(("
+                f"SELECT rl.qualified FROM stats_company_rollup rl WHERE rl.company_id = {company_id}"
+                f"), 0) = {prior}"
+            )),
+            _rollup_delta(company_id, qualified=sign,
+                          where=f"{r}.qualification_status = 'qualified'"),
+        ]
+    elif table == "fct_outreach_events":
+        deltas += [
+            _stat_delta("outreach_sent", sign, where=f"{r}.status != 'pending'"),
+            _stat_delta("outreach_opened", sign, where=f"{r}.opened_at IS NOT NULL"),
+            _stat_delta("outreach_replied", sign, where=f"{r}.responded_at IS NOT NULL"),
+            _stat_delta("outreach_interested", sign, where=f"{r}.response_type = 'interested'"),
+        ]
+    return deltas
+
+
+def _render_deltas(deltas: list[tuple], row_source: str = "") -> str:
+    """Render deltas as trigger statements, optionally reading the row from a subquery."""
+    statements = []
+    for insert, select, tables, where, conflict in deltas:
+        sources = [t for t in (row_source, tables) if t]
+        from_clause = f"FROM {', '.join(sources)}" if sources else ""
+        statements.append(f"{insert} SELECT {select} {from_clause} WHERE {where} {conflict};")
+    return "\n".join(statements)
+
+
+def _stats_trigger_sql(table: str, pk: str) -> str:
+    # INSERT OR REPLACE does not fire DELETE triggers (recursive_triggers is
+    # off), so BEFORE INSERT retracts the row about to be replaced, if any.
+    # Do not enable recursive_triggers on these connections: the retraction
+    # would then be applied twice.
+    replaced = f"(SELECT * FROM {table} WHERE {pk} = new.{pk}) AS o"
+    return f"""
+        CREATE TRIGGER IF NOT EXISTS trg_stats_{table}_bi BEFORE INSERT ON {table} BEGIN
+            {_render_deltas(_stats_deltas(table, "o", -1), row_source=replaced)}
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_stats_{table}_ai AFTER INSERT ON {table} BEGIN
+            {_render_deltas(_stats_deltas(table, "new", 1))}
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_stats_{table}_ad AFTER DELETE ON {table} BEGIN
+            {_render_deltas(_stats_deltas(table, "old", -1))}
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_stats_{table}_au AFTER UPDATE ON {table} BEGIN
+            {_render_deltas(_stats_deltas(table, "old", -1))}
+            {_render_deltas(_stats_deltas(table, "new", 1))}
+        END;
+    """
+
+
+# ── Read-Through Cache ────────────────────────────────
+
+def _cached(method):
+    """
+    Serve a read method from the Database's result cache when enabled.
+
+    The key is the method name plus its bound arguments (defaults applied,
+    so positional and keyword spellings share an entry). Calls made inside
+    an open transaction bypass the cache: they may see uncommitted writes.
+    With the cache on, results served from it are shared: treat them as
+    read-only.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self._cache
+        if cache is None or getattr(self._local, "conn", None) is not None:
+            return method(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        try:
+            key = (method.__name__, freeze(list(bound.arguments.values())[1:]))
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+        version = self._data_version()
+        result = cache.get(key, version)
+        if result is MISSING:
+            result = method(self, *args, **kwargs)
+            cache.put(key, version, result)
+        return result
+
+    return wrapper
+
+
 class Database:
     """SQLite database manager for the lead engine."""
 
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        pool_size: int | None = None,
+        cache_size: int | None = None,
+    ):
         self.db_path = db_path
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = ConnectionPool(
+            db_path,
+            settings.database_pool_size if pool_size is None else pool_size,
+        )
+        self._local = threading.local()
+
+        # Result cache (opt-in). Commits through this object bump _writes;
+        # commits from other processes show up in the watcher connection's
+        # PRAGMA data_version, which changes whenever another connection
+        # commits to the file.
+        cache_size = settings.database_cache_size if cache_size is None else cache_size
+        self._cache = QueryCache(cache_size) if cache_size > 0 else None
+        self._writes = 0
+        self._version_lock = threading.Lock()
+        self._watcher = (
+            sqlite3.connect(db_path, check_same_thread=False) if self._cache else None
+        )
+
         self._create_tables()
 
+    def close(self):
+        """Release all pooled connections."""
+        self._pool.close()
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    def __enter__(self) -> Database:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     @contextmanager
     def _connect(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
+        # A nested call on the same thread joins the outer transaction rather
+        # than checking out a second connection (which could exhaust the pool).
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self._pool.acquire()
+        self._local.conn = conn
+        changes = conn.total_changes
         try:
             yield conn
             conn.commit()
@@ -46,7 +362,26 @@ class Database:
             conn.rollback()
             raise
         finally:
-            conn.close()
+            self._local.conn = None
+            if self._cache is not None and conn.total_changes != changes:
+                with self._version_lock:
+                    self._writes += 1
+            self._pool.release(conn)
+
+    def _data_version(self) -> tuple[int, int]:
+        with self._version_lock:
+            if self._watcher is None:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            data_version = self._watcher.execute("PRAGMA data_version").fetchone()[0]
+            return data_version, self._writes
+
+    def cache_stats(self) -> dict | None:
+        """Hit/miss counters for the result cache, or None when caching is off."""
+        return self._cache.stats() if self._cache is not None else None
+
+    def clear_cache(self):
+        if self._cache is not None:
+            self._cache.clear()
 
     def _create_tables(self):
         """Create all pipeline tables."""
@@ -129,39 +464,326 @@ class Database:
 
                 CREATE INDEX IF NOT EXISTS idx_contacts_company ON dim_contacts(company_id);
                 CREATE INDEX IF NOT EXISTS idx_enriched_company ON fct_enriched_leads(company_id);
-                CREATE INDEX IF NOT EXISTS idx_scored_status ON fct_scored_leads(qualification_status);
                 CREATE INDEX IF NOT EXISTS idx_outreach_lead ON fct_outreach_events(lead_id);
+
+                -- Keyset pagination: each page is a range scan on these
+                CREATE INDEX IF NOT EXISTS idx_companies_discovered
+                    ON dim_companies(discovered_at DESC, company_id DESC);
+                CREATE INDEX IF NOT EXISTS idx_scored_score
+                    ON fct_scored_leads(score DESC, lead_id DESC);
+                CREATE INDEX IF NOT EXISTS idx_scored_status_score
+                    ON fct_scored_leads(qualification_status, score DESC, lead_id DESC);
+                -- Superseded by idx_scored_status_score (same leading column)
+                DROP INDEX IF EXISTS idx_scored_status;
+
+                -- search_leads: per-contact dedup probe and firmographic filters
+                CREATE INDEX IF NOT EXISTS idx_enriched_contact
+                    ON fct_enriched_leads(contact_id, lead_id);
+                CREATE INDEX IF NOT EXISTS idx_companies_firmographics
+                    ON dim_companies(country, industry, revenue_usd, employee_count);
+                CREATE INDEX IF NOT EXISTS idx_companies_industry
+                    ON dim_companies(industry, revenue_usd, employee_count);
+                CREATE INDEX IF NOT EXISTS idx_contacts_seniority
+                    ON dim_contacts(seniority);
             """)
+            self._fts_enabled = self._create_search_index(conn)
+            self._create_stats_tables(conn)
+            self._create_run_tables(conn)
+            self._create_queue_table(conn)
+            self._create_key_table(conn)
 
-    # ── Companies ──────────────────────────────────────
+    def analyze(self):
+        """
+        Refresh the query planner's statistics (sqlite_stat1).
 
-    def insert_company(self, company: Company) -> str:
+        Run after bulk loads: without statistics SQLite tends to drive
+        search_leads from a table scan and sort, rather than walking the
+        score index in order and stopping at the LIMIT.
+        """
         with self._connect() as conn:
+            conn.execute("ANALYZE")
+
+    # ── Full-Text Search Index ─────────────────────────
+
+    # One FTS5 row per scored lead. The FTS rowid is the lead's docid in
+    # lead_search_docs, an explicit INTEGER PRIMARY KEY that VACUUM leaves
+    # alone (the implicit rowid of fct_scored_leads may be renumbered).
+    # The trigram tokenizer indexes every three-character substring, so a
+    # query word matches anywhere inside a value ("tech" finds "NovaTech"),
+    # as the LIKE search did. JSON list columns are indexed as-is.
+    _SEARCH_INDEX_SOURCE = """
+        SELECT d.docid, c.name, ct.full_name, ct.title, c.industry,
+               e.buying_signals, c.tech_stack || ' ' || e.tech_stack_detected
+        FROM lead_search_docs d
+        JOIN fct_enriched_leads e ON e.lead_id = d.lead_id
+        JOIN dim_companies c ON e.company_id = c.company_id
+        JOIN dim_contacts ct ON e.contact_id = ct.contact_id
+    """
+
+    _SEARCH_TEXT_COLUMNS = (
+        "company_name", "contact_name", "title", "industry", "buying_signals", "tech_stack",
+    )
+    _SEARCH_INDEX_COLUMNS = f"rowid, {', '.join(_SEARCH_TEXT_COLUMNS)}"
+
+    # bm25 column weights: company name > contact name > everything else
+    _SEARCH_INDEX_WEIGHTS = "10.0, 5.0, 2.0, 2.0, 1.0, 1.0"
+
+    @classmethod
+    def _reindex_leads_sql(cls, where: str) -> str:
+        """Trigger body re-indexing the scored leads matching ``where`` (over ``d`` and ``e``)."""
+        return f"""
+            DELETE FROM lead_search WHERE rowid IN (
+                SELECT d.docid FROM lead_search_docs d
+                JOIN fct_enriched_leads e ON e.lead_id = d.lead_id
+                WHERE {where}
+            );
+            INSERT INTO lead_search ({cls._SEARCH_INDEX_COLUMNS})
+            {cls._SEARCH_INDEX_SOURCE} WHERE {where};
+        """
+
+    def _create_search_index(self, conn: sqlite3.Connection) -> bool:
+        """
+        Create the ``lead_search`` FTS5 table and its sync triggers.
+
+        Scoring a lead indexes it; re-enriching it, re-pointing it at another
+        company or contact (as ``merge_entities`` does) or upserting its
+        company or contact re-indexes it. An index from before docids or
+        the trigram tokenizer is dropped and rebuilt. Returns False (and
+        search falls back to LIKE) when the SQLite build has no FTS5 module.
+        """
+        docs = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'lead_search_docs'"
+        ).fetchone()
+        index = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'lead_search'"
+        ).fetchone()
+        existed = bool(docs and index and "trigram" in index["sql"])
+        if not existed:
+            conn.executescript("""
+                DROP TRIGGER IF EXISTS trg_lead_search_bi;
+                DROP TRIGGER IF EXISTS trg_lead_search_ai;
+                DROP TRIGGER IF EXISTS trg_lead_search_ad;
+                DROP TABLE IF EXISTS lead_search;
+            """)
+        try:
+            conn.executescript(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS lead_search USING fts5(
+                    {', '.join(self._SEARCH_TEXT_COLUMNS)},
+                    tokenize = 'trigram'
+                );
+
+                CREATE TABLE IF NOT EXISTS lead_search_docs (
+                    docid INTEGER PRIMARY KEY,
+                    lead_id TEXT NOT NULL UNIQUE
+                );
+
+                -- BEFORE INSERT also covers INSERT OR REPLACE, whose implicit
+                -- delete does not fire DELETE triggers by default.
+                CREATE TRIGGER IF NOT EXISTS trg_lead_search_bi
+                BEFORE INSERT ON fct_scored_leads BEGIN
+                    DELETE FROM lead_search WHERE rowid IN (
+                        SELECT docid FROM lead_search_docs WHERE lead_id = new.lead_id
+                    );
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_lead_search_ai
+                AFTER INSERT ON fct_scored_leads BEGIN
+                    INSERT OR IGNORE INTO lead_search_docs (lead_id) VALUES (new.lead_id);
+                    INSERT INTO lead_search ({self._SEARCH_INDEX_COLUMNS})
+                    {self._SEARCH_INDEX_SOURCE} WHERE d.lead_id = new.lead_id LIMIT 1;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_lead_search_ad
+                AFTER DELETE ON fct_scored_leads BEGIN
+                    DELETE FROM lead_search WHERE rowid IN (
+                        SELECT docid FROM lead_search_docs WHERE lead_id = old.lead_id
+                    );
+                    DELETE FROM lead_search_docs WHERE lead_id = old.lead_id;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_lead_search_enriched_ai
+                AFTER INSERT ON fct_enriched_leads
+                WHEN EXISTS (SELECT 1 FROM lead_search_docs WHERE lead_id = new.lead_id) BEGIN
+                    {self._reindex_leads_sql("d.lead_id = new.lead_id")}
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_lead_search_enriched_au
+                AFTER UPDATE OF company_id, contact_id ON fct_enriched_leads
+                WHEN EXISTS (SELECT 1 FROM lead_search_docs WHERE lead_id = new.lead_id) BEGIN
+                    {self._reindex_leads_sql("d.lead_id = new.lead_id")}
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_lead_search_company_ai
+                AFTER INSERT ON dim_companies
+                WHEN EXISTS (SELECT 1 FROM fct_enriched_leads WHERE company_id = new.company_id) BEGIN
+                    {self._reindex_leads_sql("e.company_id = new.company_id")}
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_lead_search_company_au
+                AFTER UPDATE OF name, industry, tech_stack ON dim_companies BEGIN
+                    {self._reindex_leads_sql("e.company_id = new.company_id")}
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_lead_search_contact_ai
+                AFTER INSERT ON dim_contacts
+                WHEN EXISTS (SELECT 1 FROM fct_enriched_leads WHERE contact_id = new.contact_id) BEGIN
+                    {self._reindex_leads_sql("e.contact_id = new.contact_id")}
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_lead_search_contact_au
+                AFTER UPDATE OF full_name, title ON dim_contacts BEGIN
+                    {self._reindex_leads_sql("e.contact_id = new.contact_id")}
+                END;
+            """)
+        except sqlite3.OperationalError:
+            return False
+
+        if not existed:
             conn.execute(
-                """INSERT OR REPLACE INTO dim_companies
-                   (company_id, name, industry, country, state, employee_count,
-                    revenue_usd, website, tech_stack, funding_stage, founded_year,
-                    cnpj, cnae_code, source, discovered_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    company.company_id, company.name, company.industry,
-                    company.country, company.state, company.employee_count,
-                    company.revenue_usd, company.website, company.tech_stack_json,
-                    company.funding_stage, company.founded_year,
-                    company.cnpj, company.cnae_code,
-                    company.source, company.discovered_at.isoformat(),
-                ),
+                "INSERT INTO lead_search (lead_search, rank) VALUES ('rank', ?)",
+                (f"bm25({self._SEARCH_INDEX_WEIGHTS})",),
             )
+            self._rebuild_search_index(conn)
+        return True
+
+    def _rebuild_search_index(self, conn: sqlite3.Connection):
+        conn.execute("DELETE FROM lead_search")
+        conn.execute("DELETE FROM lead_search_docs")
+        conn.execute("INSERT INTO lead_search_docs (lead_id) SELECT lead_id FROM fct_scored_leads")
+        conn.execute(f"""
+            INSERT INTO lead_search ({self._SEARCH_INDEX_COLUMNS})
+            {self._SEARCH_INDEX_SOURCE}
+        """)
+
+    def rebuild_search_index(self):
+        """
+        Re-index every scored lead.
+
+        The triggers keep the index current as leads are scored and as
+        their companies and contacts change; this is for repairs.
+        """
+        if not self._fts_enabled:
+            return
+        with self._connect() as conn:
+            self._rebuild_search_index(conn)
+
+    @staticmethod
+    def _search_terms(text_query: str) -> tuple[str, list[str]]:
+        """
+        Split free text into a trigram MATCH query and the two-character words.
+
+        Every whitespace-separated word must occur, case-insensitively, as
+        a substring of some indexed column. Words of three or more
+        characters (punctuation included, so "c++" means "c++") become
+        quoted phrases of the MATCH query; two-character words are too
+        short for trigrams and are returned for a LIKE over the index
+        columns. Single characters match nearly everything and are ignored.
+        """
+        words = text_query.split()
+        match = " ".join('"' + w.replace('"', '""') + '"' for w in words if len(w) >= 3)
+        return match, [w for w in words if len(w) == 2]
+
+    # ── Bulk Write Helpers ─────────────────────────────
+
+    def _insert_many(self, sql: str, rows: Iterable[tuple], batch_size: int) -> int:
+        """
+        Insert rows with ``executemany``, committing once per batch.
+
+        ``rows`` may be a generator; it is consumed lazily so only one batch
+        is held in memory at a time. Returns the number of rows written.
+
+        Called inside a caller's ``_connect()`` block, the inserts join the
+        caller's transaction instead: each batch runs in a savepoint and is
+        committed (or rolled back) with the rest of the caller's work.
+        """
+        owned = getattr(self._local, "conn", None) is None
+        total = 0
+        with self._connect() as conn:
+            if not owned and not conn.in_transaction:
+                # So releasing the first savepoint does not commit
+                conn.execute("BEGIN")
+            for batch in _batched(rows, batch_size):
+                if owned:
+                    conn.executemany(sql, batch)
+                    conn.commit()
+                else:
+                    conn.execute("SAVEPOINT insert_batch")
+                    try:
+                        conn.executemany(sql, batch)
+                    except Exception:
+                        conn.execute("ROLLBACK TO insert_batch")
+                        raise
+                    finally:
+                        conn.execute("RELEASE insert_batch")
+                total += len(batch)
+        return total
+
+    # ── Companies ──────────────────────────────────────
+
+    _COMPANY_INSERT = """INSERT OR REPLACE INTO dim_companies
+        (company_id, name, industry, country, state, employee_count,
+         revenue_usd, website, tech_stack, funding_stage, founded_year,
+         cnpj, cnae_code, source, discovered_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+    @staticmethod
+    def _company_params(company: Company) -> tuple:
+        return (
+            company.company_id, company.name, company.industry,
+            company.country, company.state, company.employee_count,
+            company.revenue_usd, company.website, company.tech_stack_json,
+            company.funding_stage, company.founded_year,
+            company.cnpj, company.cnae_code,
+            company.source, company.discovered_at.isoformat(),
+        )
+
+    def insert_company(self, company: Company) -> str:
+        with self._connect() as conn:
+            conn.execute(self._COMPANY_INSERT, self._company_params(company))
         return company.company_id
 
-    def get_companies(self, limit: int = 100) -> list[Company]:
+    def insert_companies(
+        self, companies: Iterable[Company], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """Bulk insert companies, one transaction per batch. Returns rows written."""
+        return self._insert_many(
+            self._COMPANY_INSERT,
+            (self._company_params(c) for c in companies),
+            batch_size,
+        )
+
+    def insert_company_rows(
+        self, rows: Iterable[tuple], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """Bulk insert already-serialized rows in ``dim_companies`` column order."""
+        return self._insert_many(self._COMPANY_INSERT, rows, batch_size)
+
+    @_cached
+    def get_companies(self, limit: int = 100, cursor: Optional[str] = None) -> list[Company]:
+        """Newest companies first; pass a cursor from get_companies_page to continue."""
+        where, params = "", []
+        if cursor:
+            where = "WHERE (discovered_at, company_id) < (?, ?)"
+            params = decode_cursor(cursor, 2)
         with self._connect() as conn:
             rows = conn.execute(
-                "SELECT * FROM dim_companies ORDER BY discovered_at DESC LIMIT ?",
-                (limit,),
+                f"""SELECT * FROM dim_companies {where}
+                    ORDER BY discovered_at DESC, company_id DESC LIMIT ?""",
+                (*params, limit),
             ).fetchall()
         return [self._row_to_company(r) for r in rows]
 
+    def get_companies_page(
+        self, limit: int = 100, cursor: Optional[str] = None
+    ) -> tuple[list[Company], Optional[str]]:
+        """One page of companies plus the cursor for the next page (None at the end)."""
+        companies = self.get_companies(limit=limit + 1, cursor=cursor)
+        if len(companies) <= limit:
+            return companies, None
+        last = companies[limit - 1]
+        return companies[:limit], encode_cursor(last.discovered_at.isoformat(), last.company_id)
+
+    @_cached
     def get_company(self, company_id: str) -> Optional[Company]:
         with self._connect() as conn:
             row = conn.execute(
@@ -169,31 +791,88 @@ class Database:
             ).fetchone()
         return self._row_to_company(row) if row else None
 
+    def find_company_ids(self, where: str, params: Iterable = ()) -> list[str]:
+        """
+        Ids of the companies matching ``where``.
+
+        ``where`` must be SQL built by the caller from fixed column names
+        with ``?`` placeholders for every value (see ``ICPMatcher.sql_clauses``).
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT company_id FROM dim_companies WHERE {where}",
+                list(params),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def get_companies_with_contacts(
+        self, company_ids: list[str]
+    ) -> tuple[list[Company], list[Contact]]:
+        """The given companies, in the order given, and all their contacts."""
+        companies: dict[str, Company] = {}
+        contacts: list[Contact] = []
+        with self._connect() as conn:
+            for batch in _batched(company_ids, 500):
+                placeholders = ", ".join("?" * len(batch))
+                companies.update(
+                    (r["company_id"], self._row_to_company(r)) for r in conn.execute(
+                        f"SELECT * FROM dim_companies WHERE company_id IN ({placeholders})", batch,
+                    )
+                )
+                contacts.extend(
+                    self._row_to_contact(r) for r in conn.execute(
+                        f"""SELECT * FROM dim_contacts WHERE company_id IN ({placeholders})
+                            ORDER BY company_id, contact_id""",
+                        batch,
+                    )
+                )
+        return [companies[cid] for cid in company_ids if cid in companies], contacts
+
     def _row_to_company(self, row: sqlite3.Row) -> Company:
         d = dict(row)
         d["tech_stack"] = json.loads(d.get("tech_stack", "[]"))
         d["discovered_at"] = datetime.fromisoformat(d["discovered_at"])
-        return Company(**d)
+        return build(Company, **d)
 
     # ── Contacts ───────────────────────────────────────
 
+    _CONTACT_INSERT = """INSERT OR REPLACE INTO dim_contacts
+        (contact_id, company_id, full_name, title, email, phone,
+         linkedin_url, seniority, department, source, verified, discovered_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+    @staticmethod
+    def _contact_params(contact: Contact) -> tuple:
+        return (
+            contact.contact_id, contact.company_id, contact.full_name,
+            contact.title, contact.email, contact.phone,
+            contact.linkedin_url, contact.seniority, contact.department,
+            contact.source, int(contact.verified),
+            contact.discovered_at.isoformat(),
+        )
+
     def insert_contact(self, contact: Contact) -> str:
         with self._connect() as conn:
-            conn.execute(
-                """INSERT OR REPLACE INTO dim_contacts
-                   (contact_id, company_id, full_name, title, email, phone,
-                    linkedin_url, seniority, department, source, verified, discovered_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    contact.contact_id, contact.company_id, contact.full_name,
-                    contact.title, contact.email, contact.phone,
-                    contact.linkedin_url, contact.seniority, contact.department,
-                    contact.source, int(contact.verified),
-                    contact.discovered_at.isoformat(),
-                ),
-            )
+            conn.execute(self._CONTACT_INSERT, self._contact_params(contact))
         return contact.contact_id
 
+    def insert_contacts(
+        self, contacts: Iterable[Contact], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """Bulk insert contacts, one transaction per batch. Returns rows written."""
+        return self._insert_many(
+            self._CONTACT_INSERT,
+            (self._contact_params(c) for c in contacts),
+            batch_size,
+        )
+
+    def insert_contact_rows(
+        self, rows: Iterable[tuple], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """Bulk insert already-serialized rows in ``dim_contacts`` column order."""
+        return self._insert_many(self._CONTACT_INSERT, rows, batch_size)
+
+    @_cached
     def get_contacts(self, company_id: Optional[str] = None, limit: int = 100) -> list[Contact]:
         with self._connect() as conn:
             if company_id:
@@ -212,32 +891,63 @@ class Database:
         d = dict(row)
         d["verified"] = bool(d.get("verified", 0))
         d["discovered_at"] = datetime.fromisoformat(d["discovered_at"])
-        return Contact(**d)
+        return build(Contact, **d)
 
     # ── Enriched Leads ─────────────────────────────────
 
+    _ENRICHED_LEAD_INSERT = """INSERT OR REPLACE INTO fct_enriched_leads
+        (lead_id, company_id, contact_id, tech_stack_detected, tech_stack_gaps,
+         buying_signals, social_signals, news_mentions,
+         enrichment_completeness, enrichment_sources, enriched_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+    @staticmethod
+    def _enriched_lead_params(lead: EnrichedLead) -> tuple:
+        return (
+            lead.lead_id, lead.company_id, lead.contact_id,
+            json.dumps(lead.tech_stack_detected),
+            json.dumps(lead.tech_stack_gaps),
+            json.dumps(lead.buying_signals),
+            json.dumps(lead.social_signals),
+            json.dumps(lead.news_mentions),
+            lead.enrichment_completeness,
+            json.dumps(lead.enrichment_sources),
+            lead.enriched_at.isoformat(),
+        )
+
     def insert_enriched_lead(self, lead: EnrichedLead) -> str:
         with self._connect() as conn:
-            conn.execute(
-                """INSERT OR REPLACE INTO fct_enriched_leads
-                   (lead_id, company_id, contact_id, tech_stack_detected, tech_stack_gaps,
-                    buying_signals, social_signals, news_mentions,
-                    enrichment_completeness, enrichment_sources, enriched_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    lead.lead_id, lead.company_id, lead.contact_id,
-                    json.dumps(lead.tech_stack_detected),
-                    json.dumps(lead.tech_stack_gaps),
-                    json.dumps(lead.buying_signals),
-                    json.dumps(lead.social_signals),
-                    json.dumps(lead.news_mentions),
-                    lead.enrichment_completeness,
-                    json.dumps(lead.enrichment_sources),
-                    lead.enriched_at.isoformat(),
-                ),
-            )
+            conn.execute(self._ENRICHED_LEAD_INSERT, self._enriched_lead_params(lead))
         return lead.lead_id
 
+    def insert_enriched_leads(
+        self, leads: Iterable[EnrichedLead], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """Bulk insert enriched leads, one transaction per batch. Returns rows written."""
+        return self._insert_many(
+            self._ENRICHED_LEAD_INSERT,
+            (self._enriched_lead_params(l) for l in leads),
+            batch_size,
+        )
+
+    def delete_leads(self, lead_ids: Iterable[str]) -> int:
+        """
+        Delete leads with their scores and outreach events, in one transaction.
+
+        Returns the number of enriched leads deleted.
+        """
+        deleted = 0
+        with self._connect() as conn:
+            for batch in _batched(lead_ids, 500):
+                placeholders = ", ".join("?" * len(batch))
+                for table in ("fct_outreach_events", "fct_scored_leads"):
+                    conn.execute(f"DELETE FROM {table} WHERE lead_id IN ({placeholders})", batch)
+                deleted += conn.execute(
+                    f"DELETE FROM fct_enriched_leads WHERE lead_id IN ({placeholders})", batch
+                ).rowcount
+        return deleted
+
+    @_cached
     def get_enriched_leads(self, limit: int = 100) -> list[EnrichedLead]:
         with self._connect() as conn:
             rows = conn.execute(
@@ -253,80 +963,132 @@ class Database:
             d[field] = json.loads(d.get(field, "[]"))
         d["social_signals"] = json.loads(d.get("social_signals", "{}"))
         d["enriched_at"] = datetime.fromisoformat(d["enriched_at"])
-        return EnrichedLead(**d)
+        return build(EnrichedLead, **d)
 
     # ── Scored Leads ───────────────────────────────────
 
+    _SCORED_LEAD_INSERT = """INSERT OR REPLACE INTO fct_scored_leads
+        (lead_id, score, score_breakdown, qualification_status,
+         budget_signal, authority_signal, need_signal, timeline_signal,
+         deal_brief, deal_stage, scored_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+    @staticmethod
+    def _scored_lead_params(lead: ScoredLead) -> tuple:
+        return (
+            lead.lead_id, lead.score,
+            lead.score_breakdown.model_dump_json(),
+            lead.qualification_status.value,
+            int(lead.budget_signal), int(lead.authority_signal),
+            int(lead.need_signal), int(lead.timeline_signal),
+            lead.deal_brief, lead.deal_stage,
+            lead.scored_at.isoformat(),
+        )
+
     def insert_scored_lead(self, lead: ScoredLead) -> str:
         with self._connect() as conn:
-            conn.execute(
-                """INSERT OR REPLACE INTO fct_scored_leads
-                   (lead_id, score, score_breakdown, qualification_status,
-                    budget_signal, authority_signal, need_signal, timeline_signal,
-                    deal_brief, deal_stage, scored_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    lead.lead_id, lead.score,
-                    lead.score_breakdown.model_dump_json(),
-                    lead.qualification_status.value,
-                    int(lead.budget_signal), int(lead.authority_signal),
-                    int(lead.need_signal), int(lead.timeline_signal),
-                    lead.deal_brief, lead.deal_stage,
-                    lead.scored_at.isoformat(),
-                ),
-            )
+            conn.execute(self._SCORED_LEAD_INSERT, self._scored_lead_params(lead))
         return lead.lead_id
 
+    def insert_scored_leads(
+        self, leads: Iterable[ScoredLead], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """Bulk insert scored leads, one transaction per batch. Returns rows written."""
+        return self._insert_many(
+            self._SCORED_LEAD_INSERT,
+            (self._scored_lead_params(l) for l in leads),
+            batch_size,
+        )
+
+    @_cached
     def get_scored_leads(
-        self, status: Optional[str] = None, limit: int = 100
+        self, status: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None
     ) -> list[ScoredLead]:
+        """Highest score first; pass a cursor from get_scored_leads_page to continue."""
+        conditions, params = [], []
+        if status:
+            conditions.append("qualification_status = ?")
+            params.append(status)
+        if cursor:
+            conditions.append("(score, lead_id) < (?, ?)")
+            params.extend(decode_cursor(cursor, 2))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
         with self._connect() as conn:
-            if status:
-                rows = conn.execute(
-                    """SELECT * FROM fct_scored_leads
-                       WHERE qualification_status = ? ORDER BY score DESC LIMIT ?""",
-                    (status, limit),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM fct_scored_leads ORDER BY score DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
+            rows = conn.execute(
+                f"""SELECT * FROM fct_scored_leads {where}
+                    ORDER BY score DESC, lead_id DESC LIMIT ?""",
+                (*params, limit),
+            ).fetchall()
         return [self._row_to_scored_lead(r) for r in rows]
 
+    def get_scored_leads_page(
+        self, status: Optional[str] = None, limit: int = 100, cursor: Optional[str] = None
+    ) -> tuple[list[ScoredLead], Optional[str]]:
+        """One page of scored leads plus the cursor for the next page (None at the end)."""
+        leads = self.get_scored_leads(status=status, limit=limit + 1, cursor=cursor)
+        if len(leads) <= limit:
+            return leads, None
+        last = leads[limit - 1]
+        return leads[:limit], encode_cursor(last.score, last.lead_id)
+
     def _row_to_scored_lead(self, row: sqlite3.Row) -> ScoredLead:
         d = dict(row)
         from src.models.models import ScoreBreakdown
-        d["score_breakdown"] = ScoreBreakdown(**json.loads(d.get("score_breakdown", "{}")))
+        d["score_breakdown"] = build(ScoreBreakdown, **json.loads(d.get("score_breakdown", "{}")))
         d["qualification_status"] = QualificationStatus(d["qualification_status"])
         d["budget_signal"] = bool(d.get("budget_signal", 0))
         d["authority_signal"] = bool(d.get("authority_signal", 0))
         d["need_signal"] = bool(d.get("need_signal", 0))
         d["timeline_signal"] = bool(d.get("timeline_signal", 0))
         d["scored_at"] = datetime.fromisoformat(d["scored_at"])
-        return ScoredLead(**d)
+        return build(ScoredLead, **d)
 
     # ── Outreach Events ────────────────────────────────
 
+    _OUTREACH_EVENT_INSERT = """INSERT OR REPLACE INTO fct_outreach_events
+        (event_id, lead_id, channel, sequence_step, subject, body,
+         status, response_type, sent_at, opened_at, responded_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+    @staticmethod
+    def _outreach_event_params(event: OutreachEvent) -> tuple:
+        return (
+            event.event_id, event.lead_id, event.channel.value,
+            event.sequence_step, event.subject, event.body,
+            event.status.value,
+            event.response_type.value if event.response_type else None,
+            event.sent_at.isoformat() if event.sent_at else None,
+            event.opened_at.isoformat() if event.opened_at else None,
+            event.responded_at.isoformat() if event.responded_at else None,
+        )
+
     def insert_outreach_event(self, event: OutreachEvent) -> str:
         with self._connect() as conn:
-            conn.execute(
-                """INSERT OR REPLACE INTO fct_outreach_events
-                   (event_id, lead_id, channel, sequence_step, subject, body,
-                    status, response_type, sent_at, opened_at, responded_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    event.event_id, event.lead_id, event.channel.value,
-                    event.sequence_step, event.subject, event.body,
-                    event.status.value,
-                    event.response_type.value if event.response_type else None,
-                    event.sent_at.isoformat() if event.sent_at else None,
-                    event.opened_at.isoformat() if event.opened_at else None,
-                    event.responded_at.isoformat() if event.responded_at else None,
-                ),
-            )
+            conn.execute(self._OUTREACH_EVENT_INSERT, self._outreach_event_params(event))
         return event.event_id
 
+    def insert_outreach_events(
+        self, events: Iterable[OutreachEvent], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """Bulk insert outreach events, one transaction per batch. Returns rows written."""
+        return self._insert_many(
+            self._OUTREACH_EVENT_INSERT,
+            (self._outreach_event_params(e) for e in events),
+            batch_size,
+        )
+
+    def delete_outreach_events(self, event_ids: Iterable[str]) -> int:
+        """Delete outreach events by id. Returns rows deleted."""
+        deleted = 0
+        with self._connect() as conn:
+            for batch in _batched(event_ids, 500):
+                placeholders = ", ".join("?" * len(batch))
+                deleted += conn.execute(
+                    f"DELETE FROM fct_outreach_events WHERE event_id IN ({placeholders})", batch
+                ).rowcount
+        return deleted
+
+    @_cached
     def get_outreach_events(self, lead_id: Optional[str] = None, limit: int = 100) -> list[OutreachEvent]:
         with self._connect() as conn:
             if lead_id:
@@ -351,115 +1113,531 @@ class Database:
         for dt_field in ["sent_at", "opened_at", "responded_at"]:
             if d.get(dt_field):
                 d[dt_field] = datetime.fromisoformat(d[dt_field])
-        return OutreachEvent(**d)
+        return build(OutreachEvent, **d)
 
     # ── Stats ──────────────────────────────────────────
 
+    def _create_stats_tables(self, conn: sqlite3.Connection):
+        """Create the incrementally maintained stats tables and their triggers."""
+        existed = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'pipeline_stats'"
+        ).fetchone()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pipeline_stats (
+                metric TEXT NOT NULL,
+                dimension TEXT NOT NULL DEFAULT '',
+                value REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (metric, dimension)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS stats_company_rollup (
+                company_id TEXT PRIMARY KEY,
+                contacts INTEGER NOT NULL DEFAULT 0,
+                enriched INTEGER NOT NULL DEFAULT 0,
+                qualified INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID;
+        """ + "".join(_stats_trigger_sql(t, pk) for t, pk in _STATS_TABLES.items()))
+        if not existed:
+            self._rebuild_stats(conn)
+
+    def _rebuild_stats(self, conn: sqlite3.Connection):
+        conn.execute("DELETE FROM pipeline_stats")
+        conn.execute("DELETE FROM stats_company_rollup")
+        for table in _STATS_TABLES:
+            conn.execute(
+                f"INSERT INTO pipeline_stats SELECT 'rows', '{table}', COUNT(*) FROM {table}"
+            )
+        conn.executescript("""
+            INSERT INTO stats_company_rollup (company_id, contacts, enriched, qualified)
+            SELECT company_id, SUM(contacts), SUM(enriched), SUM(qualified) FROM (
+                SELECT company_id, 1 AS contacts, 0 AS enriched, 0 AS qualified
+                FROM dim_contacts
+                UNION ALL
+                SELECT company_id, 0, 1, 0 FROM fct_enriched_leads
+                UNION ALL
+                SELECT e.company_id, 0, 0, 1
+                FROM fct_scored_leads s
+                JOIN fct_enriched_leads e ON s.lead_id = e.lead_id
+                WHERE s.qualification_status = 'qualified'
+            ) GROUP BY company_id;
+
+            INSERT INTO pipeline_stats
+            SELECT 'qualification', COALESCE(qualification_status, ''), COUNT(*)
+            FROM fct_scored_leads GROUP BY 2;
+
+            INSERT INTO pipeline_stats
+            SELECT 'score_sum', '', COALESCE(SUM(score), 0) FROM fct_scored_leads;
+
+            INSERT INTO pipeline_stats
+            SELECT 'industry', COALESCE(industry, ''), COUNT(*) FROM dim_companies GROUP BY 2;
+
+            INSERT INTO pipeline_stats
+            SELECT 'country', COALESCE(country, ''), COUNT(*) FROM dim_companies GROUP BY 2;
+
+            INSERT INTO pipeline_stats
+            SELECT 'funnel_icp_contacts', '', COALESCE(SUM(contacts), 0)
+            FROM stats_company_rollup WHERE enriched > 0;
+
+            INSERT INTO pipeline_stats
+            SELECT 'funnel_qualified_companies', '', COUNT(*)
+            FROM stats_company_rollup WHERE qualified > 0;
+
+            INSERT INTO pipeline_stats
+            SELECT 'pipeline_value', '', COALESCE(SUM(s.score * c.revenue_usd / 10000), 0)
+            FROM fct_scored_leads s
+            JOIN fct_enriched_leads e ON s.lead_id = e.lead_id
+            JOIN dim_companies c ON e.company_id = c.company_id
+            WHERE s.qualification_status IN ('qualified', 'nurture');
+
+            INSERT INTO pipeline_stats
+            SELECT 'outreach_sent', '', COUNT(*) FROM fct_outreach_events WHERE status != 'pending';
+            INSERT INTO pipeline_stats
+            SELECT 'outreach_opened', '', COUNT(*) FROM fct_outreach_events WHERE opened_at IS NOT NULL;
+            INSERT INTO pipeline_stats
+            SELECT 'outreach_replied', '', COUNT(*) FROM fct_outreach_events WHERE responded_at IS NOT NULL;
+            INSERT INTO pipeline_stats
+            SELECT 'outreach_interested', '', COUNT(*) FROM fct_outreach_events WHERE response_type = 'interested';
+        """)
+
+    def rebuild_stats(self):
+        """
+        Recompute pipeline_stats from the base tables.
+
+        Triggers keep the counters current on every write; use this to
+        backfill after bulk edits made outside this class, or to correct
+        pipeline value after company revenues change in place.
+        """
+        with self._connect() as conn:
+            self._rebuild_stats(conn)
+
+    @_cached
     def get_pipeline_stats(self) -> dict:
         """Get aggregate stats across all tables with funnel metrics."""
         with self._connect() as conn:
-            stats = {}
-            for table in ["dim_companies", "dim_contacts", "fct_enriched_leads",
-                          "fct_scored_leads", "fct_outreach_events"]:
-                count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-                stats[table] = count
+            rows = conn.execute("SELECT metric, dimension, value FROM pipeline_stats").fetchall()
+
+        scalar: dict[str, float] = {}
+        grouped: dict[str, dict[str, int]] = {}
+        for metric, dimension, value in rows:
+            if metric in ("rows", "qualification", "industry", "country"):
+                if value:
+                    grouped.setdefault(metric, {})[dimension] = int(round(value))
+            else:
+                scalar[metric] = value
+
+        def _ranked(metric: str) -> dict[str, int]:
+            counts = grouped.get(metric, {})
+            return dict(sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])))
+
+        stats = {}
+        table_rows = grouped.get("rows", {})
+        for table in _STATS_TABLES:
+            stats[table] = table_rows.get(table, 0)
+
+        # Qualification breakdown
+        stats["qualification_breakdown"] = grouped.get("qualification", {})
+        qualification = stats["qualification_breakdown"]
+
+        # Average score
+        scored = stats["fct_scored_leads"]
+        stats["avg_score"] = round(scalar.get("score_sum", 0) / scored, 1) if scored else 0
+
+        # Funnel: tracked at LEAD (contact) level for consistent decrease
+        stats["funnel_pool"] = stats["dim_contacts"]
+        # Contacts whose company has an enriched lead (= ICP matched + enrichment success)
+        stats["funnel_icp_contacts"] = int(round(scalar.get("funnel_icp_contacts", 0)))
+        stats["funnel_enriched"] = stats["fct_enriched_leads"]
+        stats["funnel_scored"] = stats["fct_scored_leads"]
+        stats["funnel_qualified"] = qualification.get("qualified", 0)
+        stats["funnel_pipeline"] = qualification.get("qualified", 0) + qualification.get("nurture", 0)
+        stats["funnel_qualified_companies"] = int(round(scalar.get("funnel_qualified_companies", 0)))
+
+        # Total pipeline value
+        pipeline_value = scalar.get("pipeline_value", 0)
+        stats["total_pipeline_value"] = round(pipeline_value, 2) if scored and pipeline_value else 0
+
+        # Industry and market breakdowns (largest first)
+        stats["industry_breakdown"] = _ranked("industry")
+        stats["market_breakdown"] = _ranked("country")
+
+        # Outreach stats
+        for metric in ("outreach_sent", "outreach_opened", "outreach_replied", "outreach_interested"):
+            stats[metric] = int(round(scalar.get(metric, 0)))
+
+        return stats
 
-            # Qualification breakdown
+    # ── Pipeline Runs ─────────────────────────────────
+
+    # Per-stage high-water marks recorded when a run finishes:
+    # pipeline_runs column → (table, timestamp column)
+    _RUN_WATERMARKS = {
+        "discovered_through": ("dim_companies", "discovered_at"),
+        "enriched_through": ("fct_enriched_leads", "enriched_at"),
+        "scored_through": ("fct_scored_leads", "scored_at"),
+        "outreach_through": ("fct_outreach_events", "sent_at"),
+    }
+
+    def _create_run_tables(self, conn: sqlite3.Connection):
+        """
+        Create the run log and the fingerprints of every entity a run loaded.
+
+        A fingerprint only counts as processed once the run that recorded it
+        succeeded, so a failed run is redone in full by the next one.
+        """
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pipeline_runs (
+                run_id TEXT PRIMARY KEY,
+                mode TEXT NOT NULL DEFAULT 'full',
+                status TEXT NOT NULL DEFAULT 'running',
+                started_at TEXT NOT NULL,
+                finished_at TEXT,
+                companies_seen INTEGER DEFAULT 0,
+                companies_processed INTEGER DEFAULT 0,
+                contacts_seen INTEGER DEFAULT 0,
+                contacts_processed INTEGER DEFAULT 0,
+                discovered_through TEXT,
+                enriched_through TEXT,
+                scored_through TEXT,
+                outreach_through TEXT
+            );
+
+            CREATE TABLE IF NOT EXISTS pipeline_fingerprints (
+                entity TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                entity_id TEXT NOT NULL,
+                run_id TEXT NOT NULL REFERENCES pipeline_runs(run_id),
+                PRIMARY KEY (entity, fingerprint)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_runs_status_started
+                ON pipeline_runs(status, started_at DESC);
+
+            CREATE TABLE IF NOT EXISTS fct_pipeline_runs (
+                run_id TEXT NOT NULL REFERENCES pipeline_runs(run_id),
+                stage TEXT NOT NULL,
+                stage_order INTEGER NOT NULL,
+                wall_seconds REAL DEFAULT 0.0,
+                cpu_seconds REAL DEFAULT 0.0,
+                rows_in INTEGER DEFAULT 0,
+                rows_out INTEGER DEFAULT 0,
+                rows_per_sec REAL DEFAULT 0.0,
+                db_write_seconds REAL DEFAULT 0.0,
+                peak_memory_mb REAL,
+                recorded_at TEXT NOT NULL,
+                PRIMARY KEY (run_id, stage)
+            ) WITHOUT ROWID;
+        """)
+
+    def start_pipeline_run(self, mode: str = "full", run_id: str | None = None) -> str:
+        """
+        Log a new run as 'running' and return its id.
+
+        Passing the id of an earlier run (when resuming it) sets that run
+        back to 'running' and keeps its start time and counts.
+        """
+        run_id = run_id or f"run-{uuid4().hex[:12]}"
+        with self._connect() as conn:
+            conn.execute(
+                """INSERT INTO pipeline_runs (run_id, mode, started_at) VALUES (?, ?, ?)
+                   ON CONFLICT (run_id) DO UPDATE SET status = 'running', finished_at = NULL""",
+                (run_id, mode, datetime.now(timezone.utc).isoformat()),
+            )
+        return run_id
+
+    def finish_pipeline_run(
+        self,
+        run_id: str,
+        status: str = "succeeded",
+        companies_seen: int | None = None,
+        companies_processed: int | None = None,
+        contacts_seen: int | None = None,
+        contacts_processed: int | None = None,
+    ):
+        """
+        Close a run, stamping each stage's high-water mark as of now.
+
+        Counts left as None keep their stored value (a resumed run that
+        skipped the TAM stage has nothing new to report).
+        """
+        marks = ", ".join(
+            f"{column} = (SELECT MAX({ts}) FROM {table})"
+            for column, (table, ts) in self._RUN_WATERMARKS.items()
+        )
+        with self._connect() as conn:
+            conn.execute(
+                f"""UPDATE pipeline_runs SET status = ?, finished_at = ?,
+                    companies_seen = COALESCE(?, companies_seen),
+                    companies_processed = COALESCE(?, companies_processed),
+                    contacts_seen = COALESCE(?, contacts_seen),
+                    contacts_processed = COALESCE(?, contacts_processed), {marks}
+                    WHERE run_id = ?""",
+                (
+                    status, datetime.now(timezone.utc).isoformat(),
+                    companies_seen, companies_processed,
+                    contacts_seen, contacts_processed, run_id,
+                ),
+            )
+
+    def get_pipeline_runs(self, limit: int = 20) -> list[dict]:
+        """Most recent runs first."""
+        with self._connect() as conn:
             rows = conn.execute(
-                """SELECT qualification_status, COUNT(*) as cnt
-                   FROM fct_scored_leads GROUP BY qualification_status"""
+                "SELECT * FROM pipeline_runs ORDER BY started_at DESC LIMIT ?", (limit,)
             ).fetchall()
-            stats["qualification_breakdown"] = {r["qualification_status"]: r["cnt"] for r in rows}
+        return [dict(r) for r in rows]
 
-            # Average score
-            avg = conn.execute(
-                "SELECT AVG(score) as avg_score FROM fct_scored_leads"
-            ).fetchone()
-            stats["avg_score"] = round(avg["avg_score"], 1) if avg["avg_score"] else 0
-
-            # Funnel: tracked at LEAD (contact) level for consistent decrease
-            # Total contacts in the pool
-            stats["funnel_pool"] = stats["dim_contacts"]
-
-            # Contacts whose company has an enriched lead (= ICP matched + enrichment success)
-            icp_contacts = conn.execute(
-                """SELECT COUNT(DISTINCT ct.contact_id) FROM dim_contacts ct
-                   JOIN dim_companies c ON ct.company_id = c.company_id
-                   WHERE c.company_id IN (SELECT DISTINCT company_id FROM fct_enriched_leads)"""
-            ).fetchone()[0]
-            stats["funnel_icp_contacts"] = icp_contacts
-
-            # Enriched leads
-            stats["funnel_enriched"] = stats["fct_enriched_leads"]
-
-            # Scored leads
-            stats["funnel_scored"] = stats["fct_scored_leads"]
-
-            # Qualified (hot) leads
-            qualified_leads = conn.execute(
-                "SELECT COUNT(*) FROM fct_scored_leads WHERE qualification_status = 'qualified'"
-            ).fetchone()[0]
-            stats["funnel_qualified"] = qualified_leads
-
-            # Qualified + Nurture (pipeline)
-            pipeline_leads = conn.execute(
-                "SELECT COUNT(*) FROM fct_scored_leads WHERE qualification_status IN ('qualified','nurture')"
-            ).fetchone()[0]
-            stats["funnel_pipeline"] = pipeline_leads
-
-            # Unique companies at qualified level (for funnel_qualified_companies)
-            qualified_companies = conn.execute(
-                """SELECT COUNT(DISTINCT e.company_id)
-                   FROM fct_scored_leads s
-                   JOIN fct_enriched_leads e ON s.lead_id = e.lead_id
-                   WHERE s.qualification_status = 'qualified'"""
-            ).fetchone()[0]
-            stats["funnel_qualified_companies"] = qualified_companies
-
-            # Total pipeline value
-            pipeline_val = conn.execute(
-                """SELECT SUM(s.score * c.revenue_usd / 10000) as val
-                   FROM fct_scored_leads s
-                   JOIN fct_enriched_leads e ON s.lead_id = e.lead_id
-                   JOIN dim_companies c ON e.company_id = c.company_id
-                   WHERE s.qualification_status IN ('qualified', 'nurture')"""
+    def get_last_successful_run(self) -> dict | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                """SELECT * FROM pipeline_runs WHERE status = 'succeeded'
+                   ORDER BY started_at DESC LIMIT 1"""
             ).fetchone()
-            stats["total_pipeline_value"] = round(pipeline_val[0], 2) if pipeline_val[0] else 0
+        return dict(row) if row else None
+
+    def insert_stage_metrics(self, run_id: str, metrics: Iterable[StageMetrics]) -> int:
+        """Store a run's per-stage metrics (replacing any from an earlier attempt)."""
+        now = datetime.now(timezone.utc).isoformat()
+        return self._insert_many(
+            """INSERT OR REPLACE INTO fct_pipeline_runs
+               (run_id, stage, stage_order, wall_seconds, cpu_seconds, rows_in, rows_out,
+                rows_per_sec, db_write_seconds, peak_memory_mb, recorded_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                (run_id, m.stage, order, m.wall_seconds, m.cpu_seconds, m.rows_in,
+                 m.rows_out, m.rows_per_sec, m.db_write_seconds, m.peak_memory_mb, now)
+                for order, m in enumerate(metrics)
+            ),
+            DEFAULT_BATCH_SIZE,
+        )
+
+    def get_stage_metrics(self, run_id: str) -> list[StageMetrics]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM fct_pipeline_runs WHERE run_id = ? ORDER BY stage_order",
+                (run_id,),
+            ).fetchall()
+        fields = StageMetrics.model_fields
+        return [build(StageMetrics, **{k: r[k] for k in r.keys() if k in fields}) for r in rows]
 
-            # Industry breakdown
+    def get_known_fingerprints(self, entity: str, fingerprints: Iterable[str]) -> dict[str, str]:
+        """Map each fingerprint already loaded by a successful run to its entity id."""
+        known = {}
+        with self._connect() as conn:
+            for batch in _batched(fingerprints, 500):
+                placeholders = ", ".join("?" * len(batch))
+                rows = conn.execute(
+                    f"""SELECT f.fingerprint, f.entity_id FROM pipeline_fingerprints f
+                        JOIN pipeline_runs r ON r.run_id = f.run_id
+                        WHERE f.entity = ? AND r.status = 'succeeded'
+                          AND f.fingerprint IN ({placeholders})""",
+                    [entity, *batch],
+                ).fetchall()
+                known.update((r["fingerprint"], r["entity_id"]) for r in rows)
+        return known
+
+    def record_fingerprints(
+        self, entity: str, fingerprints: Iterable[tuple[str, str]], run_id: str
+    ) -> int:
+        """Store (fingerprint, entity id) pairs loaded by ``run_id``."""
+        return self._insert_many(
+            """INSERT OR REPLACE INTO pipeline_fingerprints
+               (entity, fingerprint, entity_id, run_id) VALUES (?, ?, ?, ?)""",
+            ((entity, fp, entity_id, run_id) for fp, entity_id in fingerprints),
+            DEFAULT_BATCH_SIZE,
+        )
+
+    # ── Ingestion Queue ───────────────────────────────
+
+    def _create_queue_table(self, conn: sqlite3.Connection):
+        """
+        Create the queue the pipeline daemon drains.
+
+        Items move pending → claimed, and are deleted once processed. An
+        item whose batch failed goes back to pending with its attempt
+        counted; items that could not be processed stay behind as 'failed'
+        with the error.
+        """
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS ingest_queue (
+                item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                enqueued_at TEXT NOT NULL,
+                claimed_at TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_ingest_queue_status
+                ON ingest_queue(status, item_id);
+        """)
+        columns = {r["name"] for r in conn.execute("PRAGMA table_info(ingest_queue)")}
+        if "attempts" not in columns:
+            # Queues created before retries were counted
+            conn.execute("ALTER TABLE ingest_queue ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0")
+
+    def enqueue(self, payloads: Iterable[dict]) -> int:
+        """Append JSON payloads to the ingestion queue."""
+        now = datetime.now(timezone.utc).isoformat()
+        return self._insert_many(
+            "INSERT INTO ingest_queue (payload, enqueued_at) VALUES (?, ?)",
+            ((json.dumps(p, default=str), now) for p in payloads),
+            DEFAULT_BATCH_SIZE,
+        )
+
+    def claim_queue_items(self, limit: int) -> list[dict]:
+        """Claim up to ``limit`` pending items, oldest first."""
+        with self._connect() as conn:
             rows = conn.execute(
-                "SELECT industry, COUNT(*) as cnt FROM dim_companies GROUP BY industry ORDER BY cnt DESC"
+                """UPDATE ingest_queue SET status = 'claimed', claimed_at = ?
+                   WHERE item_id IN (
+                       SELECT item_id FROM ingest_queue WHERE status = 'pending'
+                       ORDER BY item_id LIMIT ?
+                   )
+                   RETURNING item_id, payload, enqueued_at, attempts""",
+                (datetime.now(timezone.utc).isoformat(), limit),
             ).fetchall()
-            stats["industry_breakdown"] = {r["industry"]: r["cnt"] for r in rows}
+        return sorted((dict(r) for r in rows), key=lambda r: r["item_id"])
+
+    def ack_queue_items(self, item_ids: Iterable[int]):
+        """Remove processed items from the queue."""
+        with self._connect() as conn:
+            for batch in _batched(item_ids, 500):
+                conn.execute(
+                    f"DELETE FROM ingest_queue WHERE item_id IN ({', '.join('?' * len(batch))})",
+                    batch,
+                )
+
+    def fail_queue_items(self, item_ids: Iterable[int], error: str):
+        """Park items that could not be processed, keeping the error."""
+        with self._connect() as conn:
+            for batch in _batched(item_ids, 500):
+                conn.execute(
+                    f"""UPDATE ingest_queue SET status = 'failed', error = ?
+                        WHERE item_id IN ({', '.join('?' * len(batch))})""",
+                    [error, *batch],
+                )
+
+    def retry_queue_items(self, item_ids: Iterable[int], error: str, max_attempts: int) -> int:
+        """
+        Count a failed attempt on claimed items and return them to pending;
+        items that have now been tried ``max_attempts`` times are parked as
+        'failed' instead. Returns the number parked.
+        """
+        parked = 0
+        with self._connect() as conn:
+            for batch in _batched(item_ids, 500):
+                rows = conn.execute(
+                    f"""UPDATE ingest_queue
+                        SET attempts = attempts + 1, error = ?, claimed_at = NULL,
+                            status = CASE WHEN attempts + 1 >= ? THEN 'failed' ELSE 'pending' END
+                        WHERE item_id IN ({', '.join('?' * len(batch))})
+                        RETURNING status""",
+                    [error, max_attempts, *batch],
+                ).fetchall()
+                parked += sum(r["status"] == "failed" for r in rows)
+        return parked
 
-            # Market breakdown
+    def release_queue_items(self) -> int:
+        """Return items claimed by a daemon that stopped before finishing them."""
+        with self._connect() as conn:
+            return conn.execute(
+                """UPDATE ingest_queue SET status = 'pending', claimed_at = NULL
+                   WHERE status = 'claimed'"""
+            ).rowcount
+
+    def get_queue_counts(self) -> dict[str, int]:
+        """Queued items by status."""
+        with self._connect() as conn:
             rows = conn.execute(
-                "SELECT country, COUNT(*) as cnt FROM dim_companies GROUP BY country ORDER BY cnt DESC"
+                "SELECT status, COUNT(*) AS n FROM ingest_queue GROUP BY status"
             ).fetchall()
-            stats["market_breakdown"] = {r["country"]: r["cnt"] for r in rows}
-
-            # Outreach stats
-            total_sent = conn.execute(
-                "SELECT COUNT(*) FROM fct_outreach_events WHERE status != 'pending'"
-            ).fetchone()[0]
-            total_opened = conn.execute(
-                "SELECT COUNT(*) FROM fct_outreach_events WHERE opened_at IS NOT NULL"
-            ).fetchone()[0]
-            total_replied = conn.execute(
-                "SELECT COUNT(*) FROM fct_outreach_events WHERE responded_at IS NOT NULL"
-            ).fetchone()[0]
-            total_interested = conn.execute(
-                "SELECT COUNT(*) FROM fct_outreach_events WHERE response_type = 'interested'"
-            ).fetchone()[0]
-            stats["outreach_sent"] = total_sent
-            stats["outreach_opened"] = total_opened
-            stats["outreach_replied"] = total_replied
-            stats["outreach_interested"] = total_interested
+        return {r["status"]: r["n"] for r in rows}
 
-        return stats
+    # ── Company Natural Keys ──────────────────────────
+
+    def _create_key_table(self, conn: sqlite3.Connection):
+        """Create the exact natural key → company id table behind the dedup index."""
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS company_keys (
+                natural_key TEXT PRIMARY KEY,
+                company_id TEXT NOT NULL
+            ) WITHOUT ROWID;
+
+            -- merge_entities re-points the keys of a merged-away company
+            CREATE INDEX IF NOT EXISTS idx_company_keys_company ON company_keys(company_id);
+        """)
+
+    def get_company_keys(self, keys: Iterable[str]) -> dict[str, str]:
+        """Map each natural key already recorded to its company id."""
+        found: dict[str, str] = {}
+        with self._connect() as conn:
+            for batch in _batched(keys, 500):
+                rows = conn.execute(
+                    f"""SELECT natural_key, company_id FROM company_keys
+                        WHERE natural_key IN ({', '.join('?' * len(batch))})""",
+                    batch,
+                ).fetchall()
+                found.update((r["natural_key"], r["company_id"]) for r in rows)
+        return found
+
+    def record_company_keys(self, pairs: Iterable[tuple[str, str]]) -> int:
+        """Store (natural key, company id) pairs; keys already recorded keep their id."""
+        return self._insert_many(
+            "INSERT OR IGNORE INTO company_keys (natural_key, company_id) VALUES (?, ?)",
+            pairs,
+            DEFAULT_BATCH_SIZE,
+        )
+
+    def iter_company_keys(self, batch_size: int = 50_000) -> Iterator[list[str]]:
+        """Every recorded natural key, in batches."""
+        with self._connect() as conn:
+            cursor = conn.execute("SELECT natural_key FROM company_keys")
+            while rows := cursor.fetchmany(batch_size):
+                yield [r[0] for r in rows]
+
+    def count_company_keys(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM company_keys").fetchone()[0]
+
+    # ── Entity Merges ─────────────────────────────────
+
+    def merge_entities(self, company_merges: dict[str, str], contact_merges: dict[str, str]) -> int:
+        """
+        Fold merged-away companies and contacts into their canonical records.
+
+        Contacts, leads and natural keys of a merged company move to the
+        company it was merged into. Leads of a merged contact are deleted,
+        since the canonical contact gets its own. The merged rows are then
+        removed, and the number of rows removed is returned.
+        """
+        with self._connect() as conn:
+            lead_ids = []
+            for batch in _batched(contact_merges, 500):
+                lead_ids += [r[0] for r in conn.execute(
+                    f"""SELECT lead_id FROM fct_enriched_leads
+                        WHERE contact_id IN ({', '.join('?' * len(batch))})""",
+                    batch,
+                )]
+            self.delete_leads(lead_ids)
+
+            moves = [(new, old) for old, new in company_merges.items()]
+            for table in ("dim_contacts", "fct_enriched_leads", "company_keys"):
+                conn.executemany(f"UPDATE {table} SET company_id = ? WHERE company_id = ?", moves)
+
+            removed = 0
+            for table, column, ids in (("dim_contacts", "contact_id", contact_merges),
+                                       ("dim_companies", "company_id", company_merges)):
+                for batch in _batched(ids, 500):
+                    removed += conn.execute(
+                        f"DELETE FROM {table} WHERE {column} IN ({', '.join('?' * len(batch))})",
+                        batch,
+                    ).rowcount
+        return removed
 
     # ── Search & Filter ───────────────────────────────
 
+    @_cached
     def search_leads(
         self,
         text_query: str = "",
@@ -479,113 +1657,163 @@ class Database:
         bant_need: bool | None = None,
         bant_timeline: bool | None = None,
         limit: int = 200,
-    ) -> list[dict]:
+        order_by: str = "score",
+        cursor: str | None = None,
+        columns: list[str] | None = None,
+    ) -> list[LazyRow]:
         """
         Search leads with dynamic filtering across all tables.
 
+        ``text_query`` is matched word by word as substrings against the FTS5
+        trigram index (company, contact, title, industry, buying signals,
+        tech stack); single-character words are ignored. With
+        ``order_by="relevance"`` text matches are ranked by bm25 instead of
+        score. Without FTS5, the whole query is matched as one substring of
+        company name, contact name, industry or title with LIKE.
+        ``cursor`` (from search_leads_page) continues a score-ordered search.
+
+        ``columns`` limits the result to the named keys of ``LEAD_COLUMNS``
+        (plus lead_id, score and contact_id); leave the large JSON and
+        deal_brief columns out when only rendering a table.
+
         Returns joined records: company + contact + enrichment + score data.
+        JSON columns are decoded lazily, on first access.
         """
-        conditions = []
-        params = []
-
-        # Text search across company name, contact name, industry
-        if text_query:
-            conditions.append(
-                "(c.name LIKE ? OR ct.full_name LIKE ? OR c.industry LIKE ? OR ct.title LIKE ?)"
+        # Filters are templates over table aliases: they apply to each lead
+        # in the outer query and again in the per-contact dedup subquery
+        filters = []
+        filter_params = []
+        fts_join = ""
+        order_clause = "s.score DESC, s.lead_id DESC"
+
+        # Text search across company, contact, industry, signals and tech stack
+        if text_query and self._fts_enabled:
+            match, short_words = self._search_terms(text_query)
+            if match or short_words:
+                fts_join = (
+                    "JOIN lead_search_docs {docs} ON {docs}.lead_id = {s}.lead_id "
+                    "JOIN lead_search {fts} ON {fts}.rowid = {docs}.docid"
+                )
+            if match:
+                filters.append("{fts}.lead_search MATCH ?")
+                filter_params.append(match)
+                if order_by == "relevance":
+                    # rank is the weighted bm25 configured in _create_search_index
+                    order_clause = "lead_search.rank, s.score DESC, s.lead_id DESC"
+            for word in short_words:
+                filters.append("(" + " OR ".join(
+                    f"{{fts}}.{column} LIKE ? ESCAPE '\\'" for column in self._SEARCH_TEXT_COLUMNS
+                ) + ")")
+                escaped = re.sub(r"([\\%_])", r"\\\1", word)
+                filter_params.extend([f"%{escaped}%"] * len(self._SEARCH_TEXT_COLUMNS))
+        elif text_query:
+            filters.append(
+                "({c}.name LIKE ? OR {ct}.full_name LIKE ? OR {c}.industry LIKE ? OR {ct}.title LIKE ?)"
             )
             q = f"%{text_query}%"
-            params.extend([q, q, q, q])
+            filter_params.extend([q, q, q, q])
 
         # Market filter
         if markets:
             placeholders = ",".join("?" * len(markets))
-            conditions.append(f"c.country IN ({placeholders})")
-            params.extend(markets)
+            filters.append(f"{{c}}.country IN ({placeholders})")
+            filter_params.extend(markets)
 
         # Industry filter
         if industries:
             placeholders = ",".join("?" * len(industries))
-            conditions.append(f"c.industry IN ({placeholders})")
-            params.extend(industries)
+            filters.append(f"{{c}}.industry IN ({placeholders})")
+            filter_params.extend(industries)
 
         # Revenue range
         if revenue_min is not None:
-            conditions.append("c.revenue_usd >= ?")
-            params.append(revenue_min)
+            filters.append("{c}.revenue_usd >= ?")
+            filter_params.append(revenue_min)
         if revenue_max is not None:
-            conditions.append("c.revenue_usd <= ?")
-            params.append(revenue_max)
+            filters.append("{c}.revenue_usd <= ?")
+            filter_params.append(revenue_max)
 
         # Employee range
         if employees_min is not None:
-            conditions.append("c.employee_count >= ?")
-            params.append(employees_min)
+            filters.append("{c}.employee_count >= ?")
+            filter_params.append(employees_min)
         if employees_max is not None:
-            conditions.append("c.employee_count <= ?")
-            params.append(employees_max)
+            filters.append("{c}.employee_count <= ?")
+            filter_params.append(employees_max)
 
         # Score range
         if score_min is not None:
-            conditions.append("s.score >= ?")
-            params.append(score_min)
+            filters.append("{s}.score >= ?")
+            filter_params.append(score_min)
         if score_max is not None:
-            conditions.append("s.score <= ?")
-            params.append(score_max)
+            filters.append("{s}.score <= ?")
+            filter_params.append(score_max)
 
         # Status filter
         if statuses:
             placeholders = ",".join("?" * len(statuses))
-            conditions.append(f"s.qualification_status IN ({placeholders})")
-            params.extend(statuses)
+            filters.append(f"{{s}}.qualification_status IN ({placeholders})")
+            filter_params.extend(statuses)
 
         # Seniority filter
         if seniorities:
             placeholders = ",".join("?" * len(seniorities))
-            conditions.append(f"ct.seniority IN ({placeholders})")
-            params.extend(seniorities)
+            filters.append(f"{{ct}}.seniority IN ({placeholders})")
+            filter_params.extend(seniorities)
 
         # Source filter
         if sources:
             placeholders = ",".join("?" * len(sources))
-            conditions.append(f"c.source IN ({placeholders})")
-            params.extend(sources)
+            filters.append(f"{{c}}.source IN ({placeholders})")
+            filter_params.extend(sources)
 
         # BANT filters
-        if bant_budget is not None:
-            conditions.append(f"s.budget_signal = ?")
-            params.append(int(bant_budget))
-        if bant_authority is not None:
-            conditions.append(f"s.authority_signal = ?")
-            params.append(int(bant_authority))
-        if bant_need is not None:
-            conditions.append(f"s.need_signal = ?")
-            params.append(int(bant_need))
-        if bant_timeline is not None:
-            conditions.append(f"s.timeline_signal = ?")
-            params.append(int(bant_timeline))
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        for column, wanted in (("budget_signal", bant_budget), ("authority_signal", bant_authority),
+                               ("need_signal", bant_need), ("timeline_signal", bant_timeline)):
+            if wanted is not None:
+                filters.append(f"{{s}}.{column} = ?")
+                filter_params.append(int(wanted))
+
+        outer = dict(s="s", e="e", c="c", ct="ct", fts="lead_search", docs="d")
+        inner = dict(s="s2", e="e2", c="c2", ct="ct2", fts="ls2", docs="d2")
+        conditions = [f.format(**outer) for f in filters]
+        params = list(filter_params)
+
+        # Keyset pagination: resume strictly after the last (score, lead_id) seen
+        if cursor:
+            if order_by != "score":
+                raise ValueError("cursor pagination requires order_by='score'")
+            conditions.append("(s.score, s.lead_id) < (?, ?)")
+            params.extend(decode_cursor(cursor, 2))
+
+        # One row per contact: keep the best of the contact's leads that pass
+        # the same filters. Unlike GROUP BY this keeps the plan a walk of the
+        # score index (no temp sort) and picks the surviving row
+        # deterministically; companies and contacts are only joined into the
+        # probe when a filter needs them.
+        filter_text = " ".join(filters)
+        inner_joins = [fts_join.format(**inner)]
+        if "{c}" in filter_text:
+            inner_joins.append("JOIN dim_companies c2 ON c2.company_id = e2.company_id")
+        if "{ct}" in filter_text:
+            inner_joins.append("JOIN dim_contacts ct2 ON ct2.contact_id = e2.contact_id")
+        inner_filters = "".join(f" AND {f.format(**inner)}" for f in filters)
+        conditions.append(f"""NOT EXISTS (
+            SELECT 1 FROM fct_enriched_leads e2
+            JOIN fct_scored_leads s2 ON s2.lead_id = e2.lead_id
+            {" ".join(inner_joins)}
+            WHERE e2.contact_id = e.contact_id
+              AND (s2.score, s2.lead_id) > (s.score, s.lead_id){inner_filters}
+        )""")
+        params.extend(filter_params)
+
+        where_clause = " AND ".join(conditions)
 
         query = f"""
-            SELECT
-                s.lead_id, s.score, s.qualification_status, s.deal_stage,
-                s.budget_signal, s.authority_signal, s.need_signal, s.timeline_signal,
-                s.deal_brief,
-                c.company_id, c.name as company_name, c.industry, c.country, c.state,
-                c.employee_count, c.revenue_usd, c.website, c.tech_stack,
-                c.funding_stage, c.source as company_source,
-                ct.contact_id, ct.full_name as contact_name, ct.title as contact_title,
-                ct.email, ct.phone, ct.linkedin_url, ct.seniority, ct.department,
-                e.tech_stack_detected, e.tech_stack_gaps, e.buying_signals,
-                e.social_signals, e.news_mentions, e.enrichment_completeness,
-                e.enrichment_sources
-            FROM fct_scored_leads s
-            JOIN fct_enriched_leads e ON s.lead_id = e.lead_id
-            JOIN dim_companies c ON e.company_id = c.company_id
-            JOIN dim_contacts ct ON e.contact_id = ct.contact_id
+            {self._lead_select(columns)}
+            {fts_join.format(**outer)}
             WHERE {where_clause}
-            GROUP BY ct.contact_id
-            ORDER BY s.score DESC
+            ORDER BY {order_clause}
             LIMIT ?
         """
         params.append(limit)
@@ -593,33 +1821,109 @@ class Database:
         with self._connect() as conn:
             rows = conn.execute(query, params).fetchall()
 
-        results = []
-        for row in rows:
-            d = dict(row)
-            # Parse JSON fields
-            for field in ["tech_stack", "tech_stack_detected", "tech_stack_gaps",
-                          "buying_signals", "news_mentions", "enrichment_sources"]:
-                if d.get(field):
-                    d[field] = json.loads(d[field])
-            if d.get("social_signals"):
-                d["social_signals"] = json.loads(d["social_signals"])
-            d["budget_signal"] = bool(d.get("budget_signal", 0))
-            d["authority_signal"] = bool(d.get("authority_signal", 0))
-            d["need_signal"] = bool(d.get("need_signal", 0))
-            d["timeline_signal"] = bool(d.get("timeline_signal", 0))
-            results.append(d)
-
-        return results
-
-    def get_lead_detail(self, lead_id: str) -> dict | None:
-        """Get full lead detail joining all tables + outreach events."""
-        leads = self.search_leads(limit=1000)
-        lead = next((l for l in leads if l["lead_id"] == lead_id), None)
-        if not lead:
-            return None
+        return [self._row_to_lead_dict(row) for row in rows]
+
+    def search_leads_page(
+        self, limit: int = 200, cursor: str | None = None, **filters
+    ) -> tuple[list[LazyRow], str | None]:
+        """One page of search_leads results plus the cursor for the next page."""
+        leads = self.search_leads(limit=limit + 1, cursor=cursor, **filters)
+        if len(leads) <= limit:
+            return leads, None
+        last = leads[limit - 1]
+        return leads[:limit], encode_cursor(last["score"], last["lead_id"])
+
+    # Joined lead record shared by search_leads and the direct lookups:
+    # output key -> SQL expression.
+    LEAD_COLUMNS = {
+        "lead_id": "s.lead_id",
+        "score": "s.score",
+        "qualification_status": "s.qualification_status",
+        "deal_stage": "s.deal_stage",
+        "budget_signal": "s.budget_signal",
+        "authority_signal": "s.authority_signal",
+        "need_signal": "s.need_signal",
+        "timeline_signal": "s.timeline_signal",
+        "deal_brief": "s.deal_brief",
+        "company_id": "c.company_id",
+        "company_name": "c.name",
+        "industry": "c.industry",
+        "country": "c.country",
+        "state": "c.state",
+        "employee_count": "c.employee_count",
+        "revenue_usd": "c.revenue_usd",
+        "website": "c.website",
+        "tech_stack": "c.tech_stack",
+        "funding_stage": "c.funding_stage",
+        "company_source": "c.source",
+        "contact_id": "ct.contact_id",
+        "contact_name": "ct.full_name",
+        "contact_title": "ct.title",
+        "email": "ct.email",
+        "phone": "ct.phone",
+        "linkedin_url": "ct.linkedin_url",
+        "seniority": "ct.seniority",
+        "department": "ct.department",
+        "tech_stack_detected": "e.tech_stack_detected",
+        "tech_stack_gaps": "e.tech_stack_gaps",
+        "buying_signals": "e.buying_signals",
+        "social_signals": "e.social_signals",
+        "news_mentions": "e.news_mentions",
+        "enrichment_completeness": "e.enrichment_completeness",
+        "enrichment_sources": "e.enrichment_sources",
+    }
+    # Always selected: identify the row and carry the pagination cursor
+    _LEAD_KEY_COLUMNS = ("lead_id", "score", "contact_id")
+    _LEAD_JSON_COLUMNS = (
+        "tech_stack", "tech_stack_detected", "tech_stack_gaps",
+        "buying_signals", "social_signals", "news_mentions", "enrichment_sources",
+    )
+    _LEAD_BOOL_COLUMNS = ("budget_signal", "authority_signal", "need_signal", "timeline_signal")
+    _LEAD_FROM = """
+        FROM fct_scored_leads s
+        JOIN fct_enriched_leads e ON s.lead_id = e.lead_id
+        JOIN dim_companies c ON e.company_id = c.company_id
+        JOIN dim_contacts ct ON e.contact_id = ct.contact_id
+    """
+
+    @classmethod
+    def _lead_select(cls, columns: Iterable[str] | None = None) -> str:
+        """SELECT ... FROM for joined leads, optionally projected to ``columns``."""
+        if columns is None:
+            names = list(cls.LEAD_COLUMNS)
+        else:
+            names = list(dict.fromkeys([*cls._LEAD_KEY_COLUMNS, *columns]))
+            unknown = [n for n in names if n not in cls.LEAD_COLUMNS]
+            if unknown:
+                raise ValueError(f"Unknown lead columns: {', '.join(unknown)}")
+        select = ", ".join(f"{cls.LEAD_COLUMNS[n]} AS {n}" for n in names)
+        return f"SELECT {select} {cls._LEAD_FROM}"
+
+    def _row_to_lead_dict(self, row: sqlite3.Row) -> LazyRow:
+        d = dict(row)
+        for field in self._LEAD_BOOL_COLUMNS:
+            if field in d:
+                d[field] = bool(d[field])
+        # JSON fields are parsed on first access
+        return LazyRow(d, json_fields=self._LEAD_JSON_COLUMNS)
+
+    @_cached
+    def get_lead_by_id(self, lead_id: str) -> LazyRow | None:
+        """
+        Get full lead detail (all tables + outreach events) by primary key.
 
-        # Add outreach events
-        events = self.get_outreach_events(lead_id=lead_id, limit=50)
+        Runs one joined ``WHERE s.lead_id = ?`` query plus an indexed
+        outreach lookup, so cost does not depend on table size.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                f"{self._lead_select()} WHERE s.lead_id = ?", (lead_id,)
+            ).fetchone()
+            if not row:
+                return None
+            events = self.get_outreach_events(lead_id=lead_id, limit=50)
+
+        lead = self._row_to_lead_dict(row)
         lead["outreach_events"] = [
             {
                 "event_id": e.event_id,
@@ -635,9 +1939,24 @@ class Database:
             }
             for e in events
         ]
-
         return lead
 
+    def get_lead_detail(self, lead_id: str) -> LazyRow | None:
+        """Get full lead detail joining all tables + outreach events."""
+        return self.get_lead_by_id(lead_id)
+
+    @_cached
+    def get_brief_by_id(self, lead_id: str) -> dict | None:
+        """Get a lead's score and deal brief by primary key."""
+        with self._connect() as conn:
+            row = conn.execute(
+                """SELECT lead_id, score, deal_brief, deal_stage
+                   FROM fct_scored_leads WHERE lead_id = ?""",
+                (lead_id,),
+            ).fetchone()
+        return dict(row) if row else None
+
+    @_cached
     def get_unique_values(self, column: str, table: str) -> list[str]:
         """Get unique values for a column (for filter dropdowns)."""
         allowed = {
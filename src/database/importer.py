@@ -0,0 +1,332 @@
+"""
+B2B Lead Engine — Provider File Importer
+
+Streams bulk exports from data providers (CSV, JSONL or Parquet) in
+fixed-size chunks and maps each chunk onto Company and Contact models
+through the provider's declarative mapping in ``config/providers.yaml``.
+Only one chunk of the file is in memory at a time. Each chunk comes out as
+a (companies, contacts) TAM batch, so an import can feed
+``run_pipeline(tam=...)`` directly, or go straight to the bulk writer with
+``import_file``.
+
+Chunks are read as text and typed by the mapping: numbers that do not
+parse become 0 (or None for optional fields), lists are split on the
+provider's separator, CNPJs keep only their digits, and revenue is
+converted to USD (BRL at ``settings.brl_usd_rate``). Every row then goes
+through the validating model constructors; rows without a name or that
+fail validation are skipped and counted in ``rows_rejected`` /
+``contacts_rejected``. Company ids derive
+from the company's natural key (CNPJ for BR, else website domain), so
+re-importing a file, or importing the same company from another provider,
+overwrites the same row.
+
+Usage:
+    python -m src.database.importer exports/receita.csv --provider receita_federal
+    python -m src.database.importer exports/apollo.jsonl --provider apollo --db data/lead_engine.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+import polars as pl
+from pydantic import ValidationError
+
+from src.config.provider_loader import EntityMapping, ProviderConfig, load_provider_config
+from src.config.settings import settings
+from src.database.database import Database
+from src.models.models import Company, Contact, company_key, natural_company_id, stable_id
+
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+
+# Typed model fields; everything else is text
+_INT_FIELDS = {"employee_count", "founded_year"}
+_OPTIONAL_FIELDS = {"founded_year", "cnpj", "cnae_code"}
+_LIST_FIELDS = {"tech_stack"}
+_BOOL_FIELDS = {"verified"}
+_TRUE = ["true", "1", "yes", "y", "sim", "s"]
+
+
+def currency_rates() -> dict[str, float]:
+    """USD per unit of each supported revenue currency."""
+    return {"USD": 1.0, "BRL": settings.brl_usd_rate}
+
+
+# ── Chunked Readers ───────────────────────────────────
+
+
+def _exact_chunks(frames: Iterator[pl.DataFrame], size: int) -> Iterator[pl.DataFrame]:
+    """Re-slice frames of arbitrary height into frames of exactly ``size`` rows (bar the last)."""
+    buffer: pl.DataFrame | None = None
+    for frame in frames:
+        buffer = frame if buffer is None else pl.concat([buffer, frame])
+        while buffer.height >= size:
+            yield buffer.head(size)
+            buffer = buffer.slice(size)
+    if buffer is not None and buffer.height:
+        yield buffer
+
+
+def _as_text(value) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _read_csv(path: Path, columns: list[str], size: int, delimiter: str) -> Iterator[pl.DataFrame]:
+    header = pl.read_csv(path, separator=delimiter, n_rows=0).columns
+    _require_columns(path, header, columns)
+    reader = pl.read_csv_batched(
+        path, separator=delimiter, columns=columns, infer_schema_length=0, batch_size=size,
+    )
+
+    def frames():
+        while batches := reader.next_batches(1):
+            yield from batches
+
+    yield from _exact_chunks(frames(), size)
+
+
+def _read_jsonl(path: Path, columns: list[str], size: int, separator: str) -> Iterator[pl.DataFrame]:
+    def text(value):
+        if isinstance(value, list):
+            return separator.join(map(str, value))
+        return _as_text(value)
+
+    schema = {column: pl.Utf8 for column in columns}
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            rows.append({column: text(record.get(column)) for column in columns})
+            if len(rows) == size:
+                yield pl.from_dicts(rows, schema=schema)
+                rows = []
+    if rows:
+        yield pl.from_dicts(rows, schema=schema)
+
+
+def _read_parquet(path: Path, columns: list[str], size: int, separator: str) -> Iterator[pl.DataFrame]:
+    scan = pl.scan_parquet(path)
+    schema = scan.schema
+    _require_columns(path, list(schema), columns)
+    as_text = [
+        pl.col(c).list.eval(pl.element().cast(pl.Utf8)).list.join(separator)
+        if isinstance(schema[c], pl.List) else pl.col(c).cast(pl.Utf8)
+        for c in columns
+    ]
+    total = scan.select(pl.len()).collect().item()
+    for offset in range(0, total, size):
+        yield scan.slice(offset, size).select(as_text).collect()
+
+
+def _require_columns(path: Path, available: list[str], needed: list[str]):
+    missing = sorted(set(needed) - set(available))
+    if missing:
+        raise ValueError(f"{path.name} is missing mapped columns: {', '.join(missing)}")
+
+
+# ── Importer ──────────────────────────────────────────
+
+
+class ProviderImporter:
+    """
+    Maps one provider's bulk files onto Company and Contact batches.
+
+    With a ``contact`` mapping every row is a contact whose company columns
+    repeat on each row; companies are de-duplicated within a chunk, so a
+    company whose contacts span chunks is emitted once per chunk (the
+    writers upsert it).
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        config: ProviderConfig | None = None,
+        chunk_size: int | None = None,
+    ):
+        config = config or load_provider_config(settings.provider_config_path)
+        if provider not in config.providers:
+            raise ValueError(
+                f"Unknown provider {provider!r}; expected one of {', '.join(config.providers)}"
+            )
+        self.provider = provider
+        self.mapping = config.providers[provider]
+        self.chunk_size = chunk_size or settings.import_chunk_size
+        if self.chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
+        rates = currency_rates()
+        if self.mapping.revenue_currency.upper() not in rates:
+            raise ValueError(f"Unsupported revenue currency {self.mapping.revenue_currency!r}")
+        self._rate = rates[self.mapping.revenue_currency.upper()]
+        self._check_fields(
+            self.mapping.company, set(Company.model_fields) - {"company_id"} | {"revenue"}
+        )
+        if self.mapping.contact is not None:
+            self._check_fields(self.mapping.contact, set(Contact.model_fields) - {"company_id"})
+
+        self.rows_read = 0
+        self.rows_rejected = 0
+        self.contacts_rejected = 0
+        self.discovered_at = datetime.now(timezone.utc)
+
+    def _check_fields(self, mapping: EntityMapping, allowed: set[str]):
+        unknown = sorted((set(mapping.columns) | set(mapping.constants)) - allowed - {"discovered_at"})
+        if unknown:
+            raise ValueError(f"{self.mapping.name}: unknown fields in mapping: {', '.join(unknown)}")
+
+    def read_chunks(self, path: str | Path) -> Iterator[pl.DataFrame]:
+        """The mapped columns of ``path``, as text, ``chunk_size`` rows at a time."""
+        path = Path(path)
+        fmt = self.mapping.format or FORMATS.get(path.suffix.lower())
+        if fmt not in FORMATS.values():
+            raise ValueError(f"Cannot tell the format of {path.name}; set 'format' in the mapping")
+        columns = sorted(self.mapping.source_columns())
+        if fmt == "csv":
+            return _read_csv(path, columns, self.chunk_size, self.mapping.delimiter)
+        if fmt == "jsonl":
+            return _read_jsonl(path, columns, self.chunk_size, self.mapping.list_separator)
+        return _read_parquet(path, columns, self.chunk_size, self.mapping.list_separator)
+
+    def batches(self, path: str | Path) -> Iterator[tuple[list[Company], list[Contact]]]:
+        """Stream ``path`` as (companies, contacts) batches, one per chunk."""
+        for chunk in self.read_chunks(path):
+            self.rows_read += chunk.height
+            yield self._to_models(chunk)
+
+    # ── Mapping ───────────────────────────────────────
+
+    def _typed(self, chunk: pl.DataFrame, mapping: EntityMapping) -> pl.DataFrame:
+        """Select, rename and type the mapped fields of a text chunk."""
+        sources = {field: pl.col(column) for field, column in mapping.columns.items()}
+        for field, value in mapping.constants.items():
+            sources.setdefault(field, pl.lit(_as_text(value), dtype=pl.Utf8))
+
+        exprs = []
+        for field, source in sources.items():
+            if field == "discovered_at":
+                continue
+            value = source.str.strip_chars()
+            if field == "revenue":
+                exprs.append(
+                    (value.cast(pl.Float64, strict=False).fill_null(0.0) * self._revenue_rate())
+                    .alias("revenue_usd")
+                )
+            elif field == "revenue_usd":
+                exprs.append(value.cast(pl.Float64, strict=False).fill_null(0.0).alias(field))
+            elif field in _INT_FIELDS:
+                number = value.cast(pl.Float64, strict=False).cast(pl.Int64, strict=False)
+                exprs.append((number if field in _OPTIONAL_FIELDS else number.fill_null(0)).alias(field))
+            elif field in _LIST_FIELDS:
+                exprs.append(
+                    value.fill_null("").str.split(self.mapping.list_separator)
+                    .list.eval(pl.element().str.strip_chars().filter(pl.element() != ""))
+                    .alias(field)
+                )
+            elif field in _BOOL_FIELDS:
+                exprs.append(value.str.to_lowercase().is_in(_TRUE).fill_null(False).alias(field))
+            elif field == "cnpj":
+                digits = value.str.replace_all(r"\D", "")
+                exprs.append(pl.when(digits == "").then(None).otherwise(digits).alias(field))
+            elif field in _OPTIONAL_FIELDS:
+                exprs.append(pl.when(value == "").then(None).otherwise(value).alias(field))
+            else:
+                exprs.append(value.fill_null("").alias(field))
+        return chunk.select(exprs)
+
+    def _revenue_rate(self) -> pl.Expr:
+        column = self.mapping.revenue_currency_column
+        if column is None:
+            return pl.lit(self._rate)
+        # Rows in an unknown currency get no revenue rather than a wrong one
+        return (
+            pl.col(column).str.strip_chars().str.to_uppercase()
+            .replace(currency_rates(), default=None).cast(pl.Float64)
+        )
+
+    def _to_models(self, chunk: pl.DataFrame) -> tuple[list[Company], list[Contact]]:
+        companies: dict[str, Company] = {}
+        row_company_ids: list[str | None] = []
+        for row in self._typed(chunk, self.mapping.company).iter_rows(named=True):
+            if not row["name"]:
+                self.rows_rejected += 1
+                row_company_ids.append(None)
+                continue
+            row["company_id"] = natural_company_id(company_key(
+                row["name"], row.get("website", ""), row.get("country", ""), row.get("cnpj"),
+            ))
+            row["discovered_at"] = self.discovered_at
+            if row["company_id"] not in companies:
+                # Provider data is external input: validate it, never trust it
+                try:
+                    companies[row["company_id"]] = Company(**row)
+                except ValidationError:
+                    self.rows_rejected += 1
+                    row_company_ids.append(None)
+                    continue
+            row_company_ids.append(row["company_id"])
+
+        contacts: list[Contact] = []
+        if self.mapping.contact is not None:
+            rows = self._typed(chunk, self.mapping.contact).iter_rows(named=True)
+            for company_id, row in zip(row_company_ids, rows):
+                if company_id is None or not row["full_name"]:
+                    continue
+                raw_id = row.pop("contact_id", None)
+                row["contact_id"] = (
+                    stable_id("ct", self.provider, raw_id) if raw_id
+                    else stable_id("ct", company_id, row["full_name"], row.get("email", ""))
+                )
+                row["company_id"] = company_id
+                row["discovered_at"] = self.discovered_at
+                try:
+                    contacts.append(Contact(**row))
+                except ValidationError:
+                    self.contacts_rejected += 1
+        return list(companies.values()), contacts
+
+
+def import_file(
+    path: str | Path, provider: str, db: Database, chunk_size: int | None = None
+) -> tuple[int, int]:
+    """Bulk-load a provider file into dim_companies / dim_contacts; returns (companies, contacts)."""
+    importer = ProviderImporter(provider, chunk_size=chunk_size)
+    companies = contacts = 0
+    for batch_companies, batch_contacts in importer.batches(path):
+        companies += db.insert_companies(batch_companies)
+        contacts += db.insert_contacts(batch_contacts)
+    return companies, contacts
+
+
+# ── CLI Entry Point ───────────────────────────────────
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="CSV, JSONL or Parquet export")
+    parser.add_argument("--provider", required=True, help="Mapping name in providers.yaml")
+    parser.add_argument("--db", metavar="PATH", help="SQLite database path")
+    parser.add_argument("--chunk-size", type=int, help="Rows per chunk")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    db = Database(args.db or settings.database_path)
+    companies, contacts = import_file(args.path, args.provider, db, args.chunk_size)
+    db.close()
+    print(f"Imported {companies:,} companies, {contacts:,} contacts "
+          f"in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
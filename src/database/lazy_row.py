@@ -0,0 +1,59 @@
+"""
+B2B Lead Engine — Lazy Row Mapping
+
+Read-side record type for joined lead rows. JSON columns are kept as the
+raw text SQLite returned and only parsed the first time they are read, so
+callers that render a few scalar fields never pay for decoding tech stacks,
+signals and news mentions.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import MutableMapping
+from typing import Any, Iterable, Iterator
+
+
+class LazyRow(MutableMapping):
+    """
+    A dict-like row whose JSON columns decode on first access.
+
+    Behaves like the plain dicts ``search_leads`` used to return: supports
+    ``row["field"]``, ``.get()``, item assignment, ``dict(row)`` and equality
+    with dicts. Use ``to_dict()`` where a real ``dict`` is required (e.g.
+    ``json.dumps``).
+    """
+
+    def __init__(self, data: dict[str, Any], json_fields: Iterable[str] = ()):
+        self._data = data
+        self._pending = {f for f in json_fields if data.get(f)}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._pending:
+            self._data[key] = json.loads(self._data[key])
+            self._pending.discard(key)
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any):
+        self._pending.discard(key)
+        self._data[key] = value
+
+    def __delitem__(self, key: str):
+        self._pending.discard(key)
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def to_dict(self) -> dict[str, Any]:
+        """Decode everything and return a plain dict."""
+        return {k: self[k] for k in self._data}
+
+    def __repr__(self) -> str:
+        return f"LazyRow({self.to_dict()!r})"
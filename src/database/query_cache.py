@@ -0,0 +1,119 @@
+"""
+B2B Lead Engine — Query Result Cache
+
+Bounded LRU cache for read-query results. Every entry belongs to a data
+version; when the caller reports a new version the cache is emptied, so a
+stale result is never served after a committed write.
+
+A result is copied once, when it is stored, and every hit returns that
+stored snapshot itself: results of cached reads are shared between callers
+and must be treated as read-only (copy before modifying).
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from src.database.lazy_row import LazyRow
+
+MISSING = object()
+
+
+def freeze(value: Any) -> Hashable:
+    """Turn call arguments (lists, dicts, sets) into a hashable cache key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    hash(value)  # raises TypeError for anything else we cannot key on
+    return value
+
+
+def snapshot(value: Any) -> Any:
+    """
+    A private copy of a result for the cache to share.
+
+    Lazy rows are decoded up front, so callers reading the same row from
+    several threads never race on its first-access decoding.
+    """
+    value = copy.deepcopy(value)
+    rows = value if isinstance(value, list) else [value]
+    for row in rows:
+        if isinstance(row, LazyRow):
+            row.to_dict()
+    return value
+
+
+class QueryCache:
+    """
+    Thread-safe LRU mapping of query key -> result, scoped to one data version.
+
+    ``put`` stores a ``snapshot`` of the result, so the caller that ran the
+    query keeps a result it may modify; ``get`` returns the shared snapshot
+    without copying, which is what makes a hit cheaper than re-running the
+    query.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._version: Hashable = None
+        self._lock = threading.Lock()
+
+    def _sync(self, version: Hashable):
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._version = version
+
+    def get(self, key: Hashable, version: Hashable) -> Any:
+        """Return the cached result, or ``MISSING`` if absent or out of date."""
+        with self._lock:
+            self._sync(version)
+            value = self._entries.get(key, MISSING)
+            if value is MISSING:
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def put(self, key: Hashable, version: Hashable, value: Any):
+        """Store a result computed while the data was at ``version``."""
+        value = snapshot(value)
+        with self._lock:
+            # The data moved on while the query ran; the result may already be stale.
+            if version != self._version:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
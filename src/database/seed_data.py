@@ -10,7 +10,7 @@ from __future__ import annotations
 import random
 from hashlib import md5
 
-from src.models.models import Company, Contact
+from src.models.models import Company, Contact, stable_id
 
 
 # ── Company Name Components ───────────────────────────
@@ -109,6 +109,19 @@ FUNDING_STAGES = [
 
 FUNDING_WEIGHTS = [5, 15, 25, 20, 12, 5, 3, 12, 3]  # realistic distribution
 
+# Annual revenue range (USD) per funding stage
+REVENUE_RANGES = {
+    "Pre-Seed": (100_000, 500_000),
+    "Seed": (300_000, 3_000_000),
+    "Series A": (2_000_000, 15_000_000),
+    "Series B": (8_000_000, 50_000_000),
+    "Series C": (25_000_000, 150_000_000),
+    "Series D": (50_000_000, 300_000_000),
+    "Growth": (100_000_000, 500_000_000),
+    "Bootstrapped": (500_000, 20_000_000),
+    "Public": (200_000_000, 2_000_000_000),
+}
+
 # ── Contact Templates ─────────────────────────────────
 
 PERSONA_TEMPLATES_US = [
@@ -160,6 +173,9 @@ LAST_NAMES = [
 US_SOURCES = ["apollo", "crunchbase", "sec_edgar", "linkedin", "opencorporates"]
 BR_SOURCES = ["receita_federal", "dados_abertos", "apollo", "linkedin"]
 INTL_SOURCES = ["apollo", "crunchbase", "opencorporates", "linkedin"]
+CONTACT_SOURCES = ["apollo", "hunter", "linkedin", "manual"]
+
+BR_CNAE_CODES = ["6201-5", "6202-3", "6203-1", "6204-0", "6311-9", "6319-4", "6399-2"]
 
 
 def _deterministic_seed(name: str) -> int:
@@ -173,18 +189,7 @@ def _generate_company_name(prefix: str, suffix: str) -> str:
 
 def _generate_revenue(funding_stage: str) -> float:
     """Generate realistic revenue based on funding stage."""
-    ranges = {
-        "Pre-Seed": (100_000, 500_000),
-        "Seed": (300_000, 3_000_000),
-        "Series A": (2_000_000, 15_000_000),
-        "Series B": (8_000_000, 50_000_000),
-        "Series C": (25_000_000, 150_000_000),
-        "Series D": (50_000_000, 300_000_000),
-        "Growth": (100_000_000, 500_000_000),
-        "Bootstrapped": (500_000, 20_000_000),
-        "Public": (200_000_000, 2_000_000_000),
-    }
-    lo, hi = ranges.get(funding_stage, (1_000_000, 10_000_000))
+    lo, hi = REVENUE_RANGES.get(funding_stage, (1_000_000, 10_000_000))
     return round(random.uniform(lo, hi), -3)  # round to nearest 1K
 
 
@@ -213,7 +218,13 @@ def _generate_cnpj() -> str:
 
 
 def generate_seed_companies() -> list[Company]:
-    """Generate 150 realistic seed companies (100 US, 35 BR, 15 intl)."""
+    """
+    Generate 150 realistic seed companies (100 US, 35 BR, 15 intl).
+
+    Ids are derived from each company's natural key (CNPJ for BR, else the
+    website domain), so regenerating the seed data yields the same
+    companies under the same ids.
+    """
     random.seed(42)  # reproducible
     companies = []
     used_names = set()
@@ -261,8 +272,6 @@ def generate_seed_companies() -> list[Company]:
         ))
 
     # ── 35 Brazil Companies ───────────────────────────
-    BR_CNAE_CODES = ["6201-5", "6202-3", "6203-1", "6204-0", "6311-9", "6319-4", "6399-2"]
-
     for i in range(35):
         funding = random.choices(FUNDING_STAGES, weights=FUNDING_WEIGHTS, k=1)[0]
         revenue = _generate_revenue(funding)
@@ -331,7 +340,7 @@ def generate_seed_companies() -> list[Company]:
 
 
 def generate_seed_contacts(companies: list[Company]) -> list[Contact]:
-    """Generate 1-3 contacts per company (~250+ total)."""
+    """Generate 1-3 contacts per company (~250+ total), with ids derived from company and title."""
     random.seed(43)  # reproducible but different from companies
     contacts = []
 
@@ -363,6 +372,7 @@ def generate_seed_contacts(companies: list[Company]) -> list[Contact]:
 
             contacts.append(
                 Contact(
+                    contact_id=stable_id("ct", company.company_id, tmpl["title"]),
                     company_id=company.company_id,
                     full_name=f"{first} {last}",
                     title=tmpl["title"],
@@ -371,7 +381,7 @@ def generate_seed_contacts(companies: list[Company]) -> list[Contact]:
                     linkedin_url=f"linkedin.com/in/{first.lower()}{last.lower()}{random.randint(1, 999)}",
                     seniority=tmpl["seniority"],
                     department=tmpl["department"],
-                    source=random.choice(["apollo", "hunter", "linkedin", "manual"]),
+                    source=random.choice(CONTACT_SOURCES),
                     verified=random.random() > 0.25,
                 )
             )
@@ -0,0 +1,394 @@
+"""
+B2B Lead Engine — Synthetic TAM Generator
+
+Vectorized, seeded generator for load-testing TAMs of any size. It samples
+from the same name, industry, geography, tech-stack and funding pools as
+the seed dataset, with the same per-market distributions, but draws whole
+columns at once with NumPy and assembles strings with polars. A million
+companies and about two million contacts take a few seconds.
+
+The same ``(n_companies, market_mix, seed)`` always yields identical rows,
+ids and timestamps, so runs against a synthetic TAM are comparable.
+
+Usage:
+    python -m src.database.synthetic --companies 1000000 --parquet data/synthetic
+    python -m src.database.synthetic --companies 100000 --db data/synthetic.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import polars as pl
+
+from src.database.database import DEFAULT_BATCH_SIZE, Database
+from src.database.seed_data import (
+    BR_CNAE_CODES,
+    BR_INDUSTRIES,
+    BR_SOURCES,
+    BR_STATES,
+    CONTACT_SOURCES,
+    FIRST_NAMES,
+    FUNDING_STAGES,
+    FUNDING_WEIGHTS,
+    INTL_COUNTRIES,
+    INTL_INDUSTRIES,
+    INTL_SOURCES,
+    LAST_NAMES,
+    PERSONA_TEMPLATES_BR,
+    PERSONA_TEMPLATES_US,
+    PREFIXES,
+    REVENUE_RANGES,
+    SUFFIXES_BR,
+    SUFFIXES_INTL,
+    SUFFIXES_US,
+    TECH_STACKS_POOL,
+    US_INDUSTRIES,
+    US_SOURCES,
+    US_STATES,
+)
+from src.models.models import Company, Contact, build
+
+# Market codes, in the order every per-market pool below is listed
+MARKETS = ("US", "BR", "INTL")
+US, BR, INTL = range(3)
+
+# The seed dataset's 100 / 35 / 15 split
+DEFAULT_MARKET_MIX = {"US": 100 / 150, "BR": 35 / 150, "INTL": 15 / 150}
+
+# Fixed discovery time so regenerated TAMs are identical
+SYNTHETIC_DISCOVERED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+# Cumulative thresholds splitting a uniform draw into tech-stack categories,
+# per market (same odds as generate_seed_companies)
+_TECH_CATEGORIES = ("no_crm", "basic_crm", "modern_stack", "enterprise")
+_TECH_THRESHOLDS = np.array([
+    [0.35, 0.55, 0.75],
+    [0.40, 0.65, 0.80],
+    [0.30, 0.50, 0.75],
+])
+
+_FOUNDED_FROM = np.array([2010, 2012, 2010])
+
+_CNPJ_WEIGHTS_1 = np.array([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+_CNPJ_WEIGHTS_2 = np.array([6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+
+# Multiplier for the base-number permutation; coprime with 10**8
+_CNPJ_STRIDE = 73_939_133
+
+
+# ── Sampling Helpers ──────────────────────────────────
+
+
+class _Pool:
+    """Per-market string pools flattened into one series, indexed by market offset."""
+
+    def __init__(self, *pools: list[str]):
+        self.series = pl.Series([value for pool in pools for value in pool], dtype=pl.Utf8)
+        self.sizes = np.array([len(pool) for pool in pools])
+        self.offsets = np.concatenate([[0], np.cumsum(self.sizes)[:-1]])
+
+    def sample(self, rng: np.random.Generator, market: np.ndarray) -> np.ndarray:
+        """One uniform index per row into that row's market pool."""
+        return self.offsets[market] + (rng.random(len(market)) * self.sizes[market]).astype(np.int64)
+
+    def take(self, index: np.ndarray) -> pl.Series:
+        return self.series.gather(index)
+
+
+def _distinct_triples(rng: np.random.Generator, sizes: np.ndarray) -> np.ndarray:
+    """Three distinct indices below ``sizes[i]`` per row: a vectorized ``random.sample(k=3)``."""
+    n = len(sizes)
+    first = (rng.random(n) * sizes).astype(np.int64)
+    second = (rng.random(n) * (sizes - 1)).astype(np.int64)
+    second += second >= first
+    third = (rng.random(n) * (sizes - 2)).astype(np.int64)
+    low, high = np.minimum(first, second), np.maximum(first, second)
+    third += third >= low
+    third += third >= high
+    return np.stack([first, second, third], axis=1)
+
+
+def _cnpj(base: np.ndarray) -> pl.Series:
+    """Format 8-digit base numbers as head-office CNPJs with valid check digits."""
+    digits = (base[:, None] // 10 ** np.arange(7, -1, -1)) % 10
+    digits = np.hstack([digits, np.tile([0, 0, 0, 1], (len(base), 1))])
+    for weights in (_CNPJ_WEIGHTS_1, _CNPJ_WEIGHTS_2):
+        remainder = (digits @ weights) % 11
+        check = np.where(remainder < 2, 0, 11 - remainder)
+        digits = np.hstack([digits, check[:, None]])
+    text = pl.Series(base).cast(pl.Utf8).str.zfill(8)
+    checks = pl.Series(digits[:, 12] * 10 + digits[:, 13]).cast(pl.Utf8).str.zfill(2)
+    return pl.select(pl.concat_str([
+        text.str.slice(0, 2), pl.lit("."), text.str.slice(2, 3), pl.lit("."),
+        text.str.slice(5, 3), pl.lit("/0001-"), checks,
+    ])).to_series()
+
+
+def _ids(prefix: str, n: int) -> pl.Series:
+    return pl.select(pl.concat_str([
+        pl.lit(prefix), pl.int_range(0, n, eager=True).cast(pl.Utf8).str.zfill(8),
+    ])).to_series()
+
+
+def _market_codes(rng: np.random.Generator, n: int, market_mix: dict[str, float] | None) -> np.ndarray:
+    mix = DEFAULT_MARKET_MIX if market_mix is None else market_mix
+    unknown = set(mix) - set(MARKETS)
+    if unknown:
+        raise ValueError(f"Unknown markets in market_mix: {sorted(unknown)} (expected {MARKETS})")
+    weights = np.array([float(mix.get(m, 0.0)) for m in MARKETS])
+    if (weights < 0).any() or weights.sum() <= 0:
+        raise ValueError("market_mix weights must be non-negative and not all zero")
+    return rng.choice(len(MARKETS), size=n, p=weights / weights.sum())
+
+
+# ── Generator ─────────────────────────────────────────
+
+
+def _generate_companies(rng: np.random.Generator, market: np.ndarray, seed: int) -> pl.DataFrame:
+    n = len(market)
+
+    funding_weights = np.array(FUNDING_WEIGHTS, dtype=float)
+    funding = rng.choice(len(FUNDING_STAGES), size=n, p=funding_weights / funding_weights.sum())
+    low, high = np.array([REVENUE_RANGES[stage] for stage in FUNDING_STAGES], dtype=float).T
+    revenue = np.round(low[funding] + rng.random(n) * (high[funding] - low[funding]), -3)
+
+    revenue_per_employee = rng.uniform(80_000, 200_000, n)
+    base = np.maximum(10, (revenue / revenue_per_employee).astype(np.int64))
+    headcount = np.minimum(5000, base + rng.integers(-5, 21, n))
+
+    # Names are pool prefix + market suffix plus a row number, so they (and
+    # the website domains built from them) stay unique at any size
+    prefix = rng.integers(0, len(PREFIXES), n)
+    suffixes = _Pool(SUFFIXES_US, SUFFIXES_BR, SUFFIXES_INTL)
+    suffix = suffixes.sample(rng, market)
+
+    # States and countries share one index so INTL cities match their country
+    states = _Pool(US_STATES, BR_STATES, [city for _, city in INTL_COUNTRIES])
+    countries = _Pool(["US"] * len(US_STATES), ["BR"] * len(BR_STATES),
+                      [country for country, _ in INTL_COUNTRIES])
+    state = states.sample(rng, market)
+
+    industries = _Pool(US_INDUSTRIES, BR_INDUSTRIES, INTL_INDUSTRIES)
+    industry = industries.sample(rng, market)
+
+    stacks = [json.dumps(stack) for cat in _TECH_CATEGORIES for stack in TECH_STACKS_POOL[cat]]
+    category = (rng.random(n)[:, None] >= _TECH_THRESHOLDS[market]).sum(axis=1)
+    category_sizes = np.array([len(TECH_STACKS_POOL[cat]) for cat in _TECH_CATEGORIES])
+    category_offsets = np.concatenate([[0], np.cumsum(category_sizes)[:-1]])
+    stack = category_offsets[category] + (rng.random(n) * category_sizes[category]).astype(np.int64)
+
+    founded = rng.integers(_FOUNDED_FROM[market], 2025)
+    sources = _Pool(US_SOURCES, BR_SOURCES, INTL_SOURCES)
+    source = sources.sample(rng, market)
+    tld = np.where(market == BR, ".com.br", np.where(rng.random(n) > 0.5, ".io", ".com"))
+
+    is_br = market == BR
+    cnpj_base = (np.arange(n, dtype=np.int64) * _CNPJ_STRIDE + rng.integers(0, 10**8)) % 10**8
+    cnae = rng.integers(0, len(BR_CNAE_CODES), n)
+
+    frame = pl.DataFrame({
+        "company_id": _ids(f"c-{seed}-", n),
+        "prefix": pl.Series(PREFIXES).gather(prefix),
+        "suffix": suffixes.take(suffix),
+        "row": pl.int_range(0, n, eager=True),
+        "industry": industries.take(industry),
+        "country": countries.take(state),
+        "state": states.take(state),
+        "employee_count": headcount,
+        "revenue_usd": revenue,
+        "tld": tld,
+        "tech_stack": pl.Series(stacks).gather(stack),
+        "funding_stage": pl.Series(FUNDING_STAGES).gather(funding),
+        "founded_year": founded,
+        "is_br": is_br,
+        "cnpj": _cnpj(cnpj_base),
+        "cnae_code": pl.Series(BR_CNAE_CODES).gather(cnae),
+        "source": sources.take(source),
+    })
+    name = pl.concat_str([pl.col("prefix"), pl.col("suffix"), pl.lit(" "), pl.col("row")])
+    return frame.select(
+        "company_id",
+        name.alias("name"),
+        "industry", "country", "state", "employee_count", "revenue_usd",
+        pl.concat_str([
+            pl.lit("https://"), name.str.to_lowercase().str.replace_all(r"[ /]", ""), pl.col("tld"),
+        ]).alias("website"),
+        "tech_stack", "funding_stage", "founded_year",
+        pl.when(pl.col("is_br")).then(pl.col("cnpj")).alias("cnpj"),
+        pl.when(pl.col("is_br")).then(pl.col("cnae_code")).alias("cnae_code"),
+        "source",
+        pl.lit(SYNTHETIC_DISCOVERED_AT.isoformat()).alias("discovered_at"),
+    )
+
+
+def _generate_contacts(
+    rng: np.random.Generator, market: np.ndarray, companies: pl.DataFrame, seed: int
+) -> tuple[pl.DataFrame, np.ndarray]:
+    """Contacts in company order, plus each company's contact count."""
+    headcount = companies["employee_count"].to_numpy()
+    low = np.where(headcount > 200, 2, 1)
+    high = np.where(headcount > 200, 3, np.where(headcount > 50, 3, 2))
+    counts = rng.integers(low, high + 1)
+
+    owner = np.repeat(np.arange(len(market)), counts)
+    total = len(owner)
+    slot = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    # Distinct personas within a company, from its market's templates
+    is_br = market == BR
+    persona_sizes = np.where(is_br, len(PERSONA_TEMPLATES_BR), len(PERSONA_TEMPLATES_US))
+    personas = _distinct_triples(rng, persona_sizes)
+    persona = personas[owner, slot] + np.where(is_br[owner], len(PERSONA_TEMPLATES_US), 0)
+    templates = PERSONA_TEMPLATES_US + PERSONA_TEMPLATES_BR
+
+    first = rng.integers(0, len(FIRST_NAMES), total)
+    last = rng.integers(0, len(LAST_NAMES), total)
+    first_lower = pl.Series([name.lower() for name in FIRST_NAMES]).gather(first)
+    last_lower = pl.Series([name.lower() for name in LAST_NAMES]).gather(last)
+
+    frame = pl.DataFrame({
+        "contact_id": _ids(f"ct-{seed}-", total),
+        "company_id": companies["company_id"].gather(owner),
+        "first": pl.Series(FIRST_NAMES).gather(first),
+        "last": pl.Series(LAST_NAMES).gather(last),
+        "first_lower": first_lower,
+        "last_lower": last_lower,
+        "domain": companies["website"].str.slice(len("https://")).gather(owner),
+        "persona": persona,
+        "area": rng.integers(100, 1000, total),
+        "line": rng.integers(1000, 10000, total),
+        "handle": rng.integers(1, 1000, total),
+        "source": pl.Series(CONTACT_SOURCES).gather(rng.integers(0, len(CONTACT_SOURCES), total)),
+        "verified": rng.random(total) > 0.25,
+    })
+    persona_field = lambda field: pl.Series([t[field] for t in templates]).gather(persona)  # noqa: E731
+    contacts = frame.select(
+        "contact_id", "company_id",
+        pl.concat_str([pl.col("first"), pl.lit(" "), pl.col("last")]).alias("full_name"),
+        persona_field("title").alias("title"),
+        pl.concat_str([
+            pl.col("first_lower"), pl.lit("."), pl.col("last_lower"), pl.lit("@"), pl.col("domain"),
+        ]).alias("email"),
+        pl.concat_str([pl.lit("+1-555-"), pl.col("area"), pl.lit("-"), pl.col("line")]).alias("phone"),
+        pl.concat_str([
+            pl.lit("linkedin.com/in/"), pl.col("first_lower"), pl.col("last_lower"), pl.col("handle"),
+        ]).alias("linkedin_url"),
+        persona_field("seniority").alias("seniority"),
+        persona_field("department").alias("department"),
+        "source", "verified",
+        pl.lit(SYNTHETIC_DISCOVERED_AT.isoformat()).alias("discovered_at"),
+    )
+    return contacts, counts
+
+
+class SyntheticTAM:
+    """
+    A generated TAM held as two polars frames in ``dim_companies`` /
+    ``dim_contacts`` column order (``tech_stack`` as JSON text,
+    ``discovered_at`` as ISO text). Contacts are stored in company order.
+    """
+
+    def __init__(self, companies: pl.DataFrame, contacts: pl.DataFrame, contact_counts: np.ndarray):
+        self.companies = companies
+        self.contacts = contacts
+        self.contact_counts = contact_counts
+
+    def __len__(self) -> int:
+        return self.companies.height
+
+    def batches(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[tuple[list[Company], list[Contact]]]:
+        """
+        Yield ``(companies, contacts)`` model batches, the TAM shape
+        ``run_pipeline(tam=...)`` takes. Models are built lazily, one batch
+        at a time, so streaming runs stay memory-flat.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        bounds = np.concatenate([[0], np.cumsum(self.contact_counts)])
+        discovered_at = SYNTHETIC_DISCOVERED_AT
+        for start in range(0, len(self), batch_size):
+            stop = min(start + batch_size, len(self))
+            companies = [
+                build(Company, **{**row, "tech_stack": json.loads(row["tech_stack"]),
+                                  "discovered_at": discovered_at})
+                for row in self.companies.slice(start, stop - start).iter_rows(named=True)
+            ]
+            contact_rows = self.contacts.slice(int(bounds[start]), int(bounds[stop] - bounds[start]))
+            contacts = [
+                build(Contact, **{**row, "discovered_at": discovered_at})
+                for row in contact_rows.iter_rows(named=True)
+            ]
+            yield companies, contacts
+
+    def write_parquet(self, directory: str | Path) -> tuple[Path, Path]:
+        """Write ``companies.parquet`` and ``contacts.parquet`` into ``directory``."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = directory / "companies.parquet", directory / "contacts.parquet"
+        self.companies.write_parquet(paths[0], compression="zstd")
+        self.contacts.write_parquet(paths[1], compression="zstd")
+        return paths
+
+    def write_sqlite(self, db: Database, batch_size: int = DEFAULT_BATCH_SIZE) -> tuple[int, int]:
+        """Bulk load straight into ``dim_companies`` / ``dim_contacts``. Returns rows written."""
+        return (
+            db.insert_company_rows(self.companies.iter_rows(), batch_size),
+            db.insert_contact_rows(self.contacts.iter_rows(), batch_size),
+        )
+
+
+def generate_synthetic_tam(
+    n_companies: int, market_mix: dict[str, float] | None = None, seed: int = 42
+) -> SyntheticTAM:
+    """
+    Generate ``n_companies`` companies and their contacts (~2 per company).
+
+    ``market_mix`` maps ``"US"``, ``"BR"`` and ``"INTL"`` to relative
+    weights; it defaults to the seed dataset's split. Output is fully
+    determined by the arguments.
+    """
+    if n_companies < 0:
+        raise ValueError("n_companies must be >= 0")
+    rng = np.random.default_rng(seed)
+    market = _market_codes(rng, n_companies, market_mix)
+    companies = _generate_companies(rng, market, seed)
+    contacts, counts = _generate_contacts(rng, market, companies, seed)
+    return SyntheticTAM(companies, contacts, counts)
+
+
+# ── CLI Entry Point ───────────────────────────────────
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--companies", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--mix", help='Market weights as JSON, e.g. \'{"US": 0.5, "BR": 0.5}\'')
+    parser.add_argument("--parquet", metavar="DIR", help="Write companies/contacts Parquet files here")
+    parser.add_argument("--db", metavar="PATH", help="Load into this SQLite database")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    tam = generate_synthetic_tam(args.companies, json.loads(args.mix) if args.mix else None, args.seed)
+    print(f"Generated {len(tam):,} companies, {tam.contacts.height:,} contacts "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    if args.parquet:
+        start = time.perf_counter()
+        paths = tam.write_parquet(args.parquet)
+        print(f"Wrote {', '.join(map(str, paths))} in {time.perf_counter() - start:.2f}s")
+    if args.db:
+        start = time.perf_counter()
+        tam.write_sqlite(Database(args.db))
+        print(f"Loaded {args.db} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
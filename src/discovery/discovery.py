@@ -7,11 +7,22 @@ MVP uses mock data; interface supports real API integrations.
 
 from __future__ import annotations
 
-from src.config.icp_loader import ICPConfig, ICPProfile, get_active_profiles
+from typing import Iterator
+
+import numpy as np
+import polars as pl
+
+from src.config.icp_loader import ICPConfig, get_active_profiles
+from src.discovery.icp_matcher import ICPMatcher
 from src.models.models import Company, Contact
+from src.database.database import Database
 from src.database.seed_data import generate_seed_companies, generate_seed_contacts
 
 
+# Companies per batch read back by ``discover_from_db``.
+DEFAULT_DB_BATCH_SIZE = 1000
+
+
 class DiscoveryEngine:
     """
     Lead discovery engine that filters companies against ICP criteria.
@@ -23,6 +34,7 @@ class DiscoveryEngine:
     def __init__(self, icp_config: ICPConfig):
         self.icp_config = icp_config
         self.active_profiles = get_active_profiles(icp_config)
+        self.matcher = ICPMatcher(icp_config)
 
     def discover(
         self,
@@ -44,13 +56,8 @@ class DiscoveryEngine:
         if contacts is None:
             contacts = generate_seed_contacts(companies)
 
-        # Filter companies against active ICP profiles
-        matched_companies = []
-        for company in companies:
-            for profile in self.active_profiles:
-                if self._matches_icp(company, profile):
-                    matched_companies.append(company)
-                    break
+        # Filter companies against the compiled active ICP profiles
+        matched_companies = [c for c in companies if self.matcher.match(c) is not None]
 
         # Keep only contacts for matched companies
         matched_ids = {c.company_id for c in matched_companies}
@@ -58,45 +65,34 @@ class DiscoveryEngine:
 
         return matched_companies, matched_contacts
 
-    def _matches_icp(self, company: Company, profile: ICPProfile) -> bool:
-        """Check if a company matches an ICP profile's filters."""
-        filters = profile.firmographic_filters
-
-        # Market/country check
-        geo = filters.geography
-        if geo.countries and company.country not in geo.countries:
-            return False
-
-        # State check (if specified)
-        if geo.states and company.state and company.state not in geo.states:
-            return False
-
-        # Industry check
-        if filters.industries and company.industry not in filters.industries:
-            return False
-
-        # Employee count check
-        emp = filters.employee_count
-        if company.employee_count < emp.min or company.employee_count > emp.max:
-            return False
-
-        # Revenue check (handle USD and BRL)
-        rev = filters.revenue_range
-        if rev.min_usd and company.revenue_usd < rev.min_usd:
-            return False
-        if rev.max_usd and company.revenue_usd > rev.max_usd:
-            return False
-        if rev.min_brl and company.revenue_usd < rev.min_brl:
-            return False
-        if rev.max_brl and company.revenue_usd > rev.max_brl:
-            return False
-
-        # Funding stage check
-        if filters.funding_stage and company.funding_stage:
-            if company.funding_stage not in filters.funding_stage:
-                return False
-
-        return True
+    def discover_from_db(
+        self, db: Database, batch_size: int = DEFAULT_DB_BATCH_SIZE
+    ) -> Iterator[tuple[list[Company], list[Contact]]]:
+        """
+        Discovery straight from ``dim_companies``.
+
+        Each active profile's filters run as an indexed, parameterized SQL
+        query, and only the matching companies and their contacts are read
+        back, ``batch_size`` companies at a time. The cost follows the
+        number of matches, not the size of the stored TAM.
+        """
+        matched: set[str] = set()
+        for where, params in self.matcher.sql_clauses():
+            matched.update(db.find_company_ids(where, params))
+        company_ids = sorted(matched)
+        for start in range(0, len(company_ids), batch_size):
+            yield db.get_companies_with_contacts(company_ids[start:start + batch_size])
+
+    def discover_frame(self, companies: pl.DataFrame) -> pl.DataFrame:
+        """
+        Columnar discovery: the rows of a company frame that match an ICP
+        profile, with the matching profile's id in an ``icp_profile`` column.
+        """
+        mask, profile_index = self.matcher.match_frame(companies)
+        profile_ids = pl.Series("icp_profile", self.matcher.profile_ids, dtype=pl.Utf8)
+        return companies.filter(mask).with_columns(
+            profile_ids.gather(profile_index[mask].astype(np.int64))
+        )
 
     def get_discovery_stats(
         self, companies: list[Company], contacts: list[Contact]
@@ -0,0 +1,173 @@
+"""
+B2B Lead Engine — Compiled ICP Matcher
+
+Compiles each active ICP profile once into frozensets and numeric bounds,
+so matching a company costs a few set lookups and comparisons instead of
+walking the Pydantic filter models and scanning lists on every call.
+
+``ICPMatcher.match`` checks one company; ``ICPMatcher.match_frame``
+evaluates every profile over a columnar batch of companies (a polars
+DataFrame such as ``SyntheticTAM.companies``) in a single vectorized pass
+and returns a match mask plus the index of the first matching profile.
+``ICPMatcher.sql_clauses`` pushes the same filters down into SQL, so
+discovery can run against ``dim_companies`` without loading the TAM.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import polars as pl
+
+from src.config.icp_loader import ICPConfig, ICPProfile
+from src.config.settings import settings
+from src.models.models import Company
+
+
+# Columns ``match_frame`` reads
+MATCH_COLUMNS = ("country", "state", "industry", "employee_count", "revenue_usd", "funding_stage")
+
+# Profile index of companies no profile matches
+NO_MATCH = -1
+
+
+def _optional_set(values: list[str]) -> frozenset[str] | None:
+    """An empty filter list means 'any value'."""
+    return frozenset(values) if values else None
+
+
+class CompiledProfile:
+    """One ICP profile's firmographic filters, flattened for fast matching."""
+
+    def __init__(self, profile_id: str, profile: ICPProfile):
+        filters = profile.firmographic_filters
+        self.profile_id = profile_id
+        self.name = profile.name
+        self.countries = _optional_set(filters.geography.countries)
+        self.states = _optional_set(filters.geography.states)
+        self.industries = _optional_set(filters.industries)
+        self.funding_stages = _optional_set(filters.funding_stage)
+        self.employee_min = filters.employee_count.min
+        self.employee_max = filters.employee_count.max
+
+        # Unset or zero bounds do not apply. BRL bounds are converted to USD,
+        # the currency revenue_usd is stored in.
+        rev = filters.revenue_range
+        brl = settings.brl_usd_rate
+        self.revenue_min = max(
+            (b for b in (rev.min_usd, rev.min_brl and rev.min_brl * brl) if b), default=-math.inf
+        )
+        self.revenue_max = min(
+            (b for b in (rev.max_usd, rev.max_brl and rev.max_brl * brl) if b), default=math.inf
+        )
+
+    def matches(self, company: Company) -> bool:
+        # Companies with no state or funding stage on record are not excluded
+        return (
+            (self.countries is None or company.country in self.countries)
+            and (self.states is None or not company.state or company.state in self.states)
+            and (self.industries is None or company.industry in self.industries)
+            and self.employee_min <= company.employee_count <= self.employee_max
+            and self.revenue_min <= company.revenue_usd <= self.revenue_max
+            and (self.funding_stages is None or not company.funding_stage
+                 or company.funding_stage in self.funding_stages)
+        )
+
+    def expr(self) -> pl.Expr:
+        """The same test as ``matches``, as a polars expression over ``MATCH_COLUMNS``."""
+        conditions = [
+            pl.col("employee_count").is_between(self.employee_min, self.employee_max),
+        ]
+        if self.revenue_min > -math.inf:
+            conditions.append(pl.col("revenue_usd") >= self.revenue_min)
+        if self.revenue_max < math.inf:
+            conditions.append(pl.col("revenue_usd") <= self.revenue_max)
+        if self.countries is not None:
+            conditions.append(pl.col("country").is_in(sorted(self.countries)))
+        if self.industries is not None:
+            conditions.append(pl.col("industry").is_in(sorted(self.industries)))
+        for column, allowed in (("state", self.states), ("funding_stage", self.funding_stages)):
+            if allowed is not None:
+                value = pl.col(column).fill_null("")
+                conditions.append((value == "") | value.is_in(sorted(allowed)))
+        return pl.all_horizontal(conditions)
+
+    def sql(self) -> tuple[str, list]:
+        """
+        The same test as ``matches``, as a parameterized WHERE clause over
+        ``dim_companies``.
+
+        Country, industry and revenue lead so the clause can seek
+        ``idx_companies_firmographics`` rather than scan the table.
+        """
+        clauses, params = [], []
+        for column, allowed in (("country", self.countries), ("industry", self.industries)):
+            if allowed is not None:
+                clauses.append(f"{column} IN ({', '.join('?' * len(allowed))})")
+                params.extend(sorted(allowed))
+        if self.revenue_min > -math.inf:
+            clauses.append("revenue_usd >= ?")
+            params.append(self.revenue_min)
+        if self.revenue_max < math.inf:
+            clauses.append("revenue_usd <= ?")
+            params.append(self.revenue_max)
+        clauses.append("employee_count BETWEEN ? AND ?")
+        params.extend((self.employee_min, self.employee_max))
+        for column, allowed in (("state", self.states), ("funding_stage", self.funding_stages)):
+            if allowed is not None:
+                clauses.append(
+                    f"(COALESCE({column}, '') = '' OR {column} IN ({', '.join('?' * len(allowed))}))"
+                )
+                params.extend(sorted(allowed))
+        return " AND ".join(clauses), params
+
+
+class ICPMatcher:
+    """
+    Every active profile of an ICP config, compiled.
+
+    Profiles are tried in config order; a company belongs to the first one
+    it matches.
+    """
+
+    def __init__(self, icp_config: ICPConfig):
+        self.profiles = [
+            CompiledProfile(profile_id, profile)
+            for profile_id, profile in icp_config.profiles.items()
+            if profile.enabled
+        ]
+        self.profile_ids = [p.profile_id for p in self.profiles]
+
+    def sql_clauses(self) -> list[tuple[str, list]]:
+        """One (WHERE clause, params) pair per profile, in profile order."""
+        return [profile.sql() for profile in self.profiles]
+
+    def match(self, company: Company) -> str | None:
+        """Id of the first profile ``company`` matches, or None."""
+        for profile in self.profiles:
+            if profile.matches(company):
+                return profile.profile_id
+        return None
+
+    def match_frame(self, companies: pl.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Match a columnar batch of companies against every profile at once.
+
+        Returns a boolean mask of matching rows and, per row, the index into
+        ``profile_ids`` of the first matching profile (``NO_MATCH`` where
+        none does).
+        """
+        if not self.profiles or companies.is_empty():
+            return np.zeros(companies.height, dtype=bool), np.full(companies.height, NO_MATCH, np.int16)
+        first = pl.when(self.profiles[0].expr()).then(0)
+        for index, profile in enumerate(self.profiles[1:], start=1):
+            first = first.when(profile.expr()).then(index)
+        profile_index = (
+            companies.lazy()
+            .select(first.otherwise(NO_MATCH).cast(pl.Int16))
+            .collect()
+            .to_series()
+            .to_numpy()
+        )
+        return profile_index != NO_MATCH, profile_index
@@ -12,7 +12,7 @@ from __future__ import annotations
 import random
 from datetime import datetime, timezone
 
-from src.models.models import Company, Contact, EnrichedLead
+from src.models.models import Company, Contact, EnrichedLead, build, entity_rng, stable_id
 
 
 # ── Mock Enrichment Data ──────────────────────────────
@@ -63,8 +63,13 @@ class EnrichmentPipeline:
     and Google News. In production, each provider is a real API client.
     """
 
-    def __init__(self):
+    def __init__(self, seed: int | None = None):
         self.providers = ["apollo_mock", "hunter_mock", "builtwith_mock", "news_mock"]
+        # With a seed, each lead's simulated signals come from its own
+        # generator keyed by (seed, contact), so a lead is the same whichever
+        # chunk, batch, worker or run enriches it. Without one they come from
+        # the global RNG. Lead ids always derive from company and contact.
+        self.seed = seed
 
     def enrich(
         self, companies: list[Company], contacts: list[Contact]
@@ -95,12 +100,16 @@ class EnrichmentPipeline:
 
     def _enrich_lead(self, company: Company, contact: Contact) -> EnrichedLead:
         """Enrich a single company-contact pair."""
+        rng = (
+            entity_rng(self.seed, "enrich", contact.contact_id) if self.seed is not None
+            else random
+        )
 
         # Simulate tech stack detection (BuiltWith mock)
         tech_detected = list(company.tech_stack)  # Start with known tech
         for category, tools in TECH_STACKS.items():
             if not any(t in tech_detected for t in tools):
-                tech_detected.append(random.choice(tools))
+                tech_detected.append(rng.choice(tools))
 
         # Identify tech gaps
         tech_gaps = []
@@ -110,8 +119,8 @@ class EnrichmentPipeline:
         tech_gaps = list(set(tech_gaps))
 
         # Simulate buying signals
-        num_signals = random.randint(1, 4)
-        buying_signals = random.sample(
+        num_signals = rng.randint(1, 4)
+        buying_signals = rng.sample(
             BUYING_SIGNALS_POOL, min(num_signals, len(BUYING_SIGNALS_POOL))
         )
 
@@ -123,18 +132,18 @@ class EnrichmentPipeline:
 
         # Simulate social signals
         social_signals = {
-            "linkedin_posts_30d": random.randint(0, 15),
-            "linkedin_engagement": random.choice(["low", "medium", "high"]),
-            "twitter_active": random.choice([True, False]),
-            "content_themes": random.sample(
+            "linkedin_posts_30d": rng.randint(0, 15),
+            "linkedin_engagement": rng.choice(["low", "medium", "high"]),
+            "twitter_active": rng.choice([True, False]),
+            "content_themes": rng.sample(
                 ["sales", "growth", "hiring", "product", "fundraising", "culture"],
-                k=random.randint(1, 3),
+                k=rng.randint(1, 3),
             ),
         }
 
         # Simulate news mentions
-        num_news = random.randint(0, 2)
-        news_mentions = random.sample(NEWS_POOL, min(num_news, len(NEWS_POOL)))
+        num_news = rng.randint(0, 2)
+        news_mentions = rng.sample(NEWS_POOL, min(num_news, len(NEWS_POOL)))
 
         # Calculate enrichment completeness
         fields_filled = sum([
@@ -148,7 +157,9 @@ class EnrichmentPipeline:
         ])
         completeness = round(fields_filled / 7.0, 2)
 
-        return EnrichedLead(
+        return build(
+            EnrichedLead,
+            lead_id=stable_id("l", company.company_id, contact.contact_id),
             company_id=company.company_id,
             contact_id=contact.contact_id,
             tech_stack_detected=tech_detected,
@@ -157,7 +168,7 @@ class EnrichmentPipeline:
             social_signals=social_signals,
             news_mentions=news_mentions,
             enrichment_completeness=completeness,
-            enrichment_sources=self.providers,
+            enrichment_sources=list(self.providers),
             company=company,
             contact=contact,
         )
@@ -6,14 +6,19 @@ Core domain models used across all pipeline stages.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import random
+import re
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Optional, TypeVar
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+from src.config.settings import settings
+
 
 def _uuid(prefix: str) -> str:
     return f"{prefix}-{uuid4().hex[:8]}"
@@ -23,6 +28,89 @@ def _now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# ── Deterministic Ids & Randomness ────────────────────
+
+
+def stable_id(prefix: str, *parts: str) -> str:
+    """An id derived from ``parts``: the same parts always give the same id."""
+    digest = hashlib.blake2b("\x1f".join(parts).encode(), digest_size=8).hexdigest()
+    return f"{prefix}-{digest}"
+
+
+def entity_rng(seed: int, stage: str, entity_id: str) -> random.Random:
+    """
+    An independent generator for one record in one stage of a seeded run.
+
+    Draws depend only on ``(seed, stage, entity_id)``, never on how many
+    records were processed before, so a record gets the same values in a
+    serial, parallel, sharded, resumed or incremental run.
+    """
+    return random.Random(f"{seed}:{stage}:{entity_id}")
+
+
+# ── Natural Keys ──────────────────────────────────────
+
+# Scheme, credentials and www. in front of a lowercased host; a plain string
+# so the vectorized (polars) domain code can use it too
+URL_PREFIX_PATTERN = r"^(?:[a-z][a-z0-9+.-]*://)?(?:[^@/]*@)?(?:www\d*\.)?"
+_URL_PREFIX = re.compile(URL_PREFIX_PATTERN)
+
+
+def normalize_domain(website: str) -> str:
+    """Bare host of a website: ``https://WWW.Acme.io:443/about`` → ``acme.io``."""
+    host = _URL_PREFIX.sub("", website.strip().lower())
+    return re.split(r"[/:?#]", host, maxsplit=1)[0].rstrip(".")
+
+
+def normalize_cnpj(cnpj: str | None) -> str | None:
+    """The 14 digits of a CNPJ, or None when it has some other length."""
+    digits = re.sub(r"\D", "", cnpj or "")
+    return digits if len(digits) == 14 else None
+
+
+def company_key(
+    name: str, website: str = "", country: str = "", cnpj: str | None = None
+) -> str:
+    """
+    Natural key of a company, the same whichever source reported it.
+
+    Brazilian companies are keyed by CNPJ, everything else by website
+    domain. Records with neither fall back to name and country.
+    """
+    if country.upper() == "BR" and (digits := normalize_cnpj(cnpj)):
+        return f"cnpj:{digits}"
+    if domain := normalize_domain(website):
+        return f"domain:{domain}"
+    return f"name:{' '.join(name.lower().split())}|{country.upper()}"
+
+
+def natural_company_id(key: str) -> str:
+    """Company id derived from a natural key from ``company_key``."""
+    return stable_id("c", key)
+
+
+# ── Trusted Construction ──────────────────────────────
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def build(model: type[M], /, **fields) -> M:
+    """
+    Construct a model from data the engine produced or stored itself.
+
+    Validates like the model's constructor unless
+    ``settings.trusted_construction`` is on, in which case it uses
+    ``model_construct``: values are neither validated nor coerced and
+    validators do not run (``model_post_init`` still does), so callers
+    must pass final types (enums, datetimes, nested models) and only known
+    field names. On pydantic 2 validated construction is the faster of the
+    two (benchmarks/bench_model_construction.py), hence the default.
+    """
+    if settings.trusted_construction:
+        return model.model_construct(**fields)
+    return model(**fields)
+
+
 # ── Enums ─────────────────────────────────────────────
 
 
@@ -59,9 +147,15 @@ class ResponseType(str, Enum):
 
 
 class Company(BaseModel):
-    """A discovered target company."""
+    """
+    A discovered target company.
 
-    company_id: str = Field(default_factory=lambda: _uuid("c"))
+    Without an explicit ``company_id`` the id derives from the company's
+    natural key, so the same company read twice (from any source) gets the
+    same id, whether it is validated or built with ``build()``.
+    """
+
+    company_id: str = ""
     name: str
     industry: str = ""
     country: str = ""
@@ -77,6 +171,15 @@ class Company(BaseModel):
     source: str = "manual"
     discovered_at: datetime = Field(default_factory=_now)
 
+    def model_post_init(self, __context) -> None:
+        # A post-init hook rather than a validator: model_construct runs it too
+        if not self.company_id:
+            self.company_id = natural_company_id(self.natural_key)
+
+    @property
+    def natural_key(self) -> str:
+        return company_key(self.name, self.website, self.country, self.cnpj)
+
     @property
     def tech_stack_json(self) -> str:
         return json.dumps(self.tech_stack)
@@ -209,6 +312,19 @@ class DealBrief(BaseModel):
         return "\n".join(lines)
 
 
+class StageMetrics(BaseModel):
+    """Timing, throughput and memory for one pipeline stage."""
+
+    stage: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows_in: int = 0
+    rows_out: int = 0
+    rows_per_sec: float = 0.0
+    db_write_seconds: float = 0.0
+    peak_memory_mb: Optional[float] = None  # None unless memory tracing is on
+
+
 class PipelineResult(BaseModel):
     """Result summary from running the full pipeline."""
 
@@ -223,3 +339,27 @@ class PipelineResult(BaseModel):
     deals_synced_to_crm: int = 0
     pipeline_duration_seconds: float = 0.0
     completed_at: datetime = Field(default_factory=_now)
+    run_id: Optional[str] = None
+    stage_metrics: list[StageMetrics] = []
+
+
+class BatchReport(BaseModel):
+    """One micro-batch processed by the pipeline daemon."""
+
+    batch: int
+    run_id: Optional[str] = None
+    items: int = 0
+    failed_items: int = 0
+    # Items returned to the queue for another attempt
+    retried_items: int = 0
+    companies: int = 0
+    leads_scored: int = 0
+    outreach_events: int = 0
+    deals: int = 0
+    process_seconds: float = 0.0
+    # Enqueue → fully processed, per item (seconds)
+    latency_p50: float = 0.0
+    latency_p95: float = 0.0
+    latency_p99: float = 0.0
+    latency_max: float = 0.0
+    error: Optional[str] = None
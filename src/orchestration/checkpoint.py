@@ -0,0 +1,223 @@
+"""
+B2B Lead Engine — Stage Checkpoints
+
+Persists each stage's output to a per-run directory as Arrow IPC files
+(written with polars, zstd-compressed) next to a ``manifest.json`` that
+records which stages and batches are committed. A failed run can then be
+resumed: completed stages are read back instead of recomputed, and a
+partially finished stage restarts after its last committed batch.
+
+Layout::
+
+    <checkpoint_dir>/<run_id>/
+        manifest.json
+        tam/part-00000.companies.arrow
+        enrich/part-00003.scored.arrow
+        ...
+
+Every part is written before its rows go to the database and marked
+``persisted`` after, so a crash between the two is repaired on resume by
+re-inserting that part (the inserts upsert by id).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+from pydantic import BaseModel
+
+from src.models.models import Company, Contact, EnrichedLead, OutreachEvent, ScoredLead
+
+
+# Stages in run order. Discovery and CRM sync are cheap and write nothing to
+# the database, and entity resolution's merges are idempotent, so all three
+# are recomputed instead of stored.
+PIPELINE_STAGES = ("tam", "discover", "resolve", "enrich", "score", "outreach", "crm")
+
+MANIFEST = "manifest.json"
+
+_MODELS = {m.__name__: m for m in (Company, Contact, EnrichedLead, ScoredLead, OutreachEvent)}
+
+# Denormalized links are not stored; the pipeline re-attaches them by id.
+_EXCLUDE = {
+    EnrichedLead: {"company", "contact"},
+    ScoredLead: {"enriched_lead"},
+}
+
+
+# ── Arrow Serialization ───────────────────────────────
+
+
+def _write_models(path: Path, models: list[BaseModel], model: type[BaseModel]) -> list[str]:
+    """Write models as one Arrow IPC file. Returns the JSON-encoded columns."""
+    exclude = _EXCLUDE.get(model, set())
+    fields = [f for f in model.model_fields if f not in exclude]
+    rows = [m.model_dump(mode="json", exclude=exclude) for m in models]
+    columns: dict[str, list] = {f: [row[f] for row in rows] for f in fields}
+
+    # Lists, dicts and nested models are stored as JSON text
+    json_columns = [
+        f for f, values in columns.items()
+        if any(isinstance(v, (list, dict)) for v in values)
+    ]
+    for f in json_columns:
+        columns[f] = [json.dumps(v) for v in columns[f]]
+
+    tmp = path.with_suffix(".tmp")
+    pl.DataFrame(columns, infer_schema_length=None).write_ipc(tmp, compression="zstd")
+    os.replace(tmp, path)
+    return json_columns
+
+
+def _read_models(path: Path, model: type[BaseModel], json_columns: list[str]) -> list[BaseModel]:
+    rows = pl.read_ipc(path, memory_map=False).to_dicts()
+    for row in rows:
+        for f in json_columns:
+            row[f] = json.loads(row[f])
+    # Validated: this is the one place models are rebuilt from serialized text
+    return [model.model_validate(row) for row in rows]
+
+
+# ── Run Checkpoint ────────────────────────────────────
+
+
+class RunCheckpoint:
+    """
+    Stage outputs and manifest for one pipeline run.
+
+    ``RunCheckpoint(None)`` is a disabled checkpoint: it tracks parts in
+    memory so the pipeline can use the same calls, but writes nothing.
+    """
+
+    def __init__(self, run_dir: Path | None, manifest: dict | None = None):
+        self.run_dir = run_dir
+        self.manifest = manifest or {"stages": {}}
+
+    @classmethod
+    def create(cls, root: str | Path, run_id: str, **params: Any) -> RunCheckpoint:
+        run_dir = Path(root) / run_id
+        run_dir.mkdir(parents=True, exist_ok=False)
+        checkpoint = cls(run_dir, {
+            "run_id": run_id,
+            "format": "arrow-ipc",
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "params": params,
+            "stages": {},
+        })
+        checkpoint._save_manifest()
+        return checkpoint
+
+    @classmethod
+    def open(cls, root: str | Path, run_id: str) -> RunCheckpoint:
+        run_dir = Path(root) / run_id
+        path = run_dir / MANIFEST
+        if not path.exists():
+            raise FileNotFoundError(f"No checkpoint for run {run_id!r} in {root}")
+        return cls(run_dir, json.loads(path.read_text()))
+
+    @classmethod
+    def latest(cls, root: str | Path) -> RunCheckpoint:
+        """The most recently created checkpoint under ``root``."""
+        manifests = sorted(
+            (json.loads(p.read_text()) for p in Path(root).glob(f"*/{MANIFEST}")),
+            key=lambda m: m["created_at"],
+        )
+        if not manifests:
+            raise FileNotFoundError(f"No checkpoints in {root}")
+        return cls.open(root, manifests[-1]["run_id"])
+
+    @property
+    def enabled(self) -> bool:
+        return self.run_dir is not None
+
+    @property
+    def run_id(self) -> str | None:
+        return self.manifest.get("run_id")
+
+    @property
+    def params(self) -> dict:
+        return self.manifest.get("params", {})
+
+    def _save_manifest(self):
+        if not self.enabled:
+            return
+        path = self.run_dir / MANIFEST
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.manifest, indent=2))
+        os.replace(tmp, path)
+
+    def _stage(self, stage: str) -> dict:
+        return self.manifest["stages"].setdefault(stage, {"status": "running", "parts": []})
+
+    # ── Stage State ───────────────────────────────────
+
+    def is_complete(self, stage: str) -> bool:
+        return self.manifest["stages"].get(stage, {}).get("status") == "complete"
+
+    def completed_stages(self) -> list[str]:
+        return [s for s in PIPELINE_STAGES if self.is_complete(s)]
+
+    def parts(self, stage: str) -> list[dict]:
+        """Committed parts of ``stage``, in write order."""
+        return self.manifest["stages"].get(stage, {}).get("parts", [])
+
+    def unpersisted(self, stage: str) -> list[int]:
+        """Parts written to the checkpoint but not yet confirmed in the database."""
+        return [i for i, part in enumerate(self.parts(stage)) if not part["persisted"]]
+
+    def complete(self, stage: str):
+        self._stage(stage)["status"] = "complete"
+        self._save_manifest()
+
+    def reset_from(self, stage: str):
+        """Forget ``stage`` and every stage after it, deleting their files."""
+        for name in PIPELINE_STAGES[PIPELINE_STAGES.index(stage):]:
+            self.manifest["stages"].pop(name, None)
+            if self.enabled:
+                shutil.rmtree(self.run_dir / name, ignore_errors=True)
+        self._save_manifest()
+
+    # ── Outputs ───────────────────────────────────────
+
+    def write_part(self, stage: str, outputs: dict[str, list[BaseModel]]) -> int:
+        """Commit one batch of a stage's outputs. Returns the part index."""
+        parts = self._stage(stage)["parts"]
+        index = len(parts)
+        entry = {"persisted": False, "outputs": {}}
+        for name, models in outputs.items():
+            model = type(models[0]) if models else None
+            output = {"model": model.__name__ if model else None, "rows": len(models)}
+            if self.enabled and model is not None:
+                stage_dir = self.run_dir / stage
+                stage_dir.mkdir(exist_ok=True)
+                output["file"] = f"{stage}/part-{index:05d}.{name}.arrow"
+                output["json"] = _write_models(self.run_dir / output["file"], models, model)
+            entry["outputs"][name] = output
+        parts.append(entry)
+        self._save_manifest()
+        return index
+
+    def mark_persisted(self, stage: str, index: int):
+        self.parts(stage)[index]["persisted"] = True
+        self._save_manifest()
+
+    def read(self, stage: str, name: str, part: int | None = None) -> list[BaseModel]:
+        """Output ``name`` of one part, or of all parts concatenated in order."""
+        parts = self.parts(stage) if part is None else [self.parts(stage)[part]]
+        models = []
+        for entry in parts:
+            output = entry["outputs"].get(name)
+            if not output or not output["rows"]:
+                continue
+            if not self.enabled:
+                raise RuntimeError("Checkpointing is disabled for this run")
+            models.extend(_read_models(
+                self.run_dir / output["file"], _MODELS[output["model"]], output["json"],
+            ))
+        return models
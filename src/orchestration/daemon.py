@@ -0,0 +1,505 @@
+"""
+B2B Lead Engine — Pipeline Daemon
+
+Keeps the pipeline running against an ingestion queue, so a company added
+to the TAM is scored within seconds instead of at the next batch run. The
+queue is either the ``ingest_queue`` table of the lead engine database or
+a spool directory of NDJSON files. Each queue item is one company and its
+contacts:
+
+    {"company": {"name": "Acme", ...}, "contacts": [{"full_name": ...}, ...]}
+
+Items are pulled in micro-batches that close once ``max_items`` have been
+claimed or ``max_wait`` seconds after the first one, whichever comes
+first. Each micro-batch goes through discovery → enrichment → scoring →
+outreach → CRM sync as one logged pipeline run (mode 'daemon'), and is
+acknowledged only once persisted: a daemon that dies mid-batch replays it
+on restart, and because ids are stable the replay overwrites rather than
+duplicates. An item that fails validation is parked as failed at once; an
+item whose batch fails goes back to the queue and is retried on its own,
+up to ``max_attempts`` tries, so one bad item or a passing outage does not
+sink the items batched with it. Every batch reports percentiles of the
+enqueue-to-done latency of its items.
+
+Usage:
+    python -m src.orchestration.daemon                      # drain ingest_queue
+    python -m src.orchestration.daemon --spool data/spool   # watch a spool directory
+    python -m src.orchestration.daemon --enqueue-synthetic 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import signal
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from src.config.icp_loader import ICPConfig, load_icp_config
+from src.config.settings import settings
+from src.database.database import Database
+from src.database.synthetic import generate_synthetic_tam
+from src.models.models import BatchReport, Company, Contact, stable_id
+from src.orchestration.dedup import CompanyDedup
+from src.orchestration.incremental import ChangeFilter
+from src.orchestration.metrics import StageRecorder
+from src.orchestration.parallel import StageExecutor
+from src.orchestration.streaming import TAMBatch, stream_pipeline
+
+
+# Reports and item latencies kept for ``summary``.
+REPORT_HISTORY = 1000
+LATENCY_HISTORY = 100_000
+
+
+# ── Queue Items ───────────────────────────────────────
+
+
+class QueueItem:
+    """
+    One queued company: its decoded payload, when it was enqueued (epoch
+    seconds) and how many earlier attempts at it failed.
+    """
+
+    def __init__(self, key, payload: dict, enqueued_at: float, attempts: int = 0):
+        self.key = key
+        self.payload = payload
+        self.enqueued_at = enqueued_at
+        self.attempts = attempts
+
+
+def item_payload(company: Company, contacts: Iterable[Contact]) -> dict:
+    """The queue payload for a company and its contacts."""
+    return {
+        "company": company.model_dump(mode="json"),
+        "contacts": [ct.model_dump(mode="json", exclude={"company_id"}) for ct in contacts],
+    }
+
+
+def tam_payloads(tam: Iterable[TAMBatch]) -> Iterator[dict]:
+    """One queue payload per company of a TAM."""
+    for companies, contacts in tam:
+        by_company: dict[str, list[Contact]] = {}
+        for contact in contacts:
+            by_company.setdefault(contact.company_id, []).append(contact)
+        for company in companies:
+            yield item_payload(company, by_company.get(company.company_id, []))
+
+
+def parse_payload(payload: dict) -> tuple[Company, list[Contact]]:
+    """
+    Validate a queue payload into a company and its contacts.
+
+    A missing company id derives from the company's natural key, and a
+    missing contact id from the company id and the contact's name, so the
+    same item queued twice lands on the same rows.
+    """
+    if not isinstance(payload, dict) or not isinstance(payload.get("company"), dict):
+        raise ValueError('expected {"company": {...}, "contacts": [...]}')
+    fields = dict(payload["company"])
+    company = Company.model_validate(fields)
+    contacts = []
+    for raw in payload.get("contacts") or []:
+        raw = {**raw, "company_id": company.company_id}
+        raw.setdefault("contact_id", stable_id("ct", company.company_id, str(raw.get("full_name", ""))))
+        contacts.append(Contact.model_validate(raw))
+    return company, contacts
+
+
+# ── Queues ────────────────────────────────────────────
+
+
+class SQLiteQueue:
+    """The ``ingest_queue`` table of a lead engine database."""
+
+    def __init__(self, db: Database):
+        self.db = db
+
+    def put(self, payloads: Iterable[dict]) -> int:
+        return self.db.enqueue(payloads)
+
+    def recover(self) -> int:
+        """Return items left claimed by a daemon that died; the number released."""
+        return self.db.release_queue_items()
+
+    def claim(self, limit: int) -> list[QueueItem]:
+        items = []
+        for row in self.db.claim_queue_items(limit):
+            try:
+                payload = json.loads(row["payload"])
+            except json.JSONDecodeError as exc:
+                self.db.fail_queue_items([row["item_id"]], f"invalid JSON: {exc}")
+                continue
+            enqueued_at = datetime.fromisoformat(row["enqueued_at"]).timestamp()
+            items.append(QueueItem(row["item_id"], payload, enqueued_at, row["attempts"]))
+        return items
+
+    def ack(self, items: list[QueueItem]):
+        self.db.ack_queue_items(item.key for item in items)
+
+    def fail(self, items: list[QueueItem], error: str):
+        self.db.fail_queue_items([item.key for item in items], error)
+
+    def retry(self, items: list[QueueItem], error: str, max_attempts: int) -> int:
+        """Return items for another attempt; the number parked as out of attempts."""
+        return self.db.retry_queue_items([item.key for item in items], error, max_attempts)
+
+
+class SpoolQueue:
+    """
+    A directory of ``*.ndjson`` files, one queue item per line.
+
+    Producers write a file under another name and rename it to ``.ndjson``
+    once complete (``put`` does this), so the daemon never reads half a
+    file. A file moves to ``done/`` once all its lines are processed; lines
+    that fail are appended, with their error, to ``failed/<file>``. A file
+    only partly processed when the daemon stopped is read again in full,
+    and its attempt counts, kept in memory, start over.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.done_dir = self.path / "done"
+        self.failed_dir = self.path / "failed"
+        for directory in (self.path, self.done_dir, self.failed_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        self._pending: deque[QueueItem] = deque()
+        # File name → lines not yet acknowledged or failed
+        self._open: dict[str, int] = {}
+
+    def put(self, payloads: Iterable[dict]) -> int:
+        name = f"{time.time_ns():020d}-{uuid4().hex[:8]}"
+        partial = self.path / f".{name}.partial"
+        count = 0
+        with partial.open("w") as f:
+            for payload in payloads:
+                f.write(json.dumps(payload, default=str) + "\n")
+                count += 1
+        partial.rename(self.path / f"{name}.ndjson")
+        return count
+
+    def recover(self) -> int:
+        # Claims live in memory only; unfinished files are still in the spool
+        return 0
+
+    def _scan(self):
+        for file in sorted(self.path.glob("*.ndjson")):
+            if file.name in self._open:
+                continue
+            enqueued_at = file.stat().st_mtime
+            items, bad = [], []
+            for number, line in enumerate(file.read_text().splitlines(), start=1):
+                if not line.strip():
+                    continue
+                try:
+                    items.append(QueueItem((file.name, number), json.loads(line), enqueued_at))
+                except json.JSONDecodeError as exc:
+                    bad.append({"error": f"invalid JSON: {exc}", "line": line})
+            self._open[file.name] = len(items)
+            self._write_failed(file.name, bad)
+            self._pending.extend(items)
+            if not items:
+                self._finish(file.name)
+
+    def claim(self, limit: int) -> list[QueueItem]:
+        self._scan()
+        return [self._pending.popleft() for _ in range(min(limit, len(self._pending)))]
+
+    def ack(self, items: list[QueueItem]):
+        self._settle(items)
+
+    def fail(self, items: list[QueueItem], error: str):
+        by_file: dict[str, list[dict]] = {}
+        for item in items:
+            by_file.setdefault(item.key[0], []).append({"error": error, "record": item.payload})
+        for name, records in by_file.items():
+            self._write_failed(name, records)
+        self._settle(items)
+
+    def retry(self, items: list[QueueItem], error: str, max_attempts: int) -> int:
+        """Return items for another attempt; the number parked as out of attempts."""
+        spent = []
+        for item in items:
+            item.attempts += 1
+            if item.attempts >= max_attempts:
+                spent.append(item)
+            else:
+                self._pending.appendleft(item)
+        self.fail(spent, error)
+        return len(spent)
+
+    def _write_failed(self, name: str, records: list[dict]):
+        if records:
+            with (self.failed_dir / name).open("a") as f:
+                f.writelines(json.dumps(r, default=str) + "\n" for r in records)
+
+    def _settle(self, items: list[QueueItem]):
+        for item in items:
+            name = item.key[0]
+            self._open[name] -= 1
+            if self._open[name] == 0:
+                self._finish(name)
+
+    def _finish(self, name: str):
+        (self.path / name).replace(self.done_dir / name)
+        del self._open[name]
+
+
+# ── Daemon ────────────────────────────────────────────
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class PipelineDaemon:
+    """
+    Drains a queue (``SQLiteQueue`` or ``SpoolQueue``) through the pipeline
+    in micro-batches until stopped.
+
+    Limits default from settings. ``incremental=True`` skips items whose
+    content an earlier run already processed.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        queue: SQLiteQueue | SpoolQueue,
+        icp_config: ICPConfig | None = None,
+        max_items: int | None = None,
+        max_wait: float | None = None,
+        poll_interval: float | None = None,
+        max_attempts: int | None = None,
+        workers: int | None = None,
+        seed: int = 42,
+        incremental: bool = False,
+        verbose: bool = True,
+    ):
+        self.db = db
+        self.queue = queue
+        self.icp_config = icp_config or load_icp_config(settings.icp_config_path)
+        self.max_items = max_items or settings.daemon_max_batch_items
+        self.max_wait = settings.daemon_max_wait_seconds if max_wait is None else max_wait
+        self.poll_interval = poll_interval or settings.daemon_poll_interval
+        self.max_attempts = max_attempts or settings.daemon_max_attempts
+        if self.max_items < 1:
+            raise ValueError("max_items must be >= 1")
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self.executor = StageExecutor(
+            workers=settings.pipeline_workers if workers is None else workers,
+            chunk_size=settings.pipeline_chunk_size,
+        )
+        self.dedup = CompanyDedup(db)
+        self.seed = seed
+        self.incremental = incremental
+        self.verbose = verbose
+        self.reports: deque[BatchReport] = deque(maxlen=REPORT_HISTORY)
+        self._latencies: deque[float] = deque(maxlen=LATENCY_HISTORY)
+        self._batches = 0
+        self._stop = threading.Event()
+
+    def stop(self):
+        """Finish the batch in flight, then return from ``run``."""
+        self._stop.set()
+
+    def next_batch(self, wait_for_items: bool = True) -> list[QueueItem]:
+        """
+        Claim the next micro-batch: ``max_items`` items, or whatever arrived
+        within ``max_wait`` seconds of the first one.
+
+        Returns early with what it has once stopped, and with nothing when
+        the queue is empty and ``wait_for_items`` is False.
+        """
+        items: list[QueueItem] = []
+        deadline = None
+        while not self._stop.is_set():
+            items += self.queue.claim(self.max_items - len(items))
+            now = time.monotonic()
+            if items and deadline is None:
+                deadline = now + self.max_wait
+            if len(items) >= self.max_items or (deadline is not None and now >= deadline):
+                break
+            if not items and not wait_for_items:
+                break
+            self._stop.wait(min(self.poll_interval, deadline - now) if deadline else self.poll_interval)
+        return items
+
+    def process(self, items: list[QueueItem]) -> BatchReport:
+        """Run one micro-batch through every stage and settle its items on the queue."""
+        self._batches += 1
+        start = time.perf_counter()
+        report = BatchReport(batch=self._batches, items=len(items))
+
+        accepted, companies, contacts = [], [], []
+        for item in items:
+            try:
+                company, company_contacts = parse_payload(item.payload)
+            except (ValidationError, ValueError, TypeError) as exc:
+                self.queue.fail([item], f"invalid item: {exc}")
+                report.failed_items += 1
+                continue
+            accepted.append(item)
+            companies.append(company)
+            contacts.extend(company_contacts)
+        report.companies = len(companies)
+
+        if accepted:
+            report.run_id = self.db.start_pipeline_run(mode="daemon")
+            changes = ChangeFilter(self.db, report.run_id, incremental=self.incremental)
+            metrics = StageRecorder()
+            try:
+                for batch in stream_pipeline(
+                    self.db, self.icp_config,
+                    changes.filter(self.dedup.filter([(companies, contacts)])),
+                    self.executor, len(companies), self.seed, metrics,
+                ):
+                    report.leads_scored += len(batch.scored)
+                    report.outreach_events += len(batch.events)
+                    report.deals += batch.deals
+            except Exception as exc:
+                # Not attributable to one item: every item gets another try
+                report.error = repr(exc)
+                parked = self.queue.retry(accepted, report.error, self.max_attempts)
+                report.failed_items += parked
+                report.retried_items = len(accepted) - parked
+            else:
+                self.queue.ack(accepted)
+            finally:
+                metrics.close()
+                self.db.insert_stage_metrics(report.run_id, metrics.results())
+                self.db.finish_pipeline_run(
+                    report.run_id, status="failed" if report.error else "succeeded",
+                    **changes.counts(),
+                )
+
+        done = time.time()
+        report.process_seconds = round(time.perf_counter() - start, 4)
+        if not report.error:
+            latencies = sorted(done - item.enqueued_at for item in accepted)
+            self._latencies.extend(latencies)
+            report.latency_p50 = round(_percentile(latencies, 50), 4)
+            report.latency_p95 = round(_percentile(latencies, 95), 4)
+            report.latency_p99 = round(_percentile(latencies, 99), 4)
+            report.latency_max = round(latencies[-1], 4) if latencies else 0.0
+        self.reports.append(report)
+        return report
+
+    def run(self, max_batches: int | None = None, until_idle: bool = False) -> list[BatchReport]:
+        """
+        Process micro-batches until stopped, ``max_batches`` have run or,
+        with ``until_idle``, the queue is empty.
+        """
+        released = self.queue.recover()
+        if self.verbose:
+            print(f"Pipeline daemon: batches of up to {self.max_items} items, "
+                  f"{self.max_wait:g}s window")
+            if released:
+                print(f"  Re-queued {released} items claimed by an earlier daemon")
+        reports = []
+        try:
+            while not self._stop.is_set() and (max_batches is None or len(reports) < max_batches):
+                items = self.next_batch(wait_for_items=not until_idle)
+                if not items:
+                    break
+                for batch in _isolate_retries(items):
+                    reports.append(self.process(batch))
+                    if self.verbose:
+                        print(_format_report(reports[-1]))
+        finally:
+            self.executor.close()
+            self.dedup.save()
+        if self.verbose and reports:
+            s = self.summary()
+            print(f"{s['batches']} batches, {s['items']} items — latency p50 {s['p50']:.3f}s "
+                  f"p95 {s['p95']:.3f}s p99 {s['p99']:.3f}s max {s['max']:.3f}s")
+        return reports
+
+    def summary(self) -> dict:
+        """Latency percentiles over the recent items of every batch."""
+        ordered = sorted(self._latencies)
+        return {
+            "batches": len(self.reports),
+            "items": sum(r.items for r in self.reports),
+            "p50": _percentile(ordered, 50),
+            "p95": _percentile(ordered, 95),
+            "p99": _percentile(ordered, 99),
+            "max": ordered[-1] if ordered else 0.0,
+        }
+
+
+def _isolate_retries(items: list[QueueItem]) -> list[list[QueueItem]]:
+    """
+    Split a claimed batch so each retried item runs alone: the item that
+    sank a batch then fails on its own, and its batchmates go through.
+    """
+    fresh = [item for item in items if not item.attempts]
+    batches = [[item] for item in items if item.attempts]
+    return batches + [fresh] if fresh else batches
+
+
+def _format_report(r: BatchReport) -> str:
+    line = (f"  batch {r.batch}: {r.items} items → {r.leads_scored} scored, {r.deals} deals "
+            f"in {r.process_seconds:.3f}s")
+    if r.error:
+        return f"{line} | FAILED ({r.retried_items} to retry, {r.failed_items} parked) {r.error}"
+    failed = f", {r.failed_items} rejected" if r.failed_items else ""
+    return (f"{line}{failed} | latency p50 {r.latency_p50:.3f}s p95 {r.latency_p95:.3f}s "
+            f"p99 {r.latency_p99:.3f}s max {r.latency_max:.3f}s")
+
+
+# ── CLI Entry Point ───────────────────────────────────
+
+
+def main(argv: list[str] | None = None) -> list[BatchReport]:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", dest="db_path", help="SQLite database path")
+    parser.add_argument("--spool", nargs="?", const=settings.spool_dir, metavar="DIR",
+                        help="Watch an NDJSON spool directory instead of the ingest_queue table")
+    parser.add_argument("--max-items", type=int, help="Items per micro-batch")
+    parser.add_argument("--max-wait", type=float, help="Seconds a micro-batch waits to fill")
+    parser.add_argument("--max-attempts", type=int,
+                        help="Tries per item before a failing batch parks it")
+    parser.add_argument("--workers", type=int, help="Worker processes for enrichment and scoring")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Skip items whose content was already processed")
+    parser.add_argument("--until-idle", action="store_true", help="Exit once the queue is empty")
+    parser.add_argument("--enqueue-synthetic", type=int, metavar="N",
+                        help="Queue a synthetic TAM of N companies and exit")
+    parser.add_argument("--quiet", action="store_true", help="Suppress console output")
+    args = parser.parse_args(argv)
+
+    db = Database(args.db_path or settings.database_path)
+    queue = SpoolQueue(args.spool) if args.spool else SQLiteQueue(db)
+    try:
+        if args.enqueue_synthetic:
+            count = queue.put(tam_payloads(generate_synthetic_tam(args.enqueue_synthetic).batches()))
+            if not args.quiet:
+                print(f"Queued {count:,} companies")
+            return []
+
+        daemon = PipelineDaemon(
+            db, queue, max_items=args.max_items, max_wait=args.max_wait,
+            max_attempts=args.max_attempts, workers=args.workers,
+            incremental=args.incremental, verbose=not args.quiet,
+        )
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: daemon.stop())
+        return daemon.run(until_idle=args.until_idle)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
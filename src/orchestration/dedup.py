@@ -0,0 +1,212 @@
+"""
+B2B Lead Engine — Company Deduplication
+
+Resolves incoming companies to one record per real-world company, keyed by
+the natural key from ``company_key`` (CNPJ for BR, else website domain).
+Every key loaded so far is kept, with the id it was stored under, in the
+exact ``company_keys`` table. A Bloom filter in front of that table,
+persisted next to the database, answers "never seen" for a new company in
+O(1) without a lookup; only keys the filter may contain are looked up.
+
+A company whose key is already recorded is rewritten to the stored id (its
+contacts follow), and a second record with the same key in one batch is
+folded into the first, so reruns and other sources upsert the existing row
+instead of adding a duplicate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from src.config.settings import settings
+from src.database.database import Database
+from src.models.models import Company, Contact
+from src.orchestration.streaming import TAMBatch
+
+
+def key_hashes(keys: Iterable[str]) -> np.ndarray:
+    """64-bit hashes of natural keys."""
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(k.encode(), digest_size=8).digest(), "little")
+         for k in keys),
+        dtype=np.uint64,
+    )
+
+
+# ── Bloom Filter ──────────────────────────────────────
+
+
+class BloomFilter:
+    """
+    Bloom filter over 64-bit key hashes.
+
+    Sized for ``capacity`` keys at ``error_rate`` false positives; the k bit
+    positions of a key come from double hashing the two halves of its hash.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.num_bits = max(64, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(self.num_hashes, dtype=np.uint64)
+        return (h1[:, None] + steps[None, :] * h2[:, None]) % np.uint64(self.num_bits)
+
+    def add(self, hashes: np.ndarray):
+        """Add keys by hash; callers add each key once so ``count`` stays exact."""
+        if not len(hashes):
+            return
+        positions = self._positions(hashes).ravel()
+        masks = np.left_shift(1, positions & np.uint64(7)).astype(np.uint8)
+        np.bitwise_or.at(self.bits, positions >> np.uint64(3), masks)
+        self.count += len(hashes)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Per hash: False if the key was never added, True if it probably was."""
+        if not len(hashes):
+            return np.zeros(0, dtype=bool)
+        positions = self._positions(hashes)
+        bits = self.bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)
+        return (bits & 1).all(axis=1)
+
+    def save(self, path: str | Path):
+        """Write the filter atomically (a temp file renamed into place)."""
+        path = Path(path)
+        partial = path.with_name(path.name + ".partial")
+        with open(partial, "wb") as f:
+            np.savez(
+                f, bits=self.bits, error_rate=np.float64(self.error_rate),
+                sizes=np.array([self.capacity, self.num_bits, self.num_hashes, self.count]),
+            )
+        partial.replace(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> BloomFilter:
+        with np.load(path) as data:
+            capacity, num_bits, num_hashes, count = (int(v) for v in data["sizes"])
+            bloom = cls(capacity, float(data["error_rate"]))
+            if (bloom.num_bits, bloom.num_hashes) != (num_bits, num_hashes):
+                raise ValueError(f"{path} does not match its own sizing")
+            bloom.bits = data["bits"].copy()
+            bloom.count = count
+        return bloom
+
+
+# ── Dedup Index ───────────────────────────────────────
+
+
+class CompanyDedup:
+    """
+    Natural-key index of every company loaded into ``db``.
+
+    The Bloom filter lives at ``bloom_path`` (default: the database path
+    with a ``.bloom`` suffix). It is rebuilt from ``company_keys`` when the
+    file is missing, was not saved after keys were recorded, or its keys
+    outgrow its capacity; call ``save`` once a run is done.
+    """
+
+    def __init__(self, db: Database, bloom_path: str | Path | None = None):
+        self.db = db
+        self.bloom_path = Path(bloom_path) if bloom_path else Path(db.db_path).with_suffix(".bloom")
+        self.bloom = self._open_bloom()
+        self.companies_seen = 0
+        self.known = 0
+        self.duplicates = 0
+        self.lookups = 0
+        self.false_positives = 0
+
+    def _open_bloom(self) -> BloomFilter:
+        recorded = self.db.count_company_keys()
+        if self.bloom_path.exists():
+            try:
+                bloom = BloomFilter.load(self.bloom_path)
+            except (OSError, ValueError, KeyError):
+                bloom = None
+            if bloom is not None and bloom.count == recorded and recorded <= bloom.capacity:
+                return bloom
+        return self._rebuild(recorded)
+
+    def _rebuild(self, recorded: int) -> BloomFilter:
+        bloom = BloomFilter(
+            max(settings.dedup_bloom_capacity, 2 * recorded), settings.dedup_bloom_error_rate,
+        )
+        for keys in self.db.iter_company_keys():
+            bloom.add(key_hashes(keys))
+        return bloom
+
+    def save(self):
+        self.bloom.save(self.bloom_path)
+
+    def lookup(self, keys: list[str]) -> dict[str, str]:
+        """Stored company id of each recorded key; keys the filter rules out cost nothing."""
+        maybe = self.bloom.contains(key_hashes(keys))
+        candidates = [k for k, m in zip(keys, maybe) if m]
+        self.lookups += len(candidates)
+        stored = self.db.get_company_keys(candidates) if candidates else {}
+        self.false_positives += len(set(candidates) - set(stored))
+        return stored
+
+    def resolve(self, companies: list[Company], contacts: list[Contact]) -> TAMBatch:
+        """
+        Give each company in a batch its canonical id and record new keys.
+
+        Later records of a key seen earlier in the batch are dropped in
+        favour of the first; their contacts move to the kept record.
+        """
+        keys = [c.natural_key for c in companies]
+        stored = self.lookup(keys)
+
+        canonical: dict[str, str] = {}   # incoming id → canonical id
+        by_key: dict[str, str] = {}      # key → canonical id, this batch
+        kept, new_keys = [], []
+        for company, key in zip(companies, keys):
+            if key in by_key:
+                canonical[company.company_id] = by_key[key]
+                self.duplicates += 1
+                continue
+            if key in stored:
+                self.known += 1
+                company_id = stored[key]
+            else:
+                company_id = company.company_id
+                new_keys.append((key, company_id))
+            by_key[key] = canonical[company.company_id] = company_id
+            kept.append(company if company.company_id == company_id
+                        else company.model_copy(update={"company_id": company_id}))
+
+        kept_contacts = [
+            ct if canonical.get(ct.company_id, ct.company_id) == ct.company_id
+            else ct.model_copy(update={"company_id": canonical[ct.company_id]})
+            for ct in contacts
+        ]
+        if new_keys:
+            self.db.record_company_keys(new_keys)
+            self.bloom.add(key_hashes(k for k, _ in new_keys))
+        self.companies_seen += len(companies)
+        return kept, kept_contacts
+
+    def filter(self, tam: Iterable[TAMBatch]) -> Iterator[TAMBatch]:
+        for companies, contacts in tam:
+            yield self.resolve(companies, contacts)
+
+    def counts(self) -> dict[str, int]:
+        return {
+            "companies_seen": self.companies_seen,
+            "known": self.known,
+            "duplicates": self.duplicates,
+            "lookups": self.lookups,
+            "false_positives": self.false_positives,
+        }
@@ -0,0 +1,126 @@
+"""
+B2B Lead Engine — Incremental Runs
+
+Narrows a TAM down to the companies and contacts that are new or changed
+since the last successful run. Ids are stable (derived from natural keys),
+so they say which entity a record is but not whether its content changed,
+and ``discovered_at`` is stamped afresh every time a source is read.
+Entities are therefore recognised by a fingerprint of their content, ids
+and timestamps left out; the fingerprints each run loaded are stored in
+``pipeline_fingerprints`` and only trusted once that run succeeded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Iterable, Iterator
+
+from src.database.database import Database
+from src.models.models import Company, Contact
+from src.orchestration.streaming import TAMBatch
+
+
+# Volatile fields that say nothing about whether an entity changed
+_COMPANY_VOLATILE = {"company_id", "discovered_at"}
+_CONTACT_VOLATILE = {"contact_id", "company_id", "discovered_at"}
+
+
+def _digest(fields: dict) -> str:
+    payload = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def company_fingerprint(company: Company) -> str:
+    """Content hash of a company, independent of its id and discovery time."""
+    return _digest(company.model_dump(exclude=_COMPANY_VOLATILE))
+
+
+def contact_fingerprint(contact: Contact, company_fp: str) -> str:
+    """Content hash of a contact; the owning company is identified by its fingerprint."""
+    fields = contact.model_dump(exclude=_CONTACT_VOLATILE)
+    fields["company"] = company_fp
+    return _digest(fields)
+
+
+class ChangeFilter:
+    """
+    Passes through only the new or changed part of each TAM batch.
+
+    Unchanged companies are dropped unless one of their contacts is new, in
+    which case the company is kept under the id it was stored with so the
+    new contact joins the existing record. With ``incremental=False``
+    everything passes, but fingerprints are still recorded so the next
+    incremental run can skip it.
+    """
+
+    def __init__(self, db: Database, run_id: str, incremental: bool = True):
+        self.db = db
+        self.run_id = run_id
+        self.incremental = incremental
+        self.companies_seen = 0
+        self.companies_processed = 0
+        self.contacts_seen = 0
+        self.contacts_processed = 0
+
+    def filter(self, tam: Iterable[TAMBatch]) -> Iterator[TAMBatch]:
+        for companies, contacts in tam:
+            yield self._filter_batch(companies, contacts)
+
+    def _known(self, entity: str, fingerprints: Iterable[str]) -> dict[str, str]:
+        if not self.incremental:
+            return {}
+        return self.db.get_known_fingerprints(entity, fingerprints)
+
+    def _filter_batch(self, companies: list[Company], contacts: list[Contact]) -> TAMBatch:
+        company_fps = {c.company_id: company_fingerprint(c) for c in companies}
+        contact_fps = [
+            (ct, contact_fingerprint(ct, company_fps.get(ct.company_id, "")))
+            for ct in contacts
+        ]
+        known_companies = self._known("company", company_fps.values())
+        known_contacts = self._known("contact", [fp for _, fp in contact_fps])
+
+        new_contacts = [(ct, fp) for ct, fp in contact_fps if fp not in known_contacts]
+        with_new_contacts = {ct.company_id for ct, _ in new_contacts}
+
+        # Incoming id → stored id for companies that are already loaded
+        stored_ids = {
+            cid: known_companies[fp]
+            for cid, fp in company_fps.items() if fp in known_companies
+        }
+        kept_companies = [
+            c.model_copy(update={"company_id": stored_ids[c.company_id]})
+            if c.company_id in stored_ids else c
+            for c in companies
+            if c.company_id not in stored_ids or c.company_id in with_new_contacts
+        ]
+        kept_contacts = [
+            ct.model_copy(update={"company_id": stored_ids[ct.company_id]})
+            if ct.company_id in stored_ids else ct
+            for ct, _ in new_contacts
+        ]
+
+        self.db.record_fingerprints(
+            "company",
+            ((company_fps[c.company_id], c.company_id)
+             for c in companies if c.company_id not in stored_ids),
+            self.run_id,
+        )
+        self.db.record_fingerprints(
+            "contact", ((fp, ct.contact_id) for ct, fp in new_contacts), self.run_id,
+        )
+
+        self.companies_seen += len(companies)
+        self.companies_processed += len(kept_companies)
+        self.contacts_seen += len(contacts)
+        self.contacts_processed += len(kept_contacts)
+        return kept_companies, kept_contacts
+
+    def counts(self) -> dict[str, int]:
+        return {
+            "companies_seen": self.companies_seen,
+            "companies_processed": self.companies_processed,
+            "contacts_seen": self.contacts_seen,
+            "contacts_processed": self.contacts_processed,
+        }
@@ -0,0 +1,101 @@
+"""
+B2B Lead Engine — Stage Metrics
+
+Per-stage instrumentation for pipeline runs: wall and CPU time, rows in and
+out, throughput, time spent writing to the database and (optionally) peak
+traced Python memory. A stage entered several times — once per batch in
+streaming mode, or across a resumed run — accumulates into one record.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from src.models.models import PipelineResult, StageMetrics
+
+
+class StageRecorder:
+    """
+    Collects ``StageMetrics`` for the stages of one run.
+
+    CPU time is the calling thread's only; work done in ``StageExecutor``
+    worker processes shows up as wall time. ``trace_memory`` turns on
+    ``tracemalloc``, which slows allocation-heavy stages noticeably.
+
+    Stages may run on different threads (pipelined mode); database writes
+    are attributed to the stage open on the calling thread. Traced memory
+    is process-wide, so concurrent stages see each other's peaks.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self._stages: dict[str, StageMetrics] = {}
+        self._local = threading.local()
+        self._started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+
+    def close(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str, rows_in: int = 0) -> Iterator[StageMetrics]:
+        """Time the enclosed block as (part of) stage ``name``; add ``rows_out`` to the yielded record."""
+        metrics = self._stages.setdefault(name, StageMetrics(stage=name))
+        metrics.rows_in += rows_in
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        self._local.current = metrics
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield metrics
+        finally:
+            metrics.wall_seconds += time.perf_counter() - wall
+            metrics.cpu_seconds += time.thread_time() - cpu
+            if self.trace_memory:
+                peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+                metrics.peak_memory_mb = max(metrics.peak_memory_mb or 0.0, peak_mb)
+            self._local.current = None
+
+    @contextmanager
+    def db_write(self) -> Iterator[None]:
+        """Count the enclosed block as database write time of the current stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            current = getattr(self._local, "current", None)
+            if current is not None:
+                current.db_write_seconds += time.perf_counter() - start
+
+    def results(self) -> list[StageMetrics]:
+        """Finished records in the order stages first ran, with rounded figures."""
+        results = []
+        for metrics in self._stages.values():
+            # Throughput counts rows consumed, or produced for source stages
+            rows = metrics.rows_in or metrics.rows_out
+            results.append(metrics.model_copy(update={
+                "wall_seconds": round(metrics.wall_seconds, 4),
+                "cpu_seconds": round(metrics.cpu_seconds, 4),
+                "db_write_seconds": round(metrics.db_write_seconds, 4),
+                "rows_per_sec": round(rows / metrics.wall_seconds, 1) if metrics.wall_seconds else 0.0,
+                "peak_memory_mb": (
+                    round(metrics.peak_memory_mb, 2) if metrics.peak_memory_mb is not None else None
+                ),
+            }))
+        return results
+
+
+def dump_metrics(result: PipelineResult, path: str | Path):
+    """Write a run's result and stage metrics as JSON, for tracking trends across releases."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result.model_dump(mode="json"), indent=2))
@@ -0,0 +1,143 @@
+"""
+B2B Lead Engine — Parallel Stage Execution
+
+Splits the enrichment and scoring stages into fixed-size chunks of leads
+and runs them either in-process or across a ``ProcessPoolExecutor``.
+
+Every lead draws from its own generator seeded by ``(seed, stage,
+entity id)`` (see ``entity_rng``), so a run with N workers and any chunk
+size produces exactly the same leads, in the same order, as the serial run
+with the same seed.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+from src.config.icp_loader import ICPConfig
+from src.enrichment.enrichment import EnrichmentPipeline
+from src.models.models import Company, Contact, EnrichedLead, ScoredLead
+from src.scoring.scoring import ScoringEngine
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Leads per task. Large enough that pickling the chunk to a worker is
+# cheap relative to processing it, small enough to balance across workers.
+DEFAULT_CHUNK_SIZE = 250
+
+
+def _chunks(items: list, chunk_size: int) -> list[list]:
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+# ── Chunk Tasks (module-level so worker processes can unpickle them) ──
+
+
+def enrich_chunk(task: tuple[int, list[Company], list[Contact]]) -> list[EnrichedLead]:
+    """Enrich one chunk of contacts, each from its own seeded generator."""
+    seed, companies, contacts = task
+    return EnrichmentPipeline(seed=seed).enrich(companies, contacts)
+
+
+def score_chunk(task: tuple[ICPConfig, list[EnrichedLead]]) -> list[ScoredLead]:
+    """Score one chunk of enriched leads."""
+    icp_config, leads = task
+    return ScoringEngine(icp_config).score_leads(leads)
+
+
+def enrich_and_score_chunk(
+    task: tuple[int, list[Company], list[Contact], ICPConfig]
+) -> list[tuple[EnrichedLead, ScoredLead]]:
+    """Enrich then score one chunk in a single round trip to the worker."""
+    seed, companies, contacts, icp_config = task
+    enriched = enrich_chunk((seed, companies, contacts))
+    return list(zip(enriched, score_chunk((icp_config, enriched))))
+
+
+# ── Executor ──────────────────────────────────────────
+
+
+class StageExecutor:
+    """
+    Runs per-chunk stage tasks serially (``workers <= 1``) or on a process pool.
+
+    Results are concatenated in chunk order regardless of which worker
+    finished first. Use as a context manager so the pool is shut down.
+    """
+
+    def __init__(self, workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.workers = max(1, workers)
+        self.chunk_size = chunk_size
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> StageExecutor:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def map(self, fn: Callable[[T], list[R]], tasks: Iterable[T]) -> list[R]:
+        """Apply ``fn`` to every task and flatten the per-chunk results in order."""
+        tasks = list(tasks)
+        if self.workers == 1 or len(tasks) <= 1:
+            results = map(fn, tasks)
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            results = self._pool.map(fn, tasks)
+        return [item for chunk in results for item in chunk]
+
+    # ── Stages ────────────────────────────────────────
+
+    def _enrich_tasks(
+        self, companies: list[Company], contacts: list[Contact], seed: int
+    ) -> list[tuple[int, list[Company], list[Contact]]]:
+        company_map = {c.company_id: c for c in companies}
+        tasks = []
+        for chunk in _chunks(contacts, self.chunk_size):
+            # Ship each worker only the companies its contacts belong to
+            needed = dict.fromkeys(c.company_id for c in chunk)
+            chunk_companies = [company_map[cid] for cid in needed if cid in company_map]
+            tasks.append((seed, chunk_companies, chunk))
+        return tasks
+
+    def enrich(
+        self, companies: list[Company], contacts: list[Contact], seed: int
+    ) -> list[EnrichedLead]:
+        """Parallel equivalent of ``EnrichmentPipeline(seed=seed).enrich``."""
+        return self.map(enrich_chunk, self._enrich_tasks(companies, contacts, seed))
+
+    def score(self, icp_config: ICPConfig, leads: list[EnrichedLead]) -> list[ScoredLead]:
+        """Parallel equivalent of ``ScoringEngine.score_leads``."""
+        return self.map(score_chunk, [(icp_config, chunk) for chunk in _chunks(leads, self.chunk_size)])
+
+    def enrich_and_score(
+        self,
+        companies: list[Company],
+        contacts: list[Contact],
+        icp_config: ICPConfig,
+        seed: int,
+    ) -> tuple[list[EnrichedLead], list[ScoredLead]]:
+        """
+        Enrichment followed by scoring, fused per chunk.
+
+        Same output as ``enrich`` then ``score``, but
+        each chunk crosses the process boundary once instead of three times
+        (pickling the models costs about as much as scoring them).
+        """
+        tasks = [
+            (*task, icp_config)
+            for task in self._enrich_tasks(companies, contacts, seed)
+        ]
+        pairs = self.map(enrich_and_score_chunk, tasks)
+        return [e for e, _ in pairs], [s for _, s in pairs]
@@ -0,0 +1,183 @@
+"""
+B2B Lead Engine — Pipelined Execution
+
+Runs the streaming stages concurrently, one worker thread per stage. Each
+worker takes batches from a bounded queue fed by the stage before it and
+puts them on the queue to the next, so while batch N is being enriched,
+batch N-1 is being scored and written and batch N-2 is in outreach.
+Database writes overlap with computation (SQLite releases the GIL), and the
+first scored leads reach ``fct_scored_leads`` while the TAM is still being
+read.
+
+Queues hold at most ``queue_size`` batches: a stage that runs ahead blocks
+until its consumer catches up, so memory stays bounded as in streaming
+mode. The first stage to fail stops every other stage and its exception
+is re-raised to the caller once all workers have exited; closing the
+iterator early shuts the workers down the same way.
+
+Every random draw comes from a per-entity generator (``entity_rng``), so
+outputs do not depend on thread timing.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Callable, Iterable, Iterator
+
+from src.config.icp_loader import ICPConfig
+from src.database.database import Database
+from src.discovery.discovery import DiscoveryEngine
+from src.orchestration.metrics import StageRecorder
+from src.orchestration.parallel import StageExecutor
+from src.orchestration.streaming import (
+    DEFAULT_BATCH_SIZE,
+    StreamBatch,
+    TAMBatch,
+    discover,
+    enrich_and_score,
+    load_tam,
+    reach_out,
+    resolve,
+    sync_crm,
+    write_briefs,
+)
+from src.outreach.outreach import OutreachEngine
+from src.resolution.resolution import EntityResolver
+from src.scoring.deal_brief import DealBriefGenerator
+
+
+# Batches buffered between consecutive stages.
+DEFAULT_QUEUE_SIZE = 2
+
+# How often blocked workers check whether the run was stopped (seconds).
+_POLL_INTERVAL = 0.05
+
+_END = object()
+
+
+class _Stopped(Exception):
+    """Raised inside a worker whose run was stopped by another stage."""
+
+
+class _Channel:
+    """Bounded queue between two stages that gives up once the run is stopped."""
+
+    def __init__(self, maxsize: int, stop: threading.Event):
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._stop = stop
+
+    def put(self, item):
+        while True:
+            if self._stop.is_set():
+                raise _Stopped
+            try:
+                self._queue.put(item, timeout=_POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self) -> Iterator[StreamBatch]:
+        while True:
+            if self._stop.is_set():
+                raise _Stopped
+            try:
+                item = self._queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if item is _END:
+                return
+            yield item
+
+
+Stage = Callable[[Iterable[StreamBatch]], Iterator[StreamBatch]]
+
+
+class StagePipeline:
+    """
+    Worker threads connected by bounded channels.
+
+    ``stages`` are streaming stage functions: each takes the previous
+    stage's batches and yields them on. The first stage's input is empty.
+    Iterate the pipeline to drive it; it yields batches leaving the last
+    stage.
+    """
+
+    def __init__(self, stages: list[tuple[str, Stage]], queue_size: int = DEFAULT_QUEUE_SIZE):
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        self._stop = threading.Event()
+        self._errors: list[BaseException] = []
+        self._channels = [_Channel(queue_size, self._stop) for _ in stages]
+        self._threads = [
+            threading.Thread(
+                target=self._work,
+                args=(stage, self._channels[i - 1] if i else (), self._channels[i]),
+                name=f"pipeline-{name}",
+                daemon=True,
+            )
+            for i, (name, stage) in enumerate(stages)
+        ]
+
+    def _work(self, stage: Stage, source: Iterable[StreamBatch], sink: _Channel):
+        batches = iter(stage(source))
+        try:
+            for batch in batches:
+                sink.put(batch)
+            sink.put(_END)
+        except _Stopped:
+            pass
+        except BaseException as exc:
+            self._errors.append(exc)
+            self._stop.set()
+        finally:
+            # Run a generator stage's cleanup (open metrics timers) on this thread
+            if hasattr(batches, "close"):
+                batches.close()
+
+    def stop(self):
+        """Stop every worker and wait for them to exit."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+
+    def __iter__(self) -> Iterator[StreamBatch]:
+        for thread in self._threads:
+            thread.start()
+        try:
+            yield from self._channels[-1]
+        except _Stopped:
+            pass
+        finally:
+            self.stop()
+        if self._errors:
+            raise self._errors[0]
+
+
+def pipelined_pipeline(
+    db: Database,
+    icp_config: ICPConfig,
+    tam: Iterable[TAMBatch],
+    executor: StageExecutor,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    seed: int = 42,
+    metrics: StageRecorder | None = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> Iterator[StreamBatch]:
+    """
+    ``stream_pipeline`` with every stage on its own thread.
+
+    Batches come out fully processed and persisted, in TAM order.
+    """
+    metrics = metrics or StageRecorder()
+    discovery, briefs, outreach = DiscoveryEngine(icp_config), DealBriefGenerator(), OutreachEngine(seed)
+    resolver = EntityResolver()
+    return iter(StagePipeline([
+        ("tam", lambda _: load_tam(tam, db, batch_size, metrics)),
+        ("discover", lambda b: discover(b, discovery, metrics)),
+        ("resolve", lambda b: resolve(b, resolver, db, metrics)),
+        ("enrich", lambda b: enrich_and_score(b, executor, icp_config, seed, db, metrics)),
+        ("score", lambda b: write_briefs(b, briefs, db, metrics)),
+        ("outreach", lambda b: reach_out(b, outreach, db, metrics)),
+        ("crm", lambda b: sync_crm(b, metrics)),
+    ], queue_size))
@@ -0,0 +1,306 @@
+"""
+B2B Lead Engine — Streaming Pipeline
+
+Chains TAM persistence, discovery, entity resolution, enrichment, scoring,
+outreach and CRM sync as generators over fixed-size batches of companies.
+Only the batch in flight is held in memory, so peak memory depends on the
+batch size rather than on the size of the TAM; funnel counts are
+accumulated as each batch leaves the last stage. Each stage times only its
+own work on a batch into the run's ``StageRecorder``.
+
+Random draws come from per-entity generators (``entity_rng``), so a
+company's enrichability, its leads and their outreach do not depend on
+batch boundaries or on what else is in the run. Entity resolution is the
+exception: near-duplicates are only merged when they arrive in the same
+batch.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+from src.config.icp_loader import ICPConfig
+from src.crm.crm_sync import CRMSync
+from src.database.database import Database
+from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+from src.discovery.discovery import DiscoveryEngine
+from src.models.models import (
+    Company,
+    Contact,
+    EnrichedLead,
+    OutreachEvent,
+    PipelineResult,
+    QualificationStatus,
+    ScoredLead,
+    entity_rng,
+)
+from src.orchestration.metrics import StageRecorder
+from src.orchestration.parallel import StageExecutor
+from src.outreach.outreach import OutreachEngine
+from src.resolution.resolution import EntityResolver
+from src.scoring.deal_brief import DealBriefGenerator
+
+
+# A slice of the TAM: companies plus the contacts that belong to them.
+TAMBatch = tuple[list[Company], list[Contact]]
+
+# Companies per streamed batch.
+DEFAULT_BATCH_SIZE = 500
+
+# Share of discovered companies the (simulated) providers can enrich.
+ENRICHMENT_RATE = 0.85
+
+
+def is_enrichable(company: Company, seed: int) -> bool:
+    """Whether the providers can enrich ``company`` in a run with ``seed``."""
+    return entity_rng(seed, "select", company.company_id).random() < ENRICHMENT_RATE
+
+
+# ── TAM Sources ───────────────────────────────────────
+
+
+def seed_tam() -> Iterator[TAMBatch]:
+    """The seed dataset as a single TAM batch."""
+    companies = generate_seed_companies()
+    yield companies, generate_seed_contacts(companies)
+
+
+def rebatch(tam: Iterable[TAMBatch], batch_size: int) -> Iterator[TAMBatch]:
+    """Split TAM batches into batches of at most ``batch_size`` companies."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    for companies, contacts in tam:
+        by_company: dict[str, list[Contact]] = {}
+        for contact in contacts:
+            by_company.setdefault(contact.company_id, []).append(contact)
+        for i in range(0, len(companies), batch_size):
+            chunk = companies[i:i + batch_size]
+            yield chunk, [ct for c in chunk for ct in by_company.get(c.company_id, [])]
+
+
+# ── Batch State ───────────────────────────────────────
+
+
+class StreamBatch:
+    """One TAM batch and everything the stages derive from it."""
+
+    def __init__(self, index: int, companies: list[Company], contacts: list[Contact]):
+        self.index = index
+        self.companies = companies
+        self.contacts = contacts
+        self.discovered_companies: list[Company] = []
+        self.discovered_contacts: list[Contact] = []
+        self.enriched_companies = 0
+        self.enriched: list[EnrichedLead] = []
+        self.scored: list[ScoredLead] = []
+        self.events: list[OutreachEvent] = []
+        self.deals = 0
+        self.deal_value = 0.0
+
+
+class FunnelCounters:
+    """Running funnel totals, updated once per finished batch."""
+
+    def __init__(self):
+        self.batches = 0
+        self.companies_pooled = 0
+        self.contacts_pooled = 0
+        self.companies_discovered = 0
+        self.contacts_found = 0
+        self.companies_enriched = 0
+        self.leads_enriched = 0
+        self.leads_scored = 0
+        self.leads_qualified = 0
+        self.leads_nurture = 0
+        self.leads_disqualified = 0
+        self.outreach_events_created = 0
+        self.deals_synced_to_crm = 0
+        self.pipeline_value = 0.0
+
+    def add(self, batch: StreamBatch):
+        self.batches += 1
+        self.companies_pooled += len(batch.companies)
+        self.contacts_pooled += len(batch.contacts)
+        self.companies_discovered += len(batch.discovered_companies)
+        self.contacts_found += len(batch.discovered_contacts)
+        self.companies_enriched += batch.enriched_companies
+        self.leads_enriched += len(batch.enriched)
+        self.leads_scored += len(batch.scored)
+        for lead in batch.scored:
+            if lead.qualification_status == QualificationStatus.QUALIFIED:
+                self.leads_qualified += 1
+            elif lead.qualification_status == QualificationStatus.NURTURE:
+                self.leads_nurture += 1
+            else:
+                self.leads_disqualified += 1
+        self.outreach_events_created += len(batch.events)
+        self.deals_synced_to_crm += batch.deals
+        self.pipeline_value += batch.deal_value
+
+    def to_result(self, duration_seconds: float) -> PipelineResult:
+        return PipelineResult(
+            companies_discovered=self.companies_discovered,
+            contacts_found=self.contacts_found,
+            leads_enriched=self.leads_enriched,
+            leads_scored=self.leads_scored,
+            leads_qualified=self.leads_qualified,
+            leads_nurture=self.leads_nurture,
+            leads_disqualified=self.leads_disqualified,
+            outreach_events_created=self.outreach_events_created,
+            deals_synced_to_crm=self.deals_synced_to_crm,
+            pipeline_duration_seconds=round(duration_seconds, 2),
+        )
+
+
+# ── Stages ────────────────────────────────────────────
+#
+# Each stage takes the previous stage's generator and yields the same batch
+# objects, filled in a little further.
+
+
+def load_tam(
+    tam: Iterable[TAMBatch], db: Database, batch_size: int, metrics: StageRecorder
+) -> Iterator[StreamBatch]:
+    """Stage 0: produce and store each TAM batch (the full pool) and start tracking it."""
+    source = enumerate(rebatch(tam, batch_size))
+    while True:
+        with metrics.stage("tam") as m:
+            item = next(source, None)
+            if item is None:
+                break
+            index, (companies, contacts) = item
+            with metrics.db_write():
+                db.insert_companies(companies)
+                db.insert_contacts(contacts)
+            m.rows_out += len(companies)
+        yield StreamBatch(index, companies, contacts)
+
+
+def discover(
+    batches: Iterable[StreamBatch], engine: DiscoveryEngine, metrics: StageRecorder
+) -> Iterator[StreamBatch]:
+    """Stage 1: keep companies matching an active ICP profile."""
+    for batch in batches:
+        with metrics.stage("discover", rows_in=len(batch.companies)) as m:
+            batch.discovered_companies, batch.discovered_contacts = engine.discover(
+                companies=batch.companies, contacts=batch.contacts,
+            )
+            m.rows_out += len(batch.discovered_companies)
+        yield batch
+
+
+def resolve(
+    batches: Iterable[StreamBatch], resolver: EntityResolver, db: Database, metrics: StageRecorder
+) -> Iterator[StreamBatch]:
+    """Stage 1b: fold near-duplicate companies and contacts within the batch."""
+    for batch in batches:
+        with metrics.stage("resolve", rows_in=len(batch.discovered_companies)) as m:
+            resolution = resolver.resolve(batch.discovered_companies, batch.discovered_contacts)
+            with metrics.db_write():
+                resolution.persist(db)
+            batch.discovered_companies = resolution.companies
+            batch.discovered_contacts = resolution.contacts
+            m.rows_out += len(batch.discovered_companies)
+        yield batch
+
+
+def enrich_and_score(
+    batches: Iterable[StreamBatch],
+    executor: StageExecutor,
+    icp_config: ICPConfig,
+    seed: int,
+    db: Database,
+    metrics: StageRecorder,
+) -> Iterator[StreamBatch]:
+    """Stages 2–3: enrich the enrichable companies' contacts, then score them."""
+    for batch in batches:
+        with metrics.stage("enrich", rows_in=len(batch.discovered_contacts)) as m:
+            enrichable = [c for c in batch.discovered_companies if is_enrichable(c, seed)]
+            enrichable_ids = {c.company_id for c in enrichable}
+            contacts = [c for c in batch.discovered_contacts if c.company_id in enrichable_ids]
+            batch.enriched_companies = len(enrichable)
+            batch.enriched, batch.scored = executor.enrich_and_score(
+                enrichable, contacts, icp_config, seed=seed,
+            )
+            with metrics.db_write():
+                db.insert_enriched_leads(batch.enriched)
+            m.rows_out += len(batch.scored)
+        yield batch
+
+
+def write_briefs(
+    batches: Iterable[StreamBatch],
+    brief_gen: DealBriefGenerator,
+    db: Database,
+    metrics: StageRecorder,
+) -> Iterator[StreamBatch]:
+    """Stage 3: deal briefs for qualified and nurture leads, then persist scores."""
+    for batch in batches:
+        with metrics.stage("score", rows_in=len(batch.scored)) as m:
+            for lead in batch.scored:
+                if lead.qualification_status != QualificationStatus.DISQUALIFIED:
+                    lead.deal_brief = brief_gen.generate_brief(lead).to_text()
+                    m.rows_out += 1
+            with metrics.db_write():
+                db.insert_scored_leads(batch.scored)
+        yield batch
+
+
+def _outreach_eligible(batch: StreamBatch) -> list[ScoredLead]:
+    # Qualified first, then nurture: the same order run_pipeline uses
+    by_status = {QualificationStatus.QUALIFIED: [], QualificationStatus.NURTURE: []}
+    for lead in batch.scored:
+        by_status.get(lead.qualification_status, []).append(lead)
+    return by_status[QualificationStatus.QUALIFIED] + by_status[QualificationStatus.NURTURE]
+
+
+def reach_out(
+    batches: Iterable[StreamBatch], engine: OutreachEngine, db: Database, metrics: StageRecorder
+) -> Iterator[StreamBatch]:
+    """Stage 4: outreach sequences for qualified and nurture leads."""
+    for batch in batches:
+        eligible = _outreach_eligible(batch)
+        with metrics.stage("outreach", rows_in=len(eligible)) as m:
+            batch.events = engine.generate_sequences(eligible)
+            with metrics.db_write():
+                db.insert_outreach_events(batch.events)
+            m.rows_out += len(batch.events)
+        yield batch
+
+
+def sync_crm(batches: Iterable[StreamBatch], metrics: StageRecorder) -> Iterator[StreamBatch]:
+    """Stage 5: CRM handoff. Only counts and value are kept, not the deals."""
+    for batch in batches:
+        eligible = _outreach_eligible(batch)
+        with metrics.stage("crm", rows_in=len(eligible)) as m:
+            crm = CRMSync()
+            deals = crm.sync_leads(eligible, batch.events)
+            batch.deals = len(deals)
+            batch.deal_value = sum(d.amount for d in deals)
+            m.rows_out += len(deals)
+        yield batch
+
+
+def stream_pipeline(
+    db: Database,
+    icp_config: ICPConfig,
+    tam: Iterable[TAMBatch],
+    executor: StageExecutor,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    seed: int = 42,
+    metrics: StageRecorder | None = None,
+) -> Iterator[StreamBatch]:
+    """
+    Chain every stage; iterating the result drives the whole pipeline.
+
+    Batches come out fully processed and persisted. Nothing is retained by
+    the chain itself, so drop each batch once its counts are taken.
+    """
+    metrics = metrics or StageRecorder()
+    batches = load_tam(tam, db, batch_size, metrics)
+    batches = discover(batches, DiscoveryEngine(icp_config), metrics)
+    batches = resolve(batches, EntityResolver(), db, metrics)
+    batches = enrich_and_score(batches, executor, icp_config, seed, db, metrics)
+    batches = write_briefs(batches, DealBriefGenerator(), db, metrics)
+    batches = reach_out(batches, OutreachEngine(seed), db, metrics)
+    return sync_crm(batches, metrics)
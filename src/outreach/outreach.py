@@ -17,6 +17,9 @@ from src.models.models import (
     OutreachChannel,
     OutreachStatus,
     ResponseType,
+    build,
+    entity_rng,
+    stable_id,
 )
 
 
@@ -92,6 +95,12 @@ Best,
 [Your Name]""",
     }
 
+    def __init__(self, seed: int | None = None):
+        # With a seed, each lead's template picks and simulated responses
+        # come from its own generator keyed by (seed, lead); without one,
+        # from the global RNG. Event ids always derive from lead and step.
+        self.seed = seed
+
     def generate_sequences(
         self, scored_leads: list[ScoredLead], steps: int = 3
     ) -> list[OutreachEvent]:
@@ -112,15 +121,21 @@ Best,
 
             company = enriched.company
             contact = enriched.contact
+            rng = (
+                entity_rng(self.seed, "outreach", lead.lead_id) if self.seed is not None
+                else random
+            )
 
             for step in range(1, steps + 1):
-                subject = self._generate_subject(step, company, contact)
+                subject = self._generate_subject(step, company, contact, rng)
                 body = self._generate_body(step, lead)
 
                 # Simulate sending time (staggered)
                 send_time = datetime.now(timezone.utc) + timedelta(days=(step - 1) * 3)
 
-                event = OutreachEvent(
+                event = build(
+                    OutreachEvent,
+                    event_id=stable_id("e", lead.lead_id, str(step)),
                     lead_id=lead.lead_id,
                     channel=OutreachChannel.EMAIL,
                     sequence_step=step,
@@ -131,15 +146,15 @@ Best,
                 )
 
                 # Simulate responses for demo purposes
-                event = self._simulate_response(event, step)
+                event = self._simulate_response(event, step, rng)
                 events.append(event)
 
         return events
 
-    def _generate_subject(self, step: int, company, contact) -> str:
+    def _generate_subject(self, step: int, company, contact, rng=random) -> str:
         """Generate email subject line for a given sequence step."""
         templates = self.SUBJECT_TEMPLATES.get(step, self.SUBJECT_TEMPLATES[1])
-        template = random.choice(templates)
+        template = rng.choice(templates)
 
         return template.format(
             company=company.name,
@@ -186,23 +201,23 @@ Best,
         )
 
     def _simulate_response(
-        self, event: OutreachEvent, step: int
+        self, event: OutreachEvent, step: int, rng=random
     ) -> OutreachEvent:
         """Simulate email responses for demo purposes."""
         # Simulate open rates (~60% step 1, lower after)
         open_rate = {1: 0.6, 2: 0.4, 3: 0.3}.get(step, 0.3)
-        if random.random() < open_rate:
+        if rng.random() < open_rate:
             event.status = OutreachStatus.OPENED
-            event.opened_at = event.sent_at + timedelta(hours=random.randint(1, 48))
+            event.opened_at = event.sent_at + timedelta(hours=rng.randint(1, 48))
 
             # Simulate reply rates (~15% step 1, ~10% step 2, ~5% step 3)
             reply_rate = {1: 0.15, 2: 0.10, 3: 0.05}.get(step, 0.05)
-            if random.random() < reply_rate:
+            if rng.random() < reply_rate:
                 event.status = OutreachStatus.REPLIED
                 event.responded_at = event.opened_at + timedelta(
-                    hours=random.randint(1, 24)
+                    hours=rng.randint(1, 24)
                 )
-                event.response_type = random.choice([
+                event.response_type = rng.choice([
                     ResponseType.INTERESTED,
                     ResponseType.NOT_NOW,
                     ResponseType.NOT_INTERESTED,
@@ -7,21 +7,44 @@ Produces a progressively decreasing funnel tracked at the company level.
 
 from __future__ import annotations
 
-import random
+import argparse
 import time
 from pathlib import Path
+from typing import Iterable
 
 from src.config.settings import settings
 from src.config.icp_loader import load_icp_config
 from src.database.database import Database
-from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+from src.database.importer import ProviderImporter
+from src.database.synthetic import generate_synthetic_tam
 from src.discovery.discovery import DiscoveryEngine
 from src.enrichment.enrichment import EnrichmentPipeline
 from src.scoring.scoring import ScoringEngine
 from src.scoring.deal_brief import DealBriefGenerator
 from src.outreach.outreach import OutreachEngine
+from src.resolution.resolution import EntityResolver
 from src.crm.crm_sync import CRMSync
-from src.models.models import PipelineResult
+from src.models.models import (
+    Company,
+    Contact,
+    EnrichedLead,
+    PipelineResult,
+    ScoredLead,
+    StageMetrics,
+)
+from src.orchestration.checkpoint import PIPELINE_STAGES, RunCheckpoint
+from src.orchestration.dedup import CompanyDedup
+from src.orchestration.incremental import ChangeFilter
+from src.orchestration.metrics import StageRecorder, dump_metrics
+from src.orchestration.parallel import StageExecutor
+from src.orchestration.pipelined import pipelined_pipeline
+from src.orchestration.streaming import (
+    FunnelCounters,
+    TAMBatch,
+    is_enrichable,
+    seed_tam,
+    stream_pipeline,
+)
 
 
 # ── Console Formatting ────────────────────────────────
@@ -51,10 +74,99 @@ def _stat(label: str, value, icon: str = CHECK):
     print(f"  {icon} {label}: {BOLD}{value}{RESET}")
 
 
-def run_pipeline(db_path: str | None = None, verbose: bool = True) -> PipelineResult:
+def _print_funnel(
+    pool: int,
+    discovered: int,
+    enriched_companies: int,
+    scored: int,
+    qualified: int,
+    nurture: int,
+    disqualified: int,
+    deals: int,
+    pipeline_value: float,
+    elapsed: float,
+    stages: list[StageMetrics],
+):
+    print(f"\n{'═' * 60}")
+    print(f"{BOLD}{GREEN}  ✅ PIPELINE COMPLETE{RESET}")
+    print(f"{'═' * 60}")
+    print(f"\n  {BOLD}PROGRESSIVE FUNNEL:{RESET}")
+    print(f"  {'─' * 50}")
+    print(f"  🔷 Total Pool (TAM):     {pool:>5}")
+    print(f"  🔷 ICP Discovered:       {discovered:>5}  ({discovered/max(pool, 1)*100:.0f}%)")
+    print(f"  🔷 Enriched:             {enriched_companies:>5}  ({enriched_companies/max(discovered, 1)*100:.0f}%)")
+    print(f"  🔷 Scored:               {scored:>5}  (contacts)")
+    print(f"  {GREEN}🟢 Qualified:            {qualified:>5}{RESET}")
+    print(f"  {YELLOW}🟡 Nurture:              {nurture:>5}{RESET}")
+    print(f"  {RED}🔴 Disqualified:         {disqualified:>5}{RESET}")
+    print(f"  🔷 CRM Deals:            {deals:>5}")
+    print(f"  💰 Pipeline Value:        ${pipeline_value:,.0f}")
+    print(f"  ⏱️  Duration:             {elapsed:.2f}s")
+    print(f"\n  {BOLD}STAGE METRICS:{RESET}")
+    print(f"  {'stage':<9} {'wall s':>7} {'cpu s':>7} {'rows in':>8} {'rows out':>8} "
+          f"{'rows/s':>9} {'db s':>6} {'peak MB':>8}")
+    print(f"  {'─' * 70}")
+    for m in stages:
+        peak = f"{m.peak_memory_mb:>8.1f}" if m.peak_memory_mb is not None else f"{'—':>8}"
+        print(f"  {m.stage:<9} {m.wall_seconds:>7.3f} {m.cpu_seconds:>7.3f} {m.rows_in:>8,} "
+              f"{m.rows_out:>8,} {m.rows_per_sec:>9,.0f} {m.db_write_seconds:>6.3f} {peak}")
+    print(f"{'═' * 60}")
+
+
+def run_pipeline(
+    db_path: str | None = None,
+    verbose: bool = True,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    seed: int = 42,
+    streaming: bool = False,
+    batch_size: int | None = None,
+    pipelined: bool = False,
+    queue_size: int | None = None,
+    tam: Iterable[TAMBatch] | None = None,
+    incremental: bool = False,
+    checkpoint: bool | None = None,
+    resume_run_id: str | None = None,
+    from_stage: str | None = None,
+    trace_memory: bool | None = None,
+    metrics_json: str | None = None,
+) -> PipelineResult:
     """
     Run the full B2B Lead Engine pipeline.
 
+    ``workers`` > 1 runs enrichment and scoring on a process pool in chunks
+    of ``chunk_size`` leads (defaults from settings). Every random draw
+    comes from a generator keyed by ``(seed, stage, entity id)``, so list,
+    streaming, pipelined, parallel and incremental runs with the same
+    ``seed`` produce the same leads, scores and outreach.
+
+    ``streaming=True`` pushes ``batch_size`` companies at a time through
+    every stage (see ``src.orchestration.streaming``) so peak memory stays
+    flat as the TAM grows. ``tam`` supplies the market as an iterable of
+    (companies, contacts) batches; it defaults to the seed dataset.
+    ``pipelined=True`` (implies streaming) runs each stage on its own
+    thread, connected by queues of at most ``queue_size`` batches, so
+    database writes overlap computation (see ``src.orchestration.pipelined``).
+
+    Every run is logged in ``pipeline_runs`` with per-stage high-water
+    marks. ``incremental=True`` processes only companies and contacts that
+    are new or changed since the last successful run (see
+    ``src.orchestration.incremental``); on an unchanged TAM it does no work.
+
+    ``checkpoint=True`` (list mode; default from settings) stores every
+    stage's output under ``settings.checkpoint_dir/<run_id>``.
+    ``resume_run_id`` continues such a run: finished stages are read back
+    and enrichment restarts after its last committed batch. ``from_stage``
+    discards the stored results of that stage onwards (and the rows they
+    wrote) and reruns only those stages, against the latest checkpoint if
+    no run id is given. A resumed run keeps the original seed, chunk size
+    and mode.
+
+    Per-stage wall/CPU time, rows in/out, throughput and DB write time are
+    returned in ``result.stage_metrics`` and stored in ``fct_pipeline_runs``;
+    ``trace_memory`` adds peak tracemalloc memory (slower; default from
+    settings) and ``metrics_json`` also writes the result to a JSON file.
+
     Funnel (tracked at company level — progressive decrease):
         1. Pool        — All generated companies (TAM)
         2. Discovered  — Companies matching ICP criteria
@@ -64,28 +176,179 @@ def run_pipeline(db_path: str | None = None, verbose: bool = True) -> PipelineRe
         6. CRM Deals   — Qualified + Nurture synced
     """
     start_time = time.time()
-    random.seed(42)
+    streaming = streaming or pipelined
+    resuming = bool(resume_run_id or from_stage)
+    checkpoint = settings.pipeline_checkpoints if checkpoint is None else checkpoint
+    if streaming and (checkpoint or resuming):
+        raise ValueError("Checkpoints and resume are only supported in list mode")
+    if from_stage is not None and from_stage not in PIPELINE_STAGES[1:]:
+        raise ValueError(
+            f"from_stage must be one of {', '.join(PIPELINE_STAGES[1:])}; "
+            f"start a new run to redo the TAM stage"
+        )
+
+    ckpt = RunCheckpoint(None)
+    if resuming:
+        ckpt = (
+            RunCheckpoint.open(settings.checkpoint_dir, resume_run_id) if resume_run_id
+            else RunCheckpoint.latest(settings.checkpoint_dir)
+        )
+        seed = ckpt.params["seed"]
+        chunk_size = ckpt.params["chunk_size"]
+        incremental = ckpt.params["incremental"]
+
+    executor = StageExecutor(
+        workers=settings.pipeline_workers if workers is None else workers,
+        chunk_size=settings.pipeline_chunk_size if chunk_size is None else chunk_size,
+    )
 
     if verbose:
         print(f"\n{ROCKET} {BOLD}B2B AUTONOMOUS LEAD ENGINE{RESET} {ROCKET}")
         print(f"{'─' * 60}")
         print(f"  Pipeline starting...")
+        if executor.workers > 1:
+            print(f"  Parallel mode: {executor.workers} workers, {executor.chunk_size} leads/chunk")
 
     # ── Initialize ────────────────────────────────────
     db = Database(db_path or settings.database_path)
     icp_config = load_icp_config(settings.icp_config_path)
+    mode = "incremental" if incremental else "full"
+    if resuming:
+        if from_stage:
+            _discard_from(db, ckpt, from_stage)
+        run_id = db.start_pipeline_run(mode=mode, run_id=ckpt.run_id)
+        if verbose:
+            done = ", ".join(ckpt.completed_stages()) or "none"
+            print(f"  Resuming run {run_id} (stored stages: {done})")
+    else:
+        run_id = db.start_pipeline_run(mode=mode)
+        if checkpoint:
+            ckpt = RunCheckpoint.create(
+                settings.checkpoint_dir, run_id, seed=seed, chunk_size=executor.chunk_size,
+                batch_size=settings.checkpoint_batch_size, incremental=incremental,
+            )
+    # Companies take the id their natural key was first stored under, so
+    # reruns and other sources upsert rather than duplicate
+    dedup = CompanyDedup(db)
+    changes = ChangeFilter(db, run_id, incremental=incremental)
+    tam = changes.filter(dedup.filter(seed_tam() if tam is None else tam))
+    run_counts = changes.counts
+    if ckpt.is_complete("tam"):
+        # Resumed past stage 0: the TAM is never read, keep the stored counts
+        run_counts = lambda: {}  # noqa: E731
+
+    if verbose and incremental:
+        last = db.get_last_successful_run()
+        since = last["finished_at"] if last else "never (full load)"
+        print(f"  Incremental run {run_id}: changes since {since}")
+
+    metrics = StageRecorder(
+        trace_memory=settings.pipeline_trace_memory if trace_memory is None else trace_memory
+    )
+    try:
+        if streaming:
+            result = _run_streaming(
+                db, icp_config, tam, executor,
+                batch_size or settings.pipeline_batch_size, seed, start_time, verbose, metrics,
+                queue_size=(queue_size or settings.pipeline_queue_size) if pipelined else None,
+            )
+        else:
+            result = _run_list(
+                db, icp_config, tam, executor, seed, start_time, verbose, ckpt, metrics,
+            )
+    except BaseException:
+        executor.close()
+        metrics.close()
+        db.insert_stage_metrics(run_id, metrics.results())
+        db.finish_pipeline_run(run_id, status="failed", **run_counts())
+        db.close()
+        raise
+
+    metrics.close()
+    result.run_id = run_id
+    result.stage_metrics = metrics.results()
+    db.insert_stage_metrics(run_id, result.stage_metrics)
+    db.finish_pipeline_run(run_id, status="succeeded", **run_counts())
+    dedup.save()
+    if metrics_json:
+        dump_metrics(result, metrics_json)
+    # Refresh planner statistics now that the tables hold a full run
+    db.analyze()
+    db.close()
+    return result
+
 
+def _relink(
+    companies: list[Company],
+    contacts: list[Contact],
+    enriched: list[EnrichedLead],
+    scored: list[ScoredLead],
+):
+    """Re-attach the denormalized links that checkpoints do not store."""
+    company_map = {c.company_id: c for c in companies}
+    contact_map = {c.contact_id: c for c in contacts}
+    enriched_map = {e.lead_id: e for e in enriched}
+    for lead in enriched:
+        if lead.company is None:
+            lead.company = company_map.get(lead.company_id)
+            lead.contact = contact_map.get(lead.contact_id)
+    for lead in scored:
+        if lead.enriched_lead is None:
+            lead.enriched_lead = enriched_map.get(lead.lead_id)
+
+
+def _discard_from(db: Database, ckpt: RunCheckpoint, stage: str):
+    """Drop the stored outputs of ``stage`` onwards and the rows they wrote."""
+    position = PIPELINE_STAGES.index
+    # Enrichment mints new lead ids and outreach new event ids on rerun;
+    # re-scoring keeps its lead ids and simply upserts.
+    if position(stage) <= position("enrich"):
+        db.delete_leads(lead.lead_id for lead in ckpt.read("enrich", "enriched"))
+    elif position(stage) <= position("outreach"):
+        db.delete_outreach_events(e.event_id for e in ckpt.read("outreach", "events"))
+    ckpt.reset_from(stage)
+
+
+def _run_list(
+    db: Database,
+    icp_config,
+    tam: Iterable[TAMBatch],
+    executor: StageExecutor,
+    seed: int,
+    start_time: float,
+    verbose: bool,
+    ckpt: RunCheckpoint,
+    metrics: StageRecorder,
+) -> PipelineResult:
+    """
+    List mode of run_pipeline: each stage runs over the whole TAM at once.
+
+    Stage outputs go to ``ckpt`` before the database; stages it already
+    holds are read back rather than recomputed. Each stage's work (not its
+    console output) is timed into ``metrics``.
+    """
     # ════════════════════════════════════════════════════
     # STAGE 0: Generate TAM (Total Addressable Market)
     # ════════════════════════════════════════════════════
-    all_companies = generate_seed_companies()
-    all_contacts = generate_seed_contacts(all_companies)
-
-    # Store ALL companies in the database (the full TAM pool)
-    for company in all_companies:
-        db.insert_company(company)
-    for contact in all_contacts:
-        db.insert_contact(contact)
+    with metrics.stage("tam") as m:
+        if ckpt.parts("tam"):
+            all_companies = ckpt.read("tam", "companies")
+            all_contacts = ckpt.read("tam", "contacts")
+        else:
+            all_companies, all_contacts = [], []
+            for companies, contacts in tam:
+                all_companies.extend(companies)
+                all_contacts.extend(contacts)
+            ckpt.write_part("tam", {"companies": all_companies, "contacts": all_contacts})
+
+        # Store ALL companies in the database (the full TAM pool)
+        for index in ckpt.unpersisted("tam"):
+            with metrics.db_write():
+                db.insert_companies(all_companies)
+                db.insert_contacts(all_contacts)
+            ckpt.mark_persisted("tam", index)
+        ckpt.complete("tam")
+        m.rows_out += len(all_companies)
 
     if verbose:
         _header(0, "MARKET POOL (TAM)")
@@ -98,12 +361,15 @@ def run_pipeline(db_path: str | None = None, verbose: bool = True) -> PipelineRe
     if verbose:
         _header(1, "AUTONOMOUS LEAD DISCOVERY")
 
-    discovery = DiscoveryEngine(icp_config)
-    # Pass the SAME objects to discovery so UUIDs are consistent across all tables
-    discovered_companies, discovered_contacts = discovery.discover(
-        companies=all_companies,
-        contacts=all_contacts,
-    )
+    with metrics.stage("discover", rows_in=len(all_companies)) as m:
+        discovery = DiscoveryEngine(icp_config)
+        # Pass the SAME objects to discovery so UUIDs are consistent across all tables
+        discovered_companies, discovered_contacts = discovery.discover(
+            companies=all_companies,
+            contacts=all_contacts,
+        )
+        ckpt.complete("discover")
+        m.rows_out += len(discovered_companies)
 
     if verbose:
         stats = discovery.get_discovery_stats(discovered_companies, discovered_contacts)
@@ -112,28 +378,66 @@ def run_pipeline(db_path: str | None = None, verbose: bool = True) -> PipelineRe
         for country, count in stats["by_country"].items():
             flag = "🌎" if country == "US" else ("🇧🇷" if country == "BR" else "🌍")
             _stat(f"  {country}", count, f"  {flag}")
-        pct = len(discovered_companies) / len(all_companies) * 100
+        pct = len(discovered_companies) / max(len(all_companies), 1) * 100
         _stat("ICP match rate", f"{pct:.0f}%")
 
+    with metrics.stage("resolve", rows_in=len(discovered_companies)) as m:
+        # Fold near-duplicate companies and contacts into canonical records
+        resolution = EntityResolver().resolve(discovered_companies, discovered_contacts)
+        with metrics.db_write():
+            resolution.persist(db)
+        discovered_companies, discovered_contacts = resolution.companies, resolution.contacts
+        ckpt.complete("resolve")
+        m.rows_out += len(discovered_companies)
+
+    if verbose:
+        _stat("Duplicate companies merged", len(resolution.company_merges))
+        _stat("Duplicate contacts merged", len(resolution.contact_merges))
+
     # ════════════════════════════════════════════════════
     # STAGE 2: Lead Enrichment (with partial success)
     # ════════════════════════════════════════════════════
     if verbose:
         _header(2, "LEAD ENRICHMENT & PROFILING")
 
-    # Simulate ~85% enrichment success rate
-    enrichment_rate = 0.85
-    enrichable_companies = [
-        c for c in discovered_companies if random.random() < enrichment_rate
-    ]
-    enrichable_ids = {c.company_id for c in enrichable_companies}
-    enrichable_contacts = [c for c in discovered_contacts if c.company_id in enrichable_ids]
-
-    enrichment = EnrichmentPipeline()
-    enriched_leads = enrichment.enrich(enrichable_companies, enrichable_contacts)
-
-    for lead in enriched_leads:
-        db.insert_enriched_lead(lead)
+    with metrics.stage("enrich", rows_in=len(discovered_contacts)) as m:
+        # Simulate ~85% enrichment success rate. Part 0 of the stage records
+        # the selection the later batches belong to.
+        if ckpt.parts("enrich"):
+            enrichable_companies = ckpt.read("enrich", "selected", part=0)
+        else:
+            enrichable_companies = [c for c in discovered_companies if is_enrichable(c, seed)]
+            ckpt.mark_persisted("enrich", ckpt.write_part("enrich", {"selected": enrichable_companies}))
+        enrichable_ids = {c.company_id for c in enrichable_companies}
+        enrichable_contacts = [c for c in discovered_contacts if c.company_id in enrichable_ids]
+
+        # Scoring runs in the same chunked pass; stage 3 consumes its output.
+        enrichment = EnrichmentPipeline(seed)
+        scoring = ScoringEngine(icp_config)
+        for index in ckpt.unpersisted("enrich"):
+            with metrics.db_write():
+                db.insert_enriched_leads(ckpt.read("enrich", "enriched", part=index))
+            ckpt.mark_persisted("enrich", index)
+        enriched_leads = ckpt.read("enrich", "enriched")
+        scored_leads = ckpt.read("enrich", "scored")
+
+        batch_size = ckpt.params.get("batch_size") or max(len(enrichable_contacts), 1)
+        resume_at = (len(ckpt.parts("enrich")) - 1) * batch_size
+        for start in range(resume_at, len(enrichable_contacts), batch_size):
+            enriched, scored = executor.enrich_and_score(
+                enrichable_companies, enrichable_contacts[start:start + batch_size],
+                icp_config, seed=seed,
+            )
+            index = ckpt.write_part("enrich", {"enriched": enriched, "scored": scored})
+            with metrics.db_write():
+                db.insert_enriched_leads(enriched)
+            ckpt.mark_persisted("enrich", index)
+            enriched_leads.extend(enriched)
+            scored_leads.extend(scored)
+        executor.close()
+        ckpt.complete("enrich")
+        _relink(all_companies, all_contacts, enriched_leads, scored_leads)
+        m.rows_out += len(scored_leads)
 
     if verbose:
         stats = enrichment.get_enrichment_stats(enriched_leads)
@@ -149,24 +453,32 @@ def run_pipeline(db_path: str | None = None, verbose: bool = True) -> PipelineRe
     if verbose:
         _header(3, "LEAD SCORING & QUALIFICATION")
 
-    scoring = ScoringEngine(icp_config)
-    scored_leads = scoring.score_leads(enriched_leads)
-
-    # Generate deal briefs for qualified + nurture leads
-    brief_gen = DealBriefGenerator()
-    for lead in scored_leads:
-        if lead.qualification_status.value in ["qualified", "nurture"]:
-            brief = brief_gen.generate_brief(lead)
-            lead.deal_brief = brief.to_text()
-
-    for lead in scored_leads:
-        db.insert_scored_lead(lead)
-
-    qualified = [l for l in scored_leads if l.qualification_status.value == "qualified"]
-    nurture = [l for l in scored_leads if l.qualification_status.value == "nurture"]
-    disqualified = [l for l in scored_leads if l.qualification_status.value == "disqualified"]
-
-    if verbose:
+    with metrics.stage("score", rows_in=len(scored_leads)) as m:
+        # Generate deal briefs for qualified + nurture leads
+        if ckpt.parts("score"):
+            scored_leads = ckpt.read("score", "scored")
+            _relink(all_companies, all_contacts, enriched_leads, scored_leads)
+        else:
+            brief_gen = DealBriefGenerator()
+            for lead in scored_leads:
+                if lead.qualification_status.value in ["qualified", "nurture"]:
+                    brief = brief_gen.generate_brief(lead)
+                    lead.deal_brief = brief.to_text()
+            ckpt.write_part("score", {"scored": scored_leads})
+
+        for index in ckpt.unpersisted("score"):
+            with metrics.db_write():
+                db.insert_scored_leads(scored_leads)
+            ckpt.mark_persisted("score", index)
+        ckpt.complete("score")
+
+        qualified = [l for l in scored_leads if l.qualification_status.value == "qualified"]
+        nurture = [l for l in scored_leads if l.qualification_status.value == "nurture"]
+        disqualified = [l for l in scored_leads if l.qualification_status.value == "disqualified"]
+        m.rows_out += len(qualified) + len(nurture)
+
+    # Stats are empty (no totals) when an incremental run finds no changes
+    if verbose and scored_leads:
         stats = scoring.get_scoring_stats(scored_leads)
         _stat("Leads scored", stats["total_scored"], CHART)
         _stat("Average score", f"{stats['avg_score']}/100", CHART)
@@ -187,13 +499,22 @@ def run_pipeline(db_path: str | None = None, verbose: bool = True) -> PipelineRe
 
     # Only send outreach to qualified + nurture
     outreach_eligible = qualified + nurture
-    outreach = OutreachEngine()
-    outreach_events = outreach.generate_sequences(outreach_eligible)
-
-    for event in outreach_events:
-        db.insert_outreach_event(event)
-
-    if verbose:
+    with metrics.stage("outreach", rows_in=len(outreach_eligible)) as m:
+        outreach = OutreachEngine(seed)
+        if ckpt.parts("outreach"):
+            outreach_events = ckpt.read("outreach", "events")
+        else:
+            outreach_events = outreach.generate_sequences(outreach_eligible)
+            ckpt.write_part("outreach", {"events": outreach_events})
+
+        for index in ckpt.unpersisted("outreach"):
+            with metrics.db_write():
+                db.insert_outreach_events(outreach_events)
+            ckpt.mark_persisted("outreach", index)
+        ckpt.complete("outreach")
+        m.rows_out += len(outreach_events)
+
+    if verbose and outreach_events:
         stats = outreach.get_outreach_stats(outreach_events)
         _stat("Outreach events", stats["total_events"], MAIL)
         _stat("Emails sent", stats["sent"], MAIL)
@@ -210,8 +531,11 @@ def run_pipeline(db_path: str | None = None, verbose: bool = True) -> PipelineRe
     if verbose:
         _header(5, "CRM SYNC & HANDOFF")
 
-    crm = CRMSync()
-    deals = crm.sync_leads(outreach_eligible, outreach_events)
+    with metrics.stage("crm", rows_in=len(outreach_eligible)) as m:
+        crm = CRMSync()
+        deals = crm.sync_leads(outreach_eligible, outreach_events)
+        ckpt.complete("crm")
+        m.rows_out += len(deals)
 
     if verbose:
         crm_stats = crm.get_sync_stats()
@@ -240,22 +564,19 @@ def run_pipeline(db_path: str | None = None, verbose: bool = True) -> PipelineRe
     )
 
     if verbose:
-        print(f"\n{'═' * 60}")
-        print(f"{BOLD}{GREEN}  ✅ PIPELINE COMPLETE{RESET}")
-        print(f"{'═' * 60}")
-        print(f"\n  {BOLD}PROGRESSIVE FUNNEL:{RESET}")
-        print(f"  {'─' * 50}")
-        print(f"  🔷 Total Pool (TAM):     {len(all_companies):>5}")
-        print(f"  🔷 ICP Discovered:       {len(discovered_companies):>5}  ({len(discovered_companies)/len(all_companies)*100:.0f}%)")
-        print(f"  🔷 Enriched:             {len(enrichable_companies):>5}  ({len(enrichable_companies)/len(discovered_companies)*100:.0f}%)")
-        print(f"  🔷 Scored:               {len(scored_leads):>5}  (contacts)")
-        print(f"  {GREEN}🟢 Qualified:            {len(qualified):>5}{RESET}")
-        print(f"  {YELLOW}🟡 Nurture:              {len(nurture):>5}{RESET}")
-        print(f"  {RED}🔴 Disqualified:         {len(disqualified):>5}{RESET}")
-        print(f"  🔷 CRM Deals:            {len(deals):>5}")
-        print(f"  💰 Pipeline Value:        ${crm_stats.get('total_pipeline_value', 0):,.0f}")
-        print(f"  ⏱️  Duration:             {elapsed:.2f}s")
-        print(f"{'═' * 60}")
+        _print_funnel(
+            pool=len(all_companies),
+            discovered=len(discovered_companies),
+            enriched_companies=len(enrichable_companies),
+            scored=len(scored_leads),
+            qualified=len(qualified),
+            nurture=len(nurture),
+            disqualified=len(disqualified),
+            deals=len(deals),
+            pipeline_value=crm_stats.get("total_pipeline_value", 0),
+            elapsed=elapsed,
+            stages=metrics.results(),
+        )
 
         # Show a sample deal brief
         qualified_with_briefs = [l for l in scored_leads if l.deal_brief]
@@ -266,7 +587,123 @@ def run_pipeline(db_path: str | None = None, verbose: bool = True) -> PipelineRe
     return result
 
 
+def _run_streaming(
+    db: Database,
+    icp_config,
+    tam: Iterable[TAMBatch],
+    executor: StageExecutor,
+    batch_size: int,
+    seed: int,
+    start_time: float,
+    verbose: bool,
+    metrics: StageRecorder,
+    queue_size: int | None = None,
+) -> PipelineResult:
+    """
+    Streaming mode of run_pipeline: batches flow through every stage in
+    turn, or through concurrent stage threads when ``queue_size`` is set.
+    """
+    if queue_size is None:
+        batches = stream_pipeline(db, icp_config, tam, executor, batch_size, seed, metrics)
+        mode = "STREAMING"
+    else:
+        batches = pipelined_pipeline(
+            db, icp_config, tam, executor, batch_size, seed, metrics, queue_size,
+        )
+        mode = "PIPELINED"
+    if verbose:
+        _header(0, f"{mode} PIPELINE ({batch_size} companies/batch)")
+
+    counters = FunnelCounters()
+    for batch in batches:
+        counters.add(batch)
+        if verbose:
+            _stat(
+                f"Batch {batch.index + 1}",
+                f"{len(batch.companies)} companies → {len(batch.scored)} scored, "
+                f"{batch.deals} deals",
+                CHART,
+            )
+        # Drop the batch before the next one is produced
+        del batch
+
+    executor.close()
+
+    elapsed = time.time() - start_time
+    if verbose:
+        _print_funnel(
+            pool=counters.companies_pooled,
+            discovered=counters.companies_discovered,
+            enriched_companies=counters.companies_enriched,
+            scored=counters.leads_scored,
+            qualified=counters.leads_qualified,
+            nurture=counters.leads_nurture,
+            disqualified=counters.leads_disqualified,
+            deals=counters.deals_synced_to_crm,
+            pipeline_value=counters.pipeline_value,
+            elapsed=elapsed,
+            stages=metrics.results(),
+        )
+    return counters.to_result(elapsed)
+
+
 # ── CLI Entry Point ───────────────────────────────────
 
+
+def main(argv: list[str] | None = None) -> PipelineResult:
+    parser = argparse.ArgumentParser(description="Run the B2B Lead Engine pipeline.")
+    parser.add_argument("--db", dest="db_path", help="SQLite database path")
+    parser.add_argument("--workers", type=int, help="Worker processes for enrichment and scoring")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only process companies and contacts changed since the last run")
+    parser.add_argument("--streaming", action="store_true", help="Process the TAM in batches")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="Stream batches through concurrent stage threads")
+    parser.add_argument("--synthetic", type=int, metavar="N",
+                        help="Run against a generated TAM of N companies instead of the seed data")
+    parser.add_argument("--import", dest="import_path", metavar="PATH",
+                        help="Run against a provider export (CSV, JSONL or Parquet), streamed in chunks")
+    parser.add_argument("--provider", help="Provider mapping in providers.yaml for --import")
+    parser.add_argument("--checkpoint", action="store_true", default=None,
+                        help="Store stage outputs so the run can be resumed")
+    parser.add_argument("--resume", dest="resume_run_id", metavar="RUN_ID",
+                        help="Resume a checkpointed run")
+    parser.add_argument("--from-stage", choices=PIPELINE_STAGES[1:],
+                        help="Rerun this stage and everything after it against stored "
+                             "upstream results (latest checkpoint unless --resume is given)")
+    parser.add_argument("--trace-memory", action="store_true", default=None,
+                        help="Record peak tracemalloc memory per stage (slower)")
+    parser.add_argument("--metrics-json", metavar="PATH",
+                        help="Also write the result and stage metrics to this JSON file")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+    if args.import_path and not args.provider:
+        parser.error("--import requires --provider")
+    if args.import_path and (args.checkpoint or args.resume_run_id or args.from_stage):
+        parser.error("--import streams the file and cannot be checkpointed or resumed")
+
+    tam = None
+    if args.synthetic is not None:
+        tam = generate_synthetic_tam(args.synthetic).batches()
+    elif args.import_path:
+        tam = ProviderImporter(args.provider).batches(args.import_path)
+
+    return run_pipeline(
+        db_path=args.db_path,
+        verbose=not args.quiet,
+        workers=args.workers,
+        # List mode would collect the whole export; imports always stream
+        streaming=args.streaming or bool(args.import_path),
+        pipelined=args.pipelined,
+        tam=tam,
+        incremental=args.incremental,
+        checkpoint=args.checkpoint,
+        resume_run_id=args.resume_run_id,
+        from_stage=args.from_stage,
+        trace_memory=args.trace_memory,
+        metrics_json=args.metrics_json,
+    )
+
+
 if __name__ == "__main__":
-    run_pipeline()
+    main()
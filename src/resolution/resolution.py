@@ -0,0 +1,378 @@
+"""
+B2B Lead Engine — Stage 1b: Entity Resolution
+
+Folds near-duplicate companies ("NovaTech" / "Nova Tech Inc") and contacts
+("Ana@Acme.io" / "ana@acme.io") into canonical records between discovery
+and enrichment, without comparing every pair of records.
+
+Companies are blocked by country and by the numbers in their name (names
+that differ in a number are different companies). Within a block,
+candidate pairs come from MinHash LSH over character 3-grams of the
+normalized name: records that agree on every row of a band share a bucket,
+and members of a bucket are paired within a sliding window of its sort
+order, which caps the pairs a very common name can produce. Records with
+the same domain label are paired as well. Each candidate is scored by its
+estimated name similarity, raised when the domains agree and lowered when
+they differ; different CNPJs never match. Matches are clustered (connected
+components) and each cluster is merged into its most complete record.
+
+Contacts are blocked by their resolved company and merged when they share
+an email address (ignoring case) or, without one, a normalized full name.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+import numpy as np
+import polars as pl
+
+from src.config.settings import settings
+from src.database.database import Database
+from src.models.models import URL_PREFIX_PATTERN, Company, Contact
+
+
+# Trailing name tokens that say nothing about which company it is
+LEGAL_SUFFIXES = frozenset({
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co",
+    "company", "plc", "gmbh", "ag", "sa", "ltda", "eireli", "me", "srl", "bv", "oy", "ab",
+})
+
+# Second-level labels under a country TLD (acme.com.br → acme)
+_SECOND_LEVEL = frozenset({"com", "co", "net", "org", "gov", "edu", "ac"})
+
+
+# Company fields a merge fills in from the duplicates when the canonical
+# record lacks them; also what "most complete" counts
+_COMPANY_FILL = (
+    "industry", "country", "state", "employee_count", "revenue_usd", "website",
+    "funding_stage", "founded_year", "cnpj", "cnae_code",
+)
+_CONTACT_FILL = ("title", "email", "phone", "linkedin_url", "seniority", "department")
+
+
+_LEGAL_TAIL = rf"(?:\s+(?:{'|'.join(sorted(LEGAL_SUFFIXES))}))+$"
+_LABEL = rf"([^.]+)\.(?:(?:{'|'.join(sorted(_SECOND_LEVEL))})\.[a-z]{{2}}|[^.]+)$"
+
+
+def _ascii_fold(text: str) -> str:
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower()
+
+
+def _folded(values: pl.Series) -> pl.Series:
+    """Lowercase ASCII; only the (rare) non-ASCII values go through unicodedata."""
+    values = values.fill_null("")
+    accented = values.str.contains(r"[^\x00-\x7f]")
+    if accented.any():
+        values = values.scatter(
+            accented.arg_true(), [_ascii_fold(v) for v in values.filter(accented)],
+        )
+    return values.str.to_lowercase()
+
+
+def normalize_names(names: pl.Series) -> pl.DataFrame:
+    """
+    Company names reduced for comparison (``compact``) plus the numbers in
+    them (``digits``).
+
+    Accents, case, punctuation, spacing and trailing legal suffixes are
+    dropped: "Nova Tech Inc." and "NovaTech" both give ("novatech", "").
+    """
+    words = (
+        _folded(names).str.replace_all(r"[./]", "").str.replace_all(r"[^a-z0-9]+", " ")
+        .str.strip_chars().str.replace(_LEGAL_TAIL, "")
+    )
+    compact = words.str.replace_all(" ", "", literal=True)
+    return pl.DataFrame({
+        "compact": compact,
+        "digits": compact.str.extract_all(r"\d+").list.join("-"),
+    })
+
+
+def normalize_name(name: str) -> tuple[str, str]:
+    """``normalize_names`` for one name."""
+    return normalize_names(pl.Series([name])).row(0)
+
+
+def domain_labels(websites: pl.Series) -> pl.Series:
+    """Registrable labels of websites: ``https://www.acme.com.br`` → ``acme``."""
+    host = (
+        websites.fill_null("").str.strip_chars().str.to_lowercase()
+        .str.replace(URL_PREFIX_PATTERN, "").str.extract(r"^([^/:?#]*)").str.strip_chars_end(".")
+    )
+    return host.str.extract(_LABEL).fill_null(host).fill_null("")
+
+
+def domain_label(website: str) -> str:
+    """``domain_labels`` for one website."""
+    return domain_labels(pl.Series([website]))[0]
+
+
+def contact_key(contact: Contact) -> str:
+    """What makes two contacts at one company the same person."""
+    email = contact.email.strip().lower()
+    if email:
+        return f"email:{email}"
+    return "name:" + " ".join(_ascii_fold(contact.full_name).split())
+
+
+def _codes(values: pl.Series) -> np.ndarray:
+    """Stable 64-bit codes of strings; empty strings and nulls are 0."""
+    values = values.fill_null("")
+    return (values.hash(seed=7) * (values != "")).to_numpy()
+
+
+def _completeness(record, fields) -> int:
+    return sum(1 for f in fields if getattr(record, f))
+
+
+# ── Resolution Result ─────────────────────────────────
+
+
+class Resolution:
+    """
+    One batch after resolution.
+
+    ``companies`` and ``contacts`` hold one record per entity. The merge
+    maps send each folded-away id to the id it was merged into, and
+    ``merged_companies`` / ``merged_contacts`` are the canonical records
+    whose fields a merge changed or whose duplicates were dropped.
+    """
+
+    def __init__(self):
+        self.companies: list[Company] = []
+        self.contacts: list[Contact] = []
+        self.company_merges: dict[str, str] = {}
+        self.contact_merges: dict[str, str] = {}
+        self.merged_companies: list[Company] = []
+        self.merged_contacts: list[Contact] = []
+
+    def persist(self, db: Database):
+        """Store the canonical records and fold the merged-away rows into them."""
+        if not (self.merged_companies or self.merged_contacts):
+            return
+        db.insert_companies(self.merged_companies)
+        db.insert_contacts(self.merged_contacts)
+        db.merge_entities(self.company_merges, self.contact_merges)
+
+
+# ── Resolver ──────────────────────────────────────────
+
+
+class EntityResolver:
+    """
+    Blocking + MinHash LSH matcher for companies and contacts.
+
+    ``num_perm`` MinHash values are split into ``bands`` bands; a pair whose
+    names have Jaccard similarity s becomes a candidate with probability
+    1 - (1 - s^r)^bands, r = num_perm / bands. Settings supply the defaults.
+    """
+
+    def __init__(
+        self,
+        threshold: float | None = None,
+        num_perm: int | None = None,
+        bands: int | None = None,
+        window: int | None = None,
+    ):
+        self.threshold = settings.resolution_threshold if threshold is None else threshold
+        self.num_perm = num_perm or settings.resolution_num_perm
+        self.bands = bands or settings.resolution_bands
+        self.window = window or settings.resolution_window
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        if self.window < 2:
+            raise ValueError("window must be >= 2")
+        # Multiply-shift hashes: odd multipliers, top 32 bits of the product
+        rng = np.random.default_rng(20240229)
+        self._a = rng.integers(0, 1 << 63, self.num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 1 << 63, self.num_perm, dtype=np.uint64)
+        self._band_mix = rng.integers(1, 1 << 62, self.num_perm // self.bands, dtype=np.uint64)
+        self.domain_bonus = 0.2
+        self.domain_penalty = 0.3
+
+    # ── Signatures ────────────────────────────────────
+
+    def signatures(self, names: list[str], chunk_size: int = 100_000) -> np.ndarray:
+        """MinHash signatures (n × num_perm) of normalized names' 3-grams."""
+        out = np.empty((len(names), self.num_perm), dtype=np.uint32)
+        for start in range(0, len(names), chunk_size):
+            chunk = names[start:start + chunk_size]
+            out[start:start + len(chunk)] = self._signature_chunk(chunk)
+        return out
+
+    def _signature_chunk(self, names: list[str]) -> np.ndarray:
+        encoded = [n.encode().ljust(3, b"_") for n in names]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        counts = lengths - 2
+        byte_starts = np.cumsum(lengths) - lengths
+        gram_starts = np.cumsum(counts) - counts
+        buf = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+        pos = np.arange(counts.sum()) + np.repeat(byte_starts - gram_starts, counts)
+        grams = (buf[pos] << np.uint64(16)) | (buf[pos + 1] << np.uint64(8)) | buf[pos + 2]
+
+        sig = np.empty((len(names), self.num_perm), dtype=np.uint32)
+        for p in range(self.num_perm):
+            hashed = (self._a[p] * grams + self._b[p]) >> np.uint64(32)
+            sig[:, p] = np.minimum.reduceat(hashed, gram_starts)
+        return sig
+
+    # ── Candidates & Scoring ──────────────────────────
+
+    def _window_pairs(self, keys: np.ndarray, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Pairs of ids that share a key, within ``window`` of each other in key order."""
+        order = np.argsort(keys)
+        keys, ids = keys[order], ids[order]
+        left, right = [], []
+        for k in range(1, self.window):
+            same = keys[k:] == keys[:-k]
+            if not same.any():
+                break
+            left.append(ids[:-k][same])
+            right.append(ids[k:][same])
+        if not left:
+            return np.zeros(0, np.int64), np.zeros(0, np.int64)
+        return np.concatenate(left), np.concatenate(right)
+
+    def match(
+        self,
+        names: list[str],
+        websites: list[str],
+        countries: list[str],
+        cnpjs: list[str | None],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Scored candidate pairs of records that refer to the same company.
+
+        Returns (i, j, score) for every candidate pair, i < j, with
+        ``score >= threshold`` meaning a match.
+        """
+        n = len(names)
+        normalized = normalize_names(pl.Series(names, dtype=pl.Utf8))
+        country = pl.Series(countries, dtype=pl.Utf8).fill_null("").str.to_uppercase()
+        cnpj_digits = pl.Series(cnpjs, dtype=pl.Utf8).str.replace_all(r"\D", "")
+        labels = _codes(domain_labels(pl.Series(websites, dtype=pl.Utf8)))
+        cnpj = _codes(pl.select(pl.when(cnpj_digits.str.len_chars() == 14).then(cnpj_digits)).to_series())
+        digits = _codes(normalized["digits"])
+        block = _codes(country + "|" + normalized["digits"])
+        sig = self.signatures(normalized["compact"].to_list())
+
+        # One key per (record, band), plus one per record with a domain label
+        rows = self.num_perm // self.bands
+        band_keys = (sig.reshape(n, self.bands, rows).astype(np.uint64) * self._band_mix).sum(axis=2)
+        band_keys = band_keys * np.uint64(0x9E3779B97F4A7C15) + block[:, None]
+        band_keys += np.arange(self.bands, dtype=np.uint64) * np.uint64(0xC2B2AE3D27D4EB4F)
+        has_label = labels != 0
+        domain_keys = _codes(country + "|")[has_label] + labels[has_label]
+        keys = np.concatenate([band_keys.ravel(), domain_keys])
+        ids = np.concatenate([np.repeat(np.arange(n), self.bands), np.flatnonzero(has_label)])
+
+        left, right = self._window_pairs(keys, ids)
+        i, j = np.minimum(left, right), np.maximum(left, right)
+        pair_codes = np.unique(i[i != j] * n + j[i != j])
+        i, j = pair_codes // n, pair_codes % n
+
+        score = (sig[i] == sig[j]).mean(axis=1)
+        both_labels = (labels[i] != 0) & (labels[j] != 0)
+        score += np.where(both_labels & (labels[i] == labels[j]), self.domain_bonus, 0.0)
+        score -= np.where(both_labels & (labels[i] != labels[j]), self.domain_penalty, 0.0)
+        conflict = (digits[i] != digits[j]) | ((cnpj[i] != 0) & (cnpj[j] != 0) & (cnpj[i] != cnpj[j]))
+        score[conflict] = 0.0
+        return i, j, score
+
+    def cluster(
+        self,
+        names: list[str],
+        websites: list[str],
+        countries: list[str],
+        cnpjs: list[str | None],
+    ) -> np.ndarray:
+        """Per record, the index of the first record of its cluster."""
+        i, j, score = self.match(names, websites, countries, cnpjs)
+        matched = score >= self.threshold
+        return connected_components(len(names), i[matched], j[matched])
+
+    # ── Merging ───────────────────────────────────────
+
+    def resolve(self, companies: list[Company], contacts: list[Contact]) -> Resolution:
+        """Merge duplicate companies, then duplicate contacts per company."""
+        result = Resolution()
+        roots = self.cluster(
+            [c.name for c in companies], [c.website for c in companies],
+            [c.country for c in companies], [c.cnpj for c in companies],
+        ) if len(companies) > 1 else np.arange(len(companies))
+
+        clusters: dict[int, list[Company]] = {}
+        for company, root in zip(companies, roots.tolist()):
+            clusters.setdefault(root, []).append(company)
+        for members in clusters.values():
+            canonical = _merge_companies(members) if len(members) > 1 else members[0]
+            result.companies.append(canonical)
+            if len(members) > 1:
+                result.merged_companies.append(canonical)
+                for member in members:
+                    if member.company_id != canonical.company_id:
+                        result.company_merges[member.company_id] = canonical.company_id
+
+        absorbing = set(result.company_merges.values())
+        by_key: dict[tuple[str, str], list[Contact]] = {}
+        for contact in contacts:
+            company_id = result.company_merges.get(contact.company_id, contact.company_id)
+            if company_id != contact.company_id:
+                contact = contact.model_copy(update={"company_id": company_id})
+            by_key.setdefault((company_id, contact_key(contact)), []).append(contact)
+        for members in by_key.values():
+            canonical = _merge_contacts(members) if len(members) > 1 else members[0]
+            result.contacts.append(canonical)
+            if len(members) > 1 or canonical.company_id in absorbing:
+                result.merged_contacts.append(canonical)
+            for member in members:
+                if member.contact_id != canonical.contact_id:
+                    result.contact_merges[member.contact_id] = canonical.contact_id
+        return result
+
+
+def connected_components(n: int, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """Label each of ``n`` nodes with the smallest node of its component."""
+    labels = np.arange(n)
+    while len(i):
+        li, lj = labels[i], labels[j]
+        low = np.minimum(li, lj)
+        if (li == lj).all():
+            break
+        np.minimum.at(labels, li, low)
+        np.minimum.at(labels, lj, low)
+        while not np.array_equal(compressed := labels[labels], labels):
+            labels = compressed
+    return labels
+
+
+def _merge_companies(members: list[Company]) -> Company:
+    """The most complete member, with gaps filled from the others."""
+    ranked = sorted(members, key=lambda c: -_completeness(c, _COMPANY_FILL))
+    primary, rest = ranked[0], ranked[1:]
+    update = {}
+    for field in _COMPANY_FILL:
+        if not getattr(primary, field):
+            value = next((getattr(r, field) for r in rest if getattr(r, field)), None)
+            if value:
+                update[field] = value
+    stack = list(dict.fromkeys(t for c in ranked for t in c.tech_stack))
+    if stack != primary.tech_stack:
+        update["tech_stack"] = stack
+    return primary.model_copy(update=update) if update else primary
+
+
+def _merge_contacts(members: list[Contact]) -> Contact:
+    ranked = sorted(members, key=lambda c: -_completeness(c, _CONTACT_FILL))
+    primary, rest = ranked[0], ranked[1:]
+    update = {}
+    for field in _CONTACT_FILL:
+        if not getattr(primary, field):
+            value = next((getattr(r, field) for r in rest if getattr(r, field)), None)
+            if value:
+                update[field] = value
+    if not primary.verified and any(c.verified for c in rest):
+        update["verified"] = True
+    return primary.model_copy(update=update) if update else primary
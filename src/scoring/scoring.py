@@ -13,6 +13,7 @@ from src.models.models import (
     ScoredLead,
     ScoreBreakdown,
     QualificationStatus,
+    build,
 )
 
 
@@ -71,7 +72,8 @@ class ScoringEngine:
         status = self._qualify(total_score)
         deal_stage = self._map_deal_stage(status)
 
-        return ScoredLead(
+        return build(
+            ScoredLead,
             lead_id=lead.lead_id,
             score=round(total_score, 1),
             score_breakdown=breakdown,
@@ -185,7 +187,8 @@ class ScoringEngine:
         if bonus_e >= 10:
             reasons.append(f"High data enrichment confidence (+{bonus_e} Engagement bonus)")
 
-        return ScoreBreakdown(
+        return build(
+            ScoreBreakdown,
             icp_fit=round(icp_score, 1),
             behavioral=round(behavioral_score, 1),
             tech_gap=round(tech_score, 1),
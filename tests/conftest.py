@@ -0,0 +1,11 @@
+"""Shared pytest options."""
+
+from benchmarks.bench_pipeline_stages import DEFAULT_BASELINE, DEFAULT_MAX_REGRESSION
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "stage benchmarks (run with -m benchmark)")
+    group.addoption("--benchmark-baseline", default=str(DEFAULT_BASELINE),
+                    help="Baseline JSON to compare stage timings against")
+    group.addoption("--benchmark-max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                    help="Fail when a stage is this many percent slower (or bigger) than baseline")
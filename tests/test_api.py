@@ -0,0 +1,53 @@
+"""Tests for the FastAPI endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.main as api
+from src.database.database import Database
+from src.pipeline import run_pipeline
+
+
+@pytest.fixture(scope="module")
+def client(tmp_path_factory):
+    db_path = str(tmp_path_factory.mktemp("api") / "api.db")
+    run_pipeline(db_path=db_path, verbose=False)
+    api._db = Database(db_path)
+    yield TestClient(api.app)
+    api._db.close()
+    api._db = None
+
+
+class TestPagination:
+    """Tests for cursor pagination on the list endpoints."""
+
+    def test_leads_paging(self, client):
+        first = client.get("/leads", params={"limit": 10})
+        assert len(first.json()) == 10
+        cursor = first.headers[api.NEXT_CURSOR_HEADER]
+
+        second = client.get("/leads", params={"limit": 10, "cursor": cursor}).json()
+        first_ids = {l["lead_id"] for l in first.json()}
+        assert not first_ids & {l["lead_id"] for l in second}
+        assert first.json()[-1]["score"] >= second[0]["score"]
+
+    def test_companies_last_page(self, client):
+        page = client.get("/companies", params={"limit": 500})
+        assert isinstance(page.json(), list) and page.json()
+        assert api.NEXT_CURSOR_HEADER not in page.headers
+
+    def test_bad_cursor(self, client):
+        assert client.get("/companies", params={"cursor": "%%%"}).status_code == 400
+
+
+class TestLeadBrief:
+    """Tests for the deal brief endpoint."""
+
+    def test_brief_found(self, client):
+        lead = client.get("/leads", params={"status": "qualified", "limit": 1}).json()[0]
+        body = client.get(f"/leads/{lead['lead_id']}/brief").json()
+        assert body["lead_id"] == lead["lead_id"]
+        assert body["deal_brief"]
+
+    def test_brief_missing(self, client):
+        assert client.get("/leads/l-missing/brief").status_code == 404
@@ -0,0 +1,69 @@
+"""Stage benchmark regression checks. Opt in with ``pytest -m benchmark``."""
+
+import pytest
+
+from benchmarks import bench_entity_resolution, bench_icp_matcher, bench_query_cache
+
+from benchmarks.bench_pipeline_stages import (
+    STAGES,
+    baseline_sizes,
+    compare,
+    load_baseline,
+    run,
+)
+
+
+def _row(stage="scoring", size=1000, seconds=1.0, peak_memory_mb=10.0):
+    return {"size": size, "stage": stage, "rows": 100, "seconds": seconds,
+            "rows_per_sec": 100 / seconds, "peak_memory_mb": peak_memory_mb}
+
+
+class TestCompare:
+    """Regression detection against a baseline."""
+
+    def test_within_threshold_passes(self):
+        baseline = {"results": [_row()]}
+        assert compare([_row(seconds=1.2, peak_memory_mb=12.0)], baseline, 25) == []
+
+    def test_slowdown_and_memory_growth_are_reported(self):
+        baseline = {"results": [_row()]}
+        (slow, big) = compare([_row(seconds=1.5, peak_memory_mb=20.0)], baseline, 25)
+        assert slow.startswith("scoring @ 1,000") and "+50%" in slow
+        assert "peak 20.0 MB" in big
+
+    def test_tiny_absolute_changes_are_noise(self):
+        baseline = {"results": [_row(seconds=0.01, peak_memory_mb=0.2)]}
+        assert compare([_row(seconds=0.04, peak_memory_mb=0.8)], baseline, 25) == []
+
+    def test_sizes_missing_from_baseline_are_skipped(self):
+        assert compare([_row(size=5000, seconds=99)], {"results": [_row()]}) == []
+
+
+@pytest.mark.benchmark
+def test_stages_have_not_regressed(request):
+    """Every stage at every baseline size stays within the allowed regression."""
+    baseline = load_baseline(request.config.getoption("--benchmark-baseline"))
+    results = run(baseline_sizes(baseline), seed=baseline["seed"])
+
+    assert {r["stage"] for r in results} == set(STAGES)
+    regressions = compare(results, baseline, request.config.getoption("--benchmark-max-regression"))
+    assert not regressions, "Stage regressions:\n" + "\n".join(regressions)
+
+
+@pytest.mark.benchmark
+def test_icp_matcher_filters_a_million_companies_in_under_a_second():
+    (row,) = [r for r in bench_icp_matcher.run_size(1_000_000) if r["method"] == "match_frame"]
+    assert row["seconds"] < 1.0
+
+
+@pytest.mark.benchmark
+def test_entity_resolution_matches_a_million_records():
+    (row,) = bench_entity_resolution.run([1_000_000])
+    assert row["records_per_sec"] > 50_000
+    assert row["precision"] >= 0.99 and row["recall"] >= 0.99
+
+
+@pytest.mark.benchmark
+def test_query_cache_hits_beat_misses():
+    for row in bench_query_cache.run(companies=2_000):
+        assert row["hit_ms"] < row["miss_ms"], row["read"]
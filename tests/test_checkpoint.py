@@ -0,0 +1,168 @@
+"""Tests for stage checkpoints, resume and --from-stage reruns."""
+
+import pytest
+
+from src.config.settings import settings
+from src.database.database import Database
+from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+from src.models.models import Company
+from src.orchestration.checkpoint import RunCheckpoint
+from src.orchestration.parallel import StageExecutor
+from src.outreach.outreach import OutreachEngine
+from src.pipeline import main, run_pipeline
+
+
+@pytest.fixture
+def checkpoint_dir(tmp_path, monkeypatch):
+    path = tmp_path / "runs"
+    monkeypatch.setattr(settings, "checkpoint_dir", str(path))
+    return path
+
+
+def _fail_on_call(monkeypatch, owner, name, call):
+    """Make ``owner.name`` raise on its ``call``-th invocation."""
+    original = getattr(owner, name)
+    calls = []
+
+    def flaky(self, *args, **kwargs):
+        calls.append(1)
+        if len(calls) == call:
+            raise RuntimeError("simulated crash")
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(owner, name, flaky)
+
+
+def _scores(db_path):
+    return sorted(lead.score for lead in Database(db_path).get_scored_leads(limit=1000))
+
+
+class TestRunCheckpoint:
+    """Arrow IPC stage outputs and the manifest."""
+
+    def test_models_round_trip(self, tmp_path):
+        companies = generate_seed_companies()
+        ckpt = RunCheckpoint.create(tmp_path, "run-1", seed=42)
+        ckpt.write_part("tam", {"companies": companies})
+
+        reopened = RunCheckpoint.open(tmp_path, "run-1")
+        assert reopened.params == {"seed": 42}
+        assert reopened.read("tam", "companies") == companies
+        assert (tmp_path / "run-1" / "tam" / "part-00000.companies.arrow").exists()
+
+    def test_parts_are_tracked_until_persisted(self, tmp_path):
+        ckpt = RunCheckpoint.create(tmp_path, "run-1")
+        contacts = generate_seed_contacts(generate_seed_companies())
+        first = ckpt.write_part("enrich", {"contacts": contacts[:10]})
+        ckpt.write_part("enrich", {"contacts": contacts[10:20]})
+        ckpt.mark_persisted("enrich", first)
+
+        reopened = RunCheckpoint.open(tmp_path, "run-1")
+        assert reopened.unpersisted("enrich") == [1]
+        assert reopened.read("enrich", "contacts") == contacts[:20]
+        assert reopened.read("enrich", "contacts", part=1) == contacts[10:20]
+        assert not reopened.is_complete("enrich")
+
+    def test_reset_from_drops_downstream_stages(self, tmp_path):
+        ckpt = RunCheckpoint.create(tmp_path, "run-1")
+        for stage in ("tam", "enrich", "score"):
+            ckpt.write_part(stage, {"companies": generate_seed_companies()[:2]})
+            ckpt.complete(stage)
+        ckpt.reset_from("enrich")
+
+        assert ckpt.completed_stages() == ["tam"]
+        assert not (tmp_path / "run-1" / "score").exists()
+
+    def test_missing_checkpoint_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            RunCheckpoint.open(tmp_path, "run-missing")
+        with pytest.raises(FileNotFoundError):
+            RunCheckpoint.latest(tmp_path)
+
+    def test_disabled_checkpoint_writes_nothing(self, tmp_path):
+        ckpt = RunCheckpoint(None)
+        ckpt.write_part("tam", {"companies": [Company(name="Acme")]})
+        assert ckpt.unpersisted("tam") == [0]
+        assert not any(tmp_path.iterdir())
+
+
+class TestResume:
+    """run_pipeline(resume_run_id=...) and from_stage."""
+
+    def test_checkpointed_run_matches_plain_run(self, tmp_path, checkpoint_dir, monkeypatch):
+        """Batched, checkpointed enrichment produces the same leads as one pass."""
+        monkeypatch.setattr(settings, "checkpoint_batch_size", 10)
+        plain = run_pipeline(db_path=str(tmp_path / "plain.db"), verbose=False, chunk_size=5)
+        stored = run_pipeline(db_path=str(tmp_path / "ckpt.db"), verbose=False, chunk_size=5,
+                              checkpoint=True)
+
+        skip = {"pipeline_duration_seconds", "completed_at", "run_id", "stage_metrics"}
+        assert plain.model_dump(exclude=skip) == stored.model_dump(exclude=skip)
+        ckpt = RunCheckpoint.latest(checkpoint_dir)
+        assert ckpt.completed_stages() == ["tam", "discover", "resolve", "enrich", "score", "outreach", "crm"]
+        assert len(ckpt.parts("enrich")) > 2
+
+    def test_resume_after_enrichment_crash(self, tmp_path, checkpoint_dir, monkeypatch):
+        """Resuming restarts enrichment after the last committed batch, without duplicates."""
+        monkeypatch.setattr(settings, "checkpoint_batch_size", 10)
+        reference = run_pipeline(db_path=str(tmp_path / "ref.db"), verbose=False, chunk_size=5)
+
+        db_path = str(tmp_path / "crash.db")
+        with monkeypatch.context() as patch:
+            _fail_on_call(patch, StageExecutor, "enrich_and_score", 3)
+            with pytest.raises(RuntimeError):
+                run_pipeline(db_path=db_path, verbose=False, chunk_size=5, checkpoint=True)
+
+        ckpt = RunCheckpoint.latest(checkpoint_dir)
+        assert ckpt.completed_stages() == ["tam", "discover", "resolve"]
+        assert len(ckpt.parts("enrich")) == 3  # selection + two committed batches
+        assert Database(db_path).get_pipeline_runs()[0]["status"] == "failed"
+
+        resumed = run_pipeline(db_path=db_path, verbose=False, resume_run_id=ckpt.run_id)
+        stats = Database(db_path).get_pipeline_stats()
+        assert resumed.leads_enriched == reference.leads_enriched == stats["fct_enriched_leads"]
+        assert stats["dim_companies"] == 150
+        assert _scores(db_path) == _scores(str(tmp_path / "ref.db"))
+        (run,) = Database(db_path).get_pipeline_runs()
+        assert run["status"] == "succeeded"
+        assert run["companies_seen"] == 150
+
+    def test_resume_after_outreach_crash_skips_upstream(self, tmp_path, checkpoint_dir, monkeypatch):
+        db_path = str(tmp_path / "crash.db")
+        with monkeypatch.context() as patch:
+            _fail_on_call(patch, OutreachEngine, "generate_sequences", 1)
+            with pytest.raises(RuntimeError):
+                run_pipeline(db_path=db_path, verbose=False, checkpoint=True)
+        run_id = RunCheckpoint.latest(checkpoint_dir).run_id
+
+        _fail_on_call(monkeypatch, StageExecutor, "enrich_and_score", 1)
+        result = run_pipeline(db_path=db_path, verbose=False, resume_run_id=run_id)
+
+        stats = Database(db_path).get_pipeline_stats()
+        assert result.outreach_events_created == stats["fct_outreach_events"] > 0
+        assert stats["fct_scored_leads"] == result.leads_scored
+
+    def test_from_stage_reruns_downstream_only(self, tmp_path, checkpoint_dir):
+        """--from-stage replaces the rerun stages' rows instead of adding to them."""
+        db_path = str(tmp_path / "rerun.db")
+        first = run_pipeline(db_path=db_path, verbose=False, checkpoint=True)
+        rerun = main(["--db", db_path, "--quiet", "--from-stage", "outreach"])
+
+        stats = Database(db_path).get_pipeline_stats()
+        assert rerun.leads_scored == first.leads_scored
+        assert stats["fct_outreach_events"] == rerun.outreach_events_created
+
+        main(["--db", db_path, "--quiet", "--from-stage", "enrich"])
+        stats = Database(db_path).get_pipeline_stats()
+        assert stats["fct_enriched_leads"] == stats["fct_scored_leads"]
+        assert stats["dim_companies"] == 150
+
+    def test_from_stage_rejects_tam(self, tmp_path, checkpoint_dir):
+        run_pipeline(db_path=str(tmp_path / "a.db"), verbose=False, checkpoint=True)
+        with pytest.raises(ValueError):
+            run_pipeline(db_path=str(tmp_path / "a.db"), verbose=False, from_stage="tam")
+
+    def test_streaming_cannot_checkpoint(self, tmp_path):
+        with pytest.raises(ValueError):
+            run_pipeline(db_path=str(tmp_path / "a.db"), verbose=False,
+                         streaming=True, checkpoint=True)
@@ -0,0 +1,224 @@
+"""Tests for the micro-batching pipeline daemon and its ingestion queues."""
+
+import json
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.database.database import Database
+from src.database.synthetic import generate_synthetic_tam
+from src.orchestration.daemon import (
+    PipelineDaemon,
+    SQLiteQueue,
+    SpoolQueue,
+    parse_payload,
+    tam_payloads,
+)
+from src.outreach.outreach import OutreachEngine
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / "daemon.db"))
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="module")
+def payloads():
+    return list(tam_payloads(generate_synthetic_tam(120, seed=9).batches()))
+
+
+class TestQueues:
+    """Claiming, acknowledging and parking queue items."""
+
+    def test_sqlite_queue_lifecycle(self, db, payloads):
+        queue = SQLiteQueue(db)
+        assert queue.put(payloads[:5]) == 5
+        first = queue.claim(3)
+        assert [i.payload for i in first] == payloads[:3]
+        assert db.get_queue_counts() == {"claimed": 3, "pending": 2}
+
+        queue.ack(first[:2])
+        queue.fail(first[2:], "boom")
+        assert queue.recover() == 0
+        queue.claim(1)
+        assert queue.recover() == 1
+        assert db.get_queue_counts() == {"failed": 1, "pending": 2}
+
+    def test_spool_queue_moves_finished_files(self, tmp_path, payloads):
+        queue = SpoolQueue(tmp_path / "spool")
+        queue.put(payloads[:3])
+        (tmp_path / "spool" / ".half-written.partial").write_text("{")
+        (tmp_path / "spool" / "broken.ndjson").write_text("not json\n")
+
+        items = queue.claim(10)
+        assert [i.payload for i in items] == payloads[:3]
+        assert [p.name for p in (tmp_path / "spool" / "done").iterdir()] == ["broken.ndjson"]
+        assert "invalid JSON" in (tmp_path / "spool" / "failed" / "broken.ndjson").read_text()
+
+        queue.ack(items[:2])
+        assert len(list((tmp_path / "spool").glob("*.ndjson"))) == 1
+        queue.fail(items[2:], "boom")
+        assert not list((tmp_path / "spool").glob("*.ndjson"))
+        assert len(list((tmp_path / "spool" / "done").iterdir())) == 2
+
+    def test_sqlite_queue_retries_until_attempts_run_out(self, db, payloads):
+        queue = SQLiteQueue(db)
+        queue.put(payloads[:2])
+        for attempt in range(1, 3):
+            items = queue.claim(2)
+            assert [i.attempts for i in items] == [attempt - 1] * 2
+            assert queue.retry(items, "boom", max_attempts=2) == (2 if attempt == 2 else 0)
+        assert db.get_queue_counts() == {"failed": 2}
+
+    def test_spool_queue_retries_until_attempts_run_out(self, tmp_path, payloads):
+        queue = SpoolQueue(tmp_path / "spool")
+        queue.put(payloads[:2])
+        items = queue.claim(10)
+        assert queue.retry(items, "boom", max_attempts=2) == 0
+        retried = queue.claim(10)
+        assert [i.attempts for i in retried] == [1, 1]
+        assert queue.retry(retried, "boom", max_attempts=2) == 2
+        assert not list((tmp_path / "spool").glob("*.ndjson"))
+        (failed,) = (tmp_path / "spool" / "failed").iterdir()
+        assert len(failed.read_text().splitlines()) == 2
+
+    def test_queue_without_attempts_column_is_migrated(self, tmp_path):
+        path = tmp_path / "legacy.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute("""CREATE TABLE ingest_queue (
+                item_id INTEGER PRIMARY KEY AUTOINCREMENT, payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending', enqueued_at TEXT NOT NULL,
+                claimed_at TEXT, error TEXT)""")
+            conn.execute("""INSERT INTO ingest_queue (payload, enqueued_at)
+                            VALUES ('{}', '2026-01-01T00:00:00+00:00')""")
+        db = Database(str(path))
+        assert [r["attempts"] for r in db.claim_queue_items(1)] == [0]
+        db.close()
+
+    def test_parse_payload_derives_missing_ids(self):
+        payload = {"company": {"name": "Acme"}, "contacts": [{"full_name": "Ana Lima"}]}
+        company, contacts = parse_payload(payload)
+        assert parse_payload(payload)[0].company_id == company.company_id
+        assert contacts[0].company_id == company.company_id
+        with pytest.raises(ValueError):
+            parse_payload({"contacts": []})
+
+
+class TestMicroBatching:
+    """Batches close on item count or on the time window."""
+
+    def test_batch_closes_at_max_items(self, db, payloads):
+        queue = SQLiteQueue(db)
+        queue.put(payloads[:25])
+        daemon = PipelineDaemon(db, queue, max_items=10, max_wait=60, verbose=False)
+        assert len(daemon.next_batch()) == 10
+
+    def test_batch_closes_after_window(self, db, payloads):
+        queue = SQLiteQueue(db)
+        queue.put(payloads[:3])
+        daemon = PipelineDaemon(db, queue, max_items=100, max_wait=0.2,
+                                poll_interval=0.05, verbose=False)
+        start = time.monotonic()
+        assert len(daemon.next_batch()) == 3
+        assert 0.2 <= time.monotonic() - start < 2
+
+    def test_stop_ends_an_idle_daemon(self, db):
+        daemon = PipelineDaemon(db, SQLiteQueue(db), poll_interval=0.05, verbose=False)
+        threading.Timer(0.2, daemon.stop).start()
+        assert daemon.run() == []
+
+
+class TestDaemonRuns:
+    """Micro-batches through every stage."""
+
+    def test_drains_queue_and_reports_latency(self, db, payloads):
+        queue = SQLiteQueue(db)
+        queue.put(payloads)
+        reports = PipelineDaemon(db, queue, max_items=50, max_wait=0,
+                                 verbose=False).run(until_idle=True)
+
+        assert [r.items for r in reports] == [50, 50, 20]
+        assert db.get_queue_counts() == {}
+        stats = db.get_pipeline_stats()
+        assert stats["dim_companies"] == 120
+        assert stats["fct_scored_leads"] == sum(r.leads_scored for r in reports) > 0
+        for r in reports:
+            assert 0 < r.latency_p50 <= r.latency_p95 <= r.latency_p99 <= r.latency_max
+        runs = db.get_pipeline_runs()
+        assert {r["mode"] for r in runs} == {"daemon"} and len(runs) == 3
+
+    def test_replayed_items_overwrite(self, db, payloads):
+        queue = SQLiteQueue(db)
+        for _ in range(2):
+            queue.put(payloads[:30])
+            PipelineDaemon(db, queue, max_wait=0, verbose=False).run(until_idle=True)
+        assert db.get_pipeline_stats()["dim_companies"] == 30
+
+    def test_invalid_items_are_parked(self, db, payloads):
+        queue = SQLiteQueue(db)
+        queue.put([payloads[0], {"company": {"employee_count": "many"}}])
+        (report,) = PipelineDaemon(db, queue, max_wait=0, verbose=False).run(until_idle=True)
+        assert (report.items, report.failed_items, report.companies) == (2, 1, 1)
+        assert db.get_queue_counts() == {"failed": 1}
+
+    def test_stage_failure_parks_the_batch(self, db, payloads, tmp_path, monkeypatch):
+        def broken(self, leads, steps=3):
+            raise RuntimeError("outreach down")
+
+        monkeypatch.setattr(OutreachEngine, "generate_sequences", broken)
+        queue = SpoolQueue(tmp_path / "spool")
+        queue.put(payloads)
+        (report,) = PipelineDaemon(db, queue, max_wait=0, max_attempts=1,
+                                   verbose=False).run(until_idle=True)
+
+        assert "outreach down" in report.error
+        assert report.failed_items == len(payloads)
+        assert db.get_pipeline_runs()[0]["status"] == "failed"
+        (failed,) = (tmp_path / "spool" / "failed").iterdir()
+        records = [json.loads(line) for line in failed.read_text().splitlines()]
+        assert [r["record"] for r in records] == payloads
+
+    def test_failed_batch_is_retried(self, db, payloads, monkeypatch):
+        calls = []
+        original = OutreachEngine.generate_sequences
+
+        def flaky(self, leads, steps=3):
+            calls.append(len(leads))
+            if len(calls) == 1:
+                raise RuntimeError("outreach down")
+            return original(self, leads, steps)
+
+        monkeypatch.setattr(OutreachEngine, "generate_sequences", flaky)
+        queue = SQLiteQueue(db)
+        queue.put(payloads[:5])
+        reports = PipelineDaemon(db, queue, max_wait=0, verbose=False).run(until_idle=True)
+
+        assert (reports[0].retried_items, reports[0].failed_items) == (5, 0)
+        # Each retried item runs in a batch of its own
+        assert [r.items for r in reports[1:]] == [1] * 5
+        assert not any(r.error for r in reports[1:])
+        assert db.get_queue_counts() == {}
+        assert db.get_pipeline_stats()["dim_companies"] == 5
+
+    def test_bad_item_is_parked_once_attempts_run_out(self, db, payloads, monkeypatch):
+        poison = payloads[2]["company"]["company_id"]
+        original = Database.insert_companies
+
+        def insert_companies(self, companies, *args, **kwargs):
+            if any(c.company_id == poison for c in companies):
+                raise RuntimeError("poison")
+            return original(self, companies, *args, **kwargs)
+
+        monkeypatch.setattr(Database, "insert_companies", insert_companies)
+        queue = SQLiteQueue(db)
+        queue.put(payloads[:5])
+        reports = PipelineDaemon(db, queue, max_wait=0, max_attempts=3,
+                                 verbose=False).run(until_idle=True)
+
+        assert sum(r.failed_items for r in reports) == 1
+        assert db.get_queue_counts() == {"failed": 1}
+        assert db.get_pipeline_stats()["dim_companies"] == 4
@@ -0,0 +1,610 @@
+"""Tests for the SQLite database manager."""
+
+import pytest
+
+from src.database.database import Database
+from src.database.lazy_row import LazyRow
+from src.database.query_cache import snapshot
+from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+from src.pipeline import run_pipeline
+
+
+@pytest.fixture
+def db(tmp_path):
+    return Database(str(tmp_path / "test.db"))
+
+
+@pytest.fixture
+def companies():
+    return generate_seed_companies()
+
+
+@pytest.fixture(scope="module")
+def pipeline_db(tmp_path_factory):
+    """A database populated by one full pipeline run."""
+    db_path = str(tmp_path_factory.mktemp("pipeline") / "pipeline.db")
+    run_pipeline(db_path=db_path, verbose=False)
+    return Database(db_path)
+
+
+class TestBulkInsert:
+    """Tests for the batched bulk writers."""
+
+    def test_insert_companies_returns_count(self, db, companies):
+        """Bulk insert should write every row and report the count."""
+        written = db.insert_companies(companies, batch_size=40)
+        assert written == len(companies)
+        assert db.get_pipeline_stats()["dim_companies"] == len(companies)
+
+    def test_insert_accepts_generator(self, db, companies):
+        """Bulk writers should consume generators lazily."""
+        contacts = generate_seed_contacts(companies)
+        db.insert_companies(c for c in companies)
+        written = db.insert_contacts((c for c in contacts), batch_size=7)
+        assert written == len(contacts)
+        assert db.get_pipeline_stats()["dim_contacts"] == len(contacts)
+
+    def test_bulk_matches_single_insert(self, db, companies):
+        """A row written in bulk should read back like one written singly."""
+        db.insert_companies(companies[:1])
+        stored = db.get_company(companies[0].company_id)
+        assert stored.model_dump() == companies[0].model_dump()
+
+    def test_insert_empty_iterable(self, db):
+        """Empty input should be a no-op."""
+        assert db.insert_companies([]) == 0
+
+    def test_bulk_insert_joins_outer_transaction(self, db, companies):
+        """Inside a wider transaction, batches must not commit it part-way."""
+        with pytest.raises(RuntimeError):
+            with db._connect():
+                db.insert_companies(companies, batch_size=40)
+                raise RuntimeError("caller fails after the insert")
+        assert db.get_pipeline_stats()["dim_companies"] == 0
+
+        with db._connect():
+            db.insert_companies(companies, batch_size=40)
+        assert db.get_pipeline_stats()["dim_companies"] == len(companies)
+
+    def test_invalid_batch_size(self, db, companies):
+        """Batch size must be positive."""
+        with pytest.raises(ValueError):
+            db.insert_companies(companies, batch_size=0)
+
+
+class TestConnectionPool:
+    """Tests for pooled connection reuse and lifecycle."""
+
+    def test_connection_is_reused(self, db):
+        """Sequential calls should check out the same pooled connection."""
+        with db._connect() as first:
+            pass
+        with db._connect() as second:
+            pass
+        assert first is second
+
+    def test_nested_connect_joins_outer(self, db):
+        """Nested calls on one thread should not check out a second connection."""
+        with db._connect() as outer:
+            with db._connect() as inner:
+                assert inner is outer
+
+    def test_pool_disabled(self, tmp_path, companies):
+        """pool_size=0 should still work with per-call connections."""
+        db = Database(str(tmp_path / "nopool.db"), pool_size=0)
+        db.insert_companies(companies)
+        assert db.get_pipeline_stats()["dim_companies"] == len(companies)
+
+    def test_concurrent_readers(self, tmp_path, companies):
+        """Threads sharing one Database should all get a connection."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        db = Database(str(tmp_path / "threads.db"), pool_size=2)
+        db.insert_companies(companies)
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            counts = list(pool.map(lambda _: len(db.get_companies(limit=500)), range(24)))
+        assert counts == [len(companies)] * 24
+
+    def test_close_and_context_manager(self, tmp_path):
+        """A closed Database should refuse further queries."""
+        import sqlite3
+
+        with Database(str(tmp_path / "ctx.db")) as db:
+            assert db.get_companies() == []
+        with pytest.raises(sqlite3.ProgrammingError):
+            db.get_companies()
+
+
+class TestLeadLookup:
+    """Tests for primary-key lead and brief lookups."""
+
+    def test_get_lead_by_id_matches_search(self, pipeline_db):
+        """Direct lookup should return the same joined record as search."""
+        expected = pipeline_db.search_leads(limit=1)[0]
+        lead = pipeline_db.get_lead_by_id(expected["lead_id"])
+        events = lead.pop("outreach_events")
+        assert lead == expected
+        assert all(e["event_id"] for e in events)
+
+    def test_get_lead_by_id_beyond_search_limit(self, pipeline_db):
+        """Leads ranked last by score should still be found."""
+        lowest = pipeline_db.search_leads(limit=10_000)[-1]
+        assert pipeline_db.get_lead_by_id(lowest["lead_id"]) is not None
+
+    def test_get_lead_by_id_missing(self, pipeline_db):
+        assert pipeline_db.get_lead_by_id("l-missing") is None
+
+    def test_get_brief_by_id(self, pipeline_db):
+        """Brief lookup should return the stored brief for a qualified lead."""
+        lead = pipeline_db.get_scored_leads(status="qualified", limit=1)[0]
+        brief = pipeline_db.get_brief_by_id(lead.lead_id)
+        assert brief["deal_brief"] == lead.deal_brief
+        assert brief["score"] == lead.score
+        assert pipeline_db.get_brief_by_id("l-missing") is None
+
+
+class TestFullTextSearch:
+    """Tests for the FTS5-backed text search."""
+
+    def test_index_covers_every_scored_lead(self, pipeline_db):
+        with pipeline_db._connect() as conn:
+            indexed = conn.execute("SELECT COUNT(*) FROM lead_search").fetchone()[0]
+        assert pipeline_db._fts_enabled
+        assert indexed == pipeline_db.get_pipeline_stats()["fct_scored_leads"]
+
+    def test_prefix_match(self, pipeline_db):
+        """A word prefix should match contact names starting with it."""
+        lead = pipeline_db.search_leads(limit=1)[0]
+        prefix = lead["contact_name"].split()[0][:4]
+        results = pipeline_db.search_leads(text_query=prefix, limit=500)
+        assert lead["lead_id"] in {r["lead_id"] for r in results}
+
+    def test_matches_buying_signals(self, pipeline_db):
+        """Buying signals are searchable, not just names and titles."""
+        results = pipeline_db.search_leads(text_query="SDRs", limit=500)
+        assert results
+        assert all(any("SDRs" in s for s in r["buying_signals"]) for r in results)
+
+    def test_relevance_ordering(self, pipeline_db):
+        """Relevance ordering returns the same matches as score ordering."""
+        by_score = pipeline_db.search_leads(text_query="vp sales", limit=500)
+        by_rank = pipeline_db.search_leads(text_query="vp sales", limit=500, order_by="relevance")
+        assert by_score
+        assert {r["lead_id"] for r in by_score} == {r["lead_id"] for r in by_rank}
+
+    def test_like_fallback(self, pipeline_db, monkeypatch):
+        """Without FTS5, whole-word queries should return the same leads."""
+        fts = pipeline_db.search_leads(text_query="Director", limit=500)
+        monkeypatch.setattr(pipeline_db, "_fts_enabled", False)
+        like = pipeline_db.search_leads(text_query="Director", limit=500)
+        assert fts
+        assert [r["lead_id"] for r in fts] == [r["lead_id"] for r in like]
+
+    @pytest.mark.parametrize("query", ["tech", "ova", "Director", "sales"])
+    def test_substring_matches_keep_like_results(self, pipeline_db, monkeypatch, query):
+        """Words match inside values, so nothing the LIKE search found is lost."""
+        fts = {r["lead_id"] for r in pipeline_db.search_leads(text_query=query, limit=10_000)}
+        monkeypatch.setattr(pipeline_db, "_fts_enabled", False)
+        like = {r["lead_id"] for r in pipeline_db.search_leads(text_query=query, limit=10_000)}
+        assert like <= fts
+
+    def test_punctuation_and_short_words(self, tmp_path):
+        """'c++' matches literally, two-letter words still filter, one letter is ignored."""
+        db_path = str(tmp_path / "fts.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        db = Database(db_path)
+        lead = db.search_leads(limit=1)[0]
+        (company,) = [c for c in db.get_companies(limit=1000) if c.company_id == lead["company_id"]]
+        db.insert_companies([company.model_copy(update={"name": "Zq C++ Labs"})])
+
+        assert {r["company_id"] for r in db.search_leads(text_query="c++", limit=500)} == \
+            {company.company_id}
+        assert {r["company_id"] for r in db.search_leads(text_query="zq", limit=500)} == \
+            {company.company_id}
+        everything = db.search_leads(limit=10_000)
+        assert len(db.search_leads(text_query="c", limit=10_000)) == len(everything)
+
+    def test_index_follows_replace(self, tmp_path):
+        """Re-running the pipeline (INSERT OR REPLACE) must not leave stale rows."""
+        db_path = str(tmp_path / "fts.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        run_pipeline(db_path=db_path, verbose=False)
+        db = Database(db_path)
+        with db._connect() as conn:
+            indexed = conn.execute("SELECT COUNT(*) FROM lead_search").fetchone()[0]
+        assert indexed == db.get_pipeline_stats()["fct_scored_leads"]
+
+    def test_index_survives_vacuum(self, tmp_path):
+        """Deleting leads and vacuuming must not point index rows at other leads."""
+        db_path = str(tmp_path / "fts.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        db = Database(db_path)
+        leads = db.search_leads(limit=10_000)
+        db.delete_leads(r["lead_id"] for r in leads[::2])
+        with db._connect() as conn:
+            conn.execute("VACUUM")
+
+        for lead in leads[1:40:2]:
+            name = lead["company_name"].split()[0]
+            results = db.search_leads(text_query=name, limit=500)
+            assert lead["lead_id"] in {r["lead_id"] for r in results}
+            assert all(name.lower() in r["company_name"].lower() for r in results)
+
+    def test_index_follows_company_and_contact_changes(self, tmp_path):
+        """Upserted or merged companies and contacts are re-indexed."""
+        db_path = str(tmp_path / "fts.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        db = Database(db_path)
+        lead = db.search_leads(limit=1)[0]
+        (company,) = [c for c in db.get_companies(limit=1000) if c.company_id == lead["company_id"]]
+        db.insert_companies([company.model_copy(update={"name": "Zyxwv Holdings"})])
+        renamed = db.search_leads(text_query="zyxwv")
+        assert lead["lead_id"] in {r["lead_id"] for r in renamed}
+        assert {r["company_id"] for r in renamed} == {company.company_id}
+
+        other = next(c for c in db.get_companies(limit=1000) if c.company_id != company.company_id)
+        db.insert_companies([other.model_copy(update={"name": "Qwerty Partners"})])
+        db.merge_entities({company.company_id: other.company_id}, {})
+        assert lead["lead_id"] in {r["lead_id"] for r in db.search_leads(text_query="qwerty")}
+        assert db.search_leads(text_query="zyxwv") == []
+
+    def test_legacy_index_is_rebuilt(self, tmp_path):
+        """An index keyed on the scored-lead rowid is replaced on open."""
+        db_path = str(tmp_path / "fts.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        with Database(db_path)._connect() as conn:
+            conn.execute("DROP TABLE lead_search_docs")
+            conn.execute("DELETE FROM lead_search")
+        db = Database(db_path)
+        with db._connect() as conn:
+            indexed = conn.execute("SELECT COUNT(*) FROM lead_search").fetchone()[0]
+        assert indexed == db.get_pipeline_stats()["fct_scored_leads"]
+
+    def test_word_tokenized_index_is_rebuilt(self, tmp_path):
+        """An index from before the trigram tokenizer is replaced on open."""
+        db_path = str(tmp_path / "fts.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        with Database(db_path)._connect() as conn:
+            conn.execute("DROP TABLE lead_search")
+            conn.execute("""CREATE VIRTUAL TABLE lead_search USING fts5(
+                company_name, contact_name, title, industry, buying_signals, tech_stack,
+                tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')""")
+        db = Database(db_path)
+        with db._connect() as conn:
+            indexed = conn.execute("SELECT COUNT(*) FROM lead_search").fetchone()[0]
+        assert indexed == db.get_pipeline_stats()["fct_scored_leads"]
+        lead = db.search_leads(limit=1)[0]
+        infix = lead["company_name"].split()[0][1:4]
+        assert lead["lead_id"] in {r["lead_id"] for r in db.search_leads(text_query=infix, limit=500)}
+
+
+class TestKeysetPagination:
+    """Tests for cursor-based paging of the list methods."""
+
+    def _walk(self, fetch_page, key):
+        seen, cursor = [], None
+        while True:
+            items, cursor = fetch_page(cursor)
+            seen.extend(key(i) for i in items)
+            if cursor is None:
+                return seen
+
+    def test_companies_pages_cover_table_once(self, pipeline_db):
+        all_ids = [c.company_id for c in pipeline_db.get_companies(limit=10_000)]
+        paged = self._walk(
+            lambda cur: pipeline_db.get_companies_page(limit=7, cursor=cur),
+            lambda c: c.company_id,
+        )
+        assert paged == all_ids
+
+    def test_scored_leads_pages_with_status(self, pipeline_db):
+        all_ids = [l.lead_id for l in pipeline_db.get_scored_leads(status="nurture", limit=10_000)]
+        paged = self._walk(
+            lambda cur: pipeline_db.get_scored_leads_page(status="nurture", limit=5, cursor=cur),
+            lambda l: l.lead_id,
+        )
+        assert paged == all_ids
+
+    def test_search_pages_with_filters(self, pipeline_db):
+        all_ids = [r["lead_id"] for r in pipeline_db.search_leads(markets=["US"], limit=10_000)]
+        paged = self._walk(
+            lambda cur: pipeline_db.search_leads_page(markets=["US"], limit=9, cursor=cur),
+            lambda r: r["lead_id"],
+        )
+        assert paged == all_ids
+
+    def test_invalid_cursor(self, pipeline_db):
+        with pytest.raises(ValueError):
+            pipeline_db.get_companies(cursor="not-a-cursor")
+
+    def test_page_query_uses_index(self, pipeline_db):
+        """A page should be an index range scan, not a scan plus sort."""
+        with pipeline_db._connect() as conn:
+            plan = " ".join(r["detail"] for r in conn.execute(
+                """EXPLAIN QUERY PLAN SELECT * FROM fct_scored_leads
+                   WHERE (score, lead_id) < (?, ?) ORDER BY score DESC, lead_id DESC LIMIT 10""",
+                (90.0, "l-x"),
+            ))
+        assert "idx_scored_score" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+class TestPipelineStats:
+    """Tests for the trigger-maintained pipeline_stats summary table."""
+
+    def _rebuilt(self, db):
+        incremental = db.get_pipeline_stats()
+        db.rebuild_stats()
+        return incremental, db.get_pipeline_stats()
+
+    def test_matches_rebuild_after_reruns(self, tmp_path):
+        """Counters kept by triggers should equal a full recompute, even across replaces."""
+        db_path = str(tmp_path / "stats.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        run_pipeline(db_path=db_path, verbose=False)
+        incremental, rebuilt = self._rebuilt(Database(db_path))
+        assert incremental == rebuilt
+        assert incremental["funnel_qualified"] > 0
+        assert incremental["funnel_icp_contacts"] <= incremental["funnel_pool"]
+
+    def test_matches_direct_aggregates(self, pipeline_db):
+        """Summary values should agree with aggregates over the base tables."""
+        stats = pipeline_db.get_pipeline_stats()
+        with pipeline_db._connect() as conn:
+            avg = conn.execute("SELECT ROUND(AVG(score), 1) FROM fct_scored_leads").fetchone()[0]
+            qualified_companies = conn.execute(
+                """SELECT COUNT(DISTINCT e.company_id) FROM fct_scored_leads s
+                   JOIN fct_enriched_leads e ON s.lead_id = e.lead_id
+                   WHERE s.qualification_status = 'qualified'"""
+            ).fetchone()[0]
+            us = conn.execute("SELECT COUNT(*) FROM dim_companies WHERE country = 'US'").fetchone()[0]
+        assert stats["avg_score"] == avg
+        assert stats["funnel_qualified_companies"] == qualified_companies
+        assert stats["market_breakdown"]["US"] == us
+        counts = list(stats["industry_breakdown"].values())
+        assert counts == sorted(counts, reverse=True)
+
+    def test_delete_and_update(self, tmp_path):
+        """Deletes and in-place updates should move the counters too."""
+        db_path = str(tmp_path / "stats.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        db = Database(db_path)
+        with db._connect() as conn:
+            conn.execute(
+                "UPDATE fct_scored_leads SET qualification_status = 'disqualified' "
+                "WHERE lead_id IN (SELECT lead_id FROM fct_scored_leads LIMIT 5)"
+            )
+            conn.execute("DELETE FROM fct_outreach_events WHERE opened_at IS NOT NULL")
+            conn.execute("DELETE FROM dim_contacts WHERE rowid % 3 = 0")
+        incremental, rebuilt = self._rebuilt(db)
+        assert incremental == rebuilt
+        assert incremental["outreach_opened"] == 0
+
+    def test_empty_database(self, db):
+        """A fresh database should report zeroed stats."""
+        stats = db.get_pipeline_stats()
+        assert stats["dim_companies"] == 0
+        assert stats["avg_score"] == 0
+        assert stats["qualification_breakdown"] == {}
+
+
+class TestQueryCache:
+    """Tests for the opt-in read-through result cache."""
+
+    @pytest.fixture
+    def cached_db(self, tmp_path, companies):
+        db = Database(str(tmp_path / "cache.db"), cache_size=8)
+        db.insert_companies(companies[:20])
+        return db
+
+    def test_disabled_by_default(self, db):
+        assert db.cache_stats() is None
+
+    def test_repeat_read_hits(self, cached_db):
+        first = cached_db.get_unique_values("industry", "dim_companies")
+        second = cached_db.get_unique_values(column="industry", table="dim_companies")
+        assert first == second
+        stats = cached_db.cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_list_arguments_are_keyed(self, cached_db):
+        cached_db.search_leads(markets=["US", "BR"])
+        cached_db.search_leads(markets=["US", "BR"])
+        cached_db.search_leads(markets=["US"])
+        stats = cached_db.cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+
+    def test_own_write_invalidates(self, cached_db, companies):
+        before = len(cached_db.get_companies(limit=1000))
+        cached_db.insert_company(companies[20])
+        assert len(cached_db.get_companies(limit=1000)) == before + 1
+        assert cached_db.cache_stats()["invalidations"] == 1
+
+    def test_external_write_invalidates(self, cached_db, companies):
+        """A commit from another connection is picked up via PRAGMA data_version."""
+        before = cached_db.get_pipeline_stats()["dim_companies"]
+        Database(cached_db.db_path, pool_size=0).insert_company(companies[20])
+        assert cached_db.get_pipeline_stats()["dim_companies"] == before + 1
+
+    def test_results_are_isolated(self, cached_db):
+        """The caller that ran the query may modify its result without touching the cache."""
+        stats = cached_db.get_pipeline_stats()
+        stats["dim_companies"] = -1
+        stats["market_breakdown"].clear()
+        again = cached_db.get_pipeline_stats()
+        assert again["dim_companies"] == 20
+        assert again["market_breakdown"]
+
+    def test_hits_share_a_decoded_snapshot(self, cached_db):
+        """Hits are not copied again; cached lazy rows are already decoded."""
+        first = cached_db.search_leads()
+        assert cached_db.search_leads() is cached_db.search_leads()
+        assert cached_db.search_leads() is not first
+        cached_db.get_pipeline_stats()
+        assert cached_db.get_pipeline_stats() is cached_db.get_pipeline_stats()
+
+    def test_cached_lazy_rows_are_decoded(self):
+        row = LazyRow({"lead_id": "l-1", "tech_stack": '["HubSpot"]'}, json_fields=["tech_stack"])
+        (cached,) = snapshot([row])
+        assert not cached._pending and cached["tech_stack"] == ["HubSpot"]
+        assert row._pending == {"tech_stack"}
+
+    def test_lru_eviction(self, cached_db):
+        for limit in range(1, 11):
+            cached_db.get_companies(limit=limit)
+        assert cached_db.cache_stats()["size"] == 8
+        cached_db.get_companies(limit=1)  # evicted
+        cached_db.get_companies(limit=10)  # still cached
+        stats = cached_db.cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 11)
+
+
+class TestQueryPlans:
+    """EXPLAIN QUERY PLAN regression checks for the dashboard's search filters."""
+
+    def _plan(self, db, **filters) -> str:
+        with db._connect() as conn:
+            statements = []
+            conn.set_trace_callback(statements.append)
+            try:
+                db.search_leads(**filters)
+            finally:
+                conn.set_trace_callback(None)
+            query = statements[-1]
+            return " | ".join(r["detail"] for r in conn.execute(f"EXPLAIN QUERY PLAN {query}"))
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"markets": ["US"]},
+        {"industries": ["SaaS / Software"]},
+        {"score_min": 60},
+        {"statuses": ["qualified"]},
+        {"statuses": ["qualified", "nurture"]},
+        {"seniorities": ["C-Level"]},
+        {"revenue_min": 1_000_000, "employees_min": 50},
+        {"markets": ["US"], "score_min": 70, "statuses": ["qualified"]},
+    ])
+    def test_walks_score_index_without_sort(self, pipeline_db, filters):
+        """Score-ordered searches should read an index in order and stop at the LIMIT."""
+        plan = self._plan(pipeline_db, **filters)
+        assert "USING INDEX idx_scored_score" in plan or "USING INDEX idx_scored_status_score" in plan
+        assert "TEMP B-TREE" not in plan
+        assert "SCAN c " not in plan and "SCAN ct " not in plan
+
+    def test_single_status_uses_composite(self, pipeline_db):
+        plan = self._plan(pipeline_db, statuses=["qualified"], score_min=50)
+        assert "idx_scored_status_score (qualification_status=? AND score>?)" in plan
+
+    def test_dedup_probe_is_covered(self, pipeline_db):
+        """The per-contact dedup subquery should be an index-only lookup."""
+        plan = self._plan(pipeline_db)
+        assert "COVERING INDEX idx_enriched_contact (contact_id=?)" in plan
+
+    def test_unique_values_use_index(self, pipeline_db):
+        with pipeline_db._connect() as conn:
+            plan = " ".join(r["detail"] for r in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT DISTINCT country FROM dim_companies "
+                "WHERE country != '' ORDER BY country"
+            ))
+        assert "COVERING INDEX idx_companies_firmographics" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_planner_statistics_present(self, pipeline_db):
+        with pipeline_db._connect() as conn:
+            analyzed = {r[0] for r in conn.execute("SELECT tbl FROM sqlite_stat1")}
+        assert {"fct_scored_leads", "dim_companies", "dim_contacts"} <= analyzed
+
+    def test_one_row_per_contact(self, tmp_path):
+        """A contact with several scored leads should appear once, with its best lead."""
+        db_path = str(tmp_path / "dup.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        db = Database(db_path)
+        best = db.search_leads(limit=1)[0]
+        with db._connect() as conn:
+            conn.execute(
+                """INSERT INTO fct_enriched_leads (lead_id, company_id, contact_id, enriched_at)
+                   SELECT 'l-dup', company_id, contact_id, enriched_at
+                   FROM fct_enriched_leads WHERE lead_id = ?""",
+                (best["lead_id"],),
+            )
+            conn.execute(
+                """INSERT INTO fct_scored_leads (lead_id, score, qualification_status, scored_at)
+                   SELECT 'l-dup', score - 50, qualification_status, scored_at
+                   FROM fct_scored_leads WHERE lead_id = ?""",
+                (best["lead_id"],),
+            )
+        results = db.search_leads(limit=10_000)
+        rows = [r for r in results if r["contact_id"] == best["contact_id"]]
+        assert [r["lead_id"] for r in rows] == [best["lead_id"]]
+
+    def test_dedup_respects_filters(self, tmp_path):
+        """A contact whose best lead fails a filter still appears with a lead that passes it."""
+        db_path = str(tmp_path / "dup.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        db = Database(db_path)
+        best = db.search_leads(limit=1)[0]
+        status = "disqualified" if best["qualification_status"] != "disqualified" else "nurture"
+        with db._connect() as conn:
+            conn.execute(
+                """INSERT INTO fct_enriched_leads (lead_id, company_id, contact_id, enriched_at)
+                   SELECT 'l-low', company_id, contact_id, enriched_at
+                   FROM fct_enriched_leads WHERE lead_id = ?""",
+                (best["lead_id"],),
+            )
+            conn.execute(
+                """INSERT INTO fct_scored_leads (lead_id, score, qualification_status, scored_at)
+                   SELECT 'l-low', score - 50, ?, scored_at
+                   FROM fct_scored_leads WHERE lead_id = ?""",
+                (status, best["lead_id"]),
+            )
+        for filters in ({"statuses": [status]}, {"score_max": best["score"] - 1}):
+            results = db.search_leads(limit=10_000, **filters)
+            rows = [r for r in results if r["contact_id"] == best["contact_id"]]
+            assert [r["lead_id"] for r in rows] == ["l-low"]
+
+
+class TestLazyRows:
+    """Tests for lazily decoded search rows and column projection."""
+
+    def test_json_decoded_on_access(self, pipeline_db):
+        row = pipeline_db.search_leads(limit=1)[0]
+        assert "buying_signals" in row._pending
+        assert isinstance(row["buying_signals"], list)
+        assert "buying_signals" not in row._pending
+
+    def test_behaves_like_dict(self, pipeline_db):
+        row = pipeline_db.search_leads(limit=1)[0]
+        plain = row.to_dict()
+        assert row == plain and dict(row) == plain
+        assert isinstance(plain["tech_stack"], list)
+        assert isinstance(plain["social_signals"], dict)
+        row["assigned_rep"] = "Ana"
+        assert row.get("assigned_rep") == "Ana"
+
+    def test_projection(self, pipeline_db):
+        full = pipeline_db.search_leads(limit=20)
+        slim = pipeline_db.search_leads(limit=20, columns=["company_name", "budget_signal"])
+        assert set(slim[0]) == {"lead_id", "score", "contact_id", "company_name", "budget_signal"}
+        assert slim[0]["budget_signal"] is full[0]["budget_signal"]
+        assert [r["lead_id"] for r in slim] == [r["lead_id"] for r in full]
+
+    def test_projection_pages(self, pipeline_db):
+        page, cursor = pipeline_db.search_leads_page(limit=5, columns=["company_name"])
+        assert len(page) == 5 and cursor
+
+    def test_unknown_column(self, pipeline_db):
+        with pytest.raises(ValueError):
+            pipeline_db.search_leads(columns=["password"])
+
+
+class TestTrustedConstruction:
+    """Tests for the model_construct read path."""
+
+    def test_trusted_reads_match_validated(self, pipeline_db, monkeypatch):
+        """Rows read with model_construct should equal validated models."""
+        from src.config.settings import settings
+
+        validated = pipeline_db.get_scored_leads(limit=50) + pipeline_db.get_outreach_events(limit=50)
+        monkeypatch.setattr(settings, "trusted_construction", True)
+        trusted = pipeline_db.get_scored_leads(limit=50) + pipeline_db.get_outreach_events(limit=50)
+        assert [m.model_dump() for m in trusted] == [m.model_dump() for m in validated]
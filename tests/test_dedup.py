@@ -0,0 +1,123 @@
+"""Tests for natural company keys and the Bloom-filter dedup index."""
+
+import pytest
+
+from src.database.database import Database
+from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+from src.models.models import Company, Contact, company_key, normalize_domain
+from src.orchestration.dedup import BloomFilter, CompanyDedup, key_hashes
+from src.pipeline import run_pipeline
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / "dedup.db"))
+    yield db
+    db.close()
+
+
+def _company(company_id, **fields):
+    return Company(**{"company_id": company_id, "name": "Acme", "website": "acme.io", **fields})
+
+
+class TestNaturalKeys:
+    """Keys are the same whichever source reported the company."""
+
+    def test_domain_normalization(self):
+        for website in ("https://WWW.Acme.io/about", "acme.io", "http://acme.io:8080?q=1"):
+            assert normalize_domain(website) == "acme.io"
+        assert normalize_domain("") == ""
+
+    def test_brazil_keys_on_cnpj(self):
+        assert company_key("Alfa", "alfa.com.br", "BR", "12.345.678/0001-90") == "cnpj:12345678000190"
+        assert company_key("Alfa", "alfa.com.br", "BR", "123") == "domain:alfa.com.br"
+        assert company_key("Alfa", "alfa.com", "US", "12345678000190") == "domain:alfa.com"
+        assert company_key(" Alfa  Tech ", "", "us") == "name:alfa tech|US"
+
+    def test_default_ids_follow_the_key(self):
+        assert Company(name="Acme", website="https://acme.io").company_id == \
+            Company(name="ACME Inc", website="www.acme.io/en").company_id
+        assert Company(name="Acme", website="acme.io").company_id != \
+            Company(name="Acme", website="acme.com").company_id
+        assert Company(company_id="c-1", name="Acme").company_id == "c-1"
+
+
+class TestBloomFilter:
+    """No false negatives, bounded false positives, persisted intact."""
+
+    def test_membership_and_error_rate(self):
+        bloom = BloomFilter(10_000, 0.01)
+        added = key_hashes(f"domain:{i}.io" for i in range(10_000))
+        bloom.add(added)
+        assert bloom.contains(added).all()
+        others = key_hashes(f"domain:{i}.com" for i in range(20_000))
+        assert bloom.contains(others).mean() < 0.02
+
+    def test_save_and_load(self, tmp_path):
+        bloom = BloomFilter(1000)
+        bloom.add(key_hashes(["a", "b"]))
+        bloom.save(tmp_path / "keys.bloom")
+        loaded = BloomFilter.load(tmp_path / "keys.bloom")
+        assert loaded.count == 2
+        assert loaded.contains(key_hashes(["a", "b"])).all()
+
+
+class TestCompanyDedup:
+    """Incoming companies resolve to one record per natural key."""
+
+    def test_duplicates_fold_into_the_first_record(self, db):
+        dedup = CompanyDedup(db)
+        companies = [_company("c-1"), _company("c-2", website="https://www.acme.io"),
+                     _company("c-3", website="beta.io")]
+        contacts = [Contact(contact_id=f"ct-{i}", company_id=c.company_id, full_name="X")
+                    for i, c in enumerate(companies)]
+        kept, kept_contacts = dedup.resolve(companies, contacts)
+
+        assert [c.company_id for c in kept] == ["c-1", "c-3"]
+        assert [ct.company_id for ct in kept_contacts] == ["c-1", "c-1", "c-3"]
+        assert dedup.counts()["duplicates"] == 1
+
+    def test_known_keys_keep_their_stored_id(self, db):
+        CompanyDedup(db).resolve([_company("c-first")], [])
+        dedup = CompanyDedup(db)
+        kept, _ = dedup.resolve(
+            [_company("c-other", source="apollo"), _company("c-new", website="new.io")], [],
+        )
+
+        assert [c.company_id for c in kept] == ["c-first", "c-new"]
+        assert kept[0].source == "apollo"
+        assert dedup.counts()["known"] == 1
+
+    def test_bloom_is_persisted_and_rebuilt_when_stale(self, db, tmp_path):
+        dedup = CompanyDedup(db)
+        dedup.resolve([_company(f"c-{i}", website=f"{i}.io") for i in range(50)], [])
+        dedup.save()
+        assert CompanyDedup(db).bloom.count == 50
+
+        CompanyDedup(db).resolve([_company("c-x", website="x.io")], [])  # never saved
+        reopened = CompanyDedup(db)
+        assert reopened.bloom.count == 51
+        assert reopened.lookup(["domain:x.io", "domain:nope.io"]) == {"domain:x.io": "c-x"}
+
+    def test_new_keys_skip_the_table_lookup(self, db):
+        dedup = CompanyDedup(db)
+        dedup.resolve([_company(f"c-{i}", website=f"{i}.io") for i in range(1000)], [])
+        assert dedup.counts()["lookups"] < 50
+
+    def test_pipeline_reruns_upsert(self, tmp_path):
+        db_path = str(tmp_path / "pipeline.db")
+
+        def tam(prefix):
+            companies = generate_seed_companies()
+            contacts = generate_seed_contacts(companies)
+            yield (
+                [c.model_copy(update={"company_id": f"{prefix}{c.company_id}"}) for c in companies],
+                [ct.model_copy(update={"company_id": f"{prefix}{ct.company_id}"}) for ct in contacts],
+            )
+
+        run_pipeline(db_path=db_path, verbose=False, tam=tam(""))
+        run_pipeline(db_path=db_path, verbose=False, tam=tam("src2-"))
+        stats = Database(db_path).get_pipeline_stats()
+
+        assert stats["dim_companies"] == 150
+        assert stats["dim_contacts"] == len(generate_seed_contacts(generate_seed_companies()))
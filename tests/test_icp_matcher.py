@@ -0,0 +1,169 @@
+"""Tests for the compiled and vectorized ICP matcher."""
+
+import sqlite3
+
+import polars as pl
+import pytest
+from pathlib import Path
+
+from src.config.icp_loader import load_icp_config
+from src.config.settings import settings
+from src.database.database import Database
+from src.database.synthetic import generate_synthetic_tam
+from src.discovery.discovery import DiscoveryEngine
+from src.discovery.icp_matcher import MATCH_COLUMNS, NO_MATCH, CompiledProfile, ICPMatcher
+from src.models.models import Company
+
+
+@pytest.fixture(scope="module")
+def icp_config():
+    return load_icp_config(Path(__file__).parent.parent / "config" / "icp_config.yaml")
+
+
+@pytest.fixture(scope="module")
+def matcher(icp_config):
+    return ICPMatcher(icp_config)
+
+
+def _by_id(entity):
+    return getattr(entity, "contact_id", None) or entity.company_id
+
+
+def _us_company(**overrides):
+    fields = dict(name="Acme", country="US", state="CA", industry="B2B SaaS",
+                  employee_count=200, revenue_usd=10_000_000, funding_stage="Series B")
+    return Company(**{**fields, **overrides})
+
+
+class TestCompiledProfiles:
+    """Per-company matching keeps the discovery rules."""
+
+    def test_matches_first_profile(self, matcher):
+        assert matcher.match(_us_company()) == "us_b2b_saas"
+        assert matcher.match(_us_company(country="DE")) is None
+
+    def test_missing_state_and_funding_do_not_exclude(self, matcher):
+        assert matcher.match(_us_company(state="", funding_stage="")) == "us_b2b_saas"
+        assert matcher.match(_us_company(state="OH")) is None
+        assert matcher.match(_us_company(funding_stage="Seed")) is None
+
+    def test_bounds_are_inclusive(self, matcher):
+        assert matcher.match(_us_company(employee_count=50, revenue_usd=2_000_000))
+        assert matcher.match(_us_company(employee_count=1000, revenue_usd=100_000_000))
+        assert matcher.match(_us_company(employee_count=49)) is None
+        assert matcher.match(_us_company(revenue_usd=100_000_001)) is None
+
+    def test_disabled_profiles_are_skipped(self, icp_config):
+        config = icp_config.model_copy(deep=True)
+        config.profiles["us_b2b_saas"].enabled = False
+        assert ICPMatcher(config).match(_us_company()) is None
+
+
+class TestMatchFrame:
+    """Vectorized matching over company frames."""
+
+    def test_agrees_with_per_company_matching(self, matcher):
+        tam = generate_synthetic_tam(5000, seed=11)
+        mask, profile_index = matcher.match_frame(tam.companies)
+        (companies, _), = tam.batches(batch_size=5000)
+        expected = [matcher.match(c) for c in companies]
+
+        assert mask.tolist() == [p is not None for p in expected]
+        assert [matcher.profile_ids[i] if i != NO_MATCH else None for i in profile_index] == expected
+        assert 0 < mask.sum() < len(companies)
+
+    def test_nulls_and_empty_frames(self, matcher):
+        frame = pl.DataFrame({
+            "country": ["US", "US"], "state": [None, "OH"], "industry": ["FinTech"] * 2,
+            "employee_count": [100, 100], "revenue_usd": [5e6, 5e6], "funding_stage": [None, None],
+        })
+        assert matcher.match_frame(frame)[0].tolist() == [True, False]
+        mask, profile_index = matcher.match_frame(frame.clear())
+        assert len(mask) == len(profile_index) == 0
+
+    def test_discover_frame_labels_profiles(self, icp_config):
+        tam = generate_synthetic_tam(2000, seed=11)
+        engine = DiscoveryEngine(icp_config)
+        discovered = engine.discover_frame(tam.companies)
+        (companies, contacts), = tam.batches(batch_size=2000)
+
+        assert discovered["company_id"].to_list() == [
+            c.company_id for c in engine.discover(companies, contacts)[0]
+        ]
+        by_country = dict(discovered.group_by("country").agg(pl.col("icp_profile").first()).rows())
+        assert by_country == {"US": "us_b2b_saas", "BR": "brazil_tech"}
+
+
+class TestSQLPushdown:
+    """Discovery straight from dim_companies."""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        db = Database(str(tmp_path / "tam.db"))
+        yield db
+        db.close()
+
+    def test_matches_in_memory_discovery(self, icp_config, db):
+        tam = generate_synthetic_tam(3000, seed=4)
+        tam.write_sqlite(db)
+        engine = DiscoveryEngine(icp_config)
+        batches = list(engine.discover_from_db(db, batch_size=100))
+        (companies, contacts), = tam.batches(batch_size=3000)
+        expected_companies, expected_contacts = engine.discover(companies, contacts)
+
+        assert max(len(c) for c, _ in batches) == 100
+        assert sorted((c for b, _ in batches for c in b), key=_by_id) == \
+            sorted(expected_companies, key=_by_id)
+        assert sorted((ct for _, b in batches for ct in b), key=_by_id) == \
+            sorted(expected_contacts, key=_by_id)
+
+    def test_blank_state_and_funding_match(self, icp_config, db):
+        db.insert_companies([_us_company(state="", funding_stage=""), _us_company(name="Other", state="OH")])
+        (companies, contacts), = DiscoveryEngine(icp_config).discover_from_db(db)
+        assert [c.name for c in companies] == ["Acme"]
+
+    def test_queries_seek_the_firmographics_index(self, matcher, db):
+        conn = sqlite3.connect(db.db_path)
+        for where, params in matcher.sql_clauses():
+            plan = " ".join(r[3] for r in conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT company_id FROM dim_companies WHERE {where}", params,
+            ))
+            assert "USING INDEX idx_companies_firmographics" in plan
+            assert "SCAN dim_companies" not in plan
+        conn.close()
+
+
+class TestRevenueCurrency:
+    """BRL revenue bounds are compared in USD on every matching path."""
+
+    @pytest.mark.parametrize("rate", [0.18, 0.25])
+    def test_brl_bounds_agree_across_paths(self, icp_config, tmp_path, monkeypatch, rate):
+        monkeypatch.setattr(settings, "brl_usd_rate", rate)
+        profile = CompiledProfile("brazil_tech", icp_config.profiles["brazil_tech"])
+        bounds = icp_config.profiles["brazil_tech"].firmographic_filters.revenue_range
+        low, high = bounds.min_brl * rate, bounds.max_brl * rate
+        assert (profile.revenue_min, profile.revenue_max) == (pytest.approx(low), pytest.approx(high))
+
+        # The last company is below min_brl read as USD, above it converted
+        revenues = [low - 1, profile.revenue_min, low + 1, high - 1, profile.revenue_max, high + 1,
+                    bounds.min_brl * 0.4]
+        companies = [
+            Company(name=f"Empresa {i}", country="BR", state="SP", industry="Software",
+                    employee_count=100, revenue_usd=revenue)
+            for i, revenue in enumerate(revenues)
+        ]
+        expected = [False, True, True, True, True, False, True]
+        assert [profile.matches(c) for c in companies] == expected
+
+        frame = pl.DataFrame([{col: getattr(c, col) for col in MATCH_COLUMNS} for c in companies])
+        assert frame.select(profile.expr()).to_series().to_list() == expected
+
+        db = Database(str(tmp_path / "brl.db"))
+        db.insert_companies(companies)
+        where, params = profile.sql()
+        with sqlite3.connect(db.db_path) as conn:
+            matched = {r[0] for r in conn.execute(
+                f"SELECT name FROM dim_companies WHERE {where}", params,
+            )}
+        db.close()
+        assert matched == {c.name for c, hit in zip(companies, expected) if hit}
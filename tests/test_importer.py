@@ -0,0 +1,211 @@
+"""Tests for the chunked provider file importer."""
+
+import json
+from pathlib import Path
+
+import polars as pl
+import pytest
+from pydantic import ValidationError
+
+from src.config.icp_loader import load_icp_config
+from src.config.provider_loader import ProviderMapping, load_provider_config
+from src.config.settings import settings
+from src.database.database import Database
+from src.database.importer import ProviderImporter, import_file
+from src.discovery.icp_matcher import ICPMatcher
+import src.pipeline as pipeline
+from src.pipeline import main, run_pipeline
+
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+RECEITA_HEADER = (
+    "cnpj,razao_social,setor,uf,numero_funcionarios,faturamento_anual,"
+    "site,ano_abertura,cnae_fiscal_principal"
+)
+
+
+def _receita_csv(path, rows=25):
+    lines = [RECEITA_HEADER]
+    for i in range(rows):
+        lines.append(
+            f"12.345.{i:03d}/0001-90,Empresa {i} LTDA,Software,SP,{100 + i},"
+            f"{10_000_000 + i},empresa{i}.com.br,2015,6201-5"
+        )
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def _apollo_jsonl(path):
+    people = []
+    for account in range(3):
+        for person in range(2):
+            people.append({
+                "Apollo Account Id": f"acc-{account}", "Company": f"Account {account}",
+                "Industry": "B2B SaaS", "Company Country": "US", "Company State": "CA",
+                "# Employees": 200, "Annual Revenue": 10_000_000, "Website": f"acc{account}.io",
+                "Technologies": ["HubSpot", " Slack "], "Latest Funding": "Series B",
+                "Founded Year": 2018, "Apollo Contact Id": f"p-{account}-{person}",
+                "Name": f"Person {account}-{person}", "Title": "VP of Sales",
+                "Email": f"p{person}@acc{account}.io", "Phone": None,
+                "Person Linkedin Url": "", "Seniority": "VP", "Departments": "Sales",
+            })
+    path.write_text("\n".join(json.dumps(p) for p in people) + "\n", encoding="utf-8")
+    return path
+
+
+class TestProviderConfig:
+    """Declarative provider mappings."""
+
+    def test_loads_shipped_mappings(self):
+        config = load_provider_config(CONFIG_DIR / "providers.yaml")
+        assert {"apollo", "crunchbase", "receita_federal"} <= set(config.providers)
+        assert config.providers["receita_federal"].revenue_currency == "BRL"
+        assert "razao_social" in config.providers["receita_federal"].source_columns()
+
+    def test_mapping_requires_a_name(self):
+        with pytest.raises(ValidationError):
+            ProviderMapping(name="x", company={"columns": {"industry": "sector"}})
+
+    def test_unknown_fields_and_providers_are_rejected(self):
+        config = load_provider_config(CONFIG_DIR / "providers.yaml")
+        config.providers["receita_federal"].company.columns["turnover"] = "faturamento"
+        with pytest.raises(ValueError, match="turnover"):
+            ProviderImporter("receita_federal", config)
+        with pytest.raises(ValueError, match="Unknown provider"):
+            ProviderImporter("nope", config)
+
+
+class TestChunkedReading:
+    """Each format streams in chunks of exactly chunk_size rows."""
+
+    def test_csv_chunks_and_brl_normalization(self, tmp_path):
+        importer = ProviderImporter("receita_federal", chunk_size=10)
+        batches = list(importer.batches(_receita_csv(tmp_path / "rf.csv")))
+
+        assert [len(companies) for companies, _ in batches] == [10, 10, 5]
+        company = batches[0][0][0]
+        assert company.country == "BR"
+        assert company.cnpj == "12345000000190"
+        assert company.revenue_usd == pytest.approx(10_000_000 * settings.brl_usd_rate)
+        assert company.founded_year == 2015
+        assert importer.rows_read == 25
+
+    def test_bad_values_and_nameless_rows(self, tmp_path):
+        path = tmp_path / "rf.csv"
+        path.write_text(
+            RECEITA_HEADER + "\n"
+            ",Beta Sistemas,Software,RJ,abc,,,,\n"
+            "98.765.432/0001-10,,Software,RJ,10,100,,,\n",
+            encoding="utf-8",
+        )
+        importer = ProviderImporter("receita_federal")
+        (companies, contacts), = importer.batches(path)
+
+        assert [c.name for c in companies] == ["Beta Sistemas"]
+        assert companies[0].employee_count == 0
+        assert companies[0].cnpj is None and companies[0].founded_year is None
+        assert importer.rows_rejected == 1 and contacts == []
+
+    def test_rows_failing_validation_are_rejected(self, tmp_path, monkeypatch):
+        """Mapped rows go through model validation instead of being trusted."""
+        importer = ProviderImporter("apollo")
+        typed = importer._typed
+
+        def corrupt(chunk, mapping):
+            frame = typed(chunk, mapping)
+            if mapping is importer.mapping.company:
+                return frame.with_columns(
+                    pl.when(pl.col("name") == "Account 1").then(pl.lit("lots"))
+                    .otherwise(pl.col("employee_count").cast(pl.Utf8)).alias("employee_count")
+                )
+            return frame.with_columns(
+                pl.when(pl.col("full_name") == "Person 0-1").then(pl.lit(None))
+                .otherwise(pl.col("email")).alias("email")
+            )
+
+        monkeypatch.setattr(importer, "_typed", corrupt)
+        (companies, contacts), = importer.batches(_apollo_jsonl(tmp_path / "apollo.jsonl"))
+
+        assert [c.name for c in companies] == ["Account 0", "Account 2"]
+        assert all(isinstance(c.employee_count, int) for c in companies)
+        assert [ct.full_name for ct in contacts] == ["Person 0-0", "Person 2-0", "Person 2-1"]
+        assert importer.rows_rejected == 2 and importer.contacts_rejected == 1
+
+    def test_missing_columns_fail_fast(self, tmp_path):
+        path = tmp_path / "rf.csv"
+        path.write_text("razao_social\nAlfa\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="missing mapped columns"):
+            next(ProviderImporter("receita_federal").batches(path))
+
+    def test_jsonl_people_rows(self, tmp_path):
+        importer = ProviderImporter("apollo", chunk_size=3)
+        batches = list(importer.batches(_apollo_jsonl(tmp_path / "apollo.jsonl")))
+
+        assert [(len(c), len(ct)) for c, ct in batches] == [(2, 3), (2, 3)]
+        companies = {c.company_id: c for b, _ in batches for c in b}
+        assert len(companies) == 3  # account 1 spans both chunks
+        assert all(c.tech_stack == ["HubSpot", "Slack"] for c in companies.values())
+        contacts = [ct for _, b in batches for ct in b]
+        assert {ct.company_id for ct in contacts} == set(companies)
+        assert contacts[0].seniority == "VP" and contacts[0].phone == ""
+
+    def test_parquet_list_columns(self, tmp_path):
+        path = tmp_path / "cb.parquet"
+        pl.DataFrame({
+            "uuid": [f"u{i}" for i in range(7)], "name": [f"Org {i}" for i in range(7)],
+            "category_groups_list": ["FinTech"] * 7, "country_code": ["US"] * 7,
+            "region": ["NY"] * 7, "employee_count": list(range(7)),
+            "revenue_usd": [1.5e6] * 7, "homepage_url": [None] * 7,
+            "last_funding_type": ["Series A"] * 7, "founded_year": [2020] * 7,
+            "unmapped": [[1, 2]] * 7,
+        }).write_parquet(path)
+        batches = list(ProviderImporter("crunchbase", chunk_size=3).batches(path))
+
+        assert [len(c) for c, _ in batches] == [3, 3, 1]
+        assert batches[2][0][0].employee_count == 6
+        assert batches[0][0][0].website == "" and batches[0][0][0].revenue_usd == 1.5e6
+
+
+class TestImportTargets:
+    """Imports feed the bulk writer and the pipeline."""
+
+    def test_reimport_overwrites_rows(self, tmp_path):
+        db = Database(str(tmp_path / "import.db"))
+        path = _apollo_jsonl(tmp_path / "apollo.jsonl")
+        import_file(path, "apollo", db)
+        import_file(path, "apollo", db)
+
+        with db._connect() as conn:
+            counts = conn.execute(
+                "SELECT (SELECT COUNT(*) FROM dim_companies), (SELECT COUNT(*) FROM dim_contacts)"
+            ).fetchone()
+        assert tuple(counts) == (3, 6)
+        db.close()
+
+    def test_brl_revenue_meets_brl_bounds(self, tmp_path):
+        matcher = ICPMatcher(load_icp_config(CONFIG_DIR / "icp_config.yaml"))
+        (companies, _), = ProviderImporter("receita_federal").batches(
+            _receita_csv(tmp_path / "rf.csv", rows=1)
+        )
+        assert matcher.match(companies[0]) == "brazil_tech"
+
+    def test_pipeline_runs_on_an_import(self, tmp_path):
+        importer = ProviderImporter("apollo", chunk_size=4)
+        result = run_pipeline(
+            db_path=str(tmp_path / "pipeline.db"), verbose=False, streaming=True,
+            tam=importer.batches(_apollo_jsonl(tmp_path / "apollo.jsonl")),
+        )
+        assert result.companies_discovered == 3
+
+    def test_cli_import_always_streams(self, tmp_path, monkeypatch):
+        """--import never collects the whole export into list mode."""
+        calls = []
+        monkeypatch.setattr(pipeline, "_run_list", lambda *a, **k: calls.append("list"))
+        path = _apollo_jsonl(tmp_path / "apollo.jsonl")
+        result = main(["--db", str(tmp_path / "cli.db"), "--quiet",
+                       "--import", str(path), "--provider", "apollo"])
+        assert calls == [] and result.companies_discovered == 3
+
+        with pytest.raises(SystemExit):
+            main(["--import", str(path), "--provider", "apollo", "--checkpoint"])
@@ -0,0 +1,114 @@
+"""Tests for watermarked, incremental pipeline runs."""
+
+import pytest
+
+from src.database.database import Database
+from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+from src.orchestration.incremental import company_fingerprint, contact_fingerprint
+from src.orchestration.streaming import rebatch
+from src.pipeline import run_pipeline
+
+
+def _seed_tam():
+    companies = generate_seed_companies()
+    return companies, generate_seed_contacts(companies)
+
+
+def _runs(db_path):
+    return Database(db_path).get_pipeline_runs()
+
+
+class TestFingerprints:
+    """Content fingerprints ignore ids and discovery time."""
+
+    def test_regenerated_seed_data_has_same_fingerprints(self):
+        """A fresh read of the same source yields the same fingerprints."""
+        first = generate_seed_companies()
+        second = [c.model_copy(update={"company_id": f"other-{i}"})
+                  for i, c in enumerate(generate_seed_companies())]
+        assert first[0].discovered_at != second[0].discovered_at
+        assert [company_fingerprint(c) for c in first] == [company_fingerprint(c) for c in second]
+
+    def test_changed_field_changes_fingerprint(self):
+        company = generate_seed_companies()[0]
+        changed = company.model_copy(update={"revenue_usd": company.revenue_usd + 1})
+        assert company_fingerprint(company) != company_fingerprint(changed)
+
+    def test_contact_fingerprint_depends_on_company(self):
+        companies, contacts = _seed_tam()
+        assert contact_fingerprint(contacts[0], "a") != contact_fingerprint(contacts[0], "b")
+
+
+class TestIncrementalRuns:
+    """run_pipeline(incremental=True) only processes what changed."""
+
+    def test_every_run_is_logged_with_watermarks(self, tmp_path):
+        db_path = str(tmp_path / "runs.db")
+        run_pipeline(db_path=db_path, verbose=False)
+
+        (run,) = _runs(db_path)
+        assert run["mode"] == "full"
+        assert run["status"] == "succeeded"
+        assert run["companies_seen"] == run["companies_processed"] == 150
+        for column in ("discovered_through", "enriched_through", "scored_through", "outreach_through"):
+            assert run[column] is not None
+
+    def test_unchanged_tam_does_no_work(self, tmp_path):
+        """A second incremental run over the same TAM processes nothing."""
+        db_path = str(tmp_path / "unchanged.db")
+        first = run_pipeline(db_path=db_path, verbose=False, incremental=True)
+        before = Database(db_path).get_pipeline_stats()
+        second = run_pipeline(db_path=db_path, verbose=False, incremental=True)
+
+        assert first.leads_scored > 0
+        assert second.companies_discovered == second.leads_scored == 0
+        assert Database(db_path).get_pipeline_stats() == before
+        latest = _runs(db_path)[0]
+        assert latest["companies_seen"] == 150
+        assert latest["companies_processed"] == 0
+
+    def test_full_run_primes_incremental_run(self, tmp_path):
+        db_path = str(tmp_path / "primed.db")
+        run_pipeline(db_path=db_path, verbose=False)
+        result = run_pipeline(db_path=db_path, verbose=False, incremental=True)
+        assert result.leads_scored == 0
+
+    def test_changed_and_new_entities_are_processed(self, tmp_path):
+        """Changed companies and new contacts are picked up; new contacts join the stored company."""
+        db_path = str(tmp_path / "changed.db")
+        run_pipeline(db_path=db_path, verbose=False, incremental=True)
+        stored_ids = {c.name: c.company_id for c in Database(db_path).get_companies(limit=1000)}
+
+        companies, contacts = _seed_tam()
+        companies[0] = companies[0].model_copy(update={"employee_count": 9999})
+        newcomer = contacts[-1].model_copy(update={"contact_id": "ct-new", "full_name": "Nova Pessoa"})
+        run_pipeline(db_path=db_path, verbose=False, incremental=True,
+                     tam=[(companies, contacts + [newcomer])])
+
+        latest = _runs(db_path)[0]
+        assert latest["companies_processed"] == 2
+        changed_contacts = [c for c in contacts if c.company_id == companies[0].company_id]
+        assert latest["contacts_processed"] == len(changed_contacts) + 1
+
+        db = Database(db_path)
+        owner = next(c for c in companies if c.company_id == newcomer.company_id)
+        # Seed ids derive from names, so the changed company updates its row
+        assert len(db.get_companies(limit=1000)) == 150
+        assert db.get_company(companies[0].company_id).employee_count == 9999
+        assert "ct-new" in {c.contact_id for c in db.get_contacts(company_id=stored_ids[owner.name])}
+
+    def test_failed_run_is_redone(self, tmp_path):
+        """Fingerprints recorded by a failed run do not count as processed."""
+        db_path = str(tmp_path / "failed.db")
+
+        def broken_tam():
+            yield from rebatch([_seed_tam()], 50)
+            raise RuntimeError("source went away")
+
+        with pytest.raises(RuntimeError):
+            run_pipeline(db_path=db_path, verbose=False, incremental=True, tam=broken_tam())
+        assert _runs(db_path)[0]["status"] == "failed"
+
+        result = run_pipeline(db_path=db_path, verbose=False, incremental=True)
+        assert result.leads_scored > 0
+        assert _runs(db_path)[0]["companies_processed"] == 150
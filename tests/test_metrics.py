@@ -0,0 +1,85 @@
+"""Tests for per-stage pipeline metrics."""
+
+import json
+import time
+
+from src.database.database import Database
+from src.orchestration.metrics import StageRecorder
+from src.pipeline import run_pipeline
+
+
+STAGES = ["tam", "discover", "resolve", "enrich", "score", "outreach", "crm"]
+
+
+class TestStageRecorder:
+    """Accumulating timings per stage."""
+
+    def test_stage_accumulates_across_entries(self):
+        recorder = StageRecorder()
+        for _ in range(3):
+            with recorder.stage("enrich", rows_in=10) as m:
+                time.sleep(0.01)
+                m.rows_out += 5
+        (metrics,) = recorder.results()
+        assert metrics.rows_in == 30
+        assert metrics.rows_out == 15
+        assert metrics.wall_seconds >= 0.03
+        assert metrics.rows_per_sec > 0
+        assert metrics.peak_memory_mb is None
+
+    def test_db_write_time_goes_to_current_stage(self):
+        recorder = StageRecorder()
+        with recorder.stage("score"):
+            with recorder.db_write():
+                time.sleep(0.01)
+        with recorder.db_write():  # outside any stage: not attributed
+            time.sleep(0.01)
+        (metrics,) = recorder.results()
+        assert 0.01 <= metrics.db_write_seconds < metrics.wall_seconds + 1e-9
+
+    def test_trace_memory_records_peak(self):
+        recorder = StageRecorder(trace_memory=True)
+        with recorder.stage("tam"):
+            blob = [bytes(1024) for _ in range(2048)]
+            del blob
+        recorder.close()
+        assert recorder.results()[0].peak_memory_mb >= 2
+
+
+class TestPipelineMetrics:
+    """run_pipeline reports, stores and dumps stage metrics."""
+
+    def test_result_has_every_stage(self, tmp_path):
+        result = run_pipeline(db_path=str(tmp_path / "m.db"), verbose=False)
+
+        assert [m.stage for m in result.stage_metrics] == STAGES
+        by_stage = {m.stage: m for m in result.stage_metrics}
+        assert by_stage["tam"].rows_out == 150
+        assert by_stage["discover"].rows_in == 150
+        assert by_stage["discover"].rows_out == result.companies_discovered
+        assert by_stage["enrich"].rows_out == result.leads_scored
+        assert by_stage["outreach"].rows_out == result.outreach_events_created
+        assert by_stage["crm"].rows_out == result.deals_synced_to_crm
+        assert by_stage["tam"].db_write_seconds > 0
+
+    def test_metrics_are_persisted(self, tmp_path):
+        db_path = str(tmp_path / "m.db")
+        result = run_pipeline(db_path=db_path, verbose=False)
+
+        assert Database(db_path).get_stage_metrics(result.run_id) == result.stage_metrics
+
+    def test_streaming_reports_same_stages(self, tmp_path):
+        result = run_pipeline(db_path=str(tmp_path / "m.db"), verbose=False,
+                              streaming=True, batch_size=40)
+        assert [m.stage for m in result.stage_metrics] == STAGES
+        assert result.stage_metrics[0].rows_out == 150
+
+    def test_json_dump_and_memory_tracing(self, tmp_path):
+        path = tmp_path / "metrics" / "run.json"
+        result = run_pipeline(db_path=str(tmp_path / "m.db"), verbose=False,
+                              trace_memory=True, metrics_json=str(path))
+
+        dumped = json.loads(path.read_text())
+        assert dumped["run_id"] == result.run_id
+        assert [m["stage"] for m in dumped["stage_metrics"]] == STAGES
+        assert all(m["peak_memory_mb"] > 0 for m in dumped["stage_metrics"])
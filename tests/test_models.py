@@ -0,0 +1,62 @@
+"""Tests for the domain models and the trusted ``build`` constructor."""
+
+import pytest
+from pydantic import BaseModel
+
+import src.models.models as models
+from src.config.settings import settings
+from src.models.models import Company, build, natural_company_id
+
+MODELS = [
+    obj for obj in vars(models).values()
+    if isinstance(obj, type) and issubclass(obj, BaseModel) and obj.__module__ == models.__name__
+]
+
+
+@pytest.fixture(autouse=True)
+def trusted(monkeypatch):
+    monkeypatch.setattr(settings, "trusted_construction", True)
+
+
+def _required(model: type[BaseModel]) -> dict:
+    """Placeholder values for a model's required fields."""
+    return {name: 1 if field.annotation is int else "x"
+            for name, field in model.model_fields.items() if field.is_required()}
+
+
+def _generated(model: type[BaseModel]) -> set[str]:
+    """Fields whose default is a fresh timestamp or id, never equal across instances."""
+    return {name for name, field in model.model_fields.items()
+            if field.default_factory not in (None, list, dict)}
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda m: m.__name__)
+class TestBuild:
+    """Trusted ``build`` skips validation but assembles the same instance as the constructor."""
+
+    def test_matches_constructor(self, model):
+        fields = dict(model(**_required(model)))
+        built, validated = build(model, **fields), model(**fields)
+        assert built == validated
+        assert built.model_fields_set == validated.model_fields_set
+        assert built.model_dump() == validated.model_dump()
+
+    def test_fills_defaults_like_constructor(self, model):
+        fields = _required(model)
+        skip = _generated(model)
+        assert build(model, **fields).model_dump(exclude=skip) == \
+            model(**fields).model_dump(exclude=skip)
+        assert build(model, **fields).model_fields_set == model(**fields).model_fields_set
+
+    def test_mutable_defaults_are_not_shared(self, model):
+        first, second = build(model, **_required(model)), build(model, **_required(model))
+        for name, value in dict(first).items():
+            if isinstance(value, (list, dict, BaseModel)):
+                assert value is not getattr(second, name)
+
+
+def test_trusted_company_without_id_gets_its_natural_id():
+    company = build(Company, name="Acme", website="https://acme.io", country="US")
+    assert company.company_id == natural_company_id(company.natural_key)
+    assert company == Company(name="Acme", website="https://acme.io", country="US",
+                              discovered_at=company.discovered_at)
@@ -0,0 +1,64 @@
+"""Tests for chunked, process-pool stage execution."""
+
+import pytest
+from pathlib import Path
+
+from src.config.icp_loader import load_icp_config
+from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+from src.orchestration.parallel import StageExecutor
+
+
+VOLATILE = {"enriched_at", "scored_at", "enriched_lead", "company", "contact"}
+
+
+@pytest.fixture(scope="module")
+def icp_config():
+    return load_icp_config(Path(__file__).parent.parent / "config" / "icp_config.yaml")
+
+
+@pytest.fixture(scope="module")
+def tam():
+    companies = generate_seed_companies()
+    return companies, generate_seed_contacts(companies)
+
+
+def _run(tam, icp_config, workers, chunk_size, seed=7):
+    companies, contacts = tam
+    with StageExecutor(workers=workers, chunk_size=chunk_size) as executor:
+        enriched = executor.enrich(companies, contacts, seed=seed)
+        scored = executor.score(icp_config, enriched)
+    return (
+        [l.model_dump(exclude=VOLATILE) for l in enriched],
+        [l.model_dump(exclude=VOLATILE) for l in scored],
+    )
+
+
+class TestStageExecutor:
+    """Parallel runs must be indistinguishable from serial ones."""
+
+    def test_workers_do_not_change_results(self, tam, icp_config):
+        assert _run(tam, icp_config, workers=1, chunk_size=50) == \
+            _run(tam, icp_config, workers=3, chunk_size=50)
+
+    def test_fused_matches_separate(self, tam, icp_config):
+        companies, contacts = tam
+        with StageExecutor(workers=2, chunk_size=50) as executor:
+            enriched, scored = executor.enrich_and_score(companies, contacts, icp_config, seed=7)
+        separate = _run(tam, icp_config, workers=1, chunk_size=50)
+        assert [l.model_dump(exclude=VOLATILE) for l in enriched] == separate[0]
+        assert [l.model_dump(exclude=VOLATILE) for l in scored] == separate[1]
+
+    def test_order_follows_input(self, tam, icp_config):
+        companies, contacts = tam
+        with StageExecutor(workers=2, chunk_size=33) as executor:
+            enriched = executor.enrich(companies, contacts, seed=1)
+        assert [l.contact_id for l in enriched] == [c.contact_id for c in contacts]
+
+    def test_seed_changes_results(self, tam, icp_config):
+        enriched_a, _ = _run(tam, icp_config, workers=1, chunk_size=50, seed=1)
+        enriched_b, _ = _run(tam, icp_config, workers=1, chunk_size=50, seed=2)
+        assert enriched_a != enriched_b
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            StageExecutor(chunk_size=0)
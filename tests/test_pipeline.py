@@ -87,3 +87,85 @@ class TestPipeline:
         # Pipeline stores full TAM pool (150 companies) + uses INSERT OR REPLACE
         # So second run should replace, not grow unboundedly
         assert stats["dim_companies"] <= 300 + 5  # at most 2x pool (REPLACE may miss some UUIDs)
+
+    def test_trusted_construction_matches_validated(self, tmp_path, monkeypatch):
+        """Skipping model validation must not change what the pipeline produces."""
+        from src.config.settings import settings
+
+        validated = run_pipeline(db_path=str(tmp_path / "validated.db"), verbose=False)
+        monkeypatch.setattr(settings, "trusted_construction", True)
+        trusted = run_pipeline(db_path=str(tmp_path / "trusted.db"), verbose=False)
+
+        skip = {"pipeline_duration_seconds", "completed_at", "run_id", "stage_metrics"}
+        assert trusted.model_dump(exclude=skip) == validated.model_dump(exclude=skip)
+        assert (
+            Database(str(tmp_path / "trusted.db")).get_pipeline_stats()
+            == Database(str(tmp_path / "validated.db")).get_pipeline_stats()
+        )
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """workers=N must reproduce the serial run for the same seed and chunk size."""
+        serial = run_pipeline(db_path=str(tmp_path / "serial.db"), verbose=False,
+                              workers=1, chunk_size=40)
+        parallel = run_pipeline(db_path=str(tmp_path / "parallel.db"), verbose=False,
+                                workers=2, chunk_size=40)
+
+        skip = {"pipeline_duration_seconds", "completed_at", "run_id", "stage_metrics"}
+        assert serial.model_dump(exclude=skip) == parallel.model_dump(exclude=skip)
+        assert (
+            Database(str(tmp_path / "serial.db")).get_pipeline_stats()
+            == Database(str(tmp_path / "parallel.db")).get_pipeline_stats()
+        )
+
+    def test_streaming_single_batch_matches_list_mode(self, tmp_path):
+        """A streaming run with one batch covering the TAM reproduces the list run."""
+        listed = run_pipeline(db_path=str(tmp_path / "list.db"), verbose=False)
+        streamed = run_pipeline(db_path=str(tmp_path / "stream.db"), verbose=False,
+                                streaming=True, batch_size=1000)
+
+        skip = {"pipeline_duration_seconds", "completed_at", "run_id", "stage_metrics"}
+        assert listed.model_dump(exclude=skip) == streamed.model_dump(exclude=skip)
+        assert (
+            Database(str(tmp_path / "list.db")).get_pipeline_stats()
+            == Database(str(tmp_path / "stream.db")).get_pipeline_stats()
+        )
+
+    def test_streaming_counters_match_database(self, tmp_path):
+        """Funnel counters accumulated batch by batch agree with what was persisted."""
+        db_path = str(tmp_path / "stream.db")
+        result = run_pipeline(db_path=db_path, verbose=False, streaming=True, batch_size=20)
+        stats = Database(db_path).get_pipeline_stats()
+
+        assert stats["dim_companies"] == 150
+        assert result.companies_discovered > 0
+        assert stats["fct_enriched_leads"] == result.leads_enriched
+        assert stats["fct_scored_leads"] == result.leads_scored
+        assert stats["fct_outreach_events"] == result.outreach_events_created
+        assert stats["qualification_breakdown"].get("qualified", 0) == result.leads_qualified
+        assert stats["qualification_breakdown"].get("nurture", 0) == result.leads_nurture
+        assert stats["funnel_pipeline"] == result.deals_synced_to_crm
+
+    def test_streaming_accepts_generated_tam(self, tmp_path):
+        """A lazily generated multi-batch TAM is pooled and processed in full."""
+        from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+
+        def tam(copies):
+            companies = generate_seed_companies()
+            contacts = generate_seed_contacts(companies)
+            for k in range(copies):
+                yield (
+                    [c.model_copy(update={"company_id": f"{c.company_id}-{k}"}) for c in companies],
+                    [ct.model_copy(update={"contact_id": f"{ct.contact_id}-{k}",
+                                           "company_id": f"{ct.company_id}-{k}"})
+                     for ct in contacts],
+                )
+
+        db_path = str(tmp_path / "tam.db")
+        result = run_pipeline(db_path=db_path, verbose=False, streaming=True,
+                              batch_size=100, tam=tam(3))
+        stats = Database(db_path).get_pipeline_stats()
+
+        # Copies share natural keys, so they fold into the 150 originals
+        assert stats["dim_companies"] == 150
+        assert stats["dim_contacts"] == 915
+        assert stats["fct_scored_leads"] == result.leads_scored > 0
@@ -0,0 +1,119 @@
+"""Tests for pipelined (threaded) stage execution."""
+
+import threading
+import time
+
+import pytest
+
+from src.database.database import Database
+from src.database.synthetic import generate_synthetic_tam
+from src.orchestration.pipelined import StagePipeline
+from src.outreach.outreach import OutreachEngine
+from src.pipeline import main, run_pipeline
+
+
+def _pipeline_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("pipeline-")]
+
+
+class TestStagePipeline:
+    """Bounded channels, backpressure and shutdown."""
+
+    def test_batches_pass_through_in_order(self):
+        pipeline = StagePipeline([
+            ("source", lambda _: iter(range(20))),
+            ("double", lambda items: (i * 2 for i in items)),
+        ], queue_size=1)
+        assert list(pipeline) == [i * 2 for i in range(20)]
+        assert not _pipeline_threads()
+
+    def test_fast_producer_waits_for_slow_consumer(self):
+        produced = []
+
+        def source(_):
+            for i in range(30):
+                produced.append(i)
+                yield i
+
+        lead = []
+        for i in StagePipeline([("source", source), ("pass", lambda b: b)], queue_size=2):
+            time.sleep(0.005)
+            lead.append(len(produced) - i)
+        # Two queues of two, one batch held by each stage, the one being consumed
+        assert max(lead) <= 2 * 2 + 2 + 1
+
+    def test_stage_error_stops_every_worker(self):
+        started = threading.Event()
+
+        def source(_):
+            i = 0
+            while True:  # would run forever without shutdown
+                started.set()
+                yield i
+                i += 1
+
+        def failing(items):
+            for i in items:
+                if i == 5:
+                    raise RuntimeError("stage blew up")
+                yield i
+
+        with pytest.raises(RuntimeError, match="stage blew up"):
+            list(StagePipeline([("source", source), ("fail", failing), ("pass", lambda b: b)]))
+        assert started.is_set()
+        assert not _pipeline_threads()
+
+    def test_closing_early_shuts_down(self):
+        batches = iter(StagePipeline([("source", lambda _: iter(range(10**6)))]))
+        assert next(batches) == 0
+        batches.close()
+        assert not _pipeline_threads()
+
+
+class TestPipelinedRuns:
+    """run_pipeline(pipelined=True)."""
+
+    def test_discovers_what_list_mode_discovers(self, tmp_path):
+        listed = run_pipeline(db_path=str(tmp_path / "list.db"), verbose=False)
+        piped = run_pipeline(db_path=str(tmp_path / "piped.db"), verbose=False,
+                             pipelined=True, batch_size=40)
+        assert piped.companies_discovered == listed.companies_discovered
+        assert piped.contacts_found == listed.contacts_found
+        assert Database(str(tmp_path / "piped.db")).get_pipeline_stats()["dim_companies"] == 150
+
+    def test_leads_do_not_depend_on_thread_timing(self, tmp_path):
+        tam = generate_synthetic_tam(1500)
+        first = run_pipeline(db_path=str(tmp_path / "a.db"), verbose=False, pipelined=True,
+                             batch_size=100, queue_size=1, tam=tam.batches())
+        second = run_pipeline(db_path=str(tmp_path / "b.db"), verbose=False, pipelined=True,
+                              batch_size=100, queue_size=4, tam=tam.batches())
+        scores = [
+            sorted(l.score for l in Database(str(tmp_path / p)).get_scored_leads(limit=10_000))
+            for p in ("a.db", "b.db")
+        ]
+        assert first.leads_scored == second.leads_scored > 0
+        assert scores[0] == scores[1]
+
+    def test_counters_match_database(self, tmp_path):
+        db_path = str(tmp_path / "piped.db")
+        result = main(["--db", db_path, "--quiet", "--pipelined", "--synthetic", "1000"])
+        stats = Database(db_path).get_pipeline_stats()
+
+        assert stats["dim_companies"] == 1000
+        assert stats["fct_scored_leads"] == result.leads_scored
+        assert stats["fct_outreach_events"] == result.outreach_events_created
+        assert [m.stage for m in result.stage_metrics] == [
+            "tam", "discover", "resolve", "enrich", "score", "outreach", "crm",
+        ]
+
+    def test_stage_failure_fails_the_run(self, tmp_path, monkeypatch):
+        def broken(self, leads, steps=3):
+            raise RuntimeError("outreach down")
+
+        monkeypatch.setattr(OutreachEngine, "generate_sequences", broken)
+        db_path = str(tmp_path / "failed.db")
+        with pytest.raises(RuntimeError, match="outreach down"):
+            run_pipeline(db_path=db_path, verbose=False, pipelined=True, batch_size=20)
+
+        assert not _pipeline_threads()
+        assert Database(db_path).get_pipeline_runs()[0]["status"] == "failed"
@@ -0,0 +1,167 @@
+"""Tests for fuzzy company/contact resolution (blocking + MinHash LSH)."""
+
+import numpy as np
+import pytest
+
+from src.config.icp_loader import load_icp_config
+from src.config.settings import settings
+from src.database.database import Database
+from src.database.seed_data import generate_seed_companies, generate_seed_contacts
+from src.discovery.discovery import DiscoveryEngine
+from src.models.models import Company, Contact
+from src.pipeline import run_pipeline
+from src.resolution.resolution import (
+    EntityResolver,
+    connected_components,
+    domain_label,
+    normalize_name,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / "resolution.db"))
+    yield db
+    db.close()
+
+
+def _score(resolver, a, b):
+    """Match score of two (name, website, country, cnpj) records; None if never paired."""
+    i, j, score = resolver.match(*map(list, zip(a, b)))
+    return float(score[0]) if len(score) else None
+
+
+class TestNormalization:
+    """Names and domains reduce to what identifies the company."""
+
+    def test_names(self):
+        assert normalize_name("Nova Tech Inc.") == normalize_name("NovaTech") == ("novatech", "")
+        assert normalize_name("Alfa Tecnologia LTDA") == normalize_name("ALFA TECNOLOGIA S/A")
+        assert normalize_name("Açaí Labs") == ("acailabs", "")
+        assert normalize_name("Studio 54 LLC") == ("studio54", "54")
+
+    def test_domains(self):
+        assert domain_label("https://www.acme.com.br/contato") == "acme"
+        assert domain_label("acme.io") == domain_label("http://Acme.COM") == "acme"
+        assert domain_label("") == ""
+
+
+class TestMatching:
+    """Candidate pairs are scored; only near-identical companies match."""
+
+    def test_spacing_and_suffixes_match(self):
+        resolver = EntityResolver()
+        score = _score(resolver, ("NovaTech", "novatech.io", "US", None),
+                       ("Nova Tech Inc", "", "US", None))
+        assert score >= resolver.threshold
+
+    def test_similar_names_on_other_domains_do_not(self):
+        resolver = EntityResolver()
+        score = _score(resolver, ("Acme Labs", "acmelabs.io", "US", None),
+                       ("Acme Lab", "acmelab.com", "US", None))
+        assert score is None or score < resolver.threshold
+
+    def test_numbers_and_countries_block(self):
+        resolver = EntityResolver()
+        assert _score(resolver, ("Studio 54", "", "US", None), ("Studio 45", "", "US", None)) is None
+        assert _score(resolver, ("NovaTech", "", "US", None), ("NovaTech", "", "BR", None)) is None
+
+    def test_cnpj_conflict_never_matches(self):
+        resolver = EntityResolver()
+        assert _score(resolver, ("Alfa LTDA", "alfa.com.br", "BR", "12.345.678/0001-90"),
+                      ("Alfa S/A", "alfa.com.br", "BR", "98.765.432/0001-10")) == 0.0
+        assert _score(resolver, ("Alfa LTDA", "alfa.com.br", "BR", "12.345.678/0001-90"),
+                      ("Alfa S/A", "", "BR", None)) >= resolver.threshold
+
+    def test_connected_components(self):
+        labels = connected_components(6, np.array([4, 1, 2]), np.array([5, 2, 3]))
+        assert labels.tolist() == [0, 1, 1, 1, 4, 4]
+
+    def test_bands_must_divide_signature(self):
+        with pytest.raises(ValueError):
+            EntityResolver(num_perm=30, bands=8)
+
+
+class TestMerging:
+    """Clusters become one canonical company with its contacts deduplicated."""
+
+    def test_most_complete_record_survives_and_gaps_fill(self):
+        sparse = Company(company_id="c-1", name="Nova Tech Inc", country="US",
+                         tech_stack=["Salesforce"])
+        full = Company(company_id="c-2", name="NovaTech", website="novatech.io", country="US",
+                       industry="SaaS", employee_count=120, tech_stack=["HubSpot"])
+        other = Company(company_id="c-3", name="Orbit Labs", website="orbitlabs.io", country="US")
+        result = EntityResolver().resolve([sparse, full, other], [])
+
+        assert [c.company_id for c in result.companies] == ["c-2", "c-3"]
+        assert result.company_merges == {"c-1": "c-2"}
+        assert result.companies[0].tech_stack == ["HubSpot", "Salesforce"]
+
+    def test_contacts_follow_and_merge_by_email_case(self):
+        companies = [Company(company_id="c-1", name="NovaTech", website="novatech.io"),
+                     Company(company_id="c-2", name="Nova Tech", website="novatech.io")]
+        contacts = [
+            Contact(contact_id="ct-1", company_id="c-1", full_name="Ana Souza",
+                    email="Ana@NovaTech.io"),
+            Contact(contact_id="ct-2", company_id="c-2", full_name="Ana Souza",
+                    email="ana@novatech.io", title="CTO", verified=True),
+            Contact(contact_id="ct-3", company_id="c-2", full_name="Bruno Lima"),
+        ]
+        result = EntityResolver().resolve(companies, contacts)
+
+        assert result.contact_merges == {"ct-1": "ct-2"}
+        assert {(ct.contact_id, ct.company_id) for ct in result.contacts} == \
+            {("ct-2", "c-1"), ("ct-3", "c-1")}
+        assert next(ct for ct in result.contacts if ct.contact_id == "ct-2").verified
+
+    def test_seed_data_has_no_duplicates(self):
+        companies = generate_seed_companies()
+        contacts = generate_seed_contacts(companies)
+        result = EntityResolver().resolve(companies, contacts)
+        assert len(result.companies) == len(companies)
+        assert len(result.contacts) == len(contacts)
+
+
+class TestPersistence:
+    """Merged-away rows are folded into the canonical rows in the database."""
+
+    def test_merge_entities(self, db):
+        companies = [Company(company_id="c-1", name="NovaTech", website="novatech.io"),
+                     Company(company_id="c-2", name="Nova Tech Inc")]
+        contacts = [Contact(contact_id="ct-1", company_id="c-1", full_name="Ana", email="ana@n.io"),
+                    Contact(contact_id="ct-2", company_id="c-2", full_name="Ana", email="ANA@n.io"),
+                    Contact(contact_id="ct-3", company_id="c-2", full_name="Bruno")]
+        db.insert_companies(companies)
+        db.insert_contacts(contacts)
+
+        EntityResolver().resolve(companies, contacts).persist(db)
+
+        assert [c.company_id for c in db.get_companies()] == ["c-1"]
+        assert sorted((ct.contact_id, ct.company_id) for ct in db.get_contacts()) == \
+            [("ct-1", "c-1"), ("ct-3", "c-1")]
+
+    @pytest.mark.parametrize("mode", [{}, {"streaming": True}, {"pipelined": True}])
+    def test_pipeline_folds_near_duplicates(self, tmp_path, mode):
+        companies = generate_seed_companies()
+        contacts = generate_seed_contacts(companies)
+        discovered, _ = DiscoveryEngine(load_icp_config(settings.icp_config_path)).discover(
+            companies, contacts,
+        )
+        originals = {c.company_id for c in discovered[:5]}
+        copies = [
+            c.model_copy(update={"company_id": f"dup-{c.company_id}", "name": f"{c.name} Inc",
+                                 "website": ""})
+            for c in discovered[:5]
+        ]
+        contact_copies = [
+            ct.model_copy(update={"contact_id": f"dup-{ct.contact_id}",
+                                  "company_id": f"dup-{ct.company_id}", "email": ct.email.upper()})
+            for ct in contacts if ct.company_id in originals
+        ]
+        db_path = str(tmp_path / "pipeline.db")
+        run_pipeline(db_path=db_path, verbose=False,
+                     tam=[(companies + copies, contacts + contact_copies)], **mode)
+
+        stats = Database(db_path).get_pipeline_stats()
+        assert stats["dim_companies"] == len(companies)
+        assert stats["dim_contacts"] == len(contacts)
@@ -0,0 +1,97 @@
+"""Tests for the vectorized synthetic TAM generator."""
+
+import polars as pl
+import pytest
+
+from src.database.database import Database
+from src.database.seed_data import PERSONA_TEMPLATES_BR, SUFFIXES_BR
+from src.database.synthetic import generate_synthetic_tam
+from src.pipeline import run_pipeline
+
+
+class TestGenerateSyntheticTAM:
+    """Shape, distributions and determinism of generated TAMs."""
+
+    def test_same_arguments_give_identical_frames(self):
+        first, second = generate_synthetic_tam(2000, seed=7), generate_synthetic_tam(2000, seed=7)
+        assert first.companies.equals(second.companies)
+        assert first.contacts.equals(second.contacts)
+        assert not first.companies.equals(generate_synthetic_tam(2000, seed=8).companies)
+
+    def test_market_mix(self):
+        tam = generate_synthetic_tam(5000, market_mix={"US": 1, "BR": 1})
+        countries = tam.companies["country"]
+        assert (countries == "BR").sum() == pytest.approx(2500, rel=0.1)
+        assert countries.is_in(["US", "BR"]).all()
+
+        br = tam.companies.filter(pl.col("country") == "BR")
+        assert br["cnpj"].null_count() == 0
+        assert br["website"].str.ends_with(".com.br").all()
+        assert br["name"].str.contains("|".join(SUFFIXES_BR)).all()
+
+    def test_invalid_market_mix_raises(self):
+        with pytest.raises(ValueError):
+            generate_synthetic_tam(10, market_mix={"EU": 1})
+        with pytest.raises(ValueError):
+            generate_synthetic_tam(10, market_mix={"US": 0})
+
+    def test_contacts_follow_headcount_and_personas(self):
+        tam = generate_synthetic_tam(3000)
+        joined = tam.contacts.join(tam.companies, on="company_id", suffix="_company")
+        per_company = joined.group_by("company_id").agg(
+            pl.len().alias("n"),
+            pl.col("employee_count").first(),
+            pl.col("title").n_unique().alias("titles"),
+        )
+        assert (per_company["n"] == per_company["titles"]).all()
+        assert per_company.filter(pl.col("employee_count") > 200)["n"].min() >= 2
+        assert per_company.filter(pl.col("employee_count") <= 50)["n"].max() <= 2
+        assert tam.contacts.height == int(tam.contact_counts.sum())
+
+        br_titles = joined.filter(pl.col("country") == "BR")["title"].unique().to_list()
+        assert set(br_titles) <= {t["title"] for t in PERSONA_TEMPLATES_BR}
+        domains = joined["website"].str.slice(len("https://"))
+        assert (joined["email"].str.split("@").list.last() == domains).all()
+
+    def test_names_and_cnpjs_are_unique(self):
+        tam = generate_synthetic_tam(20_000)
+        assert tam.companies["name"].n_unique() == 20_000
+        assert tam.companies["cnpj"].drop_nulls().is_unique().all()
+
+
+class TestSyntheticOutputs:
+    """Model batches, Parquet and SQLite outputs."""
+
+    def test_batches_cover_every_row(self):
+        tam = generate_synthetic_tam(250)
+        batches = list(tam.batches(batch_size=100))
+        assert [len(companies) for companies, _ in batches] == [100, 100, 50]
+        for companies, contacts in batches:
+            ids = {c.company_id for c in companies}
+            assert {ct.company_id for ct in contacts} <= ids
+        assert sum(len(contacts) for _, contacts in batches) == tam.contacts.height
+        assert isinstance(batches[0][0][0].tech_stack, list)
+
+    def test_parquet_round_trip(self, tmp_path):
+        tam = generate_synthetic_tam(500)
+        companies_path, contacts_path = tam.write_parquet(tmp_path)
+        assert pl.read_parquet(companies_path).equals(tam.companies)
+        assert pl.read_parquet(contacts_path).equals(tam.contacts)
+
+    def test_sqlite_load_matches_model_batches(self, tmp_path):
+        tam = generate_synthetic_tam(300)
+        db = Database(str(tmp_path / "synthetic.db"))
+        assert tam.write_sqlite(db) == (300, tam.contacts.height)
+
+        companies, contacts = next(tam.batches(batch_size=300))
+        assert db.get_company(companies[0].company_id) == companies[0]
+        assert db.get_contacts(company_id=companies[0].company_id) == [
+            ct for ct in contacts if ct.company_id == companies[0].company_id
+        ]
+
+    def test_pipeline_runs_on_synthetic_tam(self, tmp_path):
+        tam = generate_synthetic_tam(400)
+        result = run_pipeline(db_path=str(tmp_path / "p.db"), verbose=False,
+                              tam=tam.batches(), streaming=True, batch_size=150)
+        assert result.stage_metrics[0].rows_out == 400
+        assert result.leads_scored > 0